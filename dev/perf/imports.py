@@ -0,0 +1,125 @@
+"""Import-time benchmark for NetGraph entry points.
+
+Each target is imported in a fresh interpreter so that module caches do not
+hide regressions. Reported times are wall-clock medians over several runs,
+measured inside the child process around the import statement only.
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+
+# Module imported by each entry point; budgets are in milliseconds
+IMPORT_TARGETS: dict[str, str] = {
+    "ngraph": "ngraph",
+    "ngraph.cli": "ngraph.cli",
+    "ngraph.scenario": "ngraph.scenario",
+}
+
+DEFAULT_BUDGET_MS: dict[str, float] = {
+    "ngraph": 100.0,
+    "ngraph.cli": 150.0,
+}
+
+# Heavy third-party modules that must not be loaded by a bare `import ngraph`
+HEAVY_MODULES = ("networkx", "numpy", "pandas")
+
+_CHILD = """
+import sys, time
+t0 = time.perf_counter()
+import {module}
+dt = (time.perf_counter() - t0) * 1000.0
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(f"{{dt:.3f}} {{','.join(heavy)}}")
+"""
+
+
+@dataclass
+class ImportTiming:
+    """Import-time measurement for one module.
+
+    Attributes:
+        module: Imported module name.
+        samples_ms: Per-run import times in milliseconds.
+        heavy_loaded: Heavy modules present in ``sys.modules`` after import.
+    """
+
+    module: str
+    samples_ms: list[float]
+    heavy_loaded: list[str]
+
+    @property
+    def median_ms(self) -> float:
+        return statistics.median(self.samples_ms)
+
+
+def measure_import(module: str, runs: int = 5) -> ImportTiming:
+    """Measure the import time of ``module`` in fresh interpreters.
+
+    Args:
+        module: Dotted module name.
+        runs: Number of child processes to launch.
+
+    Returns:
+        ImportTiming with per-run samples.
+    """
+    code = _CHILD.format(module=module, heavy=HEAVY_MODULES)
+    samples: list[float] = []
+    heavy: list[str] = []
+    for _ in range(max(1, runs)):
+        out = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        ).stdout.split()
+        samples.append(float(out[0]))
+        heavy = out[1].split(",") if len(out) > 1 else []
+    return ImportTiming(module=module, samples_ms=samples, heavy_loaded=heavy)
+
+
+def run_import_benchmark(
+    runs: int = 5, budgets: dict[str, float] | None = None
+) -> tuple[list[ImportTiming], list[str]]:
+    """Measure all import targets and check them against budgets.
+
+    Args:
+        runs: Child processes per target.
+        budgets: Median budget per module in milliseconds. Defaults to
+            ``DEFAULT_BUDGET_MS``.
+
+    Returns:
+        Tuple of (timings, violations). Violations are human-readable strings.
+    """
+    budgets = DEFAULT_BUDGET_MS if budgets is None else budgets
+    timings = [measure_import(module, runs) for module in IMPORT_TARGETS.values()]
+    violations: list[str] = []
+    for timing in timings:
+        budget = budgets.get(timing.module)
+        if budget is not None and timing.median_ms > budget:
+            violations.append(
+                f"{timing.module}: median {timing.median_ms:.1f} ms exceeds "
+                f"budget {budget:.1f} ms"
+            )
+        if timing.module == "ngraph" and timing.heavy_loaded:
+            violations.append(
+                f"ngraph: eagerly imports {', '.join(timing.heavy_loaded)}"
+            )
+    return timings, violations
+
+
+def print_import_report(timings: list[ImportTiming], violations: list[str]) -> None:
+    """Print a table of import timings followed by any budget violations."""
+    print(f"{'module':<20} {'median ms':>10} {'min ms':>8} {'max ms':>8}  heavy")
+    print("-" * 60)
+    for t in timings:
+        print(
+            f"{t.module:<20} {t.median_ms:>10.1f} {min(t.samples_ms):>8.1f} "
+            f"{max(t.samples_ms):>8.1f}  {','.join(t.heavy_loaded) or '-'}"
+        )
+    if violations:
+        print("\nBudget violations:")
+        for v in violations:
+            print(f"  ✗ {v}")
+    else:
+        print("\n✓ All imports within budget")
@@ -11,6 +11,7 @@ from pathlib import Path
 
 from .analysis import PerformanceAnalyzer
 from .core import BenchmarkResult
+from .imports import print_import_report, run_import_benchmark
 from .profiles import BENCHMARK_PROFILES, get_profile_by_name
 from .runner import BenchmarkRunner
 from .topology import ALL_TOPOLOGIES
@@ -92,6 +93,14 @@ def cmd_run(args: argparse.Namespace) -> int:
         return 1
 
 
+def cmd_imports(args: argparse.Namespace) -> int:
+    """Import-time benchmark command implementation."""
+    print("Measuring import times in fresh interpreters...\n")
+    timings, violations = run_import_benchmark(runs=args.runs)
+    print_import_report(timings, violations)
+    return 1 if violations else 0
+
+
 def cmd_show_profile(args: argparse.Namespace) -> int:
     """Show profile configuration."""
     try:
@@ -251,6 +260,11 @@ def main() -> int:
     run_p = sub.add_parser("run", help="Run benchmarks then analyze")
     run_p.add_argument("--profile", help="Run a single profile")
 
+    imports_p = sub.add_parser("imports", help="Measure package import times")
+    imports_p.add_argument(
+        "--runs", type=int, default=5, help="Fresh interpreters per module"
+    )
+
     # Add show command with subcommands
     show_p = sub.add_parser("show", help="Show configuration details")
     show_sub = show_p.add_subparsers(dest="show_command")
@@ -274,6 +288,8 @@ def main() -> int:
 
     if args.command == "run":
         return cmd_run(args)
+    if args.command == "imports":
+        return cmd_imports(args)
     if args.command == "show":
         if args.show_command == "profile":
             return cmd_show_profile(args)
@@ -30,24 +30,80 @@ Example:
 
 from __future__ import annotations
 
-from importlib.metadata import version
-
-from ngraph import cli, logging
-
-__version__ = version("ngraph")
-from ngraph.analysis import AnalysisContext, analyze
-from ngraph.analysis.failure_manager import FailureManager
-from ngraph.explorer import NetworkExplorer
-from ngraph.lib.nx import EdgeMap, NodeMap, from_networkx, to_networkx
-from ngraph.model.demand.spec import TrafficDemand
-from ngraph.model.flow.policy_config import FlowPolicyPreset
-from ngraph.model.network import Link, Network, Node, RiskGroup
-from ngraph.model.path import Path
-from ngraph.results.artifacts import CapacityEnvelope
-from ngraph.results.flow import FlowEntry, FlowIterationResult, FlowSummary
-from ngraph.scenario import Scenario
-from ngraph.types.base import EdgeSelect, FlowPlacement, Mode
-from ngraph.types.dto import EdgeRef, MaxFlowResult
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from ngraph import logging
+
+if TYPE_CHECKING:
+    from ngraph import cli
+    from ngraph.analysis import AnalysisContext, analyze
+    from ngraph.analysis.failure_manager import FailureManager
+    from ngraph.explorer import NetworkExplorer
+    from ngraph.lib.nx import EdgeMap, NodeMap, from_networkx, to_networkx
+    from ngraph.model.demand.spec import TrafficDemand
+    from ngraph.model.flow.policy_config import FlowPolicyPreset
+    from ngraph.model.network import Link, Network, Node, RiskGroup
+    from ngraph.model.path import Path
+    from ngraph.results.artifacts import CapacityEnvelope, SketchCapacityEnvelope
+    from ngraph.results.flow import FlowEntry, FlowIterationResult, FlowSummary
+    from ngraph.scenario import Scenario
+    from ngraph.types.base import EdgeSelect, FlowPlacement, Mode
+    from ngraph.types.dto import EdgeRef, MaxFlowResult
+
+# Public names are resolved on first access (PEP 562) so that ``import ngraph``
+# and CLI startup do not pay for NumPy, NetworkX, or the analysis stack until
+# they are actually used.
+_LAZY_ATTRS: dict[str, str] = {
+    "AnalysisContext": "ngraph.analysis",
+    "analyze": "ngraph.analysis",
+    "FailureManager": "ngraph.analysis.failure_manager",
+    "NetworkExplorer": "ngraph.explorer",
+    "EdgeMap": "ngraph.lib.nx",
+    "NodeMap": "ngraph.lib.nx",
+    "from_networkx": "ngraph.lib.nx",
+    "to_networkx": "ngraph.lib.nx",
+    "TrafficDemand": "ngraph.model.demand.spec",
+    "FlowPolicyPreset": "ngraph.model.flow.policy_config",
+    "Link": "ngraph.model.network",
+    "Network": "ngraph.model.network",
+    "Node": "ngraph.model.network",
+    "RiskGroup": "ngraph.model.network",
+    "Path": "ngraph.model.path",
+    "CapacityEnvelope": "ngraph.results.artifacts",
+    "SketchCapacityEnvelope": "ngraph.results.artifacts",
+    "FlowEntry": "ngraph.results.flow",
+    "FlowIterationResult": "ngraph.results.flow",
+    "FlowSummary": "ngraph.results.flow",
+    "Scenario": "ngraph.scenario",
+    "EdgeSelect": "ngraph.types.base",
+    "FlowPlacement": "ngraph.types.base",
+    "Mode": "ngraph.types.base",
+    "EdgeRef": "ngraph.types.dto",
+    "MaxFlowResult": "ngraph.types.dto",
+}
+
+_LAZY_MODULES = frozenset({"cli"})
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value: Any = version("ngraph")
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    elif name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Version
@@ -75,6 +131,7 @@ __all__ = [
     "FlowIterationResult",
     "FlowSummary",
     "CapacityEnvelope",
+    "SketchCapacityEnvelope",
     # Execution
     "FailureManager",
     "NetworkExplorer",
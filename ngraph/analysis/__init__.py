@@ -20,6 +20,7 @@ from ngraph.analysis.context import LARGE_CAPACITY as LARGE_CAPACITY
 from ngraph.analysis.context import (
     AnalysisContext,
     AugmentationEdge,
+    FlowGraphPoolStats,
     analyze,
 )
 from ngraph.analysis.context import build_edge_mask as build_edge_mask
@@ -30,6 +31,11 @@ from ngraph.analysis.demand import (
     expand_demands,
 )
 from ngraph.analysis.failure_manager import AnalysisFunction, FailureManager
+from ngraph.analysis.failure_patterns import (
+    FailurePattern,
+    FailurePatternSet,
+    FailurePatternStore,
+)
 from ngraph.analysis.functions import (
     build_demand_context,
     build_maxflow_context,
@@ -50,6 +56,7 @@ __all__ = [
     "analyze",
     "AnalysisContext",
     "AugmentationEdge",
+    "FlowGraphPoolStats",
     # Placement
     "CACHEABLE_PRESETS",
     "PlacementEntry",
@@ -69,4 +76,7 @@ __all__ = [
     # Failure analysis
     "AnalysisFunction",
     "FailureManager",
+    "FailurePattern",
+    "FailurePatternSet",
+    "FailurePatternStore",
 ]
@@ -17,12 +17,16 @@ Usage:
 
 from __future__ import annotations
 
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
     FrozenSet,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -35,6 +39,8 @@ import netgraph_core
 import numpy as np
 
 from ngraph.model.path import Path
+from ngraph.profiling.memory import active_memory, note_structure
+from ngraph.profiling.phases import phase
 from ngraph.types.base import EdgeSelect, FlowPlacement, Mode
 from ngraph.types.dto import EdgeRef, MaxFlowResult
 
@@ -45,6 +51,21 @@ if TYPE_CHECKING:
 # Large capacity for pseudo edges (avoid float('inf') due to Core limitation)
 LARGE_CAPACITY = 1e15
 
+# Array views of a Core graph, for memory attribution
+_GRAPH_ARRAY_VIEWS = (
+    "capacity_view",
+    "cost_view",
+    "ext_edge_ids_view",
+    "edge_src_view",
+    "edge_dst_view",
+    "row_offsets_view",
+    "col_indices_view",
+    "adj_edge_index_view",
+    "in_row_offsets_view",
+    "in_col_indices_view",
+    "in_adj_edge_index_view",
+)
+
 
 class AugmentationEdge:
     """Edge specification for graph augmentation.
@@ -123,6 +144,15 @@ class _EdgeMapper:
         ext_id = ext_edge_ids[core_edge_id]
         return self.decode_ext_id(int(ext_id))
 
+    def to_keys(self, ext_ids: np.ndarray) -> List[str]:
+        """Format external ids as ``"link_id:direction"`` keys, skipping -1."""
+        link_ids = self.link_ids
+        return [
+            f"{link_ids[ext_id >> 1]}:{'rev' if ext_id & 1 else 'fwd'}"
+            for ext_id in ext_ids.tolist()
+            if ext_id >= 0
+        ]
+
     def to_name(self, ext_id: int) -> Optional[str]:
         if ext_id == -1:
             return None
@@ -130,14 +160,130 @@ class _EdgeMapper:
         return edge_ref.link_id if edge_ref else None
 
 
+@dataclass(frozen=True)
+class FlowGraphPoolStats:
+    """Usage counters of an AnalysisContext FlowGraph pool.
+
+    Attributes:
+        created: FlowGraphs allocated (one per thread and nesting depth).
+        reused: Borrows served by resetting an idle FlowGraph.
+        in_use: FlowGraphs currently borrowed.
+        threads: Threads that have borrowed from the pool.
+    """
+
+    created: int
+    reused: int
+    in_use: int
+    threads: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of borrows served without allocation."""
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+
+@dataclass
+class _PooledFlowState:
+    """FlowGraph plus node/edge mask buffers owned by one pool slot."""
+
+    flow_graph: netgraph_core.FlowGraph
+    node_mask: np.ndarray
+    edge_mask: np.ndarray
+
+
+class _FlowGraphPool:
+    """Thread-local pool of FlowGraphs over one multidigraph.
+
+    Each thread keeps its own idle slots, so borrowing takes no lock beyond
+    the stats counters. A slot is reset when it is handed out again; its
+    mask buffers are overwritten by the borrower.
+    """
+
+    def __init__(
+        self, multidigraph: netgraph_core.StrictMultiDiGraph, num_nodes: int
+    ) -> None:
+        self._multidigraph = multidigraph
+        self._num_nodes = num_nodes
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._reused = 0
+        self._in_use = 0
+        self._threads = 0
+
+    def _idle_slots(self) -> List[_PooledFlowState]:
+        idle = getattr(self._local, "idle", None)
+        if idle is None:
+            idle = self._local.idle = []
+            with self._lock:
+                self._threads += 1
+        return idle
+
+    @contextmanager
+    def borrow(self) -> Iterator[_PooledFlowState]:
+        """Borrow a clean slot for the duration of the ``with`` block."""
+        idle = self._idle_slots()
+        if idle:
+            slot = idle.pop()
+            slot.flow_graph.reset()
+            reused = True
+        else:
+            slot = _PooledFlowState(
+                flow_graph=netgraph_core.FlowGraph(self._multidigraph),
+                node_mask=np.empty(self._num_nodes, dtype=bool),
+                edge_mask=np.empty(self._multidigraph.num_edges(), dtype=bool),
+            )
+            reused = False
+        with self._lock:
+            if reused:
+                self._reused += 1
+            else:
+                self._created += 1
+            self._in_use += 1
+        try:
+            yield slot
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            idle.append(slot)
+
+    def stats(self) -> FlowGraphPoolStats:
+        with self._lock:
+            return FlowGraphPoolStats(
+                created=self._created,
+                reused=self._reused,
+                in_use=self._in_use,
+                threads=self._threads,
+            )
+
+
 @dataclass
 class _PseudoNodeContext:
-    """Context for pseudo nodes created during graph construction."""
+    """Context for pseudo nodes created during graph construction.
+
+    Group resolution is frozen at build time so that bound analysis calls do
+    no selector work.
+
+    Attributes:
+        source: Source selector the context was bound with.
+        sink: Sink selector the context was bound with.
+        mode: Group mode.
+        pairs: Result key -> (pseudo source id, pseudo sink id) for pairs that
+            have pseudo nodes.
+        source_groups: Source group label -> member node ids (int32).
+        sink_groups: Sink group label -> member node ids (int32).
+        unresolved_pairs: Result keys without pseudo nodes (overlapping or
+            empty groups); reported with a default value.
+    """
 
     source: Union[str, Dict[str, Any]]
     sink: Union[str, Dict[str, Any]]
     mode: Mode
     pairs: Dict[Tuple[str, str], Tuple[int, int]]
+    source_groups: Mapping[str, np.ndarray] = field(default_factory=dict)
+    sink_groups: Mapping[str, np.ndarray] = field(default_factory=dict)
+    unresolved_pairs: Tuple[Tuple[str, str], ...] = ()
 
 
 @dataclass
@@ -164,7 +310,8 @@ class AnalysisContext:
 
     Thread Safety:
         Immutable after creation. Safe for concurrent analysis calls
-        with different exclusion sets.
+        with different exclusion sets. FlowGraphs used for demand placement
+        come from a per-thread pool (see ``flow_graph_pool_stats``).
 
     Attributes:
         network: Reference to source Network (read-only).
@@ -190,6 +337,14 @@ class AnalysisContext:
     _mode: Optional[Mode] = None
     _pseudo_context: Optional[_PseudoNodeContext] = field(default=None, repr=False)
 
+    # Reusable FlowGraphs and mask buffers (created in __post_init__)
+    _flow_graph_pool: _FlowGraphPool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._flow_graph_pool = _FlowGraphPool(
+            self._multidigraph, len(self._node_mapper.node_names)
+        )
+
     @property
     def network(self) -> "Network":
         """Reference to source network (read-only)."""
@@ -273,6 +428,60 @@ class AnalysisContext:
         """Link ID to Core edge indices mapping. Internal use only."""
         return self._link_id_to_edge_indices
 
+    def link_flows(
+        self, flow_graph: netgraph_core.FlowGraph, dtype: Any = np.float64
+    ) -> np.ndarray:
+        """Return the flow on every link direction of a FlowGraph of this context.
+
+        Args:
+            flow_graph: FlowGraph built on this context's graph.
+            dtype: Floating dtype of the returned array (e.g. ``"float32"`` for
+                matrices kept per failure pattern).
+
+        Returns:
+            Array of shape ``(num_links, 2)`` with forward and reverse flow per
+            link, in ``Network.link_arrays()`` order. Augmentation edges are
+            ignored; the reverse column is zero for directed-only graphs.
+        """
+        ext_ids = np.asarray(self._multidigraph.ext_edge_ids_view())
+        flows = np.asarray(flow_graph.edge_flow_view(), dtype=np.float64)
+        is_link = ext_ids >= 0
+        out = np.zeros(2 * len(self._edge_mapper.link_ids), dtype=dtype)
+        # Ext ids encode (link_index << 1) | direction, i.e. the row-major slot
+        out[ext_ids[is_link]] = flows[is_link]
+        return out.reshape(-1, 2)
+
+    def flow_graph_pool_stats(self) -> FlowGraphPoolStats:
+        """Usage counters of the FlowGraph pool used for demand placement."""
+        return self._flow_graph_pool.stats()
+
+    @contextmanager
+    def _borrow_flow_state(
+        self,
+        excluded_nodes: Optional[Set[str]] = None,
+        excluded_links: Optional[Set[str]] = None,
+    ) -> Iterator[_PooledFlowState]:
+        """Borrow a reset FlowGraph with masks filled for the exclusions.
+
+        The FlowGraph and masks belong to the pool; they must not be used
+        after the ``with`` block exits.
+        """
+        with self._flow_graph_pool.borrow() as slot:
+            with phase("analysis.masks"):
+                self._build_node_mask(excluded_nodes, out=slot.node_mask)
+                self._build_edge_mask(excluded_links, out=slot.edge_mask)
+            yield slot
+
+    @property
+    def source_groups(self) -> Mapping[str, np.ndarray]:
+        """Bound source group label -> member node ids. Internal use only."""
+        return self._pseudo_context.source_groups if self._pseudo_context else {}
+
+    @property
+    def sink_groups(self) -> Mapping[str, np.ndarray]:
+        """Bound sink group label -> member node ids. Internal use only."""
+        return self._pseudo_context.sink_groups if self._pseudo_context else {}
+
     # ──────────────────────────────────────────────────────────────
     # Factory methods
     # ──────────────────────────────────────────────────────────────
@@ -314,9 +523,11 @@ class AnalysisContext:
 
         # Build pseudo node augmentations if source/sink provided
         pseudo_pairs: Optional[Dict[Tuple[str, str], Tuple[str, str]]] = None
+        group_names: Optional[Tuple[Dict[str, List[str]], Dict[str, List[str]]]] = None
         if source is not None and sink is not None:
+            group_names = _select_group_names(network, source, sink)
             pseudo_augmentations, pseudo_pairs = _build_pseudo_node_augmentations(
-                network, source, sink, mode
+                network, source, sink, mode, groups=group_names
             )
             all_augmentations.extend(pseudo_augmentations)
 
@@ -326,10 +537,18 @@ class AnalysisContext:
             add_reverse=True,
             augmentations=all_augmentations if all_augmentations else None,
         )
+        if active_memory() is not None:
+            note_structure(
+                "graph_arrays",
+                sum(
+                    getattr(ctx._multidigraph, view)().nbytes
+                    for view in _GRAPH_ARRAY_VIEWS
+                ),
+            )
 
         # Create pseudo context if bound
         pseudo_context: Optional[_PseudoNodeContext] = None
-        if source is not None and sink is not None:
+        if source is not None and sink is not None and group_names is not None:
             resolved_pairs: Dict[Tuple[str, str], Tuple[int, int]] = {}
             if pseudo_pairs:
                 for pair_key, (
@@ -340,11 +559,31 @@ class AnalysisContext:
                     pseudo_snk_id = ctx._node_mapper.to_id(pseudo_snk_name)
                     resolved_pairs[pair_key] = (pseudo_src_id, pseudo_snk_id)
 
+            src_names, snk_names = group_names
+            if mode == Mode.COMBINE:
+                all_pairs = [("|".join(sorted(src_names)), "|".join(sorted(snk_names)))]
+            else:
+                all_pairs = [(s, t) for s in src_names for t in snk_names]
+            node_id_of = ctx._node_mapper.node_id_of
+
+            def _member_ids(groups: Dict[str, List[str]]) -> Dict[str, np.ndarray]:
+                return {
+                    label: np.fromiter(
+                        (node_id_of[n] for n in names), dtype=np.int32, count=len(names)
+                    )
+                    for label, names in groups.items()
+                }
+
             pseudo_context = _PseudoNodeContext(
                 source=source,
                 sink=sink,
                 mode=mode,
                 pairs=resolved_pairs,
+                source_groups=MappingProxyType(_member_ids(src_names)),
+                sink_groups=MappingProxyType(_member_ids(snk_names)),
+                unresolved_pairs=tuple(
+                    key for key in all_pairs if key not in resolved_pairs
+                ),
             )
 
         return cls(
@@ -461,7 +700,8 @@ class AnalysisContext:
             flow_placement: Flow placement strategy.
             excluded_nodes: Nodes to exclude from this analysis.
             excluded_links: Links to exclude from this analysis.
-            include_min_cut: If True, compute and include min-cut edges.
+            include_min_cut: If True, include the min-cut edges, taken from the
+                residual graph of the same max-flow run.
 
         Returns:
             Dict mapping (source_label, sink_label) to MaxFlowResult.
@@ -740,10 +980,20 @@ class AnalysisContext:
                 raise ValueError("Unbound context: source and sink are required.")
             return source, sink, mode
 
-    def _build_node_mask(self, excluded_nodes: Optional[Set[str]] = None) -> np.ndarray:
-        """Build node mask array for Core algorithms."""
-        num_nodes = len(self._node_mapper.node_names)
-        mask = np.ones(num_nodes, dtype=bool)
+    def _build_node_mask(
+        self,
+        excluded_nodes: Optional[Set[str]] = None,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Build node mask array for Core algorithms.
+
+        Fills ``out`` in place when given instead of allocating.
+        """
+        if out is None:
+            mask = np.ones(len(self._node_mapper.node_names), dtype=bool)
+        else:
+            mask = out
+            mask.fill(True)
 
         for node_id in self._disabled_node_ids:
             mask[node_id] = False
@@ -755,10 +1005,20 @@ class AnalysisContext:
 
         return mask
 
-    def _build_edge_mask(self, excluded_links: Optional[Set[str]] = None) -> np.ndarray:
-        """Build edge mask array for Core algorithms."""
-        num_edges = self._multidigraph.num_edges()
-        mask = np.ones(num_edges, dtype=bool)
+    def _build_edge_mask(
+        self,
+        excluded_links: Optional[Set[str]] = None,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Build edge mask array for Core algorithms.
+
+        Fills ``out`` in place when given instead of allocating.
+        """
+        if out is None:
+            mask = np.ones(self._multidigraph.num_edges(), dtype=bool)
+        else:
+            mask = out
+            mask.fill(True)
 
         for link_id in self._disabled_link_ids:
             if link_id in self._link_id_to_edge_indices:
@@ -810,23 +1070,25 @@ class AnalysisContext:
     ) -> Dict[Tuple[str, str], float]:
         """Max flow using pre-built pseudo nodes."""
         core_flow_placement = self._map_flow_placement(flow_placement)
-        node_mask = self._build_node_mask(excluded_nodes)
-        edge_mask = self._build_edge_mask(excluded_links)
+        with phase("analysis.masks"):
+            node_mask = self._build_node_mask(excluded_nodes)
+            edge_mask = self._build_edge_mask(excluded_links)
 
         pseudo_node_pairs = self._pseudo_context.pairs if self._pseudo_context else {}
         results: Dict[Tuple[str, str], float] = {}
 
         for pair_key, (pseudo_src_id, pseudo_snk_id) in pseudo_node_pairs.items():
-            flow_value, _ = self._algorithms.max_flow(
-                self._handle,
-                pseudo_src_id,
-                pseudo_snk_id,
-                flow_placement=core_flow_placement,
-                shortest_path=shortest_path,
-                require_capacity=require_capacity,
-                node_mask=node_mask,
-                edge_mask=edge_mask,
-            )
+            with phase("core.max_flow"):
+                flow_value, _ = self._algorithms.max_flow(
+                    self._handle,
+                    pseudo_src_id,
+                    pseudo_snk_id,
+                    flow_placement=core_flow_placement,
+                    shortest_path=shortest_path,
+                    require_capacity=require_capacity,
+                    node_mask=node_mask,
+                    edge_mask=edge_mask,
+                )
             results[pair_key] = flow_value
 
         # Fill missing pairs (overlapping src/snk)
@@ -870,28 +1132,17 @@ class AnalysisContext:
     ) -> Dict[Tuple[str, str], MaxFlowResult]:
         """Detailed max flow using pre-built pseudo nodes."""
         core_flow_placement = self._map_flow_placement(flow_placement)
-        node_mask = self._build_node_mask(excluded_nodes)
-        edge_mask = self._build_edge_mask(excluded_links)
+        with phase("analysis.masks"):
+            node_mask = self._build_node_mask(excluded_nodes)
+            edge_mask = self._build_edge_mask(excluded_links)
         ext_edge_ids = self._multidigraph.ext_edge_ids_view()
 
         pseudo_node_pairs = self._pseudo_context.pairs if self._pseudo_context else {}
         results: Dict[Tuple[str, str], MaxFlowResult] = {}
 
         for pair_key, (pseudo_src_id, pseudo_snk_id) in pseudo_node_pairs.items():
-            flow_value, core_summary = self._algorithms.max_flow(
-                self._handle,
-                pseudo_src_id,
-                pseudo_snk_id,
-                flow_placement=core_flow_placement,
-                shortest_path=shortest_path,
-                require_capacity=require_capacity,
-                node_mask=node_mask,
-                edge_mask=edge_mask,
-            )
-
-            min_cut_edges: Optional[Tuple[EdgeRef, ...]] = None
-            if include_min_cut:
-                sens_results = self._algorithms.sensitivity_analysis(
+            with phase("core.max_flow"):
+                flow_value, core_summary = self._algorithms.max_flow(
                     self._handle,
                     pseudo_src_id,
                     pseudo_snk_id,
@@ -901,13 +1152,10 @@ class AnalysisContext:
                     node_mask=node_mask,
                     edge_mask=edge_mask,
                 )
-                edge_refs: List[EdgeRef] = []
-                for edge_id, _delta in sens_results:
-                    ext_id = ext_edge_ids[edge_id]
-                    edge_ref = self._edge_mapper.decode_ext_id(int(ext_id))
-                    if edge_ref is not None:
-                        edge_refs.append(edge_ref)
-                min_cut_edges = tuple(edge_refs)
+
+            min_cut_edges: Optional[Tuple[EdgeRef, ...]] = None
+            if include_min_cut:
+                min_cut_edges = self._decode_min_cut(core_summary, ext_edge_ids)
 
             results[pair_key] = _construct_max_flow_result(
                 flow_value, core_summary, min_cut_edges
@@ -917,6 +1165,25 @@ class AnalysisContext:
         self._fill_missing_pairs_bound(results, _construct_max_flow_result(0.0))
         return results
 
+    def _decode_min_cut(
+        self, core_summary: Any, ext_edge_ids: np.ndarray
+    ) -> Tuple[EdgeRef, ...]:
+        """Map the min-cut of a max-flow summary to real link directions.
+
+        Core derives the cut from the final residual graph (edges leaving the
+        set of nodes reachable from the source), so no second flow run is
+        needed. Pseudo augmentation edges (ext id -1) are dropped.
+        """
+        cut_ids = np.asarray(core_summary.min_cut.edges, dtype=np.int64)
+        if cut_ids.size == 0:
+            return ()
+        decode = self._edge_mapper.decode_ext_id
+        return tuple(
+            decode(int(ext_id))
+            for ext_id in np.asarray(ext_edge_ids)[cut_ids]
+            if ext_id >= 0
+        )
+
     def _max_flow_detailed_unbound(
         self,
         *,
@@ -954,24 +1221,26 @@ class AnalysisContext:
     ) -> Dict[Tuple[str, str], Dict[str, float]]:
         """Sensitivity analysis using pre-built pseudo nodes."""
         core_flow_placement = self._map_flow_placement(flow_placement)
-        node_mask = self._build_node_mask(excluded_nodes)
-        edge_mask = self._build_edge_mask(excluded_links)
+        with phase("analysis.masks"):
+            node_mask = self._build_node_mask(excluded_nodes)
+            edge_mask = self._build_edge_mask(excluded_links)
         ext_edge_ids = self._multidigraph.ext_edge_ids_view()
 
         pseudo_node_pairs = self._pseudo_context.pairs if self._pseudo_context else {}
         results: Dict[Tuple[str, str], Dict[str, float]] = {}
 
         for pair_key, (pseudo_src_id, pseudo_snk_id) in pseudo_node_pairs.items():
-            sens_results = self._algorithms.sensitivity_analysis(
-                self._handle,
-                pseudo_src_id,
-                pseudo_snk_id,
-                flow_placement=core_flow_placement,
-                shortest_path=shortest_path,
-                require_capacity=require_capacity,
-                node_mask=node_mask,
-                edge_mask=edge_mask,
-            )
+            with phase("core.sensitivity"):
+                sens_results = self._algorithms.sensitivity_analysis(
+                    self._handle,
+                    pseudo_src_id,
+                    pseudo_snk_id,
+                    flow_placement=core_flow_placement,
+                    shortest_path=shortest_path,
+                    require_capacity=require_capacity,
+                    node_mask=node_mask,
+                    edge_mask=edge_mask,
+                )
 
             sensitivity_map: Dict[str, float] = {}
             for edge_id, delta in sens_results:
@@ -1011,28 +1280,15 @@ class AnalysisContext:
         )
 
     def _fill_missing_pairs_bound(self, results: Dict, default_value) -> None:
-        """Fill results for pairs not in the graph (e.g., overlapping)."""
+        """Fill results for pairs not in the graph (e.g., overlapping).
+
+        Uses the pair list frozen at construction; no selector work.
+        """
         if not self._pseudo_context:
             return
-
-        from ngraph.dsl.selectors import normalize_selector, select_nodes
-
-        src_selector = normalize_selector(self._source or "", "workflow")
-        snk_selector = normalize_selector(self._sink or "", "workflow")
-
-        src_groups = select_nodes(self._network, src_selector, default_active_only=True)
-        snk_groups = select_nodes(self._network, snk_selector, default_active_only=True)
-
-        if self._mode == Mode.COMBINE:
-            combined_src_label = "|".join(sorted(src_groups.keys()))
-            combined_snk_label = "|".join(sorted(snk_groups.keys()))
-            if (combined_src_label, combined_snk_label) not in results:
-                results[(combined_src_label, combined_snk_label)] = default_value
-        elif self._mode == Mode.PAIRWISE:
-            for src_label in src_groups:
-                for snk_label in snk_groups:
-                    if (src_label, snk_label) not in results:
-                        results[(src_label, snk_label)] = default_value
+        for key in self._pseudo_context.unresolved_pairs:
+            if key not in results:
+                results[key] = default_value
 
     def _shortest_path_costs_impl(
         self,
@@ -1057,8 +1313,9 @@ class AnalysisContext:
         if not snk_groups:
             raise ValueError(f"No sink nodes found matching '{sink}'.")
 
-        node_mask = self._build_node_mask(excluded_nodes)
-        edge_mask = self._build_edge_mask(excluded_links)
+        with phase("analysis.masks"):
+            node_mask = self._build_node_mask(excluded_nodes)
+            edge_mask = self._build_edge_mask(excluded_links)
         core_edge_select = self._map_edge_select(edge_select)
 
         if mode == Mode.COMBINE:
@@ -1155,8 +1412,9 @@ class AnalysisContext:
         if not snk_groups:
             raise ValueError(f"No sink nodes found matching '{sink}'.")
 
-        node_mask = self._build_node_mask(excluded_nodes)
-        edge_mask = self._build_edge_mask(excluded_links)
+        with phase("analysis.masks"):
+            node_mask = self._build_node_mask(excluded_nodes)
+            edge_mask = self._build_edge_mask(excluded_links)
         core_edge_select = self._map_edge_select(edge_select)
 
         def _best_paths_for_groups(
@@ -1272,8 +1530,9 @@ class AnalysisContext:
         if not snk_groups:
             raise ValueError(f"No sink nodes found matching '{sink}'.")
 
-        node_mask = self._build_node_mask(excluded_nodes)
-        edge_mask = self._build_edge_mask(excluded_links)
+        with phase("analysis.masks"):
+            node_mask = self._build_node_mask(excluded_nodes)
+            edge_mask = self._build_edge_mask(excluded_links)
         core_edge_select = self._map_edge_select(edge_select)
 
         def _ksp_for_groups(src_names: List[str], snk_names: List[str]) -> List[Path]:
@@ -1384,13 +1643,16 @@ class AnalysisContext:
 # ──────────────────────────────────────────────────────────────────────────────
 
 
-def _build_pseudo_node_augmentations(
+def _select_group_names(
     network: "Network",
     source: Union[str, Dict[str, Any]],
     sink: Union[str, Dict[str, Any]],
-    mode: Mode,
-) -> Tuple[List[AugmentationEdge], Dict[Tuple[str, str], Tuple[str, str]]]:
-    """Build augmentation edges for pseudo source/sink nodes."""
+) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    """Resolve source/sink selectors to active member names per group label.
+
+    Raises:
+        ValueError: If either selector matches no active nodes.
+    """
     from ngraph.dsl.selectors import normalize_selector, select_nodes
 
     # Normalize selectors and select nodes
@@ -1406,23 +1668,47 @@ def _build_pseudo_node_augmentations(
     if not snk_groups:
         raise ValueError(f"No sink nodes found matching '{sink}'.")
 
+    return (
+        {label: [n.name for n in nodes] for label, nodes in src_groups.items()},
+        {label: [n.name for n in nodes] for label, nodes in snk_groups.items()},
+    )
+
+
+def _build_pseudo_node_augmentations(
+    network: "Network",
+    source: Union[str, Dict[str, Any]],
+    sink: Union[str, Dict[str, Any]],
+    mode: Mode,
+    *,
+    groups: Optional[Tuple[Dict[str, List[str]], Dict[str, List[str]]]] = None,
+) -> Tuple[List[AugmentationEdge], Dict[Tuple[str, str], Tuple[str, str]]]:
+    """Build augmentation edges for pseudo source/sink nodes.
+
+    Args:
+        network: Network to select groups from.
+        source: Source selector.
+        sink: Sink selector.
+        mode: Group mode.
+        groups: Pre-resolved ``(source, sink)`` member names per label, as
+            returned by ``_select_group_names``. Resolved here when omitted.
+    """
+    src_names_by_label, snk_names_by_label = (
+        groups if groups is not None else _select_group_names(network, source, sink)
+    )
+
     # Helper to get node names from groups
-    def _get_names(groups: Dict[str, List[Any]]) -> List[str]:
-        names: List[str] = []
-        for nodes in groups.values():
-            for node in nodes:
-                names.append(node.name)
-        return names
+    def _get_names(groups: Dict[str, List[str]]) -> List[str]:
+        return [name for names in groups.values() for name in names]
 
     augmentations: List[AugmentationEdge] = []
     pair_to_pseudo_names: Dict[Tuple[str, str], Tuple[str, str]] = {}
 
     if mode == Mode.COMBINE:
-        combined_src_label = "|".join(sorted(src_groups.keys()))
-        combined_snk_label = "|".join(sorted(snk_groups.keys()))
+        combined_src_label = "|".join(sorted(src_names_by_label))
+        combined_snk_label = "|".join(sorted(snk_names_by_label))
 
-        combined_src_names = _get_names(src_groups)
-        combined_snk_names = _get_names(snk_groups)
+        combined_src_names = _get_names(src_names_by_label)
+        combined_snk_names = _get_names(snk_names_by_label)
 
         has_overlap = bool(set(combined_src_names) & set(combined_snk_names))
 
@@ -1445,29 +1731,40 @@ def _build_pseudo_node_augmentations(
             )
 
     elif mode == Mode.PAIRWISE:
-        for src_label, src_nodes in src_groups.items():
-            for snk_label, snk_nodes in snk_groups.items():
-                active_src_names = [n.name for n in src_nodes]
-                active_snk_names = [n.name for n in snk_nodes]
-
-                if set(active_src_names) & set(active_snk_names):
+        # One pseudo node per group, shared by every pair it takes part in.
+        # Pseudo sources have only outgoing and pseudo sinks only incoming
+        # edges, so the other groups' pseudo nodes are dead ends for a given
+        # pair and need no masking. The graph stays linear in group count.
+        snk_sets = {label: set(names) for label, names in snk_names_by_label.items()}
+        used_src: Dict[str, None] = {}
+        used_snk: Dict[str, None] = {}
+
+        for src_label, active_src_names in src_names_by_label.items():
+            if not active_src_names:
+                continue
+            src_set = set(active_src_names)
+            for snk_label, active_snk_names in snk_names_by_label.items():
+                if not active_snk_names or not src_set.isdisjoint(snk_sets[snk_label]):
                     continue
-                if not active_src_names or not active_snk_names:
-                    continue
-
-                pseudo_src = f"__PSEUDO_SRC_{src_label}__"
-                pseudo_snk = f"__PSEUDO_SNK_{snk_label}__"
-
-                for src_name in active_src_names:
-                    augmentations.append(
-                        AugmentationEdge(pseudo_src, src_name, LARGE_CAPACITY, 0)
-                    )
-                for snk_name in active_snk_names:
-                    augmentations.append(
-                        AugmentationEdge(snk_name, pseudo_snk, LARGE_CAPACITY, 0)
-                    )
+                used_src[src_label] = None
+                used_snk[snk_label] = None
+                pair_to_pseudo_names[(src_label, snk_label)] = (
+                    f"__PSEUDO_SRC_{src_label}__",
+                    f"__PSEUDO_SNK_{snk_label}__",
+                )
 
-                pair_to_pseudo_names[(src_label, snk_label)] = (pseudo_src, pseudo_snk)
+        for src_label in used_src:
+            pseudo_src = f"__PSEUDO_SRC_{src_label}__"
+            for src_name in src_names_by_label[src_label]:
+                augmentations.append(
+                    AugmentationEdge(pseudo_src, src_name, LARGE_CAPACITY, 0)
+                )
+        for snk_label in used_snk:
+            pseudo_snk = f"__PSEUDO_SNK_{snk_label}__"
+            for snk_name in snk_names_by_label[snk_label]:
+                augmentations.append(
+                    AugmentationEdge(snk_name, pseudo_snk, LARGE_CAPACITY, 0)
+                )
 
     else:
         raise ValueError(f"Invalid mode '{mode}'.")
@@ -1495,71 +1792,98 @@ def _build_graph_core(
     add_reverse: bool = True,
     augmentations: Optional[List[AugmentationEdge]] = None,
 ) -> _GraphBuildResult:
-    """Build Core graph infrastructure from Network."""
-    # Identify real nodes
-    real_node_names = set(network.nodes.keys())
+    """Build Core graph infrastructure from Network.
+
+    Network edges come from the cached columnar view (``Network.link_arrays``),
+    so only augmentation edges are processed in Python.
+    """
+    arrays = network.link_arrays()
+    real_node_names = arrays.node_names
+    nodes = network.nodes
 
     # Infer pseudo nodes from augmentations
     pseudo_node_names: Set[str] = set()
     if augmentations:
         for aug_edge in augmentations:
-            if aug_edge.source not in real_node_names:
+            if aug_edge.source not in nodes:
                 pseudo_node_names.add(aug_edge.source)
-            if aug_edge.target not in real_node_names:
+            if aug_edge.target not in nodes:
                 pseudo_node_names.add(aug_edge.target)
 
     # Assign node IDs (real first, then pseudo)
-    all_node_names = sorted(real_node_names) + sorted(pseudo_node_names)
+    all_node_names = real_node_names + sorted(pseudo_node_names)
     node_mapper = _NodeMapper(all_node_names)
 
     # Build edge mapper
-    link_ids = sorted(network.links.keys())
+    link_ids = arrays.link_ids
     edge_mapper = _EdgeMapper(link_ids)
 
-    # Build edge arrays
-    src_list: List[int] = []
-    dst_list: List[int] = []
-    capacity_list: List[float] = []
-    cost_list: List[float] = []
-    ext_edge_id_list: List[int] = []
-
-    for link_id in link_ids:
-        link = network.links[link_id]
-        src_id = node_mapper.to_id(link.source)
-        dst_id = node_mapper.to_id(link.target)
-
-        # Forward edge
-        src_list.append(src_id)
-        dst_list.append(dst_id)
-        capacity_list.append(link.capacity)
-        cost_list.append(link.cost)
-        ext_edge_id_list.append(edge_mapper.encode_ext_id(link_id, "fwd"))
-
-        # Reverse edge
-        if add_reverse:
-            src_list.append(dst_id)
-            dst_list.append(src_id)
-            capacity_list.append(link.capacity)
-            cost_list.append(link.cost)
-            ext_edge_id_list.append(edge_mapper.encode_ext_id(link_id, "rev"))
-
-    # Add augmentation edges
+    # Network edge arrays; ext id encodes (link_index << 1) | direction bit
+    num_links = len(link_ids)
+    fwd_ext_ids = np.arange(num_links, dtype=np.int64) << 1
+    if add_reverse:
+        src_arr = np.empty(2 * num_links, dtype=np.int32)
+        dst_arr = np.empty(2 * num_links, dtype=np.int32)
+        src_arr[0::2] = arrays.src
+        src_arr[1::2] = arrays.dst
+        dst_arr[0::2] = arrays.dst
+        dst_arr[1::2] = arrays.src
+        capacity_arr = np.repeat(arrays.capacity, 2)
+        cost_arr = np.repeat(arrays.cost.astype(np.int64), 2)
+        ext_edge_ids_arr = np.empty(2 * num_links, dtype=np.int64)
+        ext_edge_ids_arr[0::2] = fwd_ext_ids
+        ext_edge_ids_arr[1::2] = fwd_ext_ids | 1
+    else:
+        src_arr = arrays.src.astype(np.int32)
+        dst_arr = arrays.dst.astype(np.int32)
+        capacity_arr = arrays.capacity
+        cost_arr = arrays.cost.astype(np.int64)
+        ext_edge_ids_arr = fwd_ext_ids
+
+    # Append augmentation edges
     if augmentations:
-        for aug_edge in augmentations:
-            src_id = node_mapper.to_id(aug_edge.source)
-            dst_id = node_mapper.to_id(aug_edge.target)
-            src_list.append(src_id)
-            dst_list.append(dst_id)
-            capacity_list.append(aug_edge.capacity)
-            cost_list.append(aug_edge.cost)
-            ext_edge_id_list.append(-1)  # Sentinel: not a network edge
-
-    # Convert to numpy arrays
-    src_arr = np.array(src_list, dtype=np.int32)
-    dst_arr = np.array(dst_list, dtype=np.int32)
-    capacity_arr = np.array(capacity_list, dtype=np.float64)
-    cost_arr = np.array(cost_list, dtype=np.int64)
-    ext_edge_ids_arr = np.array(ext_edge_id_list, dtype=np.int64)
+        node_id_of = node_mapper.node_id_of
+        num_aug = len(augmentations)
+        src_arr = np.concatenate(
+            (
+                src_arr,
+                np.fromiter(
+                    (node_id_of[a.source] for a in augmentations),
+                    dtype=np.int32,
+                    count=num_aug,
+                ),
+            )
+        )
+        dst_arr = np.concatenate(
+            (
+                dst_arr,
+                np.fromiter(
+                    (node_id_of[a.target] for a in augmentations),
+                    dtype=np.int32,
+                    count=num_aug,
+                ),
+            )
+        )
+        capacity_arr = np.concatenate(
+            (
+                capacity_arr,
+                np.fromiter(
+                    (a.capacity for a in augmentations),
+                    dtype=np.float64,
+                    count=num_aug,
+                ),
+            )
+        )
+        cost_arr = np.concatenate(
+            (
+                cost_arr,
+                np.array([a.cost for a in augmentations], dtype=np.int64),
+            )
+        )
+        # Sentinel -1: not a network edge
+        ext_edge_ids_arr = np.concatenate(
+            (ext_edge_ids_arr, np.full(num_aug, -1, dtype=np.int64))
+        )
 
     # Build StrictMultiDiGraph
     multidigraph = netgraph_core.StrictMultiDiGraph.from_arrays(
@@ -1576,32 +1900,43 @@ def _build_graph_core(
     algorithms = netgraph_core.Algorithms(backend)
     handle = algorithms.build_graph(multidigraph)
 
-    # Pre-compute disabled node IDs
-    disabled_node_ids: Set[int] = set()
-    for node_name, node in network.nodes.items():
-        if node.disabled and node_name in node_mapper.node_id_of:
-            disabled_node_ids.add(node_mapper.node_id_of[node_name])
+    # Pre-compute disabled node IDs (real node IDs equal their sorted position)
+    disabled_node_ids = frozenset(np.flatnonzero(arrays.node_disabled).tolist())
 
     # Pre-compute disabled link IDs
-    disabled_link_ids: Set[str] = {
-        link_id for link_id, link in network.links.items() if link.disabled
-    }
-
-    # Pre-compute link_id -> edge indices mapping
-    ext_edge_ids = multidigraph.ext_edge_ids_view()
-    link_id_to_edge_indices: Dict[str, List[int]] = {}
-    for edge_idx in range(len(ext_edge_ids)):
-        ext_id = int(ext_edge_ids[edge_idx])
-        if ext_id == -1:
-            continue
-        edge_ref = edge_mapper.decode_ext_id(ext_id)
-        if edge_ref:
-            link_id_to_edge_indices.setdefault(edge_ref.link_id, []).append(edge_idx)
+    disabled_link_ids = frozenset(
+        map(link_ids.__getitem__, np.flatnonzero(arrays.disabled).tolist())
+    )
 
-    # Convert to immutable structures
-    frozen_link_id_to_edge_indices = {
-        k: tuple(v) for k, v in link_id_to_edge_indices.items()
-    }
+    # Pre-compute link_id -> edge indices mapping. Core may reorder edges, so
+    # invert the ext id column rather than assuming the input layout.
+    ext_edge_ids = np.asarray(multidigraph.ext_edge_ids_view(), dtype=np.int64)
+    is_link_edge = ext_edge_ids >= 0
+    edge_index_of_ext = np.empty(2 * num_links, dtype=np.int64)
+    edge_index_of_ext[ext_edge_ids[is_link_edge]] = np.flatnonzero(is_link_edge)
+    frozen_link_id_to_edge_indices: Dict[str, Tuple[int, ...]]
+    if add_reverse:
+        fwd_idx = edge_index_of_ext[0::2]
+        rev_idx = edge_index_of_ext[1::2]
+        frozen_link_id_to_edge_indices = dict(
+            zip(
+                link_ids,
+                zip(
+                    np.minimum(fwd_idx, rev_idx).tolist(),
+                    np.maximum(fwd_idx, rev_idx).tolist(),
+                    strict=True,
+                ),
+                strict=True,
+            )
+        )
+    else:
+        frozen_link_id_to_edge_indices = dict(
+            zip(
+                link_ids,
+                ((idx,) for idx in edge_index_of_ext[0::2].tolist()),
+                strict=True,
+            )
+        )
 
     return _GraphBuildResult(
         _handle=handle,
@@ -1609,8 +1944,8 @@ def _build_graph_core(
         _node_mapper=node_mapper,
         _edge_mapper=edge_mapper,
         _algorithms=algorithms,
-        _disabled_node_ids=frozenset(disabled_node_ids),
-        _disabled_link_ids=frozenset(disabled_link_ids),
+        _disabled_node_ids=disabled_node_ids,
+        _disabled_link_ids=disabled_link_ids,
         _link_id_to_edge_indices=frozen_link_id_to_edge_indices,
     )
 
@@ -10,90 +10,64 @@ I is iteration count, A is per-iteration analysis cost, and P is parallelism.
 Graph caching amortizes expensive graph construction across all iterations,
 and O(|excluded|) mask building replaces O(V+E) iteration.
 
-Space complexity: O(V + E + I * R), where V and E are node and link counts,
-and R is result size per iteration. The pre-built graph is shared across
-all iterations.
+Space complexity: O(V + E + U * R), where V and E are node and link counts,
+U is the number of distinct failure patterns, and R is result size per
+pattern. Iterations are sampled in bounded chunks and streamed to the
+workers as new patterns appear, so memory does not grow with I and analysis
+starts before sampling finishes. The pre-built graph is shared across all
+iterations.
 
 Parallelism: The C++ Core backend releases the GIL during computation,
 enabling true parallelism with Python threads. With graph caching, most
 per-iteration work runs in GIL-free C++ code; speedup depends on workload
-and parallelism level.
+and parallelism level. With parallelism > 1, failure sampling also runs in
+the workers: each draws its own iterations from ``seed + i`` and deduplicates
+through a shared pattern table, producing the same patterns, counts, and
+traces as serial sampling.
 """
 
 from __future__ import annotations
 
-import hashlib
-import os
 import time
-from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING, Any, Dict, Optional, Protocol, Set
-
-from ngraph.dsl.selectors import flatten_link_attrs, flatten_node_attrs
+from collections import deque
+from collections.abc import Sized
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Protocol,
+)
+
+from ngraph.analysis.failure_patterns import (
+    SAMPLE_CHUNK_SIZE,
+    ConcurrentPatternTable,
+    FailurePattern,
+    FailurePatternSampler,
+    FailurePatternSet,
+    FailurePatternStore,
+)
 from ngraph.logging import get_logger
 from ngraph.model.failure.policy_set import FailurePolicySet
+from ngraph.profiling.memory import active_memory, approx_size, note_structure
+from ngraph.profiling.phases import count, phase
+from ngraph.profiling.workers import profile_worker_task
 from ngraph.types.base import FlowPlacement
 
 if TYPE_CHECKING:
-    import cProfile
-
     from ngraph.model.network import Network
+    from ngraph.utils.checkpoint import MonteCarloCheckpoint
 
 from ngraph.model.failure.policy import FailurePolicy
 
 logger = get_logger(__name__)
 
 
-def _is_hashable(obj: Any) -> bool:
-    """Return True if obj is hashable, False otherwise.
-
-    This avoids try/except TypeError patterns when checking hashability.
-    """
-    try:
-        hash(obj)
-        return True
-    except TypeError:
-        return False
-
-
-def _create_cache_key(
-    excluded_nodes: Set[str],
-    excluded_links: Set[str],
-    analysis_name: str,
-    analysis_kwargs: Dict[str, Any],
-) -> tuple:
-    """Create cache key from exclusions, analysis name, and parameters.
-
-    Args:
-        excluded_nodes: Set of excluded node names.
-        excluded_links: Set of excluded link IDs.
-        analysis_name: Name of the analysis function.
-        analysis_kwargs: Analysis function arguments.
-
-    Returns:
-        Tuple suitable for use as a cache key.
-    """
-    # Basic components that are always hashable
-    base_key = (
-        tuple(sorted(excluded_nodes)),
-        tuple(sorted(excluded_links)),
-        analysis_name,
-    )
-
-    # Normalize analysis_kwargs for hashing
-    hashable_kwargs = []
-    for key, value in sorted(analysis_kwargs.items()):
-        # Try to hash the (key, value) pair directly
-        if _is_hashable((key, value)):
-            hashable_kwargs.append((key, value))
-        else:
-            # Use object id for non-hashable values. Avoid str() which triggers
-            # deep __repr__ traversals on large objects (e.g., graphs with thousands
-            # of edges). id() works here because these objects persist across calls.
-            hashable_kwargs.append((key, f"{type(value).__name__}_{id(value)}"))
-
-    return base_key + (tuple(hashable_kwargs),)
-
-
 def _auto_adjust_parallelism(parallelism: int, analysis_func: Any) -> int:
     """Adjust parallelism based on function characteristics.
 
@@ -157,23 +131,6 @@ def _generic_worker(args: tuple[Any, ...]) -> tuple[Any, int, bool, set[str], se
         analysis_name,
     ) = args
 
-    # Optional per-worker profiling for performance analysis
-    profile_dir_env = os.getenv("NGRAPH_PROFILE_DIR")
-    collect_profile: bool = bool(profile_dir_env)
-
-    profiler: "cProfile.Profile | None" = None
-    if collect_profile:
-        # Install per-worker profiler when requested
-        import cProfile
-
-        profiler = cProfile.Profile()
-        try:
-            profiler.enable()
-        except ValueError:
-            # Another profiler is already active (e.g., pytest-cov in threading mode)
-            profiler = None
-            collect_profile = False
-
     import threading
 
     worker_id = threading.current_thread().name
@@ -182,33 +139,23 @@ def _generic_worker(args: tuple[Any, ...]) -> tuple[Any, int, bool, set[str], se
         f"excluded_nodes={len(excluded_nodes)}, excluded_links={len(excluded_links)}"
     )
 
-    # Execute analysis function with network and exclusion sets
+    # Execute analysis function with network and exclusion sets; profiled
+    # in memory when ``ngraph run --profile`` collects worker profiles
     worker_logger.debug(f"Worker {worker_id} executing {analysis_name}")
-    result = analysis_func(network, excluded_nodes, excluded_links, **analysis_kwargs)
+    with profile_worker_task():
+        result = analysis_func(
+            network, excluded_nodes, excluded_links, **analysis_kwargs
+        )
     worker_logger.debug(f"Worker {worker_id} completed analysis")
 
-    # Dump profile if enabled (for performance analysis)
-    if profiler is not None:
-        profiler.disable()
-        import pstats
-        import threading
-        import uuid
-        from pathlib import Path
-
-        profile_dir = Path(profile_dir_env) if profile_dir_env else None
-        if profile_dir is not None:
-            profile_dir.mkdir(parents=True, exist_ok=True)
-            unique_id = uuid.uuid4().hex[:8]
-            thread_id = threading.current_thread().ident
-            profile_path = (
-                profile_dir / f"{analysis_name}_thread_{thread_id}_{unique_id}.pstats"
-            )
-            pstats.Stats(profiler).dump_stats(profile_path)
-            worker_logger.debug("Saved worker profile to %s", profile_path.name)
-
     return (result, iteration_index, is_baseline, excluded_nodes, excluded_links)
 
 
+def _analysis_result(args: tuple[Any, ...]) -> Any:
+    """Run ``_generic_worker`` and return only the analysis result."""
+    return _generic_worker(args)[0]
+
+
 class FailureManager:
     """Failure analysis engine with Monte Carlo capabilities.
 
@@ -224,6 +171,10 @@ class FailureManager:
         network: The underlying network (not modified during analysis).
         failure_policy_set: Set of named failure policies.
         policy_name: Name of specific failure policy to use.
+        pattern_store: Store of sampled failure patterns and flattened attrs,
+            shared by all FailureManagers of a scenario run.
+        checkpoint: Optional progress file; Monte Carlo runs save and resume
+            their sampled patterns and results through it.
     """
 
     def __init__(
@@ -231,6 +182,8 @@ class FailureManager:
         network: "Network",
         failure_policy_set: FailurePolicySet,
         policy_name: str | None = None,
+        pattern_store: FailurePatternStore | None = None,
+        checkpoint: "MonteCarloCheckpoint | None" = None,
     ) -> None:
         """Initialize FailureManager.
 
@@ -238,12 +191,22 @@ class FailureManager:
             network: Network to analyze (read-only, not modified).
             failure_policy_set: Set of named failure policies.
             policy_name: Name of specific policy to use. If None, no failure policy is applied.
+            pattern_store: Optional shared store (e.g. ``scenario.failure_pattern_store``).
+                Seeded runs with the same policy, seed, and iteration count reuse
+                its patterns instead of sampling again. A private store is used
+                when omitted.
+            checkpoint: Optional Monte Carlo progress file (see
+                ``ngraph.utils.checkpoint``). Failure iterations are then run in
+                segments and progress is saved periodically; a matching saved
+                run is resumed after its last completed segment.
         """
         self.network = network
         self.failure_policy_set = failure_policy_set
         self.policy_name = policy_name
-        self._merged_node_attrs: dict[str, dict[str, Any]] | None = None
-        self._merged_link_attrs: dict[str, dict[str, Any]] | None = None
+        if pattern_store is not None and pattern_store.network is not network:
+            raise ValueError("pattern_store belongs to a different network")
+        self.pattern_store = pattern_store or FailurePatternStore(network)
+        self.checkpoint = checkpoint
 
     def get_failure_policy(self) -> "FailurePolicy | None":
         """Get failure policy for analysis.
@@ -293,21 +256,24 @@ class FailureManager:
         if policy is None:
             return excluded_nodes, excluded_links
 
-        # Build merged views of nodes and links including top-level fields required by
-        # policy matching and risk-group expansion. Results are cached for reuse.
-        if self._merged_node_attrs is None:
-            self._merged_node_attrs = {
-                node_name: flatten_node_attrs(node)
-                for node_name, node in self.network.nodes.items()
-            }
-        if self._merged_link_attrs is None:
-            self._merged_link_attrs = {
-                link_id: flatten_link_attrs(link, link_id)
-                for link_id, link in self.network.links.items()
-            }
+        with phase("failures.sample"):
+            self._apply_policy(
+                policy, seed_offset, failure_trace, excluded_nodes, excluded_links
+            )
+        return excluded_nodes, excluded_links
 
-        node_map = self._merged_node_attrs
-        link_map = self._merged_link_attrs
+    def _apply_policy(
+        self,
+        policy: "FailurePolicy",
+        seed_offset: int | None,
+        failure_trace: Optional[Dict[str, Any]],
+        excluded_nodes: set[str],
+        excluded_links: set[str],
+    ) -> None:
+        """Add the entities failed by ``policy`` to the exclusion sets."""
+        # Merged views of nodes and links including top-level fields required by
+        # policy matching and risk-group expansion, built once per pattern store.
+        node_map, link_map = self.pattern_store.flattened_attrs()
 
         # Apply failure policy with optional deterministic seed override
         failed_ids = policy.apply_failures(
@@ -340,8 +306,6 @@ class FailureManager:
                     # Check children recursively
                     to_check.extend(grp.children)
 
-        return excluded_nodes, excluded_links
-
     def run_monte_carlo_analysis(
         self,
         analysis_func: AnalysisFunction,
@@ -432,10 +396,6 @@ class FailureManager:
             f"parallelism={parallelism}, policy={self.policy_name}"
         )
 
-        # Pre-compute worker arguments for all iterations
-        logger.debug("Pre-computing failure exclusions for all iterations")
-        pre_compute_start = time.time()
-
         # Baseline is always run first (no failures, separate from failure iterations)
         baseline_arg = (
             self.network,
@@ -448,58 +408,43 @@ class FailureManager:
             func_name,
         )
 
-        # Build failure iteration arguments (indexed 0..iterations-1)
-        worker_args: list[tuple] = []
-        key_to_first_arg: dict[tuple, tuple] = {}
-        key_to_count: dict[tuple, int] = {}
-        key_to_trace: dict[tuple, dict[str, Any]] = {}
-
-        for i in range(iterations):
-            seed_offset = seed + i if seed is not None else None
-
-            # Pre-compute exclusions for this failure iteration
-            trace = {} if store_failure_patterns else None
-            excluded_nodes, excluded_links = self.compute_exclusions(
-                policy, seed_offset, failure_trace=trace
+        # Distinct failure patterns in first-occurrence order. Seeded runs already
+        # sampled by another step come from the shared pattern store. Shard runs
+        # cover only their slice of the iterations.
+        shard = getattr(self.checkpoint, "shard", None)
+        run = (
+            shard.iteration_range(iterations)
+            if shard is not None
+            else range(iterations)
+        )
+        policy_name = self.policy_name or ""
+        cached = (
+            self.pattern_store.lookup(
+                policy_name, policy, seed, run, store_failure_patterns
             )
+            if iterations > 0 and policy is not None
+            else None
+        )
+        patterns: list[FailurePattern] = list(cached.patterns) if cached else []
 
-            arg = (
+        def _worker_arg(p: FailurePattern) -> tuple:
+            return (
                 self.network,
-                excluded_nodes,
-                excluded_links,
+                set(p.excluded_nodes),
+                set(p.excluded_links),
                 analysis_func,
                 analysis_kwargs,
-                i,  # iteration_index (0-based for failures)
+                p.first_iteration,
                 False,  # is_baseline
                 func_name,
             )
-            worker_args.append(arg)
-
-            # Build deduplication key (excludes iteration index)
-            dedup_key = _create_cache_key(
-                excluded_nodes, excluded_links, func_name, analysis_kwargs
-            )
-            if dedup_key not in key_to_first_arg:
-                key_to_first_arg[dedup_key] = arg
-                key_to_count[dedup_key] = 1
-                # Store trace for first occurrence
-                if trace is not None:
-                    key_to_trace[dedup_key] = trace
-            else:
-                key_to_count[dedup_key] += 1
 
-        pre_compute_time = time.time() - pre_compute_start
-        logger.debug(
-            f"Pre-computed {len(worker_args)} failure exclusion sets in {pre_compute_time:.2f}s"
-        )
-
-        # Prepare unique tasks (deduplicated by failure pattern + analysis params)
-        unique_worker_args: list[tuple] = list(key_to_first_arg.values())
-        num_unique_tasks: int = len(unique_worker_args)
-        if iterations > 0:
-            logger.info(
-                f"Monte-Carlo deduplication: {num_unique_tasks} unique patterns from {iterations} failure iterations"
-            )
+        def _streamed_worker_args(sampler: FailurePatternSampler) -> Iterator[tuple]:
+            # Sampling runs in bounded chunks while workers analyze patterns
+            # already seen
+            for p in sampler.iter_new_patterns(run, SAMPLE_CHUNK_SIZE):
+                patterns.append(p)
+                yield _worker_arg(p)
 
         start_time = time.time()
 
@@ -513,62 +458,90 @@ class FailureManager:
             baseline_result.failure_state = {"excluded_nodes": [], "excluded_links": []}
             baseline_result.failure_trace = None  # No policy applied for baseline
 
-        # Execute failure iterations (deduplicated)
-        if iterations > 0:
-            use_parallel = parallelism > 1 and num_unique_tasks > 1
-            if use_parallel:
-                unique_result_values = self._run_parallel(
-                    unique_worker_args, num_unique_tasks, parallelism
+        # Execute failure iterations (one analysis per distinct pattern)
+        unique_result_values: list[Any] = []
+        if iterations > 0 and policy is not None:
+            use_parallel = parallelism > 1 and iterations > 1
+            sample_start = time.time()
+            if self.checkpoint is not None:
+                pattern_set, unique_result_values = self._run_checkpointed(
+                    self.checkpoint,
+                    policy,
+                    run,
+                    iterations,
+                    seed,
+                    store_failure_patterns,
+                    analysis_func,
+                    analysis_kwargs,
+                    func_name,
+                    parallelism if use_parallel else 1,
+                    cached=cached,
+                )
+                patterns = pattern_set.patterns
+                if cached is None:
+                    self.pattern_store.put(policy_name, policy, seed, run, pattern_set)
+            elif cached is not None:
+                worker_args = [_worker_arg(p) for p in patterns]
+                unique_result_values = (
+                    self._run_parallel(worker_args, len(worker_args), parallelism)
+                    if use_parallel and len(worker_args) > 1
+                    else self._run_serial(worker_args)
+                )
+            elif use_parallel:
+                # Workers draw their own iterations (seed + i) and dedup them
+                # through a shared table; the outcome equals serial sampling.
+                pattern_set, unique_result_values = self._run_parallel_sampling(
+                    policy,
+                    run,
+                    seed,
+                    store_failure_patterns,
+                    analysis_func,
+                    analysis_kwargs,
+                    func_name,
+                    parallelism,
                 )
+                patterns = pattern_set.patterns
+                self.pattern_store.put(policy_name, policy, seed, run, pattern_set)
             else:
-                unique_result_values = self._run_serial(unique_worker_args)
-
-            # Map unique task results back to their dedup keys
-            key_to_result: dict[tuple, Any] = {}
-            for (dedup_key, _arg), value in zip(
-                key_to_first_arg.items(), unique_result_values, strict=True
-            ):
-                key_to_result[dedup_key] = value
-        else:
-            key_to_result = {}
+                sampler = self._sampler(policy, seed, store_failure_patterns)
+                unique_result_values = self._run_serial(_streamed_worker_args(sampler))
+                self.pattern_store.put(
+                    policy_name, policy, seed, run, sampler.pattern_set()
+                )
+            logger.debug(
+                f"Sampled and analyzed {iterations} failure iterations in "
+                f"{time.time() - sample_start:.2f}s"
+            )
+            logger.info(
+                f"Monte-Carlo deduplication: {len(patterns)} unique patterns from {iterations} failure iterations"
+            )
+            count("failures.iterations", len(run))
+            count("failures.unique_patterns", len(patterns))
+        num_unique_tasks = len(patterns)
 
         elapsed_time = time.time() - start_time
 
         # Enrich unique failure results with metadata and occurrence_count
         results: list[Any] = []
-        for dedup_key, rep_arg in key_to_first_arg.items():
-            result = key_to_result.get(dedup_key)
+        for pattern, result in zip(patterns, unique_result_values, strict=True):
             if result is None:
                 continue
 
-            exc_nodes: set[str] = rep_arg[1]
-            exc_links: set[str] = rep_arg[2]
-
-            # Compute failure_id (hash of exclusions, or "" for empty)
-            if not exc_nodes and not exc_links:
-                fid = ""
-            else:
-                payload = (
-                    ",".join(sorted(exc_nodes)) + "|" + ",".join(sorted(exc_links))
-                )
-                fid = hashlib.blake2s(
-                    payload.encode("utf-8"), digest_size=8
-                ).hexdigest()
-
             # Enrich FlowIterationResult-like objects
             if hasattr(result, "failure_id") and hasattr(result, "summary"):
-                result.failure_id = fid
+                result.failure_id = pattern.failure_id
                 result.failure_state = {
-                    "excluded_nodes": list(exc_nodes),
-                    "excluded_links": list(exc_links),
+                    "excluded_nodes": list(pattern.excluded_nodes),
+                    "excluded_links": list(pattern.excluded_links),
                 }
-                result.failure_trace = (
-                    key_to_trace.get(dedup_key) if store_failure_patterns else None
-                )
-                result.occurrence_count = key_to_count[dedup_key]
+                result.failure_trace = pattern.trace if store_failure_patterns else None
+                result.occurrence_count = pattern.count
 
             results.append(result)
 
+        if active_memory() is not None:
+            note_structure("monte_carlo_results", approx_size(results))
+
         return {
             "baseline": baseline_result,
             "results": results,
@@ -582,11 +555,260 @@ class FailureManager:
             },
         }
 
+    def _sampler(
+        self,
+        policy: "FailurePolicy",
+        seed: int | None,
+        with_traces: bool,
+    ) -> FailurePatternSampler:
+        """Return an incremental pattern sampler bound to ``policy``."""
+        return FailurePatternSampler(
+            lambda seed_offset, trace: self.compute_exclusions(
+                policy, seed_offset, failure_trace=trace
+            ),
+            seed,
+            with_traces=with_traces,
+        )
+
+    def _run_parallel_sampling(
+        self,
+        policy: "FailurePolicy",
+        iterations: range,
+        seed: int | None,
+        with_traces: bool,
+        analysis_func: AnalysisFunction,
+        analysis_kwargs: Dict[str, Any],
+        func_name: str,
+        parallelism: int,
+        table: ConcurrentPatternTable | None = None,
+        known_results: Dict[int, Any] | None = None,
+    ) -> tuple[FailurePatternSet, list[Any]]:
+        """Sample and analyze failure iterations inside worker threads.
+
+        Iterations are split into contiguous blocks. Each worker draws its
+        block with seeds ``seed + i``, records every draw in a shared
+        ``ConcurrentPatternTable`` and analyzes only the patterns it records
+        first. Counts, first iterations, and traces match serial sampling.
+
+        Args:
+            table: Table holding patterns of earlier iterations, if continuing
+                a run. A new table is used when omitted.
+            known_results: Analysis results of the patterns already in
+                ``table``, keyed by ``id(pattern)``.
+
+        Returns:
+            Tuple of (pattern set in first-occurrence order, analysis results
+            aligned with ``pattern_set.patterns``).
+        """
+        if table is None:
+            table = ConcurrentPatternTable(with_traces)
+        workers = max(1, min(parallelism, len(iterations)))
+        block = max(1, min(SAMPLE_CHUNK_SIZE, len(iterations) // (workers * 8)))
+        blocks = (
+            range(start, min(start + block, iterations.stop))
+            for start in range(iterations.start, iterations.stop, block)
+        )
+
+        def _sample_block(block_range: range) -> list[tuple[FailurePattern, Any]]:
+            analyzed: list[tuple[FailurePattern, Any]] = []
+            for i in block_range:
+                trace: Optional[Dict[str, Any]] = {} if with_traces else None
+                excluded_nodes, excluded_links = self.compute_exclusions(
+                    policy,
+                    seed + i if seed is not None else None,
+                    failure_trace=trace,
+                )
+                pattern, is_new = table.record(i, excluded_nodes, excluded_links, trace)
+                if is_new:
+                    result = _analysis_result(
+                        (
+                            self.network,
+                            excluded_nodes,
+                            excluded_links,
+                            analysis_func,
+                            analysis_kwargs,
+                            i,
+                            False,  # is_baseline
+                            func_name,
+                        )
+                    )
+                    analyzed.append((pattern, result))
+            return analyzed
+
+        analyzed_blocks = self._run_parallel(
+            blocks, None, workers, worker=_sample_block
+        )
+        result_by_pattern = dict(known_results or {})
+        result_by_pattern.update(
+            (id(pattern), result)
+            for analyzed in analyzed_blocks
+            for pattern, result in analyzed
+        )
+        pattern_set = table.pattern_set()
+        results = [result_by_pattern[id(p)] for p in pattern_set.patterns]
+        return pattern_set, results
+
+    def _run_checkpointed(
+        self,
+        checkpoint: "MonteCarloCheckpoint",
+        policy: "FailurePolicy",
+        iterations: range,
+        total_iterations: int,
+        seed: int | None,
+        with_traces: bool,
+        analysis_func: AnalysisFunction,
+        analysis_kwargs: Dict[str, Any],
+        func_name: str,
+        parallelism: int,
+        cached: FailurePatternSet | None = None,
+    ) -> tuple[FailurePatternSet, list[Any]]:
+        """Sample and analyze failure iterations in segments with checkpoints.
+
+        Segments of ``SAMPLE_CHUNK_SIZE * parallelism`` iterations run one
+        after another (serially or with in-worker sampling). After a segment,
+        the completed iteration prefix, the pattern table, and the analysis
+        results are saved when the checkpoint interval has elapsed. Saved
+        progress with the same signature is restored first, so only the
+        remaining iterations run.
+
+        ``iterations`` is the slice to run: all of ``range(total_iterations)``,
+        or one shard of it when the checkpoint has a shard. Shard runs always
+        save their final progress so that ``ngraph merge`` can combine them.
+        Patterns already sampled by another step (``cached``) are analyzed
+        instead of sampled again.
+
+        Returns:
+            Tuple of (pattern set in first-occurrence order, analysis results
+            aligned with ``pattern_set.patterns``).
+        """
+        from ngraph.utils.checkpoint import MonteCarloProgress
+
+        signature = (
+            func_name,
+            self.policy_name,
+            seed,
+            0,
+            total_iterations,
+            with_traces,
+        )
+        use_parallel = parallelism > 1
+        table = ConcurrentPatternTable(with_traces) if use_parallel else None
+        sampler = None if use_parallel else self._sampler(policy, seed, with_traces)
+
+        start = iterations.start
+        result_by_pattern: Dict[int, Any] = {}
+        progress = checkpoint.load(signature)
+        if progress is not None and (
+            progress.start_iteration != iterations.start
+            or progress.next_iteration > iterations.stop
+        ):
+            progress = None
+        if progress is None and cached is not None:
+            worker_args = [
+                (
+                    self.network,
+                    set(p.excluded_nodes),
+                    set(p.excluded_links),
+                    analysis_func,
+                    analysis_kwargs,
+                    p.first_iteration,
+                    False,  # is_baseline
+                    func_name,
+                )
+                for p in cached.patterns
+            ]
+            results = (
+                self._run_parallel(worker_args, len(worker_args), parallelism)
+                if parallelism > 1 and len(worker_args) > 1
+                else self._run_serial(worker_args)
+            )
+            progress = MonteCarloProgress(
+                iterations.stop, cached, results, iterations.start
+            )
+            if checkpoint.shard is not None:
+                checkpoint.save(signature, progress)
+            return cached, results
+        if progress is not None:
+            (table if table is not None else sampler).restore(progress.patterns)  # type: ignore[union-attr]
+            result_by_pattern = {
+                id(p): r
+                for p, r in zip(
+                    progress.patterns.patterns, progress.results, strict=True
+                )
+            }
+            start = progress.next_iteration
+
+        def _snapshot() -> tuple[FailurePatternSet, list[Any]]:
+            pattern_set = (
+                table.pattern_set() if table is not None else sampler.pattern_set()  # type: ignore[union-attr]
+            )
+            return pattern_set, [result_by_pattern[id(p)] for p in pattern_set.patterns]
+
+        def _segment_args(seg: range, sink: list[FailurePattern]) -> Iterator[tuple]:
+            for p in sampler.iter_new_patterns(seg, SAMPLE_CHUNK_SIZE):  # type: ignore[union-attr]
+                sink.append(p)
+                yield (
+                    self.network,
+                    set(p.excluded_nodes),
+                    set(p.excluded_links),
+                    analysis_func,
+                    analysis_kwargs,
+                    p.first_iteration,
+                    False,  # is_baseline
+                    func_name,
+                )
+
+        segment = max(1, SAMPLE_CHUNK_SIZE * parallelism)
+        for seg_start in range(start, iterations.stop, segment):
+            seg = range(seg_start, min(seg_start + segment, iterations.stop))
+            if table is not None:
+                pattern_set, results = self._run_parallel_sampling(
+                    policy,
+                    seg,
+                    seed,
+                    with_traces,
+                    analysis_func,
+                    analysis_kwargs,
+                    func_name,
+                    parallelism,
+                    table=table,
+                    known_results=result_by_pattern,
+                )
+                result_by_pattern = {
+                    id(p): r for p, r in zip(pattern_set.patterns, results, strict=True)
+                }
+            else:
+                new_patterns: list[FailurePattern] = []
+                new_results = self._run_serial(_segment_args(seg, new_patterns))
+                result_by_pattern.update(
+                    zip(map(id, new_patterns), new_results, strict=True)
+                )
+            if seg.stop < iterations.stop and checkpoint.due():
+                pattern_set, results = _snapshot()
+                checkpoint.save(
+                    signature,
+                    MonteCarloProgress(
+                        seg.stop, pattern_set, results, iterations.start
+                    ),
+                )
+
+        if checkpoint.shard is not None:
+            pattern_set, results = _snapshot()
+            checkpoint.save(
+                signature,
+                MonteCarloProgress(
+                    iterations.stop, pattern_set, results, iterations.start
+                ),
+            )
+            return pattern_set, results
+        return _snapshot()
+
     def _run_parallel(
         self,
-        worker_args: list[tuple],
-        total_tasks: int,
+        worker_args: Iterable[Any],
+        total_tasks: int | None,
         parallelism: int,
+        worker: Callable[[Any], Any] | None = None,
     ) -> list[Any]:
         """Run analysis in parallel using shared network approach.
 
@@ -595,101 +817,102 @@ class FailureManager:
         only small exclusion sets, and the C++ Core backend releases the GIL
         during computation to enable true parallelism.
 
+        Tasks are pulled from ``worker_args`` lazily and at most
+        ``4 * workers`` are in flight, so a streamed task source (e.g. failure
+        patterns sampled on the fly) keeps memory bounded and workers start
+        as soon as the first task exists.
+
         Args:
-            worker_args: Pre-computed worker arguments for all iterations.
-            total_tasks: Number of tasks to run.
+            worker_args: Worker arguments, in result order. May be a generator.
+            total_tasks: Number of tasks if known (used for logging only).
             parallelism: Number of parallel worker threads to use.
+            worker: Task function whose return values are collected. Defaults
+                to the analysis result of ``_generic_worker``.
 
         Returns:
-            List of analysis results.
+            List of analysis results in task order.
         """
-        workers = min(parallelism, total_tasks)
+        workers = parallelism if total_tasks is None else min(parallelism, total_tasks)
+        workers = max(1, workers)
+        total_label = str(total_tasks) if total_tasks is not None else "streamed"
         logger.info(
-            f"Running parallel analysis with {workers} workers for {total_tasks} iterations"
+            f"Running parallel analysis with {workers} workers for {total_label} tasks"
         )
 
         # Network is shared by reference (zero-copy) across threads
         logger.debug(f"Sharing network by reference across {workers} threads")
 
-        # Calculate optimal chunksize to minimize overhead
-        chunksize = max(1, total_tasks // (workers * 4))
-        logger.debug(f"Using chunksize={chunksize} for parallel execution")
+        task = worker if worker is not None else _analysis_result
+        window = workers * 4
+        progress_step = (
+            max(1, total_tasks // 10)
+            if total_tasks is not None and total_tasks >= 20
+            else None
+        )
 
         start_time = time.time()
-        completed_tasks = 0
-        results = []
+        results: list[Any] = []
+        pending: deque[Future] = deque()
+
+        def _collect_oldest() -> None:
+            results.append(pending.popleft().result())
+            if progress_step is not None and len(results) % progress_step == 0:
+                logger.info(
+                    f"Parallel analysis progress: {len(results)}/{total_tasks} tasks completed"
+                )
 
-        with ThreadPoolExecutor(
-            max_workers=workers,
-        ) as pool:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
             logger.debug(
                 f"ThreadPoolExecutor created with {workers} workers and shared network"
             )
-            logger.info(f"Starting parallel execution of {total_tasks} iterations")
-
-            for (
-                result,
-                _iteration_index,
-                _is_baseline,
-                _excluded_nodes,
-                _excluded_links,
-            ) in pool.map(_generic_worker, worker_args, chunksize=chunksize):
-                completed_tasks += 1
-                results.append(result)
-
-                # Progress logging (throttle for small N at INFO)
-                if total_tasks >= 20:
-                    # Show approx 10% increments
-                    step = max(1, total_tasks // 10)
-                    if completed_tasks % step == 0:
-                        logger.info(
-                            f"Parallel analysis progress: {completed_tasks}/{total_tasks} tasks completed"
-                        )
+            try:
+                for arg in worker_args:
+                    # Each task runs in a copy of the caller's context so
+                    # phase timers reach the step recorder
+                    pending.append(pool.submit(copy_context().run, task, arg))
+                    if len(pending) >= window:
+                        _collect_oldest()
+                while pending:
+                    _collect_oldest()
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
 
         elapsed_time = time.time() - start_time
         logger.info(f"Parallel analysis completed in {elapsed_time:.2f} seconds")
-        logger.debug(
-            f"Average time per iteration: {elapsed_time / total_tasks:.3f} seconds"
-        )
+        if results:
+            logger.debug(
+                f"Average time per task: {elapsed_time / len(results):.3f} seconds"
+            )
 
         return results
 
     def _run_serial(
         self,
-        worker_args: list[tuple],
+        worker_args: Iterable[tuple],
     ) -> list[Any]:
         """Run analysis serially for single process execution.
 
         Args:
-            worker_args: Pre-computed worker arguments for all iterations.
+            worker_args: Worker arguments, in result order. May be a generator.
 
         Returns:
             List of analysis results.
         """
         logger.info("Running serial analysis")
         start_time = time.time()
+        total = len(worker_args) if isinstance(worker_args, Sized) else None
+        total_label = str(total) if total is not None else "?"
 
         results = []
 
-        # In serial mode, disable worker-level profiling in the current process
-        # to avoid nesting profilers when the CLI has already enabled step-level
-        # profiling. This prevents errors from profilers that require exclusivity.
-        _restore_profile_env = False
-        _saved_profile_dir = os.environ.get("NGRAPH_PROFILE_DIR")
-        if _saved_profile_dir:
-            # Temporarily remove the env var so _generic_worker skips profiling
-            os.environ.pop("NGRAPH_PROFILE_DIR", None)
-            _restore_profile_env = True
-            logger.debug(
-                "Temporarily disabled NGRAPH_PROFILE_DIR for serial execution to avoid nested profilers"
-            )
-
         for i, args in enumerate(worker_args):
             iter_start = time.time()
 
             is_baseline_arg = len(args) > 6 and args[6]  # is_baseline flag
             baseline_msg = " (baseline)" if is_baseline_arg else ""
-            logger.debug(f"Serial iteration {i + 1}/{len(worker_args)}{baseline_msg}")
+            logger.debug(f"Serial iteration {i + 1}/{total_label}{baseline_msg}")
 
             (
                 result,
@@ -701,26 +924,22 @@ class FailureManager:
 
             results.append(result)
 
-            iter_time = time.time() - iter_start
-            if len(worker_args) <= 10:
+            if total is not None and total <= 10:
                 logger.debug(
-                    f"Serial iteration {i + 1} completed in {iter_time:.3f} seconds"
+                    f"Serial iteration {i + 1} completed in "
+                    f"{time.time() - iter_start:.3f} seconds"
                 )
 
-            if len(worker_args) > 1 and (i + 1) % max(1, len(worker_args) // 10) == 0:
+            if total is not None and total > 1 and (i + 1) % max(1, total // 10) == 0:
                 logger.info(
-                    f"Serial analysis progress: {i + 1}/{len(worker_args)} iterations completed"
+                    f"Serial analysis progress: {i + 1}/{total} iterations completed"
                 )
 
-        # Restore worker profiling env var if we changed it
-        if _restore_profile_env:
-            os.environ["NGRAPH_PROFILE_DIR"] = _saved_profile_dir or ""
-
         elapsed_time = time.time() - start_time
         logger.info(f"Serial analysis completed in {elapsed_time:.2f} seconds")
-        if len(worker_args) > 1:
+        if len(results) > 1:
             logger.debug(
-                f"Average time per iteration: {elapsed_time / len(worker_args):.3f} seconds"
+                f"Average time per iteration: {elapsed_time / len(results):.3f} seconds"
             )
 
         return results
@@ -890,6 +1109,8 @@ class FailureManager:
         store_failure_patterns: bool = False,
         include_flow_details: bool = False,
         include_used_edges: bool = False,
+        include_link_utilization: bool = False,
+        utilization_bins: int = 10,
     ) -> Any:
         """Analyze traffic demand placement success under failures.
 
@@ -907,6 +1128,9 @@ class FailureManager:
             store_failure_patterns: Whether to store failure trace on results.
             include_flow_details: Whether to include cost distribution details.
             include_used_edges: Whether to include used edges in results.
+            include_link_utilization: Whether to accumulate per-link utilization
+                statistics across failure iterations.
+            utilization_bins: Histogram bins over [0, 1] for link utilization.
 
         Returns:
             Dictionary with keys:
@@ -914,6 +1138,8 @@ class FailureManager:
             - 'results': List of unique FlowIterationResult objects (deduplicated patterns).
               Each result has occurrence_count indicating how many iterations matched.
             - 'metadata': Execution metadata (iterations, unique_patterns, execution_time, etc.)
+            - 'link_utilization': With ``include_link_utilization``, the
+              ``LinkUtilizationAccumulator.to_dict()`` export.
         """
         from ngraph.analysis.functions import demand_placement_analysis
 
@@ -953,9 +1179,48 @@ class FailureManager:
             placement_rounds=placement_rounds,
             include_flow_details=include_flow_details,
             include_used_edges=include_used_edges,
+            include_link_flows=include_link_utilization,
         )
+        if include_link_utilization:
+            raw_results["link_utilization"] = self._process_link_utilization(
+                raw_results, utilization_bins
+            )
         return raw_results
 
+    def _process_link_utilization(
+        self, raw_results: dict[str, Any], bins: int
+    ) -> dict[str, Any]:
+        """Accumulate link flows of Monte Carlo results into utilization stats.
+
+        Consumes the ``link_flows`` arrays of the baseline and failure results
+        (they are removed from ``data``), weighting each unique failure result
+        by its occurrence_count. Counts are final only after sampling, so each
+        unique result keeps its float32 matrix until then: peak memory is
+        ``8 * num_links * unique_patterns`` bytes (e.g. 400 MB for 10,000 links
+        and 5,000 unique patterns), also in Monte Carlo checkpoints.
+
+        Args:
+            raw_results: Output of ``run_monte_carlo_analysis`` with link flows.
+            bins: Histogram bins over [0, 1].
+
+        Returns:
+            ``LinkUtilizationAccumulator.to_dict()`` export.
+        """
+        from ngraph.results.utilization import LinkUtilizationAccumulator
+
+        arrays = self.network.link_arrays()
+        accumulator = LinkUtilizationAccumulator(
+            arrays.link_ids, arrays.capacity, bins=bins
+        )
+        baseline = raw_results.get("baseline")
+        if baseline is not None and "link_flows" in baseline.data:
+            accumulator.set_baseline(baseline.data.pop("link_flows"))
+        for result in raw_results["results"]:
+            link_flows = result.data.pop("link_flows", None)
+            if link_flows is not None:
+                accumulator.add(link_flows, weight=result.occurrence_count)
+        return accumulator.to_dict()
+
     def run_sensitivity_monte_carlo(
         self,
         source: str | dict[str, Any],
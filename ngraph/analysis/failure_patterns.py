@@ -0,0 +1,417 @@
+"""Failure pattern sampling results shared across workflow steps.
+
+Monte Carlo steps that use the same failure policy and seed draw identical
+exclusion sets. ``FailurePatternStore`` keeps the deduplicated patterns of
+each sampling run (keyed by policy name, seed, and iteration range) together
+with the flattened node/link attribute views that policy matching needs, so a
+scenario samples, deduplicates, and hashes each failure set once no matter how
+many steps consume it.
+
+The store assumes the network is not modified while it is in use. Scenarios
+create a fresh store at the start of every run and drop it after every step
+that is not ``concurrent_safe``, since such steps may modify the network.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from ngraph.dsl.selectors import flatten_link_attrs, flatten_node_attrs
+from ngraph.logging import get_logger
+
+if TYPE_CHECKING:
+    from ngraph.model.failure.policy import FailurePolicy
+    from ngraph.model.network import Network
+
+logger = get_logger(__name__)
+
+# Iterations sampled per chunk when patterns are streamed to workers
+SAMPLE_CHUNK_SIZE = 1024
+
+ComputeExclusions = Callable[
+    [Optional[int], Optional[Dict[str, Any]]], Tuple[set[str], set[str]]
+]
+
+
+def failure_id_for(
+    excluded_nodes: FrozenSet[str], excluded_links: FrozenSet[str]
+) -> str:
+    """Return the stable identifier of an exclusion set ("" when empty)."""
+    if not excluded_nodes and not excluded_links:
+        return ""
+    payload = ",".join(sorted(excluded_nodes)) + "|" + ",".join(sorted(excluded_links))
+    return hashlib.blake2s(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@dataclass
+class FailurePattern:
+    """One distinct exclusion set drawn during Monte Carlo sampling.
+
+    Attributes:
+        excluded_nodes: Node names excluded by the pattern.
+        excluded_links: Link IDs excluded by the pattern.
+        count: Number of iterations that produced this pattern.
+        first_iteration: Index of the first iteration that produced it.
+        failure_id: Stable hash of the exclusions ("" for no failures).
+        trace: Policy trace of the first occurrence, if traces were recorded.
+    """
+
+    excluded_nodes: FrozenSet[str]
+    excluded_links: FrozenSet[str]
+    count: int
+    first_iteration: int
+    failure_id: str
+    trace: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class FailurePatternSet:
+    """Deduplicated patterns of one sampling run, in first-occurrence order.
+
+    Attributes:
+        patterns: Distinct patterns with occurrence counts.
+        iterations: Number of sampled iterations.
+        has_traces: True if each pattern carries its policy trace.
+    """
+
+    patterns: List[FailurePattern]
+    iterations: int
+    has_traces: bool = False
+
+
+class FailurePatternSampler:
+    """Incremental sampler that deduplicates draws as they are generated.
+
+    Memory grows with the number of distinct patterns, not with the number
+    of sampled iterations.
+
+    Args:
+        compute: Callable ``(seed_offset, trace) -> (excluded_nodes,
+            excluded_links)``, typically ``FailureManager.compute_exclusions``
+            bound to a policy.
+        seed: Base seed; iteration ``i`` uses ``seed + i``. None samples
+            non-deterministically.
+        with_traces: Record the policy trace of each pattern's first occurrence.
+    """
+
+    def __init__(
+        self,
+        compute: ComputeExclusions,
+        seed: Optional[int],
+        with_traces: bool = False,
+    ) -> None:
+        self._compute = compute
+        self._seed = seed
+        self._with_traces = with_traces
+        self._by_key: Dict[Tuple[FrozenSet[str], FrozenSet[str]], FailurePattern] = {}
+        self._iterations = 0
+
+    def restore(self, pattern_set: FailurePatternSet) -> None:
+        """Continue from previously sampled patterns (e.g. a checkpoint).
+
+        Later draws of a restored pattern update its count in place.
+        """
+        for p in pattern_set.patterns:
+            self._by_key[(p.excluded_nodes, p.excluded_links)] = p
+        self._iterations += pattern_set.iterations
+
+    def sample(self, iterations: range) -> List[FailurePattern]:
+        """Sample ``iterations`` and return the patterns first seen in them.
+
+        Counts of previously seen patterns are updated in place.
+        """
+        seed = self._seed
+        by_key = self._by_key
+        new: List[FailurePattern] = []
+        for i in iterations:
+            trace: Optional[Dict[str, Any]] = {} if self._with_traces else None
+            nodes, links = self._compute(seed + i if seed is not None else None, trace)
+            key = (frozenset(nodes), frozenset(links))
+            pattern = by_key.get(key)
+            if pattern is None:
+                pattern = by_key[key] = FailurePattern(
+                    excluded_nodes=key[0],
+                    excluded_links=key[1],
+                    count=1,
+                    first_iteration=i,
+                    failure_id=failure_id_for(*key),
+                    trace=trace,
+                )
+                new.append(pattern)
+            else:
+                pattern.count += 1
+        self._iterations += len(iterations)
+        return new
+
+    def iter_new_patterns(
+        self, iterations: range, chunk_size: int = SAMPLE_CHUNK_SIZE
+    ) -> Iterator[FailurePattern]:
+        """Sample ``iterations`` in chunks, yielding each new pattern once.
+
+        Counts are final only after the iterator is exhausted.
+        """
+        step = max(1, chunk_size)
+        for start in range(iterations.start, iterations.stop, step):
+            yield from self.sample(range(start, min(start + step, iterations.stop)))
+
+    def pattern_set(self) -> FailurePatternSet:
+        """Patterns sampled so far, in first-occurrence order."""
+        return FailurePatternSet(
+            patterns=list(self._by_key.values()),
+            iterations=self._iterations,
+            has_traces=self._with_traces,
+        )
+
+
+class ConcurrentPatternTable:
+    """Thread-safe deduplication table for patterns drawn by parallel workers.
+
+    Workers sample disjoint iteration ranges and record each draw here. The
+    first recorder of a pattern analyzes it; later draws only bump the count.
+    ``first_iteration`` and ``trace`` always reflect the lowest iteration that
+    produced the pattern, so the final set equals serial sampling regardless
+    of scheduling.
+
+    Args:
+        with_traces: Whether recorded draws carry policy traces.
+    """
+
+    def __init__(self, with_traces: bool = False) -> None:
+        self._with_traces = with_traces
+        self._lock = threading.Lock()
+        self._by_key: Dict[Tuple[FrozenSet[str], FrozenSet[str]], FailurePattern] = {}
+        self._iterations = 0
+
+    def restore(self, pattern_set: FailurePatternSet) -> None:
+        """Continue from patterns of earlier iterations (e.g. a checkpoint).
+
+        Restored patterns are never reported as new by ``record``.
+        """
+        with self._lock:
+            for p in pattern_set.patterns:
+                self._by_key[(p.excluded_nodes, p.excluded_links)] = p
+            self._iterations += pattern_set.iterations
+
+    def record(
+        self,
+        iteration: int,
+        excluded_nodes: set[str],
+        excluded_links: set[str],
+        trace: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[FailurePattern, bool]:
+        """Record the draw of one iteration.
+
+        Returns:
+            Tuple of (pattern, is_new). ``is_new`` is True for exactly one
+            caller per distinct pattern.
+        """
+        key = (frozenset(excluded_nodes), frozenset(excluded_links))
+        with self._lock:
+            self._iterations += 1
+            pattern = self._by_key.get(key)
+            if pattern is None:
+                pattern = self._by_key[key] = FailurePattern(
+                    excluded_nodes=key[0],
+                    excluded_links=key[1],
+                    count=1,
+                    first_iteration=iteration,
+                    failure_id=failure_id_for(*key),
+                    trace=trace,
+                )
+                return pattern, True
+            pattern.count += 1
+            if iteration < pattern.first_iteration:
+                pattern.first_iteration = iteration
+                pattern.trace = trace
+            return pattern, False
+
+    def pattern_set(self) -> FailurePatternSet:
+        """Recorded patterns in first-occurrence (serial) order."""
+        with self._lock:
+            patterns = sorted(self._by_key.values(), key=lambda p: p.first_iteration)
+            return FailurePatternSet(
+                patterns=patterns,
+                iterations=self._iterations,
+                has_traces=self._with_traces,
+            )
+
+
+def sample_failure_patterns(
+    compute: ComputeExclusions,
+    iterations: range,
+    seed: Optional[int],
+    with_traces: bool = False,
+) -> FailurePatternSet:
+    """Sample exclusion sets for ``iterations`` and deduplicate them.
+
+    Args:
+        compute: Callable ``(seed_offset, trace) -> (excluded_nodes,
+            excluded_links)``.
+        iterations: Iteration indices to sample. Iteration ``i`` uses seed
+            ``seed + i`` when a seed is given.
+        seed: Base seed, or None for non-deterministic sampling.
+        with_traces: Record the policy trace of each pattern's first occurrence.
+
+    Returns:
+        FailurePatternSet with patterns in first-occurrence order.
+    """
+    sampler = FailurePatternSampler(compute, seed, with_traces)
+    sampler.sample(iterations)
+    return sampler.pattern_set()
+
+
+@dataclass
+class _StoreEntry:
+    policy: "FailurePolicy"
+    patterns: FailurePatternSet
+
+
+@dataclass
+class FailurePatternStore:
+    """Scenario-scoped cache of sampled failure patterns and flattened attrs.
+
+    Thread-safe. Only seeded runs are cached; unseeded sampling is
+    non-deterministic and always recomputed.
+
+    Attributes:
+        network: Network the patterns and attribute views belong to.
+    """
+
+    network: "Network"
+    _node_attrs: Optional[Dict[str, Dict[str, Any]]] = field(default=None, repr=False)
+    _link_attrs: Optional[Dict[str, Dict[str, Any]]] = field(default=None, repr=False)
+    _entries: Dict[Tuple[Any, ...], _StoreEntry] = field(
+        default_factory=dict, repr=False
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _hits: int = 0
+    _misses: int = 0
+
+    def flattened_attrs(
+        self,
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Return flattened node and link attribute maps, built once."""
+        with self._lock:
+            if self._node_attrs is None or self._link_attrs is None:
+                self._node_attrs = {
+                    name: flatten_node_attrs(node)
+                    for name, node in self.network.nodes.items()
+                }
+                self._link_attrs = {
+                    link_id: flatten_link_attrs(link, link_id)
+                    for link_id, link in self.network.links.items()
+                }
+            return self._node_attrs, self._link_attrs
+
+    @staticmethod
+    def _key(
+        policy_name: str, seed: int, iterations: range, with_traces: bool
+    ) -> Tuple[Any, ...]:
+        return (policy_name, seed, iterations.start, iterations.stop, with_traces)
+
+    def lookup(
+        self,
+        policy_name: str,
+        policy: "FailurePolicy",
+        seed: Optional[int],
+        iterations: range,
+        with_traces: bool,
+    ) -> Optional[FailurePatternSet]:
+        """Return stored patterns for a sampling run, or None on a miss.
+
+        A run recorded with traces also satisfies requests without traces.
+        Unseeded runs always miss.
+
+        Args:
+            policy_name: Name of the failure policy in the scenario.
+            policy: Policy object (entries for a different object are ignored).
+            seed: Base seed.
+            iterations: Iteration range of the run.
+            with_traces: Whether policy traces are required.
+        """
+        if seed is None:
+            return None
+        candidates = (True,) if with_traces else (False, True)
+        with self._lock:
+            for traced in candidates:
+                entry = self._entries.get(
+                    self._key(policy_name, seed, iterations, traced)
+                )
+                if entry is not None and entry.policy is policy:
+                    self._hits += 1
+                    logger.debug(
+                        "Reusing %d failure patterns for policy=%s seed=%s",
+                        len(entry.patterns.patterns),
+                        policy_name,
+                        seed,
+                    )
+                    return entry.patterns
+            self._misses += 1
+        return None
+
+    def put(
+        self,
+        policy_name: str,
+        policy: "FailurePolicy",
+        seed: Optional[int],
+        iterations: range,
+        patterns: FailurePatternSet,
+    ) -> None:
+        """Store the patterns of a completed seeded sampling run."""
+        if seed is None:
+            return
+        key = self._key(policy_name, seed, iterations, patterns.has_traces)
+        with self._lock:
+            self._entries[key] = _StoreEntry(policy, patterns)
+
+    def get_or_sample(
+        self,
+        policy_name: str,
+        policy: "FailurePolicy",
+        seed: Optional[int],
+        iterations: range,
+        with_traces: bool,
+        sample: Callable[[], FailurePatternSet],
+    ) -> FailurePatternSet:
+        """Return stored patterns for a sampling run or sample and store them.
+
+        Args:
+            policy_name: Name of the failure policy in the scenario.
+            policy: Policy object.
+            seed: Base seed. None disables caching.
+            iterations: Iteration range of the run.
+            with_traces: Whether policy traces are required.
+            sample: Callable producing the patterns on a miss.
+
+        Returns:
+            FailurePatternSet for the run.
+        """
+        cached = self.lookup(policy_name, policy, seed, iterations, with_traces)
+        if cached is not None:
+            return cached
+        patterns = sample()
+        self.put(policy_name, policy, seed, iterations, patterns)
+        return patterns
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Lookup counters: ``hits``, ``misses``, ``entries``."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": len(self._entries),
+            }
@@ -19,13 +19,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Optional, Set
 
-import netgraph_core
-
 from ngraph.analysis.context import AnalysisContext, analyze
 from ngraph.analysis.demand import expand_demands
 from ngraph.analysis.placement import place_demands
 from ngraph.model.demand.spec import TrafficDemand
 from ngraph.model.flow.policy_config import FlowPolicyPreset
+from ngraph.profiling.phases import phase
 from ngraph.results.flow import FlowEntry, FlowIterationResult, FlowSummary
 from ngraph.types.base import FlowPlacement, Mode
 
@@ -106,12 +105,9 @@ def max_flow_analysis(
     else:
         ctx = analyze(network, source=source, sink=target, mode=mode_enum)
 
-    flow_entries: list[FlowEntry] = []
-    total_demand = 0.0
-    total_placed = 0.0
-
-    if include_flow_details or include_min_cut:
-        flows = ctx.max_flow_detailed(
+    detailed = include_flow_details or include_min_cut
+    if detailed:
+        flows: dict[Any, Any] = ctx.max_flow_detailed(
             shortest_path=shortest_path,
             require_capacity=require_capacity,
             flow_placement=flow_placement,
@@ -119,34 +115,6 @@ def max_flow_analysis(
             excluded_links=excluded_links,
             include_min_cut=include_min_cut,
         )
-        for (src, dst), summary in flows.items():
-            value = float(summary.total_flow)
-            cost_dist = summary.cost_distribution or {}
-            min_cut_edges = summary.min_cut or ()
-            entry = FlowEntry(
-                source=str(src),
-                destination=str(dst),
-                priority=0,
-                demand=value,
-                placed=value,
-                dropped=0.0,
-                cost_distribution=(
-                    {float(k): float(v) for k, v in cost_dist.items()}
-                    if include_flow_details
-                    else {}
-                ),
-                data=(
-                    {
-                        "edges": [f"{e.link_id}:{e.direction}" for e in min_cut_edges],
-                        "edges_kind": "min_cut",
-                    }
-                    if include_min_cut and min_cut_edges
-                    else {}
-                ),
-            )
-            flow_entries.append(entry)
-            total_demand += value
-            total_placed += value
     else:
         flows = ctx.max_flow(
             shortest_path=shortest_path,
@@ -155,30 +123,68 @@ def max_flow_analysis(
             excluded_nodes=excluded_nodes,
             excluded_links=excluded_links,
         )
-        for (src, dst), val in flows.items():
-            value = float(val)
-            entry = FlowEntry(
-                source=str(src),
-                destination=str(dst),
-                priority=0,
-                demand=value,
-                placed=value,
-                dropped=0.0,
-            )
-            flow_entries.append(entry)
-            total_demand += value
-            total_placed += value
-
-    overall_ratio = (total_placed / total_demand) if total_demand > 0 else 1.0
-    dropped_flows = sum(1 for e in flow_entries if e.dropped > 0.0)
-    summary = FlowSummary(
-        total_demand=total_demand,
-        total_placed=total_placed,
-        overall_ratio=overall_ratio,
-        dropped_flows=dropped_flows,
-        num_flows=len(flow_entries),
-    )
-    return FlowIterationResult(flows=flow_entries, summary=summary)
+
+    with phase("results.build"):
+        flow_entries: list[FlowEntry] = []
+        total_demand = 0.0
+        total_placed = 0.0
+
+        if detailed:
+            for (src, dst), summary in flows.items():
+                value = float(summary.total_flow)
+                cost_dist = summary.cost_distribution or {}
+                min_cut_edges = summary.min_cut or ()
+                entry = FlowEntry(
+                    source=str(src),
+                    destination=str(dst),
+                    priority=0,
+                    demand=value,
+                    placed=value,
+                    dropped=0.0,
+                    cost_distribution=(
+                        {float(k): float(v) for k, v in cost_dist.items()}
+                        if include_flow_details
+                        else {}
+                    ),
+                    data=(
+                        {
+                            "edges": [
+                                f"{e.link_id}:{e.direction}" for e in min_cut_edges
+                            ],
+                            "edges_kind": "min_cut",
+                        }
+                        if include_min_cut and min_cut_edges
+                        else {}
+                    ),
+                )
+                flow_entries.append(entry)
+                total_demand += value
+                total_placed += value
+        else:
+            for (src, dst), val in flows.items():
+                value = float(val)
+                entry = FlowEntry(
+                    source=str(src),
+                    destination=str(dst),
+                    priority=0,
+                    demand=value,
+                    placed=value,
+                    dropped=0.0,
+                )
+                flow_entries.append(entry)
+                total_demand += value
+                total_placed += value
+
+        overall_ratio = (total_placed / total_demand) if total_demand > 0 else 1.0
+        dropped_flows = sum(1 for e in flow_entries if e.dropped > 0.0)
+        summary = FlowSummary(
+            total_demand=total_demand,
+            total_placed=total_placed,
+            overall_ratio=overall_ratio,
+            dropped_flows=dropped_flows,
+            num_flows=len(flow_entries),
+        )
+        return FlowIterationResult(flows=flow_entries, summary=summary)
 
 
 def demand_placement_analysis(
@@ -190,6 +196,7 @@ def demand_placement_analysis(
     include_flow_details: bool = False,
     include_used_edges: bool = False,
     context: Optional[AnalysisContext] = None,
+    include_link_flows: bool = False,
 ) -> FlowIterationResult:
     """Analyze traffic demand placement success rates using Core directly.
 
@@ -215,6 +222,9 @@ def demand_placement_analysis(
         include_flow_details: When True, include cost_distribution per flow.
         include_used_edges: When True, include set of used edges per demand in entry data.
         context: Pre-built AnalysisContext for fast repeated analysis.
+        include_link_flows: When True, store the ``(num_links, 2)`` forward and
+            reverse link flow matrix under ``data["link_flows"]`` (a float32
+            NumPy array, 8 bytes per link; see ``AnalysisContext.link_flows``).
 
     Returns:
         FlowIterationResult describing this iteration.
@@ -237,52 +247,65 @@ def demand_placement_analysis(
             network, augmentations=expansion.augmentations
         )
 
-    node_mask = ctx._build_node_mask(excluded_nodes)
-    edge_mask = ctx._build_edge_mask(excluded_links)
-    flow_graph = netgraph_core.FlowGraph(ctx.multidigraph)
-
-    # Phase 3: Place demands using unified placement module
-    result = place_demands(
-        expansion.demands,
-        [d.volume for d in expansion.demands],
-        flow_graph,
-        ctx,
-        node_mask,
-        edge_mask,
-        collect_entries=True,
-        include_cost_distribution=include_flow_details,
-        include_used_edges=include_used_edges,
-    )
+    # Phase 3: Place demands on a pooled FlowGraph (reset, not reallocated)
+    with ctx._borrow_flow_state(excluded_nodes, excluded_links) as state:
+        result = place_demands(
+            expansion.demands,
+            [d.volume for d in expansion.demands],
+            state.flow_graph,
+            ctx,
+            state.node_mask,
+            state.edge_mask,
+            collect_entries=True,
+            include_cost_distribution=include_flow_details,
+            include_used_edges=include_used_edges,
+        )
+        # Copy out before the pooled FlowGraph is reset by the next borrower.
+        # float32 halves the matrix kept per unique pattern until the run ends.
+        link_flows = (
+            ctx.link_flows(state.flow_graph, dtype="float32")
+            if include_link_flows
+            else None
+        )
 
-    # Phase 4: Convert to FlowEntry format
-    flow_entries = [
-        FlowEntry(
-            source=e.src_name,
-            destination=e.dst_name,
-            priority=e.priority,
-            demand=e.volume,
-            placed=e.placed,
-            dropped=e.volume - e.placed,
-            cost_distribution=e.cost_distribution,
-            data=(
-                {"edges": sorted(e.used_edges), "edges_kind": "used"}
-                if e.used_edges
-                else {}
-            ),
+    with phase("results.build"):
+        # Phase 4: Convert to FlowEntry format (edge keys are formatted here)
+        edge_mapper = ctx.edge_mapper
+        flow_entries = [
+            FlowEntry(
+                source=e.src_name,
+                destination=e.dst_name,
+                priority=e.priority,
+                demand=e.volume,
+                placed=e.placed,
+                dropped=e.volume - e.placed,
+                cost_distribution=e.cost_distribution,
+                data=(
+                    {
+                        "edges": sorted(edge_mapper.to_keys(e.used_edge_ids)),
+                        "edges_kind": "used",
+                    }
+                    if e.used_edge_ids.size
+                    else {}
+                ),
+            )
+            for e in result.entries or []
+        ]
+
+        dropped_flows = sum(1 for e in flow_entries if e.dropped > 0.0)
+        summary = FlowSummary(
+            total_demand=result.summary.total_demand,
+            total_placed=result.summary.total_placed,
+            overall_ratio=result.summary.ratio,
+            dropped_flows=dropped_flows,
+            num_flows=len(flow_entries),
         )
-        for e in result.entries or []
-    ]
-
-    dropped_flows = sum(1 for e in flow_entries if e.dropped > 0.0)
-    summary = FlowSummary(
-        total_demand=result.summary.total_demand,
-        total_placed=result.summary.total_placed,
-        overall_ratio=result.summary.ratio,
-        dropped_flows=dropped_flows,
-        num_flows=len(flow_entries),
-    )
 
-    return FlowIterationResult(flows=flow_entries, summary=summary, data={})
+        return FlowIterationResult(
+            flows=flow_entries,
+            summary=summary,
+            data={} if link_flows is None else {"link_flows": link_flows},
+        )
 
 
 def sensitivity_analysis(
@@ -346,34 +369,35 @@ def sensitivity_analysis(
         excluded_links=excluded_links,
     )
 
-    # Build FlowEntry for each pair
-    flow_entries: list[FlowEntry] = []
-    total_flow = 0.0
-
-    for (src, dst), flow_value in flow_values.items():
-        sensitivity_map = sensitivity_results.get((src, dst), {})
-        entry = FlowEntry(
-            source=str(src),
-            destination=str(dst),
-            priority=0,
-            demand=flow_value,
-            placed=flow_value,
-            dropped=0.0,
-            data={"sensitivity": sensitivity_map},
+    with phase("results.build"):
+        # Build FlowEntry for each pair
+        flow_entries: list[FlowEntry] = []
+        total_flow = 0.0
+
+        for (src, dst), flow_value in flow_values.items():
+            sensitivity_map = sensitivity_results.get((src, dst), {})
+            entry = FlowEntry(
+                source=str(src),
+                destination=str(dst),
+                priority=0,
+                demand=flow_value,
+                placed=flow_value,
+                dropped=0.0,
+                data={"sensitivity": sensitivity_map},
+            )
+            flow_entries.append(entry)
+            total_flow += flow_value
+
+        # Build summary
+        summary = FlowSummary(
+            total_demand=total_flow,
+            total_placed=total_flow,
+            overall_ratio=1.0,
+            dropped_flows=0,
+            num_flows=len(flow_entries),
         )
-        flow_entries.append(entry)
-        total_flow += flow_value
-
-    # Build summary
-    summary = FlowSummary(
-        total_demand=total_flow,
-        total_placed=total_flow,
-        overall_ratio=1.0,
-        dropped_flows=0,
-        num_flows=len(flow_entries),
-    )
 
-    return FlowIterationResult(flows=flow_entries, summary=summary)
+        return FlowIterationResult(flows=flow_entries, summary=summary)
 
 
 def build_demand_context(
@@ -9,6 +9,8 @@ import netgraph_core
 import numpy as np
 
 from ngraph.model.flow.policy_config import FlowPolicyPreset, create_flow_policy
+from ngraph.profiling.memory import active_memory, note_structure
+from ngraph.profiling.phases import count, phase
 
 if TYPE_CHECKING:
     from ngraph.analysis.context import AnalysisContext
@@ -29,6 +31,26 @@ _CACHEABLE_TE: frozenset[FlowPolicyPreset] = frozenset(
 )
 
 _MIN_FLOW = 1e-9
+_NO_EDGES = np.empty(0, dtype=np.int64)
+
+
+def _used_ext_ids(
+    flow_graph: netgraph_core.FlowGraph,
+    flow_indices: Sequence[netgraph_core.FlowIndex],
+    ext_edge_ids: np.ndarray,
+) -> np.ndarray:
+    """Return sorted unique external ids of network edges carrying the flows."""
+    edge_ids = np.fromiter(
+        (
+            edge_id
+            for fidx in flow_indices
+            for edge_id, _ in flow_graph.get_flow_edges(fidx)
+        ),
+        dtype=np.int64,
+    )
+    ext = ext_edge_ids[edge_ids]
+    # Augmentation edges carry the -1 sentinel
+    return np.unique(ext[ext >= 0])
 
 
 @dataclass(slots=True)
@@ -57,7 +79,8 @@ class PlacementEntry:
     volume: float
     placed: float
     cost_distribution: dict[float, float] = field(default_factory=dict)
-    used_edges: set[str] = field(default_factory=set)
+    # Sorted unique external edge ids; format with ``_EdgeMapper.to_keys``
+    used_edge_ids: np.ndarray = field(default_factory=lambda: _NO_EDGES)
 
 
 @dataclass(slots=True)
@@ -131,6 +154,11 @@ def place_demands(
 
     dag_cache: dict[tuple[int, FlowPolicyPreset], tuple[np.ndarray, Any]] = {}
     entries: list[PlacementEntry] | None = [] if collect_entries else None
+    ext_edge_ids = (
+        np.asarray(ctx.multidigraph.ext_edge_ids_view(), dtype=np.int64)
+        if include_used_edges
+        else None
+    )
     total_demand = 0.0
     total_placed = 0.0
     flow_idx_counter = 0
@@ -141,7 +169,7 @@ def place_demands(
         total_demand += volume
 
         if demand.policy_preset in CACHEABLE_PRESETS:
-            placed, cost_dist, used_edges, flow_idx_counter = _place_cached(
+            placed, cost_dist, used_ids, flow_idx_counter = _place_cached(
                 src_id,
                 dst_id,
                 volume,
@@ -154,10 +182,10 @@ def place_demands(
                 edge_mask,
                 flow_idx_counter,
                 include_cost_distribution,
-                include_used_edges,
+                ext_edge_ids,
             )
         else:
-            placed, cost_dist, used_edges = _place_with_policy(
+            placed, cost_dist, used_ids = _place_with_policy(
                 src_id,
                 dst_id,
                 volume,
@@ -168,7 +196,7 @@ def place_demands(
                 node_mask,
                 edge_mask,
                 include_cost_distribution,
-                include_used_edges,
+                ext_edge_ids,
             )
 
         total_placed += placed
@@ -182,10 +210,22 @@ def place_demands(
                     volume=volume,
                     placed=placed,
                     cost_distribution=cost_dist if include_cost_distribution else {},
-                    used_edges=used_edges if include_used_edges else set(),
+                    used_edge_ids=used_ids,
                 )
             )
 
+    if dag_cache and active_memory() is not None:
+        note_structure(
+            "dag_cache",
+            sum(
+                dists.nbytes
+                + dag.parent_offsets.nbytes
+                + dag.parents.nbytes
+                + dag.via_edges.nbytes
+                for dists, dag in dag_cache.values()
+            ),
+        )
+
     return PlacementResult(
         summary=PlacementSummary(total_demand=total_demand, total_placed=total_placed),
         entries=entries,
@@ -205,8 +245,8 @@ def _place_cached(
     edge_mask: np.ndarray,
     flow_idx_start: int,
     include_cost_distribution: bool,
-    include_used_edges: bool,
-) -> tuple[float, dict[float, float], set[str], int]:
+    ext_edge_ids: np.ndarray | None,
+) -> tuple[float, dict[float, float], np.ndarray, int]:
     """Place single demand with SPF caching."""
     cache_key = (src_id, preset)
     selection = _get_edge_selection(preset)
@@ -219,23 +259,27 @@ def _place_cached(
     placed = 0.0
     remaining = volume
 
-    if cache_key not in dag_cache:
-        dists, dag = ctx.algorithms.spf(
-            ctx.handle,
-            src=src_id,
-            dst=None,
-            selection=selection,
-            node_mask=node_mask,
-            edge_mask=edge_mask,
-            multipath=True,
-            dtype="float64",
-        )
+    if cache_key in dag_cache:
+        count("placement.dag_cache_hits")
+    else:
+        count("placement.dag_cache_misses")
+        with phase("core.spf"):
+            dists, dag = ctx.algorithms.spf(
+                ctx.handle,
+                src=src_id,
+                dst=None,
+                selection=selection,
+                node_mask=node_mask,
+                edge_mask=edge_mask,
+                multipath=True,
+                dtype="float64",
+            )
         dag_cache[cache_key] = (dists, dag)
 
     dists, dag = dag_cache[cache_key]
 
     if dists[dst_id] == float("inf"):
-        return 0.0, {}, set(), flow_idx_counter
+        return 0.0, {}, _NO_EDGES, flow_idx_counter
 
     cost = float(dists[dst_id])
 
@@ -257,17 +301,18 @@ def _place_cached(
             # Note: Do NOT cache residual-based DAGs. The TE loop computes
             # DAGs specific to this demand's placement; caching them would
             # corrupt results for other demands from the same source.
-            fresh_dists, fresh_dag = ctx.algorithms.spf(
-                ctx.handle,
-                src=src_id,
-                dst=None,
-                selection=selection,
-                residual=residual,
-                node_mask=node_mask,
-                edge_mask=edge_mask,
-                multipath=True,
-                dtype="float64",
-            )
+            with phase("core.spf"):
+                fresh_dists, fresh_dag = ctx.algorithms.spf(
+                    ctx.handle,
+                    src=src_id,
+                    dst=None,
+                    selection=selection,
+                    residual=residual,
+                    node_mask=node_mask,
+                    edge_mask=edge_mask,
+                    multipath=True,
+                    dtype="float64",
+                )
 
             if fresh_dists[dst_id] == float("inf"):
                 break
@@ -297,15 +342,11 @@ def _place_cached(
         for c, amt in flow_costs:
             cost_dist[c] = cost_dist.get(c, 0.0) + amt
 
-    used_edges: set[str] = set()
-    if include_used_edges:
-        for fidx in flow_indices:
-            for edge_id, _ in flow_graph.get_flow_edges(fidx):
-                ref = ctx.edge_mapper.to_ref(edge_id, ctx.multidigraph)
-                if ref:
-                    used_edges.add(f"{ref.link_id}:{ref.direction}")
+    used_ids = _NO_EDGES
+    if ext_edge_ids is not None:
+        used_ids = _used_ext_ids(flow_graph, flow_indices, ext_edge_ids)
 
-    return placed, cost_dist, used_edges, flow_idx_counter
+    return placed, cost_dist, used_ids, flow_idx_counter
 
 
 def _place_with_policy(
@@ -319,8 +360,8 @@ def _place_with_policy(
     node_mask: np.ndarray,
     edge_mask: np.ndarray,
     include_cost_distribution: bool,
-    include_used_edges: bool,
-) -> tuple[float, dict[float, float], set[str]]:
+    ext_edge_ids: np.ndarray | None,
+) -> tuple[float, dict[float, float], np.ndarray]:
     """Place single demand using FlowPolicy (for non-cacheable presets)."""
     policy = create_flow_policy(
         ctx.algorithms,
@@ -332,22 +373,21 @@ def _place_with_policy(
     placed, _ = policy.place_demand(flow_graph, src_id, dst_id, priority, volume)
 
     cost_dist: dict[float, float] = {}
-    used_edges: set[str] = set()
+    used_ids = _NO_EDGES
 
-    if include_cost_distribution or include_used_edges:
-        for flow_key, flow_data in policy.flows.items():
-            if include_cost_distribution:
+    if include_cost_distribution or ext_edge_ids is not None:
+        flows = policy.flows
+        if include_cost_distribution:
+            for flow_data in flows.values():
                 cost, flow_vol = float(flow_data[2]), float(flow_data[3])
                 if flow_vol > 0:
                     cost_dist[cost] = cost_dist.get(cost, 0.0) + flow_vol
 
-            if include_used_edges:
-                fidx = netgraph_core.FlowIndex(
-                    flow_key[0], flow_key[1], flow_key[2], flow_key[3]
-                )
-                for edge_id, _ in flow_graph.get_flow_edges(fidx):
-                    ref = ctx.edge_mapper.to_ref(edge_id, ctx.multidigraph)
-                    if ref:
-                        used_edges.add(f"{ref.link_id}:{ref.direction}")
+        if ext_edge_ids is not None:
+            used_ids = _used_ext_ids(
+                flow_graph,
+                [netgraph_core.FlowIndex(*key[:4]) for key in flows],
+                ext_edge_ids,
+            )
 
-    return placed, cost_dist, used_edges
+    return placed, cost_dist, used_ids
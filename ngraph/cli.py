@@ -3,23 +3,23 @@
 from __future__ import annotations
 
 import argparse
-import json
 import logging
 import os
+import re
 import sys
 from pathlib import Path
 from statistics import median
 from time import perf_counter
 from typing import Any, Dict, List, Optional
 
-from ngraph.explorer import NetworkExplorer
 from ngraph.logging import get_logger, set_global_log_level
-from ngraph.profiling.profiler import PerformanceProfiler, PerformanceReporter
-from ngraph.scenario import Scenario
 from ngraph.utils.output_paths import (
+    checkpoints_dir_for_run,
     ensure_parent_dir,
     profiles_dir_for_run,
     results_path_for_run,
+    scenario_prefix_from_path,
+    shards_dir_for_run,
 )
 
 logger = get_logger(__name__)
@@ -116,6 +116,44 @@ def _format_duration(seconds: float) -> str:
     return f"{minutes}m {rem:.1f}s"
 
 
+def _write_results_file(results: Any, path: Path, keys: Optional[List[str]]) -> None:
+    """Write results to ``path``: a results archive for ``.zip``, else JSON.
+
+    The file is written next to ``path`` under a temporary name and moved into
+    place only when the export succeeds, so a failed export (e.g. a non-finite
+    value) leaves any earlier results file intact.
+    """
+    ensure_parent_dir(path)
+    logger.info(f"Writing results to: {path}")
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        if path.suffix == ".zip":
+            from ngraph.results.archive import write_results_archive
+
+            write_results_archive(results, tmp_path, keys=keys)
+        else:
+            from ngraph.results.json_writer import write_results_json
+
+            with open(tmp_path, "wb") as fh:
+                write_results_json(results, fh, keys=keys)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    logger.info("Results written successfully")
+
+
+def _print_results(results: Any, keys: Optional[List[str]]) -> None:
+    """Print results as compact JSON to stdout."""
+    import io
+
+    from ngraph.results.json_writer import write_results_json
+
+    buffer = io.BytesIO()
+    write_results_json(results, buffer, keys=keys)
+    print(buffer.getvalue().decode("utf-8"))
+
+
 def _plural(n: int, singular: str, plural: Optional[str] = None) -> str:
     """Return grammatically correct unit for count n.
 
@@ -233,6 +271,8 @@ def _print_network_structure(
         logger.setLevel(logging.WARNING)
         explorer = None
         try:
+            from ngraph.explorer import NetworkExplorer
+
             # Use non-strict validation so hierarchy is printable even with issues
             explorer = NetworkExplorer.explore_network(
                 network, components_library, strict_validation=False
@@ -864,12 +904,15 @@ def _print_workflow_steps(scenario: Any, detail: bool, network: Any) -> None:
                     print("        WARNING: No nodes matched for the given patterns")
 
 
-def _inspect_scenario(path: Path, detail: bool = False) -> None:
+def _inspect_scenario(
+    path: Path, detail: bool = False, cache_dir: Optional[Path] = None
+) -> None:
     """Inspect a scenario file, validate it, and show key characteristics.
 
     Args:
         path: Scenario YAML file.
         detail: Whether to show detailed information including sample node names.
+        cache_dir: Optional compiled-scenario cache directory.
     """
     logger.info(f"Inspecting scenario from: {path}")
     _start_time = perf_counter()
@@ -879,7 +922,9 @@ def _inspect_scenario(path: Path, detail: bool = False) -> None:
         yaml_text = path.read_text()
         logger.info("✓ YAML file loaded successfully")
 
-        scenario = Scenario.from_yaml(yaml_text)
+        from ngraph.scenario import Scenario
+
+        scenario = Scenario.from_yaml(yaml_text, cache_dir=cache_dir)
         logger.debug(
             "Scenario loaded: nodes=%d, links=%d, steps=%d, policies=%d, demand_sets=%d",
             len(getattr(scenario.network, "nodes", {})),
@@ -1033,6 +1078,66 @@ def _inspect_scenario(path: Path, detail: bool = False) -> None:
         sys.exit(1)
 
 
+def _inspect_results(path: Path, detail: bool = False) -> None:
+    """Summarize a results archive without loading step data.
+
+    Args:
+        path: Results archive (``*.results.zip``).
+        detail: Whether to list the data keys of every step.
+    """
+    from ngraph.results.archive import ResultsReader
+
+    def mb(size: int) -> str:
+        return f"{size / (1024 * 1024):.1f}MB"
+
+    try:
+        with ResultsReader(path) as reader:
+            print("\n" + "=" * 60)
+            print("NETGRAPH RESULTS INSPECTION")
+            print("=" * 60)
+            packed, raw = reader.stored_size()
+            print(f"\n   File: {path}")
+            print(f"   Steps: {len(reader.steps)} stored, {len(reader.workflow)} run")
+            print(f"   Size: {mb(packed)} compressed, {mb(raw)} uncompressed")
+
+            rows: List[List[str]] = []
+            for name in reader.steps:
+                info = reader.workflow.get(name, {})
+                packed, raw = reader.stored_size(name)
+                rows.append(
+                    [
+                        name,
+                        str(info.get("step_type", "-")),
+                        str(info.get("execution_order", "-")),
+                        str(len(reader.data_keys(name))),
+                        mb(packed),
+                        mb(raw),
+                    ]
+                )
+            print("\nSTEPS")
+            print("-" * 30)
+            print(
+                _format_table(
+                    ["Step", "Type", "Order", "Keys", "Compressed", "Raw"], rows
+                )
+            )
+
+            if detail:
+                for name in reader.steps:
+                    key_rows = []
+                    for key in reader.data_keys(name):
+                        n = reader.num_rows(name, key)
+                        key_rows.append([key, "-" if n is None else f"{n:,}"])
+                    print(f"\n{name}")
+                    print("-" * 30)
+                    print(_format_table(["Key", "Rows"], key_rows) or "   (no data)")
+    except Exception as e:
+        logger.error(f"Failed to inspect results: {e}")
+        print("❌ ERROR: Failed to inspect results")
+        print(f"  {type(e).__name__}: {e}")
+        sys.exit(1)
+
+
 def _run_scenario(
     path: Path,
     results_override: Optional[Path],
@@ -1041,7 +1146,18 @@ def _run_scenario(
     keys: Optional[list[str]] = None,
     profile: bool = False,
     profile_memory: bool = False,
+    profile_sample: int = 1,
+    record_phases: bool = False,
     output_dir: Optional[Path] = None,
+    cache_dir: Optional[Path] = None,
+    validate_schema: bool = True,
+    checkpoint_dir: Optional[Path] = None,
+    resume: bool = False,
+    checkpoint_interval: Optional[float] = None,
+    shard: Optional[str] = None,
+    shard_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    step_cache: bool = True,
 ) -> None:
     """Run a scenario file and export results as JSON by default.
 
@@ -1055,68 +1171,181 @@ def _run_scenario(
         keys: Optional list of workflow step names to include. When ``None`` all steps are
             exported.
         profile: Whether to enable performance profiling with CPU analysis.
+        profile_sample: With ``profile``, profile every N-th analysis task run
+            in worker threads.
+        profile_memory: Record per-step RSS and large-structure sizes under
+            ``memory`` in each step's metadata (reported with ``profile``).
+        record_phases: Record phase timers and counters of analysis hot paths
+            under ``phases`` in each step's metadata (always on with
+            ``profile``).
+        cache_dir: Optional compiled-scenario cache directory.
+        validate_schema: Whether to validate the YAML against the JSON schema.
+        checkpoint_dir: Optional directory for run checkpoints. Enables
+            checkpointing of completed steps and Monte Carlo progress.
+        resume: Continue from the checkpoints in ``checkpoint_dir`` (default
+            ``<scenario_name>.checkpoints``, under ``--output`` when provided).
+        checkpoint_interval: Minimum seconds between Monte Carlo progress saves.
+        shard: Optional ``"K/N"``. Runs only the K-th of N slices of every Monte
+            Carlo step; outputs go to ``shard_dir`` (default
+            ``<scenario_name>.shards``) for ``ngraph merge`` instead of a
+            results file.
+        shard_dir: Directory shared by all shards of the run.
+        workers: Run independent workflow steps concurrently with this global
+            worker budget. Ignored with ``profile``, which times steps one by
+            one.
+        step_cache: With ``cache_dir``, reuse the results of steps whose inputs
+            are unchanged since an earlier run (not for shard runs).
     """
     logger.info(f"Loading scenario from: {path}")
     _start_time = perf_counter()
 
     try:
+        from ngraph.profiling.memory import memory_tracking
+        from ngraph.profiling.phases import phase_timing
+        from ngraph.scenario import Scenario
+
         yaml_text = path.read_text()
-        scenario = Scenario.from_yaml(yaml_text)
+
+        checkpoint = None
+        scenario = None
+        if shard is not None:
+            from ngraph.utils.checkpoint import DEFAULT_CHECKPOINT_INTERVAL
+            from ngraph.utils.scenario_cache import scenario_cache_key
+            from ngraph.utils.sharding import (
+                ShardSpec,
+                shard_checkpoint,
+                shared_scenario,
+            )
+
+            if checkpoint_dir is not None:
+                raise ValueError("--checkpoint-dir cannot be combined with --shard")
+            spec = ShardSpec.parse(shard)
+            effective_shard_dir = shard_dir or shards_dir_for_run(path, output_dir)
+            key = scenario_cache_key(yaml_text)
+            checkpoint = shard_checkpoint(
+                effective_shard_dir,
+                key,
+                spec,
+                resume=resume,
+                interval=(
+                    DEFAULT_CHECKPOINT_INTERVAL
+                    if checkpoint_interval is None
+                    else checkpoint_interval
+                ),
+            )
+            # All shards analyze the one compiled scenario published first
+            scenario = shared_scenario(
+                effective_shard_dir,
+                key,
+                scenario_prefix_from_path(path),
+                spec,
+                lambda: Scenario.from_yaml(
+                    yaml_text, cache_dir=cache_dir, validate_schema=validate_schema
+                ),
+            )
+            no_results = True
+            logger.info(
+                f"Running shard {spec.index}/{spec.count}: {checkpoint.directory}"
+            )
+        elif checkpoint_dir is not None or resume:
+            from ngraph.utils.checkpoint import (
+                DEFAULT_CHECKPOINT_INTERVAL,
+                RunCheckpoint,
+            )
+            from ngraph.utils.scenario_cache import scenario_cache_key
+
+            effective_checkpoint_dir = checkpoint_dir or checkpoints_dir_for_run(
+                path, output_dir
+            )
+            checkpoint = RunCheckpoint(
+                effective_checkpoint_dir,
+                scenario_cache_key(yaml_text),
+                resume=resume,
+                interval=(
+                    DEFAULT_CHECKPOINT_INTERVAL
+                    if checkpoint_interval is None
+                    else checkpoint_interval
+                ),
+            )
+            logger.info(
+                f"{'Resuming from' if resume else 'Writing'} checkpoints: "
+                f"{effective_checkpoint_dir}"
+            )
+
+        # A resumed run continues on the exact scenario object it started with
+        if scenario is None and checkpoint is not None and resume:
+            scenario = checkpoint.load_scenario()
+        if scenario is None:
+            scenario = Scenario.from_yaml(
+                yaml_text, cache_dir=cache_dir, validate_schema=validate_schema
+            )
+            if checkpoint is not None:
+                checkpoint.save_scenario(scenario)
+
+        memo = None
+        if cache_dir is not None and step_cache and shard is None:
+            from ngraph.utils.step_cache import StepCache
+
+            memo = StepCache(cache_dir)
 
         if profile:
+            from ngraph.profiling.profiler import (
+                PerformanceProfiler,
+                PerformanceReporter,
+            )
+
             logger.info("Performance profiling enabled")
+            if workers is not None:
+                logger.warning("--workers is ignored with --profile")
             # Initialize detailed profiler
-            profiler = PerformanceProfiler(track_memory=profile_memory)
+            profiler = PerformanceProfiler(
+                track_memory=profile_memory, worker_sample_every=profile_sample
+            )
 
             # Start scenario-level profiling
             profiler.start_scenario()
 
             logger.info("Starting scenario execution with profiling")
 
-            # Enable child-process profiling for parallel workflows
-            child_profile_dir = profiles_dir_for_run(path, output_dir)
-            child_profile_dir.mkdir(parents=True, exist_ok=True)
-            os.environ["NGRAPH_PROFILE_DIR"] = str(child_profile_dir.resolve())
-            logger.info(f"Worker profiles will be saved to: {child_profile_dir}")
+            # Worker-thread profiles are merged into each step in memory; with
+            # an output directory, every step's merged profile is also saved
+            step_profile_dir: Optional[Path] = None
+            if output_dir is not None:
+                step_profile_dir = profiles_dir_for_run(path, output_dir)
+                step_profile_dir.mkdir(parents=True, exist_ok=True)
+                logger.info(f"Step profiles will be saved to: {step_profile_dir}")
 
             # Manual execution of workflow steps with profiling
+            scenario.checkpoint = checkpoint
+            scenario.step_cache = memo
+            if memo is not None:
+                memo.prepare(scenario)
             for step in scenario.workflow:
                 step_name = step.name or step.__class__.__name__
                 step_type = step.__class__.__name__
 
-                with profiler.profile_step(step_name, step_type):
+                if checkpoint is not None and checkpoint.restore_step(scenario, step):
+                    continue
+                with profiler.profile_step(step_name, step_type), phase_timing():
                     step.execute(scenario)
+                step_md = scenario.results.get_step(step_name).get("metadata", {})
+                profiler.record_phases(step_name, step_md.get("phases"))
+                if checkpoint is not None:
+                    checkpoint.save_step(scenario, step)
+                if step_profile_dir is not None:
+                    safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", step_name)
+                    profiler.save_detailed_profile(
+                        step_profile_dir / f"{safe_name}.pstats", step_name
+                    )
 
-                # Merge any worker profiles generated by this step
-                if child_profile_dir.exists():
-                    profiler.merge_child_profiles(child_profile_dir, step_name)
-
+            if checkpoint is not None:
+                checkpoint.mark_complete()
             logger.info("Scenario execution completed successfully")
 
             # End scenario profiling and analyze results
             profiler.end_scenario()
             profiler.analyze_performance()
 
-            # Clean up any remaining worker profile files
-            if child_profile_dir.exists():
-                remaining_files = list(child_profile_dir.glob("*.pstats"))
-                if remaining_files:
-                    logger.debug(
-                        f"Cleaning up {len(remaining_files)} remaining profile files"
-                    )
-                    for f in remaining_files:
-                        try:
-                            f.unlink()
-                        except Exception as exc:
-                            logger.debug("Failed to remove profile file %s: %s", f, exc)
-                # Keep the profiles directory when an explicit output dir is used
-                # to make artifact paths consistent and discoverable.
-                if output_dir is None:
-                    try:
-                        child_profile_dir.rmdir()  # Remove dir if empty
-                    except Exception as exc:
-                        logger.debug("Failed to remove profiles dir: %s", exc)
-
             # Generate and display performance report
             reporter = PerformanceReporter(profiler.results)
             performance_report = reporter.generate_report()
@@ -1124,51 +1353,39 @@ def _run_scenario(
 
         else:
             logger.info("Starting scenario execution")
-            scenario.run()
+            with phase_timing(record_phases), memory_tracking(profile_memory):
+                scenario.run(
+                    checkpoint=checkpoint, max_workers=workers, step_cache=memo
+                )
             logger.info("Scenario execution completed successfully")
             print("✅ Scenario execution completed")
+        if memo is not None:
+            logger.info(
+                "Step cache: %d hits, %d misses",
+                memo.stats["hits"],
+                memo.stats["misses"],
+            )
 
-        # Export JSON results by default unless disabled
-        if not no_results:
-            logger.info("Serializing results to JSON")
-            results_dict: Dict[str, Any] = scenario.results.to_dict()
-
-            if keys:
-                # Filter only the steps subsection; keep workflow/scenario intact
-                steps_map = results_dict.get("steps", {})
-                filtered_steps: Dict[str, Any] = {
-                    step: steps_map[step] for step in keys if step in steps_map
-                }
-                results_dict["steps"] = filtered_steps
-
-            json_str = json.dumps(results_dict, indent=2, default=str)
+        if shard is not None and checkpoint is not None:
+            print(f"✅ Shard {shard} written to: {checkpoint.directory}")
+            if stdout:
+                logger.warning("--stdout is ignored for shard runs; merge shards first")
+            stdout = False
 
+        # Export JSON results by default unless disabled; --keys filters only
+        # the steps subsection (workflow/scenario stay intact)
+        if not no_results:
             # Derive default results file path using output directory policy
             effective_output = results_path_for_run(
                 scenario_path=path,
                 output_dir=output_dir,
                 results_override=results_override,
             )
-
-            ensure_parent_dir(effective_output)
-            logger.info(f"Writing results to: {effective_output}")
-            effective_output.write_text(json_str)
-            logger.info("Results written successfully")
+            _write_results_file(scenario.results, effective_output, keys or None)
             print(f"✅ Results written to: {effective_output}")
 
-            if stdout:
-                print(json_str)
-        elif stdout:
-            # Print to stdout even without file export
-            results_dict: Dict[str, Any] = scenario.results.to_dict()
-            if keys:
-                steps_map = results_dict.get("steps", {})
-                filtered_steps: Dict[str, Any] = {
-                    step: steps_map[step] for step in keys if step in steps_map
-                }
-                results_dict["steps"] = filtered_steps
-            json_str = json.dumps(results_dict, indent=2, default=str)
-            print(json_str)
+        if stdout:
+            _print_results(scenario.results, keys or None)
 
         # Final success duration log
         _elapsed = perf_counter() - _start_time
@@ -1186,6 +1403,44 @@ def _run_scenario(
         sys.exit(1)
 
 
+def _merge_shards(
+    shard_dir: Path,
+    results_override: Optional[Path],
+    stdout: bool,
+    output_dir: Optional[Path] = None,
+) -> None:
+    """Merge the shards of a ``run --shard`` directory into one results file.
+
+    Args:
+        shard_dir: Directory shared by all shards.
+        results_override: Optional explicit results path. Defaults to
+            ``<scenario_name>.results.json``, under ``--output`` when provided.
+        stdout: Whether to also print results to stdout.
+        output_dir: Optional base output directory.
+    """
+    from ngraph.utils.sharding import merge_shards
+
+    _start_time = perf_counter()
+    try:
+        scenario, name = merge_shards(shard_dir)
+        effective_output = results_path_for_run(
+            scenario_path=Path(f"{name}.yaml"),
+            output_dir=output_dir,
+            results_override=results_override,
+        )
+        _write_results_file(scenario.results, effective_output, None)
+        print(f"✅ Results written to: {effective_output}")
+        if stdout:
+            _print_results(scenario.results, None)
+        logger.info(
+            f"Merged shards in {_format_duration(perf_counter() - _start_time)}"
+        )
+    except Exception as e:
+        logger.error(f"Failed to merge shards: {type(e).__name__}: {e}")
+        print(f"❌ ERROR: Failed to merge shards: {type(e).__name__}: {e}")
+        sys.exit(1)
+
+
 def main(argv: Optional[List[str]] = None) -> None:
     """Entry point for the ``ngraph`` command.
 
@@ -1210,7 +1465,7 @@ def main(argv: Optional[List[str]] = None) -> None:
         dest="command",
         required=True,
         title="Available commands",
-        metavar="{run,inspect}",
+        metavar="{run,inspect,merge}",
         help="Available commands",
     )
 
@@ -1223,7 +1478,8 @@ def main(argv: Optional[List[str]] = None) -> None:
         type=Path,
         default=None,
         help=(
-            "Export results to JSON file (default: <scenario_name>.results.json;"
+            "Export results to JSON file, or to a compressed results archive"
+            " when the name ends in .zip (default: <scenario_name>.results.json;"
             " placed under --output when provided)"
         ),
     )
@@ -1251,20 +1507,134 @@ def main(argv: Optional[List[str]] = None) -> None:
     run_parser.add_argument(
         "--profile-memory",
         action="store_true",
-        help="Also track peak memory per step (via tracemalloc)",
+        help=(
+            "Record per-step RSS (sampled) and large-structure sizes in step "
+            "metadata; with --profile, also report them"
+        ),
+    )
+    run_parser.add_argument(
+        "--phase-timing",
+        action="store_true",
+        help=(
+            "Record phase timers and counters (failure sampling, masks, Core"
+            " calls, result building) in step metadata"
+        ),
+    )
+    run_parser.add_argument(
+        "--profile-sample",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "With --profile, profile every N-th analysis task in worker threads"
+            " to bound profiling overhead (default: 1, all tasks)"
+        ),
+    )
+    run_parser.add_argument(
+        "--skip-schema-validation",
+        action="store_true",
+        help="Skip JSON schema validation of the scenario (trusted inputs only)",
+    )
+    run_parser.add_argument(
+        "--checkpoint-dir",
+        type=Path,
+        default=None,
+        help=(
+            "Save completed steps and Monte Carlo progress to this directory"
+            " (default with --resume: <scenario_name>.checkpoints)"
+        ),
+    )
+    run_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from its checkpoints",
+    )
+    run_parser.add_argument(
+        "--checkpoint-interval",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Minimum seconds between Monte Carlo progress saves (default: 60)",
+    )
+    run_parser.add_argument(
+        "--no-step-cache",
+        action="store_true",
+        help="With --cache-dir, cache only compiled scenarios, not step results",
+    )
+    run_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Run independent workflow steps concurrently, sharing N analysis"
+            " workers (default: steps run one after another)"
+        ),
+    )
+    run_parser.add_argument(
+        "--shard",
+        default=None,
+        metavar="K/N",
+        help=(
+            "Run only the K-th of N slices of every Monte Carlo step and save"
+            " it for 'ngraph merge' (no results file)"
+        ),
+    )
+    run_parser.add_argument(
+        "--shard-dir",
+        type=Path,
+        default=None,
+        help=(
+            "Directory shared by all shards (default: <scenario_name>.shards;"
+            " placed under --output when provided)"
+        ),
     )
 
     # Inspect command
     inspect_parser = subparsers.add_parser(
-        "inspect", help="Inspect and validate a scenario"
+        "inspect",
+        help="Inspect and validate a scenario, or summarize a results archive",
+    )
+    inspect_parser.add_argument(
+        "scenario", type=Path, help="Path to scenario YAML or results archive (.zip)"
     )
-    inspect_parser.add_argument("scenario", type=Path, help="Path to scenario YAML")
     inspect_parser.add_argument(
         "--detail",
         "-d",
         action="store_true",
         help="Show detailed information including complete node/link tables and step parameters",
     )
+    # Merge command
+    merge_parser = subparsers.add_parser(
+        "merge", help="Merge the shards of a 'run --shard' directory"
+    )
+    merge_parser.add_argument(
+        "shard_dir", type=Path, help="Directory shared by all shards"
+    )
+    merge_parser.add_argument(
+        "--results",
+        "-r",
+        type=Path,
+        default=None,
+        help=(
+            "Export results to JSON file, or to a compressed results archive"
+            " when the name ends in .zip (default: <scenario_name>.results.json;"
+            " placed under --output when provided)"
+        ),
+    )
+    merge_parser.add_argument(
+        "--stdout",
+        action="store_true",
+        help="Print results to stdout",
+    )
+    merge_parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Output directory for the merged results file",
+    )
+
     # Global output directory for all commands
     for p in (run_parser, inspect_parser):
         p.add_argument(
@@ -1278,6 +1648,16 @@ def main(argv: Optional[List[str]] = None) -> None:
                 " consistent '<prefix>.<suffix>' naming convention."
             ),
         )
+        p.add_argument(
+            "--cache-dir",
+            type=Path,
+            default=None,
+            help=(
+                "Cache compiled scenarios in this directory, keyed by YAML"
+                " content and ngraph version (run: also reuse results of"
+                " unchanged steps)"
+            ),
+        )
 
     # Determine effective arguments (support both direct calls and module entrypoint)
     effective_args = sys.argv[1:] if argv is None else argv
@@ -1307,10 +1687,28 @@ def main(argv: Optional[List[str]] = None) -> None:
             keys=args.keys,
             profile=args.profile,
             profile_memory=args.profile_memory,
+            profile_sample=args.profile_sample,
+            record_phases=args.phase_timing,
             output_dir=args.output,
+            cache_dir=args.cache_dir,
+            validate_schema=not args.skip_schema_validation,
+            checkpoint_dir=args.checkpoint_dir,
+            resume=args.resume,
+            checkpoint_interval=args.checkpoint_interval,
+            shard=args.shard,
+            shard_dir=args.shard_dir,
+            workers=args.workers,
+            step_cache=not args.no_step_cache,
         )
     elif args.command == "inspect":
-        _inspect_scenario(args.scenario, args.detail)
+        from ngraph.results.archive import is_results_archive
+
+        if is_results_archive(args.scenario):
+            _inspect_results(args.scenario, args.detail)
+        else:
+            _inspect_scenario(args.scenario, args.detail, cache_dir=args.cache_dir)
+    elif args.command == "merge":
+        _merge_shards(args.shard_dir, args.results, args.stdout, args.output)
 
 
 if __name__ == "__main__":
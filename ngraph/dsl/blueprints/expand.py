@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import copy
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ngraph.dsl.blueprints import parser as _bp_parse
 from ngraph.dsl.expansion import (
@@ -41,6 +41,20 @@ class Blueprint:
     links: List[Dict[str, Any]]
 
 
+@dataclass
+class _BlueprintInstance:
+    """Expanded blueprint nodes and deferred links relative to the instance path.
+
+    Attributes:
+        nodes: (relative name, disabled, risk_groups, attrs) per node, in
+            expansion order.
+        links: (link definition, relative parent path) per deferred link.
+    """
+
+    nodes: List[Tuple[str, bool, Set[str], Dict[str, Any]]]
+    links: List[Tuple[Dict[str, Any], str]]
+
+
 @dataclass
 class DSLExpansionContext:
     """Carries the blueprint definitions and the final Network instance
@@ -50,11 +64,14 @@ class DSLExpansionContext:
         blueprints: Dictionary of blueprint-name -> Blueprint.
         network: The Network into which expanded nodes/links are inserted.
         pending_bp_links: Deferred blueprint link expansions.
+        blueprint_instances: Expanded blueprint templates keyed by blueprint
+            name and instance parameters; reused for identical instances.
     """
 
     blueprints: Dict[str, Blueprint]
     network: Network
     pending_bp_links: List[tuple[Dict[str, Any], str]] = field(default_factory=list)
+    blueprint_instances: Dict[str, _BlueprintInstance] = field(default_factory=dict)
 
 
 def expand_network_dsl(data: Dict[str, Any]) -> Network:
@@ -246,40 +263,30 @@ def _expand_node_group(
         if not isinstance(param_overrides, dict):
             raise ValueError(f"'params' must be a dict in node '{group_name}'.")
 
-        # For each node in the blueprint, apply param overrides and
-        # merge parent's attrs/disabled/risk_groups
-        for bp_sub_name, bp_sub_def in bp.nodes.items():
-            merged_def = _apply_parameters(bp_sub_name, bp_sub_def, param_overrides)
-            merged_def = dict(merged_def)  # ensure we can mutate
-
-            # Force disabled if parent is disabled
-            if parent_disabled:
-                merged_def["disabled"] = True
-
-            # Merge parent's attrs
-            child_attrs = merged_def.get("attrs", {})
-            if not isinstance(child_attrs, dict):
-                raise ValueError(
-                    f"Node '{bp_sub_name}' has non-dict 'attrs' inside blueprint '{blueprint_name}'."
-                )
-            merged_def["attrs"] = {**parent_attrs, **child_attrs}
-
-            # Merge parent's risk_groups with child's
-            child_rgs = expand_risk_group_refs(merged_def.get("risk_groups", []))
-            merged_def["risk_groups"] = parent_risk_groups | child_rgs
-
-            # Recursively expand
-            _expand_node_group(
+        # Instances with identical inputs differ only by path: expand the
+        # blueprint once and stamp renamed copies for the rest.
+        instance_key = repr(
+            (
+                blueprint_name,
+                param_overrides,
+                parent_attrs,
+                parent_disabled,
+                sorted(parent_risk_groups),
+            )
+        )
+        instance = ctx.blueprint_instances.get(instance_key)
+        if instance is None:
+            instance = _build_blueprint_instance(
                 ctx,
-                parent_path=effective_path,
-                group_name=bp_sub_name,
-                group_def=merged_def,
-                inherited_risk_groups=merged_def["risk_groups"],
+                bp,
+                effective_path,
+                param_overrides,
+                parent_attrs,
+                parent_disabled,
+                parent_risk_groups,
             )
-
-        # Defer blueprint links under this parent's path to run after node rules
-        for link_def in bp.links:
-            ctx.pending_bp_links.append((link_def, effective_path))
+            ctx.blueprint_instances[instance_key] = instance
+        _stamp_blueprint_instance(ctx, instance, effective_path)
 
     elif "nodes" in group_def:
         # Nested nodes => recognized keys
@@ -388,6 +395,129 @@ def _expand_node_group(
                 ctx.network.add_node(node)
 
 
+def _build_blueprint_instance(
+    ctx: DSLExpansionContext,
+    bp: Blueprint,
+    effective_path: str,
+    param_overrides: Dict[str, Any],
+    parent_attrs: Dict[str, Any],
+    parent_disabled: bool,
+    parent_risk_groups: Set[str],
+) -> _BlueprintInstance:
+    """Expand a blueprint once in isolation and record it relative to its path.
+
+    For each node in the blueprint, param overrides are applied and the
+    parent's attrs/disabled/risk_groups are merged in. Nested blueprints are
+    expanded through the same instance cache.
+
+    Args:
+        ctx: The expansion context (provides blueprints and the instance cache).
+        bp: Blueprint to expand.
+        effective_path: Path of the instance being expanded.
+        param_overrides: The instance's ``params``.
+        parent_attrs: Attributes merged into every blueprint node.
+        parent_disabled: Whether the instance is disabled.
+        parent_risk_groups: Risk groups inherited by every blueprint node.
+
+    Returns:
+        The expanded instance with names and link paths relative to
+        ``effective_path``.
+    """
+    scratch = DSLExpansionContext(
+        blueprints=ctx.blueprints,
+        network=Network(),
+        blueprint_instances=ctx.blueprint_instances,
+    )
+    for bp_sub_name, bp_sub_def in bp.nodes.items():
+        merged_def = _apply_parameters(bp_sub_name, bp_sub_def, param_overrides)
+        merged_def = dict(merged_def)  # ensure we can mutate
+
+        # Force disabled if parent is disabled
+        if parent_disabled:
+            merged_def["disabled"] = True
+
+        # Merge parent's attrs
+        child_attrs = merged_def.get("attrs", {})
+        if not isinstance(child_attrs, dict):
+            raise ValueError(
+                f"Node '{bp_sub_name}' has non-dict 'attrs' inside blueprint '{bp.name}'."
+            )
+        merged_def["attrs"] = {**parent_attrs, **child_attrs}
+
+        # Merge parent's risk_groups with child's
+        child_rgs = expand_risk_group_refs(merged_def.get("risk_groups", []))
+        merged_def["risk_groups"] = parent_risk_groups | child_rgs
+
+        # Recursively expand
+        _expand_node_group(
+            scratch,
+            parent_path=effective_path,
+            group_name=bp_sub_name,
+            group_def=merged_def,
+            inherited_risk_groups=merged_def["risk_groups"],
+        )
+
+    # Defer blueprint links under this parent's path to run after node rules
+    for link_def in bp.links:
+        scratch.pending_bp_links.append((link_def, effective_path))
+
+    offset = len(effective_path)
+    return _BlueprintInstance(
+        nodes=[
+            (node.name[offset:], node.disabled, node.risk_groups, node.attrs)
+            for node in scratch.network.nodes.values()
+        ],
+        links=[
+            (link_def, parent[offset:]) for link_def, parent in scratch.pending_bp_links
+        ],
+    )
+
+
+def _stamp_blueprint_instance(
+    ctx: DSLExpansionContext, instance: _BlueprintInstance, effective_path: str
+) -> None:
+    """Add a copy of an expanded blueprint instance under ``effective_path``.
+
+    Args:
+        ctx: The expansion context whose network receives the nodes.
+        instance: Template produced by ``_build_blueprint_instance``.
+        effective_path: Path of the new instance.
+    """
+    for rel_name, disabled, risk_groups, attrs in instance.nodes:
+        node = Node(
+            name=effective_path + rel_name,
+            disabled=disabled,
+            attrs=_copy_attrs(attrs),
+        )
+        node.risk_groups = set(risk_groups)
+        ctx.network.add_node(node)
+    for link_def, rel_parent in instance.links:
+        ctx.pending_bp_links.append((link_def, effective_path + rel_parent))
+
+
+_IMMUTABLE_SCALARS = (str, int, float, bool, type(None))
+
+
+def _copy_attrs(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep-copy an attrs dict.
+
+    YAML-derived attrs are scalars, dicts, and lists; those are copied
+    structurally, which is much cheaper than ``copy.deepcopy``. Anything else
+    falls back to ``copy.deepcopy``.
+    """
+    return {k: _copy_value(v) for k, v in attrs.items()}
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, _IMMUTABLE_SCALARS):
+        return value
+    if type(value) is dict:
+        return {k: _copy_value(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_value(v) for v in value]
+    return copy.deepcopy(value)
+
+
 def _normalize_link_selector(sel: Any, base: str) -> Dict[str, Any]:
     """Normalize a source/target selector for link expansion.
 
@@ -674,22 +804,22 @@ def _create_link(
         link_def: Dict with flat link properties.
         count: Number of parallel links to create between source and target.
     """
-    for _ in range(count):
-        capacity = link_def.get("capacity", 1.0)
-        cost = link_def.get("cost", 1.0)
-        attrs = copy.deepcopy(link_def.get("attrs", {}))
-        disabled_flag = bool(link_def.get("disabled", False))
-        link_rgs = expand_risk_group_refs(link_def.get("risk_groups", []))
+    capacity = link_def.get("capacity", 1.0)
+    cost = link_def.get("cost", 1.0)
+    attrs = link_def.get("attrs", {})
+    disabled_flag = bool(link_def.get("disabled", False))
+    link_rgs = expand_risk_group_refs(link_def.get("risk_groups", []))
 
+    for _ in range(count):
         link = Link(
             source=source,
             target=target,
             capacity=capacity,
             cost=cost,
-            attrs=attrs,
+            attrs=_copy_attrs(attrs),
             disabled=disabled_flag,
         )
-        link.risk_groups = link_rgs
+        link.risk_groups = set(link_rgs)
         net.add_link(link)
 
 
@@ -761,9 +891,12 @@ def _process_link_rules(net: Network, network_data: Dict[str, Any]) -> None:
         network_data: DSL data possibly containing 'link_rules'.
     """
     link_rules = network_data.get("link_rules", [])
-    if not isinstance(link_rules, list):
+    if not isinstance(link_rules, list) or not link_rules:
         return
 
+    # Rules never add links, so one adjacency index serves all of them
+    adjacency = _build_link_adjacency(net)
+
     for link_rule in link_rules:
         if not isinstance(link_rule, dict):
             raise ValueError("Each link_rule must be a dict.")
@@ -788,18 +921,40 @@ def _process_link_rules(net: Network, network_data: Dict[str, Any]) -> None:
         expand_spec = ExpansionSpec.from_dict(link_rule)
         if expand_spec and not expand_spec.is_empty():
             for expanded_rule in expand_block(link_rule, expand_spec):
-                _apply_link_rule(net, expanded_rule)
+                _apply_link_rule(net, expanded_rule, adjacency)
         else:
-            _apply_link_rule(net, link_rule)
+            _apply_link_rule(net, link_rule, adjacency)
+
+
+def _build_link_adjacency(net: Network) -> Dict[str, List[str]]:
+    """Map each node name to the IDs of links incident to it.
+
+    Args:
+        net: Network whose links are indexed.
+
+    Returns:
+        Dict of node name -> incident link IDs in link insertion order. A link
+        appears once per distinct endpoint.
+    """
+    adjacency: Dict[str, List[str]] = {}
+    for link_id, link in net.links.items():
+        adjacency.setdefault(link.source, []).append(link_id)
+        if link.target != link.source:
+            adjacency.setdefault(link.target, []).append(link_id)
+    return adjacency
 
 
-def _apply_link_rule(net: Network, rule: Dict[str, Any]) -> None:
+def _apply_link_rule(
+    net: Network,
+    rule: Dict[str, Any],
+    adjacency: Optional[Dict[str, List[str]]] = None,
+) -> None:
     """Apply a single link rule to matching links."""
     source = rule["source"]
     target = rule["target"]
     bidirectional = rule.get("bidirectional", True)
 
-    _update_links(net, source, target, rule, bidirectional)
+    _update_links(net, source, target, rule, bidirectional, adjacency)
 
 
 def _update_links(
@@ -808,6 +963,7 @@ def _update_links(
     target: Any,
     rule: Dict[str, Any],
     bidirectional: bool = True,
+    adjacency: Optional[Dict[str, List[str]]] = None,
 ) -> None:
     """Updates all Link objects between nodes matching source and target selectors
     with new parameters (capacity, cost, disabled, risk_groups, attrs).
@@ -817,12 +973,18 @@ def _update_links(
 
     If risk_groups is given, it *replaces* the link's existing risk_groups.
 
+    Candidate links are taken from the adjacency lists of whichever endpoint
+    set (source or target) has fewer incident links, so the cost is
+    proportional to the selected neighborhood rather than the whole network.
+
     Args:
         net: The network whose links should be updated.
         source: Selector (string path or dict with path/match) for source nodes.
         target: Selector (string path or dict with path/match) for target nodes.
         rule: Rule dict with flat link properties.
         bidirectional: If True, also update reversed direction links.
+        adjacency: Node name -> incident link IDs (see ``_build_link_adjacency``).
+            Built on demand when omitted.
     """
     # Use unified selector system for full selector support
     src_sel = normalize_selector(source, context="override")
@@ -848,7 +1010,19 @@ def _update_links(
     link_match_raw = rule.get("link_match")
     link_match = parse_match_spec(link_match_raw) if link_match_raw else None
 
-    for link_id, link in net.links.items():
+    if adjacency is None:
+        adjacency = _build_link_adjacency(net)
+    # Every matching link touches both endpoint sets; scan the cheaper one
+    src_degree = sum(len(adjacency.get(name, ())) for name in source_nodes)
+    tgt_degree = sum(len(adjacency.get(name, ())) for name in target_nodes)
+    pivot = source_nodes if src_degree <= tgt_degree else target_nodes
+    candidate_ids = dict.fromkeys(
+        link_id for name in pivot for link_id in adjacency.get(name, ())
+    )
+
+    links = net.links
+    for link_id in candidate_ids:
+        link = links[link_id]
         forward_match = link.source in source_nodes and link.target in target_nodes
         reverse_match = (
             bidirectional
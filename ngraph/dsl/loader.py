@@ -3,11 +3,16 @@
 Provides a single entrypoint to parse a YAML string, normalize keys where
 needed, validate against the packaged JSON schema, and return a canonical
 dictionary suitable for downstream expansion/parsing.
+
+Parsing uses the libyaml-backed ``CSafeLoader`` when PyYAML was built with it,
+falling back to the pure-Python ``SafeLoader``. The packaged schema and its
+validator are loaded once per process.
 """
 
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from importlib import resources
 from typing import Any, Dict
 
@@ -15,15 +20,56 @@ import yaml
 
 from ngraph.utils.yaml_utils import normalize_yaml_dict_keys
 
+# Same semantics as yaml.SafeLoader; the C implementation is several times faster
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=1)
+def _scenario_validator() -> Any:
+    """Return a cached JSON schema validator for the packaged scenario schema."""
+    try:
+        import jsonschema  # type: ignore
+    except Exception as exc:  # pragma: no cover
+        raise RuntimeError(
+            "jsonschema is required for scenario validation. Install dev extras or add 'jsonschema' to dependencies."
+        ) from exc
+
+    try:
+        with (
+            resources.files("ngraph.schemas")
+            .joinpath("scenario.json")
+            .open("r", encoding="utf-8")
+        ) as f:  # type: ignore[attr-defined]
+            schema_data = json.load(f)
+    except Exception as exc:  # pragma: no cover
+        raise RuntimeError(
+            "Failed to locate packaged NetGraph scenario schema 'ngraph/schemas/scenario.json'."
+        ) from exc
+
+    validator_cls = jsonschema.validators.validator_for(schema_data)
+    validator_cls.check_schema(schema_data)
+    return validator_cls(schema_data)
+
 
-def load_scenario_yaml(yaml_str: str) -> Dict[str, Any]:
+def load_scenario_yaml(
+    yaml_str: str, *, validate_schema: bool = True
+) -> Dict[str, Any]:
     """Load, normalize, and validate a Scenario YAML string.
 
     Returns a canonical dictionary representation that downstream parsers can
     consume without worrying about YAML-specific quirks (e.g., boolean-like
     keys) and with schema shape already enforced.
+
+    Args:
+        yaml_str: Scenario YAML text.
+        validate_schema: If False, skip JSON schema validation. Structural
+            pre-checks and the top-level key check still run. Intended for
+            trusted, previously validated scenarios where load time matters.
+
+    Returns:
+        Canonical scenario dictionary.
     """
-    data = yaml.safe_load(yaml_str)
+    data = yaml.load(yaml_str, Loader=_SafeLoader)
     if data is None:
         data = {}
     if not isinstance(data, dict):
@@ -72,26 +118,13 @@ def load_scenario_yaml(yaml_str: str) -> Dict[str, Any]:
                 )
 
     # JSON Schema validation
-    try:
+    if validate_schema:
         import jsonschema  # type: ignore
-    except Exception as exc:  # pragma: no cover
-        raise RuntimeError(
-            "jsonschema is required for scenario validation. Install dev extras or add 'jsonschema' to dependencies."
-        ) from exc
-
-    try:
-        with (
-            resources.files("ngraph.schemas")
-            .joinpath("scenario.json")
-            .open("r", encoding="utf-8")
-        ) as f:  # type: ignore[attr-defined]
-            schema_data = json.load(f)
-    except Exception as exc:  # pragma: no cover
-        raise RuntimeError(
-            "Failed to locate packaged NetGraph scenario schema 'ngraph/schemas/scenario.json'."
-        ) from exc
 
-    jsonschema.validate(data, schema_data)  # type: ignore[arg-type]
+        validator = _scenario_validator()
+        error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+        if error is not None:
+            raise error
 
     # Enforce allowed top-level keys
     recognized_keys = {
@@ -113,7 +113,8 @@ def build_failure_policy(
 
     Args:
         fp_data: Policy definition dict with keys: modes (required), attrs,
-            expand_groups, expand_children. Each mode contains weight and rules.
+            expand_groups, expand_children, sampler. Each mode contains weight
+            and rules.
         policy_name: Name identifier for this policy (used for seed derivation).
         derive_seed: Callable to derive deterministic seeds from component names.
 
@@ -190,6 +191,7 @@ def build_failure_policy(
         expand_children=expand_children,
         seed=policy_seed,
         modes=modes,
+        sampler=fp_data.get("sampler", "python"),
     )
 
 
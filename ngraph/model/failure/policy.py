@@ -6,6 +6,12 @@ with simple operators; rules select matches using "all", probabilistic
 "random" (with `probability`), or fixed-size "choice" (with `count`).
 Policies can optionally expand failures by shared risk groups or by
 risk-group children.
+
+Random draws use Python's ``random`` module by default. Policies with
+``sampler="numpy"`` draw from a NumPy ``Generator`` instead: Bernoulli
+selections, uniform choices, and weighted-choice keys are drawn as one vector
+per rule, which is much faster for rules that match many entities. The two
+samplers produce different (each reproducible) streams for the same seed.
 """
 
 from __future__ import annotations
@@ -13,9 +19,27 @@ from __future__ import annotations
 import random as _random
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional, Sequence, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from ngraph.dsl.selectors import Condition, EntityScope, match_entity_ids
+from ngraph.utils.seed_manager import numpy_generator
+
+if TYPE_CHECKING:
+    import numpy as np
+
+FailureSampler = Literal["python", "numpy"]
+_Rng = Union[_random.Random, "np.random.Generator"]
 
 
 @dataclass
@@ -80,7 +104,8 @@ class FailurePolicy:
     """A container for failure modes plus optional metadata in `attrs`.
 
     The main entry point is `apply_failures`, which:
-      1) Build a single RNG for the entire call (from `seed` or `self.seed`).
+      1) Build a single RNG for the entire call (from `seed` or `self.seed`)
+         using the backend selected by `sampler`.
       2) Select a mode based on weights (one RNG draw).
       3) For each rule in the mode, gather relevant entities.
       4) Match based on rule conditions using 'and' or 'or' logic.
@@ -98,6 +123,10 @@ class FailurePolicy:
         seed: Default seed for reproducible random operations. Overridden
             by the ``seed`` parameter on ``apply_failures`` when provided.
         modes: List of weighted failure modes.
+        sampler: Random backend. "python" (default) uses ``random.Random``
+            with one draw per candidate; "numpy" uses a NumPy ``Generator``
+            seeded with ``SeedSequence(seed)`` and draws each rule's
+            selection as a single vector.
     """
 
     attrs: Dict[str, Any] = field(default_factory=dict)
@@ -105,6 +134,11 @@ class FailurePolicy:
     expand_children: bool = False
     seed: Optional[int] = None
     modes: List[FailureMode] = field(default_factory=list)
+    sampler: FailureSampler = "python"
+
+    def __post_init__(self) -> None:
+        if self.sampler not in ("python", "numpy"):
+            raise ValueError(f"sampler={self.sampler!r} must be 'python' or 'numpy'.")
 
     def apply_failures(
         self,
@@ -117,12 +151,13 @@ class FailurePolicy:
     ) -> List[str]:
         """Identify which entities fail for this iteration.
 
-        A single ``random.Random`` instance is created from the effective seed
-        (``seed`` if given, else ``self.seed``).  All random draws -- mode
-        selection followed by per-rule entity selection -- are sequential from
-        this one stream, ensuring that rules are statistically independent.
-        When no seed is available, an unseeded ``Random()`` instance is used so
-        that results are isolated from the global ``random`` module state.
+        A single RNG is created from the effective seed (``seed`` if given,
+        else ``self.seed``): ``random.Random(seed)`` for the python sampler or
+        ``Generator(PCG64(SeedSequence(seed)))`` for the numpy sampler.  All
+        random draws -- mode selection followed by per-rule entity selection --
+        are sequential from this one stream, ensuring that rules are
+        statistically independent.  When no seed is available, an unseeded
+        RNG is used so that results are isolated from global random state.
 
         Args:
             network_nodes: Mapping of node_id -> flattened attribute dict.
@@ -158,11 +193,15 @@ class FailurePolicy:
         # All random draws (mode selection, entity selection across rules)
         # come from this one stream, ensuring statistical independence.
         effective_seed = seed if seed is not None else self.seed
-        rng = (
-            _random.Random(effective_seed)
-            if effective_seed is not None
-            else _random.Random()
-        )
+        rng: _Rng
+        if self.sampler == "numpy":
+            rng = numpy_generator(effective_seed)
+        else:
+            rng = (
+                _random.Random(effective_seed)
+                if effective_seed is not None
+                else _random.Random()
+            )
 
         # Determine rules from a selected mode (or none if no modes)
         rules_to_apply: Sequence[FailureRule] = []
@@ -288,7 +327,7 @@ class FailurePolicy:
     def _select_entities(
         entity_ids: Set[str],
         rule: FailureRule,
-        rng: _random.Random,
+        rng: _Rng,
         entity_map: Dict[str, Any],
     ) -> Set[str]:
         """Select entities for failure per rule.
@@ -301,15 +340,20 @@ class FailurePolicy:
             entity_ids: Set of candidate entity IDs.
             rule: The failure rule specifying selection strategy.
             rng: Random instance shared across the entire apply_failures call.
+                A NumPy Generator dispatches to the vectorized selection.
             entity_map: Mapping of entity_id -> attribute dict.
         """
         if not entity_ids:
             return set()
+        if not isinstance(rng, _random.Random):
+            return FailurePolicy._select_entities_vectorized(
+                entity_ids, rule, rng, entity_map
+            )
 
         # Ensure deterministic mapping from RNG draws to entity IDs by
         # iterating entities in a stable order. Set iteration order is
         # intentionally non-deterministic across processes (hash randomization).
-        ordered_ids = sorted(entity_ids)
+        ordered_ids = FailurePolicy._ordered_ids(entity_ids, entity_map)
 
         if rule.mode == "random":
             return {eid for eid in ordered_ids if rng.random() < rule.probability}
@@ -359,6 +403,88 @@ class FailurePolicy:
         else:
             raise ValueError(f"Unsupported mode: {rule.mode}")
 
+    @staticmethod
+    def _select_entities_vectorized(
+        entity_ids: Set[str],
+        rule: FailureRule,
+        rng: "np.random.Generator",
+        entity_map: Dict[str, Any],
+    ) -> Set[str]:
+        """Select entities for failure per rule using whole-vector draws.
+
+        Same semantics as ``_select_entities``; the draws per rule are:
+        "random" -- one uniform vector over the sorted candidates;
+        "choice" -- one ``Generator.choice`` without replacement, or for
+        ``weight_by`` one uniform vector for Efraimidis-Spirakis keys over the
+        positive-weight candidates plus one choice to fill from zero-weight
+        candidates.
+        """
+        import numpy as np
+
+        if rule.mode == "all":
+            return entity_ids
+        ordered_ids = FailurePolicy._ordered_ids(entity_ids, entity_map)
+        n = len(ordered_ids)
+
+        if rule.mode == "random":
+            hits = np.flatnonzero(rng.random(n) < rule.probability)
+            return {ordered_ids[i] for i in hits.tolist()}
+        elif rule.mode == "choice":
+            count = min(rule.count, n)
+            if count <= 0:
+                return set()
+
+            if rule.weight_by:
+                weights = np.fromiter(
+                    (
+                        FailurePolicy._extract_weight(
+                            entity_map.get(eid), rule.weight_by
+                        )
+                        for eid in ordered_ids
+                    ),
+                    dtype=np.float64,
+                    count=n,
+                )
+                positive = np.flatnonzero(weights > 0.0)
+                picked: List[int] = []
+                if positive.size:
+                    k = min(count, int(positive.size))
+                    # Keys log(U)/w rank like U^(1/w); 1 - U avoids log(0)
+                    keys = np.log1p(-rng.random(positive.size)) / weights[positive]
+                    if k < positive.size:
+                        top = np.argpartition(-keys, k - 1)[:k]
+                    else:
+                        top = np.arange(positive.size)
+                    picked.extend(positive[top].tolist())
+                remaining = count - len(picked)
+                zeros = np.flatnonzero(weights <= 0.0)
+                if remaining > 0 and zeros.size:
+                    fill = rng.choice(
+                        zeros.size, size=min(remaining, int(zeros.size)), replace=False
+                    )
+                    picked.extend(zeros[fill].tolist())
+                if picked:
+                    return {ordered_ids[i] for i in picked}
+
+            chosen = rng.choice(n, size=count, replace=False)
+            return {ordered_ids[i] for i in chosen.tolist()}
+        else:
+            raise ValueError(f"Unsupported mode: {rule.mode}")
+
+    @staticmethod
+    def _ordered_ids(entity_ids: Set[str], entity_map: Dict[str, Any]) -> List[str]:
+        """Return ``entity_ids`` sorted.
+
+        Candidates are collected in ``entity_map`` order first: maps are
+        usually built in (nearly) sorted order, which timsort handles in close
+        to linear time, unlike the random order of a set.
+        """
+        ordered = [eid for eid in entity_map if eid in entity_ids]
+        if len(ordered) != len(entity_ids):
+            return sorted(entity_ids)
+        ordered.sort()
+        return ordered
+
     @staticmethod
     def _extract_weight(entity: Any, attr_name: str) -> float:
         """Extract weight attribute from entity which can be dict-like or object.
@@ -417,7 +543,7 @@ class FailurePolicy:
         return selected_ids
 
     @staticmethod
-    def _select_mode_index(modes: Sequence["FailureMode"], rng: _random.Random) -> int:
+    def _select_mode_index(modes: Sequence["FailureMode"], rng: _Rng) -> int:
         """Select a mode index based on normalized weights.
 
         Modes with non-positive weights are ignored.
@@ -547,6 +673,7 @@ class FailurePolicy:
             "expand_groups": self.expand_groups,
             "expand_children": self.expand_children,
             "seed": self.seed,
+            "sampler": self.sampler,
         }
         if self.modes:
             data["modes"] = [
@@ -7,14 +7,76 @@ that can be used independently.
 from __future__ import annotations
 
 import re
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 from ngraph.logging import get_logger
 from ngraph.utils.ids import new_base64_uuid
 
+if TYPE_CHECKING:
+    import numpy as np
+
 LOGGER = get_logger(__name__)
 
+_REGEX_META = frozenset(".^$*+?{}[]|()")
+
+
+def _regex_literal_prefix(pattern: str) -> str:
+    """Return a literal prefix that every ``re.match`` of ``pattern`` must start with.
+
+    The scan is conservative: it stops at the first metacharacter and returns
+    an empty string whenever the pattern may contain a top-level alternation.
+
+    Args:
+        pattern: Regular expression used with ``re.match``.
+
+    Returns:
+        Literal prefix, possibly empty.
+    """
+    if "|" in pattern and ("[" in pattern or _has_top_level_alternation(pattern)):
+        return ""
+    chars: List[str] = []
+    i = 1 if pattern.startswith("^") else 0
+    n = len(pattern)
+    while i < n:
+        ch = pattern[i]
+        if ch == "\\":
+            nxt = pattern[i + 1] if i + 1 < n else ""
+            if not nxt or nxt.isalnum():
+                break
+            chars.append(nxt)
+            i += 2
+            continue
+        if ch in _REGEX_META:
+            # The last literal is optional under these quantifiers
+            if ch in "*?{" and chars:
+                chars.pop()
+            break
+        chars.append(ch)
+        i += 1
+    return "".join(chars)
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
 
 @dataclass
 class Node:
@@ -99,6 +161,34 @@ class RiskGroup:
     _membership_raw: Optional[Dict[str, Any]] = field(default=None, repr=False)
 
 
+@dataclass(frozen=True)
+class LinkArrays:
+    """Columnar (struct-of-arrays) view of a Network's nodes and links.
+
+    Nodes are ordered by name and links by link ID, which is the order used
+    when building Core graphs. ``src`` and ``dst`` index into ``node_names``.
+
+    Attributes:
+        node_names: Node names in sorted order.
+        link_ids: Link IDs in sorted order.
+        src: Source node index per link (int32).
+        dst: Target node index per link (int32).
+        capacity: Capacity per link (float64).
+        cost: Cost per link (float64).
+        disabled: Disabled flag per link (bool).
+        node_disabled: Disabled flag per node (bool).
+    """
+
+    node_names: List[str]
+    link_ids: List[str]
+    src: np.ndarray
+    dst: np.ndarray
+    capacity: np.ndarray
+    cost: np.ndarray
+    disabled: np.ndarray
+    node_disabled: np.ndarray
+
+
 @dataclass
 class Network:
     """A container for network nodes and links.
@@ -122,6 +212,26 @@ class Network:
     _selection_cache: Dict[str, Dict[str, List[Node]]] = field(
         default_factory=dict, init=False, repr=False
     )
+    # Sorted node names for prefix lookups (see select_node_groups_by_path)
+    _name_index: Optional[Tuple[List[str], List[int], List[Node]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Incrementally maintained link columns in insertion order (see link_arrays)
+    _node_pos: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _link_seq: List[str] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _link_src_pos: array = field(
+        default_factory=lambda: array("q"), init=False, repr=False, compare=False
+    )
+    _link_dst_pos: array = field(
+        default_factory=lambda: array("q"), init=False, repr=False, compare=False
+    )
+    _structure_cache: Optional[Tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add_node(self, node: Node) -> None:
         """Add a node to the network (keyed by node.name).
@@ -134,8 +244,12 @@ class Network:
         """
         if node.name in self.nodes:
             raise ValueError(f"Node '{node.name}' already exists in the network.")
+        if len(self._node_pos) == len(self.nodes):
+            self._node_pos[node.name] = len(self._node_pos)
         self.nodes[node.name] = node
         self._selection_cache.clear()  # Invalidate cache on modification
+        self._name_index = None
+        self._structure_cache = None
 
     def add_link(self, link: Link) -> None:
         """Add a link to the network (keyed by the link's auto-generated ID).
@@ -151,7 +265,132 @@ class Network:
         if link.target not in self.nodes:
             raise ValueError(f"Target node '{link.target}' not found in network.")
 
+        in_sync = len(self._link_seq) == len(self.links) and len(self._node_pos) == len(
+            self.nodes
+        )
+        if in_sync and link.id not in self.links:
+            self._link_seq.append(link.id)
+            self._link_src_pos.append(self._node_pos[link.source])
+            self._link_dst_pos.append(self._node_pos[link.target])
         self.links[link.id] = link
+        self._structure_cache = None
+
+    def relabel_links(self, link_ids: List[str]) -> None:
+        """Replace the IDs of all links, in insertion order.
+
+        Used to keep link IDs stable across rebuilds of identical network
+        content (see ``ngraph.utils.step_cache``).
+
+        Args:
+            link_ids: New IDs, one per link in insertion order. Each must keep
+                the ``"{source}|{target}|"`` prefix of its link.
+
+        Raises:
+            ValueError: If the count, uniqueness, or a prefix does not match.
+        """
+        links = list(self.links.values())
+        if len(link_ids) != len(links) or len(set(link_ids)) != len(link_ids):
+            raise ValueError("link_ids must contain one unique ID per link")
+        for link, new_id in zip(links, link_ids, strict=True):
+            if not new_id.startswith(f"{link.source}|{link.target}|"):
+                raise ValueError(f"ID '{new_id}' does not match link {link.id}")
+        self.links = {}
+        self._link_seq = []
+        self._link_src_pos = array("q")
+        self._link_dst_pos = array("q")
+        for link, new_id in zip(links, link_ids, strict=True):
+            link.id = new_id
+            self.add_link(link)
+
+    def link_arrays(self) -> LinkArrays:
+        """Return a columnar view of nodes and links for graph construction.
+
+        Link endpoints are tracked incrementally by ``add_node``/``add_link``,
+        and the sorted node/link ordering is cached until the next structural
+        change. Capacity, cost, and disabled flags are gathered from the
+        Node/Link objects on every call, so direct attribute edits are always
+        reflected.
+
+        Nodes or links added, removed or replaced in ``nodes``/``links``
+        directly (bypassing ``add_node``/``add_link``) are picked up by a
+        one-off rebuild when the dictionary keys no longer match the tracked
+        columns. ``Link.source``/``Link.target`` must not be edited in place
+        (link IDs embed the endpoints); remove and re-add the link instead.
+
+        Returns:
+            LinkArrays snapshot ordered by node name and link ID.
+
+        Raises:
+            KeyError: If a link references a node that is not in the network.
+        """
+        # Deferred so that building a model does not require loading NumPy
+        import numpy as np
+
+        self._sync_link_columns()
+        if self._structure_cache is None:
+            ins_names = list(self._node_pos)
+            node_order = sorted(range(len(ins_names)), key=ins_names.__getitem__)
+            node_rank = np.empty(len(ins_names), dtype=np.int64)
+            node_rank[node_order] = np.arange(len(ins_names), dtype=np.int64)
+
+            link_seq = self._link_seq
+            link_order = np.array(
+                sorted(range(len(link_seq)), key=link_seq.__getitem__),
+                dtype=np.int64,
+            )
+            src_pos = np.frombuffer(self._link_src_pos, dtype=np.int64)
+            dst_pos = np.frombuffer(self._link_dst_pos, dtype=np.int64)
+
+            self._structure_cache = (
+                list(map(ins_names.__getitem__, node_order)),
+                list(map(link_seq.__getitem__, link_order.tolist())),
+                node_rank[src_pos[link_order]].astype(np.int32),
+                node_rank[dst_pos[link_order]].astype(np.int32),
+            )
+
+        node_names, link_ids, src, dst = self._structure_cache
+        links = list(map(self.links.__getitem__, link_ids))
+        nodes = map(self.nodes.__getitem__, node_names)
+        count = len(links)
+        return LinkArrays(
+            node_names=node_names,
+            link_ids=link_ids,
+            src=src,
+            dst=dst,
+            capacity=np.fromiter(
+                map(attrgetter("capacity"), links), dtype=np.float64, count=count
+            ),
+            cost=np.fromiter(
+                map(attrgetter("cost"), links), dtype=np.float64, count=count
+            ),
+            disabled=np.fromiter(
+                map(attrgetter("disabled"), links), dtype=bool, count=count
+            ),
+            node_disabled=np.fromiter(
+                map(attrgetter("disabled"), nodes), dtype=bool, count=len(node_names)
+            ),
+        )
+
+    def _sync_link_columns(self) -> None:
+        """Rebuild tracked link columns if nodes/links were edited directly.
+
+        Compares membership, not sizes, so same-size replacements (e.g.
+        ``del links[a]; links[b.id] = b``) are detected as well.
+        """
+        if self._node_pos.keys() == self.nodes.keys() and self._link_seq == list(
+            self.links
+        ):
+            return
+        self._node_pos = {name: pos for pos, name in enumerate(self.nodes)}
+        self._link_seq = list(self.links)
+        node_pos = self._node_pos
+        self._link_src_pos = array(
+            "q", [node_pos[link.source] for link in self.links.values()]
+        )
+        self._link_dst_pos = array(
+            "q", [node_pos[link.target] for link in self.links.values()]
+        )
+        self._structure_cache = None
 
     def select_node_groups_by_path(self, path: str) -> Dict[str, List[Node]]:
         r"""Select and group nodes by regex pattern on node name.
@@ -160,6 +399,10 @@ class Network:
         - With capturing groups: label is "|"-joined non-None captures.
         - Without captures: label is the original pattern string.
 
+        Patterns that start with a literal prefix (e.g. ``"dc1/pod2/leaf.*"``)
+        are evaluated only against nodes whose names share that prefix, found
+        via a sorted name index. Results keep node insertion order.
+
         Note: For attribute-based grouping, use the unified selector system
         with ``{"group_by": "attr_name"}`` dict selectors.
 
@@ -176,7 +419,9 @@ class Network:
         pattern = re.compile(path)
         groups_map: Dict[str, List[Node]] = {}
 
-        for node in self.nodes.values():
+        prefix = _regex_literal_prefix(path)
+        candidates = self._nodes_with_prefix(prefix) if prefix else self.nodes.values()
+        for node in candidates:
             match = pattern.match(node.name)
             if match:
                 captures = match.groups()
@@ -189,6 +434,22 @@ class Network:
         self._selection_cache[path] = groups_map
         return groups_map
 
+    def _nodes_with_prefix(self, prefix: str) -> List[Node]:
+        """Return nodes whose name starts with ``prefix``, in insertion order."""
+        index = self._name_index
+        if index is None or len(index[2]) != len(self.nodes):
+            node_list = list(self.nodes.values())
+            names = [node.name for node in node_list]
+            order = sorted(range(len(names)), key=names.__getitem__)
+            index = ([names[i] for i in order], order, node_list)
+            self._name_index = index
+        sorted_names, order, node_list = index
+        lo = bisect_left(sorted_names, prefix)
+        hi = lo
+        while hi < len(sorted_names) and sorted_names[hi].startswith(prefix):
+            hi += 1
+        return [node_list[i] for i in sorted(order[lo:hi])]
+
     def disable_node(self, node_name: str) -> None:
         """Mark a node as disabled.
 
@@ -5,8 +5,13 @@ This package exposes public profiling APIs for workflow execution:
 - ``PerformanceProfiler``: CPU and wall-time profiling per workflow step.
 - ``PerformanceReporter``: Text report generation from profiling results.
 - ``ProfileResults`` and ``StepProfile``: Data structures for collected metrics.
+- ``WorkerProfiles``: In-memory profiles of worker-thread analysis tasks.
+- ``StepMemory``: Sampled RSS and large-structure sizes of a workflow step.
 """
 
+from .memory import (
+    StepMemory as StepMemory,
+)
 from .profiler import (
     PerformanceProfiler as PerformanceProfiler,
 )
@@ -19,10 +24,15 @@ from .profiler import (
 from .profiler import (
     StepProfile as StepProfile,
 )
+from .workers import (
+    WorkerProfiles as WorkerProfiles,
+)
 
 __all__ = [
     "PerformanceProfiler",
     "PerformanceReporter",
     "ProfileResults",
+    "StepMemory",
     "StepProfile",
+    "WorkerProfiles",
 ]
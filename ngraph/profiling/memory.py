@@ -0,0 +1,201 @@
+"""Per-step process memory sampling and structure attribution.
+
+``StepMemory`` samples the resident set size (RSS) of the process from
+``/proc/self/statm`` in a background thread while a step runs, so native
+allocations by netgraph_core and NumPy are included and Python allocations
+run at full speed (unlike ``tracemalloc``). Sampling costs one small file
+read per interval; the peak between samples can be missed, which the
+``samples`` count helps judge.
+
+Analysis code attributes large structures to the active step with
+``note_structure(name, nbytes)``; the largest size seen per name is kept.
+Attributed structures:
+
+- ``graph_arrays``: Core graph arrays of analysis contexts (CSR adjacency,
+  capacities, costs, edge ids).
+- ``dag_cache``: SPF distances and predecessor DAGs cached by one demand
+  placement call.
+- ``monte_carlo_results``: analysis results held by ``FailureManager``
+  before they are stored (approximate).
+- ``results``: stored step results (approximate).
+
+``WorkflowStep.execute`` records ``memory`` in the step metadata when memory
+tracking is enabled (``memory_tracking()``, ``ngraph run --profile-memory``).
+RSS is process-wide: with concurrently running steps the figures overlap.
+On systems without ``/proc`` the RSS fields are None.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Generator, Optional
+
+_enabled = False
+_active: ContextVar[Optional["StepMemory"]] = ContextVar(
+    "ngraph_step_memory", default=None
+)
+
+_STATM = "/proc/self/statm"
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):  # pragma: no cover - non-POSIX
+    _PAGE_SIZE = 4096
+
+# Default seconds between RSS samples
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+
+@contextmanager
+def memory_tracking(enabled: bool = True) -> Generator[None, None, None]:
+    """Enable (or disable) per-step memory recording within the block."""
+    global _enabled
+    previous, _enabled = _enabled, bool(enabled)
+    try:
+        yield
+    finally:
+        _enabled = previous
+
+
+def memory_tracking_enabled() -> bool:
+    """Return True if workflow steps record memory in their metadata."""
+    return _enabled
+
+
+def rss_bytes() -> Optional[int]:
+    """Return the current resident set size of the process, or None."""
+    try:
+        with open(_STATM, "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def approx_size(obj: Any) -> int:
+    """Return an approximate deep size of ``obj`` in bytes.
+
+    Follows containers, instance ``__dict__``/``__slots__`` and counts NumPy
+    arrays by ``nbytes``. Shared objects are counted once.
+    """
+    seen: set[int] = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        nbytes = getattr(item, "nbytes", None)
+        if isinstance(nbytes, int) and hasattr(item, "dtype"):
+            total += nbytes
+            continue
+        total += sys.getsizeof(item, 0)
+        if isinstance(item, (str, bytes, bytearray, int, float, bool)):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        else:
+            attrs = getattr(item, "__dict__", None)
+            if attrs is not None:
+                stack.append(attrs)
+            for slot in getattr(type(item), "__slots__", ()):
+                value = getattr(item, slot, None)
+                if value is not None:
+                    stack.append(value)
+    return total
+
+
+class StepMemory:
+    """RSS sampler and structure sizes of one workflow step.
+
+    Args:
+        interval: Seconds between RSS samples.
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL) -> None:
+        self.interval = float(interval)
+        self.rss_start: Optional[int] = None
+        self.rss_end: Optional[int] = None
+        self.rss_peak: Optional[int] = None
+        self.samples = 0
+        self._structures: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        rss = rss_bytes()
+        if rss is None:
+            return
+        with self._lock:
+            self.samples += 1
+            if self.rss_peak is None or rss > self.rss_peak:
+                self.rss_peak = rss
+            self.rss_end = rss
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def note(self, name: str, nbytes: int) -> None:
+        """Record the size of a structure (the largest size per name is kept)."""
+        with self._lock:
+            if nbytes > self._structures.get(name, -1):
+                self._structures[name] = int(nbytes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return RSS figures and structure sizes in bytes."""
+        with self._lock:
+            delta = (
+                self.rss_end - self.rss_start
+                if self.rss_end is not None and self.rss_start is not None
+                else None
+            )
+            return {
+                "rss_start": self.rss_start,
+                "rss_end": self.rss_end,
+                "rss_peak": self.rss_peak,
+                "rss_delta": delta,
+                "samples": self.samples,
+                "structures": dict(sorted(self._structures.items())),
+            }
+
+    @contextmanager
+    def activate(self) -> Generator["StepMemory", None, None]:
+        """Sample RSS and collect structure sizes while the context is active."""
+        self.rss_start = rss_bytes()
+        self._sample()
+        token = _active.set(self)
+        self._stop.clear()
+        if self.rss_start is not None:
+            self._thread = threading.Thread(
+                target=self._poll, name="ngraph-memory-sampler", daemon=True
+            )
+            self._thread.start()
+        try:
+            yield self
+        finally:
+            self._stop.set()
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+            _active.reset(token)
+            self._sample()
+
+
+def active_memory() -> Optional[StepMemory]:
+    """Return the ``StepMemory`` of the current context, if any."""
+    return _active.get()
+
+
+def note_structure(name: str, nbytes: int) -> None:
+    """Attribute ``nbytes`` to structure ``name`` of the active step, if any."""
+    memory = _active.get()
+    if memory is not None:
+        memory.note(name, nbytes)
@@ -0,0 +1,149 @@
+"""Phase timers and counters for analysis hot paths.
+
+Analysis code marks its phases with ``phase(name)`` (a timer) and
+``count(name)`` (a counter). Both are no-ops unless a ``PhaseRecorder`` is
+active in the current context, so the instrumentation is always in place and
+costs one context-variable lookup when disabled.
+
+``WorkflowStep.execute`` activates a recorder per step when phase timing is
+enabled (``enable_phase_timing()``, ``phase_timing()``, or ``ngraph run
+--phase-timing`` / ``--profile``) and stores its summary under ``phases`` in
+the step metadata.
+``FailureManager`` propagates the context to its worker threads, so timers
+sum over threads and may exceed the step's wall time for parallel steps.
+
+Instrumented phases:
+
+- ``failures.sample``: failure policy application (exclusion sets).
+- ``analysis.masks``: node and edge mask construction.
+- ``core.spf``, ``core.max_flow``, ``core.sensitivity``: Core calls.
+- ``results.build``: ``FlowIterationResult`` construction.
+- ``results.serialize``: conversion of step results to dictionaries.
+
+Counters: ``placement.dag_cache_hits`` / ``placement.dag_cache_misses`` (SPF
+DAG reuse across demands from the same source) and
+``failures.iterations`` / ``failures.unique_patterns`` (Monte Carlo
+deduplication).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Generator, Optional
+
+_enabled = False
+_recorder: ContextVar[Optional["PhaseRecorder"]] = ContextVar(
+    "ngraph_phase_recorder", default=None
+)
+
+
+def enable_phase_timing(enabled: bool = True) -> None:
+    """Enable or disable per-step phase recording for this process."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+@contextmanager
+def phase_timing(enabled: bool = True) -> Generator[None, None, None]:
+    """Enable (or disable) per-step phase recording within the block."""
+    global _enabled
+    previous, _enabled = _enabled, bool(enabled)
+    try:
+        yield
+    finally:
+        _enabled = previous
+
+
+def phase_timing_enabled() -> bool:
+    """Return True if workflow steps record phase timers and counters."""
+    return _enabled
+
+
+class PhaseRecorder:
+    """Thread-safe accumulator of named timers and counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._timers: Dict[str, list[float]] = {}
+        self._counters: Dict[str, int] = {}
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add one timed call of ``seconds`` to timer ``name``."""
+        with self._lock:
+            entry = self._timers.get(name)
+            if entry is None:
+                self._timers[name] = [seconds, 1]
+            else:
+                entry[0] += seconds
+                entry[1] += 1
+
+    def add_count(self, name: str, n: int = 1) -> None:
+        """Increase counter ``name`` by ``n``."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return ``{"timers": {name: {"seconds", "calls"}}, "counters": {...}}``."""
+        with self._lock:
+            return {
+                "timers": {
+                    name: {"seconds": float(seconds), "calls": int(calls)}
+                    for name, (seconds, calls) in sorted(self._timers.items())
+                },
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    @contextmanager
+    def activate(self) -> Generator["PhaseRecorder", None, None]:
+        """Record phases of the current context into this recorder."""
+        token = _recorder.set(self)
+        try:
+            yield self
+        finally:
+            _recorder.reset(token)
+
+
+class _PhaseTimer:
+    __slots__ = ("_recorder", "_name", "_start")
+
+    def __init__(self, recorder: PhaseRecorder, name: str) -> None:
+        self._recorder = recorder
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc: Any) -> None:
+        self._recorder.add_time(self._name, time.perf_counter() - self._start)
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NO_PHASE = _NoPhase()
+
+
+def phase(name: str) -> Any:
+    """Return a context manager timing phase ``name`` (no-op when inactive)."""
+    recorder = _recorder.get()
+    if recorder is None:
+        return _NO_PHASE
+    return _PhaseTimer(recorder, name)
+
+
+def count(name: str, n: int = 1) -> None:
+    """Increase counter ``name`` by ``n`` (no-op when inactive)."""
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder.add_count(name, n)
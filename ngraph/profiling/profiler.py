@@ -1,8 +1,9 @@
 """Profiling for NetGraph workflow execution.
 
 Provides CPU and wall-clock timing per workflow step using ``cProfile`` and
-optionally peak memory via ``tracemalloc``. Aggregates results into structured
-summaries and identifies time-dominant steps (bottlenecks).
+optionally memory via the RSS sampler of ``ngraph.profiling.memory``. Aggregates
+results into structured summaries and identifies time-dominant steps
+(bottlenecks).
 """
 
 from __future__ import annotations
@@ -11,13 +12,14 @@ import cProfile
 import io
 import pstats
 import time
-import tracemalloc
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional, Tuple
 
 from ngraph.logging import get_logger
+from ngraph.profiling.memory import StepMemory
+from ngraph.profiling.workers import WorkerProfiles
 
 logger = get_logger(__name__)
 
@@ -32,9 +34,14 @@ class StepProfile:
         wall_time: Total wall-clock time in seconds.
         cpu_time: CPU time spent in step execution.
         function_calls: Number of function calls during execution.
-        memory_peak: Peak memory usage during step in bytes (if available).
+        memory_peak: Peak process RSS during the step in bytes (if available).
         cprofile_stats: Detailed cProfile statistics object.
-        worker_profiles_merged: Number of worker profiles merged into this step.
+        worker_profiles_merged: Number of worker-thread analysis tasks whose
+            profiles are merged into ``cprofile_stats``.
+        phases: Phase timers and counters recorded by the step (the
+            ``phases`` entry of its results metadata), if any.
+        memory: RSS figures and structure sizes of the step (the ``memory``
+            entry of its results metadata), if memory was tracked.
     """
 
     step_name: str
@@ -45,6 +52,8 @@ class StepProfile:
     memory_peak: Optional[float] = None
     cprofile_stats: Optional[pstats.Stats] = None
     worker_profiles_merged: int = 0
+    phases: Optional[Dict[str, Any]] = None
+    memory: Optional[Dict[str, Any]] = None
 
 
 @dataclass
@@ -74,13 +83,25 @@ class PerformanceProfiler:
     Profiles workflow steps using cProfile and identifies bottlenecks.
     """
 
-    def __init__(self, track_memory: bool = False):
+    def __init__(self, track_memory: bool = False, worker_sample_every: int = 1):
         """Initialize the performance profiler.
 
         Args:
-            track_memory: If True, record peak memory per step using tracemalloc.
+            track_memory: If True, sample process RSS per step and record the
+                sizes of large structures (see ``ngraph.profiling.memory``).
+            worker_sample_every: Profile every N-th analysis task run in worker
+                threads (1 profiles all tasks). Larger values bound the
+                profiling overhead of long Monte Carlo runs.
+
+        Raises:
+            ValueError: If ``worker_sample_every`` is less than 1.
         """
+        if worker_sample_every < 1:
+            raise ValueError(
+                f"worker_sample_every must be >= 1, got {worker_sample_every}"
+            )
         self.results = ProfileResults()
+        self._worker_sample_every = int(worker_sample_every)
         self._scenario_start_time: Optional[float] = None
         self._scenario_end_time: Optional[float] = None
         self._track_memory: bool = bool(track_memory)
@@ -134,19 +155,19 @@ class PerformanceProfiler:
         start_time = time.perf_counter()
         profiler = cProfile.Profile()
         profiler.enable()
+        # Worker threads are invisible to this profiler; collect them separately
+        workers = WorkerProfiles(self._worker_sample_every)
 
-        # Optional: per-step tracemalloc to capture peak memory
-        mem_tracing_started = False
-        if self._track_memory:
-            try:
-                tracemalloc.start()
-                mem_tracing_started = True
-            except RuntimeError:
-                # Another tracemalloc session might be active; skip memory tracking
-                mem_tracing_started = False
+        # Optional: RSS sampling; the step attributes structures to it
+        memory = StepMemory() if self._track_memory else None
 
         try:
-            yield
+            with workers.activate():
+                if memory is None:
+                    yield
+                else:
+                    with memory.activate():
+                        yield
         finally:
             # Capture end time
             end_time = time.perf_counter()
@@ -155,9 +176,12 @@ class PerformanceProfiler:
             # Capture CPU profiling data
             profiler.disable()
 
-            # Create stats object for analysis
+            # Create stats object for analysis, including worker-thread tasks
             stats_stream = io.StringIO()
             stats = pstats.Stats(profiler, stream=stats_stream)
+            worker_stats, worker_tasks = workers.flush()
+            if worker_stats is not None:
+                stats.add(worker_stats)
 
             # Extract CPU time and function call counts
             # Access stats data through the stats attribute (pstats internal structure)
@@ -171,20 +195,8 @@ class PerformanceProfiler:
                 stat_tuple[0] for stat_tuple in stats_data.values()
             )  # cc = call count
 
-            # Optional: capture peak memory usage
-            memory_peak_bytes: Optional[int] = None
-            if mem_tracing_started:
-                try:
-                    current, peak = tracemalloc.get_traced_memory()
-                    memory_peak_bytes = int(peak)
-                except Exception as exc:
-                    logger.debug("Failed to get traced memory: %s", exc)
-                    memory_peak_bytes = None
-                finally:
-                    try:
-                        tracemalloc.stop()
-                    except Exception as exc:
-                        logger.debug("Failed to stop tracemalloc: %s", exc)
+            memory_info = memory.to_dict() if memory is not None else None
+            memory_peak_bytes = memory_info["rss_peak"] if memory_info else None
 
             # Create step profile
             step_profile = StepProfile(
@@ -197,6 +209,8 @@ class PerformanceProfiler:
                 if memory_peak_bytes is not None
                 else None,
                 cprofile_stats=stats,
+                worker_profiles_merged=worker_tasks,
+                memory=memory_info,
             )
 
             self.results.step_profiles.append(step_profile)
@@ -206,62 +220,17 @@ class PerformanceProfiler:
                 f"({wall_time:.3f}s wall, {cpu_time:.3f}s CPU, {function_calls:,} calls)"
             )
 
-    def merge_child_profiles(self, profile_dir: Path, step_name: str) -> None:
-        """Merge child worker profiles into the parent step profile.
+    def record_phases(self, step_name: str, phases: Optional[Dict[str, Any]]) -> None:
+        """Attach the phase timers and counters of a profiled step.
 
         Args:
-            profile_dir: Directory containing worker profile files.
-            step_name: Name of the workflow step these workers belong to.
+            step_name: Name of the profiled workflow step.
+            phases: The ``phases`` entry of the step's results metadata.
         """
-        # Find the step profile to merge into
-        step_profile = None
         for profile in self.results.step_profiles:
             if profile.step_name == step_name:
-                step_profile = profile
-                break
-
-        if not step_profile or not step_profile.cprofile_stats:
-            logger.warning(f"No parent profile found for step: {step_name}")
-            return
-
-        # Find all worker profile files for this step
-        worker_files = list(profile_dir.glob("*_worker_*.pstats"))
-        if not worker_files:
-            logger.debug(f"No worker profiles found in {profile_dir}")
-            return
-
-        logger.debug(f"Found {len(worker_files)} worker profiles to merge")
-
-        # Merge all worker stats into the parent stats
-        try:
-            merged_count = 0
-            for worker_file in worker_files:
-                step_profile.cprofile_stats.add(str(worker_file))
-                logger.debug(f"Merged worker profile: {worker_file.name}")
-                merged_count += 1
-
-            # Update function call count after merge
-            stats_data = getattr(step_profile.cprofile_stats, "stats", {})
-            step_profile.function_calls = sum(
-                stat_tuple[0] for stat_tuple in stats_data.values()
-            )
-            step_profile.worker_profiles_merged = merged_count
-
-            logger.info(
-                f"Merged {len(worker_files)} worker profiles into step '{step_name}'"
-            )
-
-            # Clean up worker files after successful merge
-            for worker_file in worker_files:
-                try:
-                    worker_file.unlink()
-                except Exception as exc:
-                    logger.debug(
-                        "Failed to remove worker profile %s: %s", worker_file, exc
-                    )
-
-        except Exception as e:
-            logger.warning(f"Failed to merge worker profiles: {type(e).__name__}: {e}")
+                profile.phases = phases or None
+                return
 
     def analyze_performance(self) -> None:
         """Analyze profiling results and identify bottlenecks.
@@ -444,6 +413,14 @@ class PerformanceReporter:
         # Detailed function analysis
         report_lines.extend(self._generate_detailed_analysis())
 
+        # Phase timers and counters recorded by analysis code
+        if any(p.phases for p in self.results.step_profiles):
+            report_lines.extend(self._generate_phase_analysis())
+
+        # RSS and structure sizes per step
+        if any(p.memory for p in self.results.step_profiles):
+            report_lines.extend(self._generate_memory_analysis())
+
         # Report footer
         report_lines.extend(["", "=" * 80, "END OF PERFORMANCE REPORT", "=" * 80])
 
@@ -622,3 +599,75 @@ class PerformanceReporter:
                 lines.append("")
 
         return lines
+
+    def _generate_phase_analysis(self) -> List[str]:
+        """Generate per-step phase timer and counter section."""
+        lines = ["5. PHASE BREAKDOWN", "-" * 40, ""]
+
+        for step in self.results.step_profiles:
+            if not step.phases:
+                continue
+            lines.append(f"Step '{step.step_name}' ({step.step_type}):")
+
+            timers = step.phases.get("timers", {})
+            if timers:
+                width = max(len(name) for name in timers)
+                for name, timer in sorted(
+                    timers.items(), key=lambda kv: kv[1]["seconds"], reverse=True
+                ):
+                    share = (
+                        timer["seconds"] / step.wall_time * 100
+                        if step.wall_time > 0
+                        else 0.0
+                    )
+                    lines.append(
+                        f"   {name.ljust(width)}  {timer['seconds']:.3f}s  "
+                        f"{timer['calls']:,} calls  {share:.1f}% of step"
+                    )
+
+            counters = step.phases.get("counters", {})
+            for name, value in counters.items():
+                lines.append(f"   {name}: {value:,}")
+
+            hits = counters.get("placement.dag_cache_hits", 0)
+            misses = counters.get("placement.dag_cache_misses", 0)
+            if hits + misses > 0:
+                lines.append(f"   DAG cache hit rate: {hits / (hits + misses):.1%}")
+            iterations = counters.get("failures.iterations", 0)
+            if iterations > 0:
+                unique = counters.get("failures.unique_patterns", 0)
+                lines.append(
+                    f"   Dedup ratio: {unique:,} unique patterns / "
+                    f"{iterations:,} iterations ({unique / iterations:.1%})"
+                )
+            lines.append("")
+
+        lines.append("   Timers sum over worker threads and may exceed step wall time.")
+        return lines
+
+    def _generate_memory_analysis(self) -> List[str]:
+        """Generate per-step RSS and structure size section."""
+
+        def mb(value: Optional[int]) -> str:
+            return "-" if value is None else f"{value / (1024 * 1024):.1f}MB"
+
+        lines = ["6. MEMORY BY STEP", "-" * 40, ""]
+        for step in self.results.step_profiles:
+            if not step.memory:
+                continue
+            info = step.memory
+            lines.append(f"Step '{step.step_name}' ({step.step_type}):")
+            delta = info.get("rss_delta")
+            delta_str = "-" if delta is None else f"{delta / (1024 * 1024):+.1f}MB"
+            lines.append(
+                f"   RSS start {mb(info.get('rss_start'))}, "
+                f"peak {mb(info.get('rss_peak'))}, "
+                f"end {mb(info.get('rss_end'))} ({delta_str}, "
+                f"{info.get('samples', 0):,} samples)"
+            )
+            for name, nbytes in info.get("structures", {}).items():
+                lines.append(f"   {name}: {mb(nbytes)}")
+            lines.append("")
+
+        lines.append("   RSS is process-wide; concurrent steps overlap.")
+        return lines
@@ -0,0 +1,134 @@
+"""In-memory profiling of analysis worker threads.
+
+``cProfile`` hooks are per thread, so the step-level profiler does not see
+the analysis tasks that ``FailureManager`` runs in worker threads. While a
+``WorkerProfiles`` collector is active, every worker thread keeps one
+``cProfile.Profile`` that is enabled only around its (sampled) analysis tasks
+and accumulates across tasks and thread pools. ``flush`` combines the
+per-thread profiles into a single ``pstats.Stats`` once per step; nothing is
+written to disk per task.
+
+With ``sample_every=N`` only every N-th task is profiled, which bounds the
+profiling overhead to roughly 1/N of the worker time. Tasks run by the thread
+that activated the collector (serial execution) are already covered by the
+step-level profiler and are not profiled again.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import itertools
+import pstats
+import threading
+from contextlib import contextmanager
+from typing import Generator, List, Optional, Tuple
+
+from ngraph.logging import get_logger
+
+logger = get_logger(__name__)
+
+_active: Optional["WorkerProfiles"] = None
+
+
+class WorkerProfiles:
+    """Per-thread profile accumulator for analysis tasks.
+
+    Args:
+        sample_every: Profile every N-th task (1 profiles all tasks).
+
+    Raises:
+        ValueError: If ``sample_every`` is less than 1.
+    """
+
+    def __init__(self, sample_every: int = 1) -> None:
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be >= 1, got {sample_every}")
+        self.sample_every = int(sample_every)
+        self._owner: Optional[int] = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._profiles: List[cProfile.Profile] = []
+        self._counter = itertools.count()
+        self._tasks = 0
+        self._sampled = 0
+
+    def _thread_profile(self) -> cProfile.Profile:
+        profile = getattr(self._local, "profile", None)
+        if profile is None:
+            profile = cProfile.Profile()
+            self._local.profile = profile
+            with self._lock:
+                self._profiles.append(profile)
+        return profile
+
+    @contextmanager
+    def task(self) -> Generator[None, None, None]:
+        """Profile the enclosed analysis task if it is sampled."""
+        if threading.get_ident() == self._owner:
+            yield
+            return
+        index = next(self._counter)
+        profile = self._thread_profile() if index % self.sample_every == 0 else None
+        if profile is not None:
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler owns this thread (e.g. coverage tooling)
+                profile = None
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            with self._lock:
+                self._tasks += 1
+                if profile is not None:
+                    self._sampled += 1
+
+    def flush(self) -> Tuple[Optional[pstats.Stats], int]:
+        """Combine and reset the collected profiles.
+
+        Returns:
+            Tuple of (combined stats or None if no task was profiled, number
+            of profiled tasks).
+        """
+        with self._lock:
+            profiles, self._profiles = self._profiles, []
+            tasks, sampled = self._tasks, self._sampled
+            self._tasks = self._sampled = 0
+        self._local = threading.local()
+        stats: Optional[pstats.Stats] = None
+        for profile in profiles:
+            profile.create_stats()
+            if not profile.stats:  # type: ignore[attr-defined]
+                continue
+            if stats is None:
+                stats = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+        if tasks:
+            logger.debug("Profiled %d of %d worker tasks", sampled, tasks)
+        return stats, sampled if stats is not None else 0
+
+    @contextmanager
+    def activate(self) -> Generator["WorkerProfiles", None, None]:
+        """Collect worker profiles while the context is active."""
+        global _active
+        previous, _active = _active, self
+        self._owner = threading.get_ident()
+        try:
+            yield self
+        finally:
+            _active = previous
+            self._owner = None
+
+
+@contextmanager
+def profile_worker_task() -> Generator[None, None, None]:
+    """Profile an analysis task with the active collector, if any."""
+    collector = _active
+    if collector is None:
+        yield
+        return
+    with collector.task():
+        yield
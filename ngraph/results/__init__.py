@@ -6,18 +6,25 @@ artifact dataclasses live in ``ngraph.results.artifacts``.
 
 from __future__ import annotations
 
-from .artifacts import CapacityEnvelope
+from .archive import ResultsReader, write_results_archive
+from .artifacts import CapacityEnvelope, SketchCapacityEnvelope
 from .flow import FlowEntry, FlowIterationResult, FlowSummary
+from .sketch import QuantileSketch
 from .store import Results, WorkflowStepMetadata
 
 __all__ = [
     # Store
     "Results",
     "WorkflowStepMetadata",
+    # Compressed archive
+    "ResultsReader",
+    "write_results_archive",
     # Flow results
     "FlowEntry",
     "FlowIterationResult",
     "FlowSummary",
     # Artifacts
     "CapacityEnvelope",
+    "SketchCapacityEnvelope",
+    "QuantileSketch",
 ]
@@ -0,0 +1,407 @@
+"""Compressed results archive with lazy, random-access reading.
+
+A results archive is a zip file holding the same ``{workflow, steps,
+scenario}`` document as the JSON export, split into independently compressed
+entries so that one step, one row of a list (e.g. one failure iteration of
+``flow_results``) or one column can be read without decompressing or parsing
+the rest:
+
+- ``index.json``: format version, the workflow registry and, per step, the
+  entry names of its metadata and of every data key.
+- ``steps/<i>/metadata.json``: step metadata.
+- ``steps/<i>/data/<j>.json``: a data value that is not a list.
+- ``steps/<i>/data/<j>/<c>...``: chunk ``c`` of a list value, holding up to
+  ``chunk_size`` rows. When all rows of a chunk are dicts with the same keys
+  (e.g. ``FlowIterationResult``), every key is stored as its own column entry
+  ``<c>/<k>.json``; otherwise the rows are stored as one ``<c>.json`` array.
+- ``scenario.json``: scenario snapshot, if any.
+
+Entries are compact JSON encoded like ``write_results_json`` (objects with
+``to_dict()`` converted, NumPy values native, non-finite floats rejected) and
+deflate-compressed. ``ResultsReader`` opens the archive and loads entries on
+demand; ``ResultsReader.to_dict()`` rebuilds the full document.
+"""
+
+from __future__ import annotations
+
+import json
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ngraph.results.json_writer import _resolve_encoder
+from ngraph.results.store import Results
+
+ARCHIVE_FORMAT = "ngraph-results"
+ARCHIVE_VERSION = 1
+DEFAULT_CHUNK_SIZE = 1000
+
+_INDEX = "index.json"
+_SCENARIO = "scenario.json"
+
+
+def is_results_archive(path: Union[str, Path]) -> bool:
+    """Return True if ``path`` is a zip file with a results archive index."""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            return _INDEX in zf.NameToInfo
+    except (OSError, zipfile.BadZipFile):
+        return False
+
+
+def _as_row(item: Any) -> Any:
+    if hasattr(item, "to_dict") and callable(item.to_dict):
+        return item.to_dict()
+    return item
+
+
+def _columns(rows: List[Any]) -> Optional[List[str]]:
+    """Return the shared keys of ``rows`` if all are dicts with equal str keys."""
+    first = rows[0]
+    if not isinstance(first, dict) or not all(isinstance(k, str) for k in first):
+        return None
+    fields = list(first)
+    for row in rows[1:]:
+        if not isinstance(row, dict) or list(row) != fields:
+            return None
+    return fields
+
+
+def write_results_archive(
+    results: Results,
+    path: Union[str, Path],
+    keys: Optional[List[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    compresslevel: int = 6,
+    backend: str = "auto",
+) -> None:
+    """Write results to a compressed, randomly accessible zip archive.
+
+    Args:
+        results: Results store to export.
+        path: Destination file (conventionally ``*.results.zip``).
+        keys: Optional step names to include (the workflow registry and
+            scenario snapshot are always written).
+        chunk_size: Maximum rows per chunk of list values.
+        compresslevel: Deflate level, 0 (store) to 9.
+        backend: JSON backend, as for ``write_results_json``.
+
+    Raises:
+        ValueError: If ``chunk_size`` is less than 1, a value is a non-finite
+            float, a step stores invalid result keys, or the backend is
+            unknown or unavailable.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    encode = _resolve_encoder(backend)
+    workflow, parts = results._export_sections(keys)
+    index: Dict[str, Any] = {
+        "format": ARCHIVE_FORMAT,
+        "version": ARCHIVE_VERSION,
+        "workflow": workflow,
+        "steps": {},
+        "scenario": None,
+    }
+
+    with zipfile.ZipFile(
+        path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+    ) as zf:
+
+        def put(name: str, value: Any) -> str:
+            zf.writestr(name, encode(value))
+            return name
+
+        for i, (step_name, metadata, data) in enumerate(parts):
+            base = f"steps/{i}"
+            try:
+                step_index: Dict[str, Any] = {
+                    "dir": base,
+                    "metadata": put(f"{base}/metadata.json", metadata),
+                    "data": {},
+                }
+                for j, (key, value) in enumerate(data.items()):
+                    if not isinstance(value, list):
+                        step_index["data"][str(key)] = {
+                            "entry": put(f"{base}/data/{j}.json", value)
+                        }
+                        continue
+                    chunks: List[Dict[str, Any]] = []
+                    for c, start in enumerate(range(0, len(value), chunk_size)):
+                        rows = [_as_row(v) for v in value[start : start + chunk_size]]
+                        prefix = f"{base}/data/{j}/{c}"
+                        fields = _columns(rows)
+                        if fields is None:
+                            chunks.append(
+                                {
+                                    "rows": len(rows),
+                                    "entry": put(f"{prefix}.json", rows),
+                                }
+                            )
+                        else:
+                            chunks.append(
+                                {
+                                    "rows": len(rows),
+                                    "columns": {
+                                        field: put(
+                                            f"{prefix}/{k}.json",
+                                            [row[field] for row in rows],
+                                        )
+                                        for k, field in enumerate(fields)
+                                    },
+                                }
+                            )
+                    step_index["data"][str(key)] = {
+                        "rows": len(value),
+                        "chunks": chunks,
+                    }
+            except ValueError as exc:
+                raise ValueError(
+                    f"Cannot export results of step '{step_name}' as JSON: {exc}"
+                ) from exc
+            index["steps"][step_name] = step_index
+        if results._scenario:
+            index["scenario"] = put(_SCENARIO, results._scenario)
+        zf.writestr(_INDEX, encode(index))
+
+
+def _lookup(value: Any, path: List[str]) -> Any:
+    for part in path:
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+class ResultsReader:
+    """Lazy reader of a results archive written by ``write_results_archive``.
+
+    Only the index is parsed on open; every other entry is decompressed and
+    parsed when first requested. Use as a context manager or call ``close()``.
+
+    Example:
+        >>> with ResultsReader("run.results.zip") as rr:
+        ...     rr.steps
+        ...     rr.row("mc", "flow_results", 0)
+        ...     rr.column("mc", "flow_results", "summary.overall_ratio")
+
+    Args:
+        path: Archive file.
+
+    Raises:
+        ValueError: If the file is not a results archive of a supported
+            version.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        try:
+            self._zip = zipfile.ZipFile(self.path)
+        except zipfile.BadZipFile as exc:
+            raise ValueError(f"{self.path} is not a results archive: {exc}") from exc
+        try:
+            index = json.loads(self._zip.read(_INDEX))
+        except KeyError:
+            self._zip.close()
+            raise ValueError(
+                f"{self.path} is not a results archive (no index)"
+            ) from None
+        if index.get("format") != ARCHIVE_FORMAT or index.get("version") != (
+            ARCHIVE_VERSION
+        ):
+            self._zip.close()
+            raise ValueError(
+                f"Unsupported results archive {index.get('format')!r} "
+                f"version {index.get('version')!r}"
+            )
+        self._index: Dict[str, Any] = index
+        # Most recently loaded chunk, so sequential row access parses it once
+        self._chunk: Tuple[Optional[Tuple[str, str, int]], List[Any]] = (None, [])
+
+    def close(self) -> None:
+        """Close the underlying zip file."""
+        self._zip.close()
+
+    def __enter__(self) -> "ResultsReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # ---- Index ------------------------------------------------------------
+    @property
+    def workflow(self) -> Dict[str, Any]:
+        """Workflow registry of all steps (as in the JSON export)."""
+        return self._index["workflow"]
+
+    @property
+    def steps(self) -> List[str]:
+        """Names of the stored steps, in export order."""
+        return list(self._index["steps"])
+
+    def data_keys(self, step: str) -> List[str]:
+        """Return the data keys of ``step``."""
+        return list(self._step(step)["data"])
+
+    def num_rows(self, step: str, key: str) -> Optional[int]:
+        """Return the length of a list value, or None for other values."""
+        return self._key(step, key).get("rows")
+
+    def stored_size(self, step: Optional[str] = None) -> Tuple[int, int]:
+        """Return (compressed, uncompressed) bytes of a step or the archive."""
+        prefix = "" if step is None else self._step(step)["dir"] + "/"
+        infos = [i for i in self._zip.infolist() if i.filename.startswith(prefix)]
+        return (
+            sum(i.compress_size for i in infos),
+            sum(i.file_size for i in infos),
+        )
+
+    def _step(self, step: str) -> Dict[str, Any]:
+        try:
+            return self._index["steps"][step]
+        except KeyError:
+            raise KeyError(f"Step '{step}' not found in {self.path}") from None
+
+    def _key(self, step: str, key: str) -> Dict[str, Any]:
+        try:
+            return self._step(step)["data"][key]
+        except KeyError:
+            raise KeyError(f"Step '{step}' has no data key '{key}'") from None
+
+    def _read(self, entry: str) -> Any:
+        return json.loads(self._zip.read(entry))
+
+    # ---- Values -----------------------------------------------------------
+    @property
+    def scenario(self) -> Optional[Dict[str, Any]]:
+        """Scenario snapshot, or None when the archive has none."""
+        entry = self._index.get("scenario")
+        return None if entry is None else self._read(entry)
+
+    def metadata(self, step: str) -> Dict[str, Any]:
+        """Return the metadata of ``step``."""
+        return self._read(self._step(step)["metadata"])
+
+    def get(self, step: str, key: str) -> Any:
+        """Return one data value of ``step`` (list values are fully loaded)."""
+        info = self._key(step, key)
+        if "entry" in info:
+            return self._read(info["entry"])
+        return [row for chunk in self._chunks(step, key) for row in chunk]
+
+    def step(self, step: str) -> Dict[str, Any]:
+        """Return ``{"metadata", "data"}`` of ``step``, as in the JSON export."""
+        return {
+            "metadata": self.metadata(step),
+            "data": {key: self.get(step, key) for key in self.data_keys(step)},
+        }
+
+    def _load_chunk(self, step: str, key: str, c: int) -> List[Any]:
+        cache_key = (step, key, c)
+        if self._chunk[0] == cache_key:
+            return self._chunk[1]
+        chunk = self._key(step, key)["chunks"][c]
+        if "entry" in chunk:
+            rows = self._read(chunk["entry"])
+        else:
+            columns = {f: self._read(e) for f, e in chunk["columns"].items()}
+            rows = [
+                dict(zip(columns, values, strict=True))
+                for values in zip(*columns.values(), strict=True)
+            ]
+        self._chunk = (cache_key, rows)
+        return rows
+
+    def _chunks(self, step: str, key: str) -> Iterator[List[Any]]:
+        info = self._key(step, key)
+        if "chunks" not in info:
+            raise ValueError(f"Data key '{key}' of step '{step}' is not a list")
+        for c in range(len(info["chunks"])):
+            yield self._load_chunk(step, key, c)
+
+    def iter_rows(self, step: str, key: str) -> Iterator[Any]:
+        """Iterate over the rows of a list value, one chunk in memory at a time.
+
+        Raises:
+            ValueError: If the value is not a list.
+        """
+        for chunk in self._chunks(step, key):
+            yield from chunk
+
+    def row(self, step: str, key: str, index: int) -> Any:
+        """Return row ``index`` of a list value, loading only its chunk.
+
+        Raises:
+            ValueError: If the value is not a list.
+            IndexError: If ``index`` is out of range.
+        """
+        info = self._key(step, key)
+        if "chunks" not in info:
+            raise ValueError(f"Data key '{key}' of step '{step}' is not a list")
+        n = info["rows"]
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError(f"Row {index} out of range for '{key}' ({n} rows)")
+        for c, chunk in enumerate(info["chunks"]):
+            if index < chunk["rows"]:
+                return self._load_chunk(step, key, c)[index]
+            index -= chunk["rows"]
+        raise AssertionError("unreachable: chunk row counts do not add up")
+
+    def column(self, step: str, key: str, field: str) -> List[Any]:
+        """Return one field of every row of a list of dicts.
+
+        Columnar chunks only read the entry of the field. ``field`` may be a
+        dotted path into nested dicts (e.g. ``"summary.overall_ratio"``);
+        rows without the field yield None.
+
+        Raises:
+            ValueError: If the value is not a list.
+        """
+        head, *rest = field.split(".")
+        info = self._key(step, key)
+        if "chunks" not in info:
+            raise ValueError(f"Data key '{key}' of step '{step}' is not a list")
+        values: List[Any] = []
+        for c, chunk in enumerate(info["chunks"]):
+            columns = chunk.get("columns")
+            if columns is not None and head in columns:
+                part = self._read(columns[head])
+            elif columns is not None:
+                part = [None] * chunk["rows"]
+            else:
+                part = [_lookup(row, [head]) for row in self._load_chunk(step, key, c)]
+            values.extend([_lookup(v, rest) for v in part] if rest else part)
+        return values
+
+    def find_row(self, step: str, key: str, field: str, value: Any) -> Tuple[int, Any]:
+        """Return ``(index, row)`` of the first row whose ``field`` equals ``value``.
+
+        Reads the ``field`` column, then only the chunk of the matching row.
+
+        Raises:
+            KeyError: If no row matches.
+        """
+        for i, v in enumerate(self.column(step, key, field)):
+            if v == value:
+                return i, self.row(step, key, i)
+        raise KeyError(f"No row of '{key}' in step '{step}' has {field}={value!r}")
+
+    def failure_pattern(
+        self, step: str, failure_id: str, key: str = "flow_results"
+    ) -> Dict[str, Any]:
+        """Return the iteration result of one failure pattern by ``failure_id``.
+
+        Raises:
+            KeyError: If no iteration has this failure ID.
+        """
+        return self.find_row(step, key, "failure_id", failure_id)[1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Load the full ``{workflow, steps, scenario}`` document."""
+        doc: Dict[str, Any] = {
+            "workflow": self.workflow,
+            "steps": {name: self.step(name) for name in self.steps},
+        }
+        scenario = self.scenario
+        if scenario:
+            doc["scenario"] = scenario
+        return doc
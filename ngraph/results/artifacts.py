@@ -5,6 +5,8 @@ simulations in a JSON-serializable form:
 
 - `CapacityEnvelope`: frequency-based capacity distributions and optional
   aggregated flow statistics
+- `SketchCapacityEnvelope`: capacity distributions in a bounded, mergeable
+  quantile sketch (for continuous values and incremental or sharded feeds)
 - `FailurePatternResult`: capacity results for specific failure patterns
 """
 
@@ -12,7 +14,13 @@ from __future__ import annotations
 
 import hashlib
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
+
+from ngraph.results.sketch import (
+    DEFAULT_MAX_BUCKETS,
+    DEFAULT_RELATIVE_ACCURACY,
+    QuantileSketch,
+)
 
 
 @dataclass
@@ -278,6 +286,152 @@ class CapacityEnvelope:
         return values
 
 
+@dataclass
+class SketchCapacityEnvelope:
+    """Capacity envelope backed by a mergeable quantile sketch.
+
+    Unlike ``CapacityEnvelope``, memory and serialized size do not grow with
+    the number of distinct capacity values, values can be added one at a time
+    and envelopes built by different workers or shards merge exactly.
+    Percentiles carry a relative error of at most the sketch's
+    ``relative_accuracy``; min, max, mean and stdev are exact.
+
+    Attributes:
+        source_pattern: Regex pattern used to select source nodes.
+        sink_pattern: Regex pattern used to select sink nodes.
+        mode: Flow analysis mode ("combine" or "pairwise").
+        sketch: Quantile sketch of the capacity values.
+    """
+
+    source_pattern: str
+    sink_pattern: str
+    mode: str
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    @classmethod
+    def from_values(
+        cls,
+        source_pattern: str,
+        sink_pattern: str,
+        mode: str,
+        values: Iterable[float],
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ) -> "SketchCapacityEnvelope":
+        """Create an envelope from capacity values.
+
+        Args:
+            source_pattern: Source node pattern.
+            sink_pattern: Sink node pattern.
+            mode: Flow analysis mode.
+            values: Capacity values (any iterable, e.g. a NumPy array).
+            relative_accuracy: Maximum relative error of percentiles.
+            max_buckets: Upper bound on the number of sketch buckets.
+
+        Returns:
+            SketchCapacityEnvelope summarizing ``values``.
+        """
+        sketch = QuantileSketch(relative_accuracy, max_buckets)
+        sketch.extend(values)
+        return cls(source_pattern, sink_pattern, mode, sketch)
+
+    def add(self, value: float) -> None:
+        """Add one capacity value."""
+        self.sketch.add(value)
+
+    def merge(self, other: "SketchCapacityEnvelope") -> None:
+        """Add the values of another envelope for the same flow.
+
+        Raises:
+            ValueError: If the envelopes describe different flows or use
+                different sketch accuracies.
+        """
+        if (other.source_pattern, other.sink_pattern, other.mode) != (
+            self.source_pattern,
+            self.sink_pattern,
+            self.mode,
+        ):
+            raise ValueError(
+                "Cannot merge envelopes of different flows: "
+                f"{self.source_pattern}->{self.sink_pattern} ({self.mode}) vs "
+                f"{other.source_pattern}->{other.sink_pattern} ({other.mode})"
+            )
+        self.sketch.merge(other.sketch)
+
+    @property
+    def total_samples(self) -> int:
+        """Total number of samples represented."""
+        return self.sketch.count
+
+    @property
+    def min_capacity(self) -> Optional[float]:
+        """Minimum observed capacity (None when empty)."""
+        return self.sketch.min
+
+    @property
+    def max_capacity(self) -> Optional[float]:
+        """Maximum observed capacity (None when empty)."""
+        return self.sketch.max
+
+    @property
+    def mean_capacity(self) -> float:
+        """Mean capacity across all samples."""
+        return self.sketch.mean
+
+    @property
+    def stdev_capacity(self) -> float:
+        """Standard deviation of capacity values."""
+        return self.sketch.stdev
+
+    def get_percentile(self, percentile: float) -> float:
+        """Calculate a percentile from the sketch.
+
+        Args:
+            percentile: Percentile to calculate (0-100).
+
+        Returns:
+            Capacity value at the specified percentile.
+
+        Raises:
+            ValueError: If ``percentile`` is outside [0, 100] or the envelope
+                is empty.
+        """
+        if not (0 <= percentile <= 100):
+            raise ValueError("Percentile must be between 0 and 100")
+        return self.sketch.quantile(percentile / 100.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "source": self.source_pattern,
+            "sink": self.sink_pattern,
+            "mode": self.mode,
+            "min": self.min_capacity,
+            "max": self.max_capacity,
+            "mean": self.mean_capacity,
+            "stdev": self.stdev_capacity,
+            "total_samples": self.total_samples,
+            "sketch": self.sketch.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SketchCapacityEnvelope":
+        """Construct a SketchCapacityEnvelope from a dictionary.
+
+        Args:
+            data: Dictionary as produced by to_dict().
+
+        Returns:
+            SketchCapacityEnvelope
+        """
+        return cls(
+            source_pattern=str(data.get("source", "")),
+            sink_pattern=str(data.get("sink", "")),
+            mode=str(data.get("mode", "combine")),
+            sketch=QuantileSketch.from_dict(data.get("sketch") or {}),
+        )
+
+
 @dataclass
 class FailurePatternResult:
     """Result for a unique failure pattern with associated capacity matrix.
@@ -0,0 +1,194 @@
+"""Streaming JSON export of workflow results.
+
+``write_results_json`` writes the same ``{workflow, steps, scenario}`` document
+as ``json.dumps(Results.to_dict())`` without building the converted copy
+first: every step is encoded straight from the stored objects, one step (and
+one element of large top-level lists such as ``flow_results``) at a time, so
+peak memory stays near the size of the largest element instead of twice the
+whole document.
+
+Encoding is compact (no indentation). Objects with ``to_dict()`` are
+converted on demand, NumPy arrays and scalars are encoded natively, and other
+unknown objects fall back to ``str`` like the previous ``default=str`` export.
+Non-finite floats (NaN, Infinity) are not valid JSON and raise ``ValueError``
+naming the step.
+
+``orjson`` is used when installed. It writes non-finite floats as ``null``, so
+when an encoded element contains ``null`` the element is scanned for
+non-finite floats (``None`` values are common in step results and need no
+re-encoding); only then is it re-encoded with the validating standard-library
+encoder to raise the error.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional
+
+from ngraph.results.store import Results
+
+try:  # pragma: no cover - optional dependency
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+# Top-level data lists with more elements than this are encoded per element
+_STREAM_LIST_MIN = 16
+
+
+def _default(obj: Any) -> Any:
+    if hasattr(obj, "to_dict") and callable(obj.to_dict):
+        return obj.to_dict()
+    tolist = getattr(obj, "tolist", None)
+    if tolist is not None and hasattr(obj, "dtype"):
+        # NumPy arrays and scalars; the encoder validates the floats
+        return tolist()
+    return str(obj)
+
+
+_STDLIB_ENCODER = json.JSONEncoder(
+    allow_nan=False, separators=(",", ":"), default=_default, check_circular=False
+)
+
+
+def _str_keys(obj: Any) -> Any:
+    """Coerce dict keys to strings (for keys ``json`` rejects, e.g. tuples)."""
+    if hasattr(obj, "to_dict") and callable(obj.to_dict):
+        obj = obj.to_dict()
+    if isinstance(obj, dict):
+        return {str(k): _str_keys(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_str_keys(v) for v in obj]
+    return obj
+
+
+def _encode_stdlib(obj: Any) -> bytes:
+    try:
+        text = _STDLIB_ENCODER.encode(obj)
+    except TypeError as exc:
+        if "keys must be" not in str(exc):
+            raise
+        text = _STDLIB_ENCODER.encode(_str_keys(obj))
+    return text.encode("utf-8")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Return True if ``obj`` contains a NaN or infinite float (keys included)."""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif value is None or isinstance(value, (str, int)):
+            continue
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+            stack.extend(k for k in value if isinstance(k, float))
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif hasattr(value, "to_dict") and callable(value.to_dict):
+            stack.append(value.to_dict())
+        elif hasattr(value, "dtype"):
+            if value.dtype.kind in "fc":
+                import numpy as np
+
+                if not np.isfinite(value).all():
+                    return True
+    return False
+
+
+def _encode_orjson(obj: Any) -> bytes:  # pragma: no cover - optional dependency
+    assert _orjson is not None
+    out = _orjson.dumps(
+        obj,
+        default=_default,
+        option=_orjson.OPT_SERIALIZE_NUMPY | _orjson.OPT_NON_STR_KEYS,
+    )
+    # orjson encodes NaN/Infinity as null; only a non-finite float needs the
+    # stdlib encoder, which raises the ValueError
+    if b"null" in out and _has_non_finite(obj):
+        return _encode_stdlib(obj)
+    return out
+
+
+def _resolve_encoder(backend: str) -> Callable[[Any], bytes]:
+    if backend == "json":
+        return _encode_stdlib
+    if backend == "orjson":
+        if _orjson is None:
+            raise ValueError("backend 'orjson' requested but orjson is not installed")
+        return _encode_orjson
+    if backend == "auto":
+        return _encode_stdlib if _orjson is None else _encode_orjson
+    raise ValueError(f"Unknown JSON backend '{backend}' (expected auto, json, orjson)")
+
+
+def _iter_data(data: Dict[str, Any], encode: Callable[[Any], bytes]) -> Iterator[bytes]:
+    """Yield the encoded step ``data`` dict, streaming large top-level lists."""
+    yield b"{"
+    for i, (key, value) in enumerate(data.items()):
+        if i:
+            yield b","
+        yield encode(str(key))
+        yield b":"
+        if isinstance(value, list) and len(value) > _STREAM_LIST_MIN:
+            yield b"["
+            for j, item in enumerate(value):
+                if j:
+                    yield b","
+                yield encode(item)
+            yield b"]"
+        else:
+            yield encode(value)
+    yield b"}"
+
+
+def write_results_json(
+    results: Results,
+    fp: IO[bytes],
+    keys: Optional[List[str]] = None,
+    backend: str = "auto",
+) -> None:
+    """Stream results as compact JSON to a binary file object.
+
+    Args:
+        results: Results store to export.
+        fp: Binary file object (e.g. ``open(path, "wb")`` or
+            ``sys.stdout.buffer``).
+        keys: Optional step names to include under ``steps`` (the workflow
+            registry and scenario snapshot are always written).
+        backend: ``"auto"`` (orjson when installed), ``"orjson"`` or ``"json"``.
+
+    Raises:
+        ValueError: If a value is a non-finite float, a step stores invalid
+            result keys, or the backend is unknown or unavailable.
+    """
+    encode = _resolve_encoder(backend)
+    workflow, parts = results._export_sections(keys)
+    write = fp.write
+
+    write(b'{"workflow":')
+    write(encode(workflow))
+    write(b',"steps":{')
+    for i, (step_name, metadata, data) in enumerate(parts):
+        if i:
+            write(b",")
+        try:
+            write(encode(step_name))
+            write(b':{"metadata":')
+            write(encode(metadata))
+            write(b',"data":')
+            for chunk in _iter_data(data, encode):
+                write(chunk)
+            write(b"}")
+        except ValueError as exc:
+            raise ValueError(
+                f"Cannot export results of step '{step_name}' as JSON: {exc}"
+            ) from exc
+    write(b"}")
+    if results._scenario:
+        write(b',"scenario":')
+        write(encode(results._scenario))
+    write(b"}")
@@ -0,0 +1,278 @@
+"""Mergeable quantile sketch for streaming capacity distributions.
+
+``QuantileSketch`` maps every value to a logarithmic bucket (DDSketch-style):
+bucket ``k`` holds magnitudes in ``(gamma**(k-1), gamma**k]`` with
+``gamma = (1 + a) / (1 - a)``, so any quantile is answered with a relative
+value error of at most ``a`` (``relative_accuracy``). Zero has its own bucket
+and negative values are bucketed by magnitude.
+
+Buckets only hold counts, so sketches fed incrementally (e.g. per worker or
+per shard) merge exactly by adding counts: unless buckets were collapsed, the
+merged sketch equals the sketch of the concatenated values regardless of merge
+order. The number of buckets
+grows with the logarithm of the value range, not with the number of distinct
+values; when it exceeds ``max_buckets``, the smallest-magnitude buckets are
+collapsed, which loses accuracy only for the lowest quantiles.
+
+Count, min, max, mean and standard deviation are tracked exactly (up to
+floating-point summation order).
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+
+
+def _collapse(bins: Dict[int, int], excess: int) -> None:
+    """Merge the ``excess + 1`` smallest keys of ``bins`` into one bucket."""
+    keys = sorted(bins)[: excess + 1]
+    target = keys[-1]
+    bins[target] = sum(bins.pop(k) for k in keys[:-1]) + bins[target]
+
+
+class QuantileSketch:
+    """Quantile sketch with bounded relative error and exact merges.
+
+    Args:
+        relative_accuracy: Maximum relative error of returned quantile values,
+            in (0, 1).
+        max_buckets: Upper bound on the number of stored buckets.
+
+    Raises:
+        ValueError: If ``relative_accuracy`` is outside (0, 1) or
+            ``max_buckets`` is less than 2.
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ) -> None:
+        if not (0.0 < relative_accuracy < 1.0):
+            raise ValueError(
+                f"relative_accuracy must be in (0, 1), got {relative_accuracy}"
+            )
+        if max_buckets < 2:
+            raise ValueError(f"max_buckets must be >= 2, got {max_buckets}")
+        self.relative_accuracy = float(relative_accuracy)
+        self.max_buckets = int(max_buckets)
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: Dict[int, int] = {}
+        self.negative_bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._mean = 0.0
+        self._m2 = 0.0
+        # Ascending (value, cumulative count) arrays, rebuilt lazily
+        self._values: Optional[List[float]] = None
+        self._cumulative: List[int] = []
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        return 2.0 * self._gamma**key / (self._gamma + 1.0)
+
+    def _update_moments(
+        self, n: int, mean: float, m2: float, lo: float, hi: float
+    ) -> None:
+        # Chan et al. parallel update of count, mean and sum of squared deviations
+        total = self.count + n
+        delta = mean - self._mean
+        self._mean += delta * n / total
+        self._m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = lo if self.min is None else min(self.min, lo)
+        self.max = hi if self.max is None else max(self.max, hi)
+        self._values = None
+
+    def _bound(self) -> None:
+        excess = len(self.bins) + len(self.negative_bins) - self.max_buckets
+        while excess > 0:
+            store = (
+                self.bins
+                if len(self.bins) >= len(self.negative_bins)
+                else self.negative_bins
+            )
+            step = min(excess, len(store) - 1)
+            _collapse(store, step)
+            excess -= step
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add ``count`` occurrences of ``value``.
+
+        Raises:
+            ValueError: If ``value`` is not finite or ``count`` is less than 1.
+        """
+        value = float(value)
+        if not math.isfinite(value):
+            raise ValueError(f"Cannot add non-finite value {value} to sketch")
+        if count < 1:
+            raise ValueError(f"count must be >= 1, got {count}")
+        if value > 0.0:
+            key = self._key(value)
+            self.bins[key] = self.bins.get(key, 0) + count
+        elif value < 0.0:
+            key = self._key(-value)
+            self.negative_bins[key] = self.negative_bins.get(key, 0) + count
+        else:
+            self.zero_count += count
+        self._update_moments(count, value, 0.0, value, value)
+        self._bound()
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Add many values at once (bucketed with NumPy).
+
+        Raises:
+            ValueError: If any value is not finite.
+        """
+        import numpy as np
+
+        if not hasattr(values, "__len__"):
+            values = list(values)
+        arr = np.asarray(values, dtype=np.float64).ravel()
+        if arr.size == 0:
+            return
+        if not np.isfinite(arr).all():
+            raise ValueError("Cannot add non-finite values to sketch")
+        for bins, magnitudes in (
+            (self.bins, arr[arr > 0.0]),
+            (self.negative_bins, -arr[arr < 0.0]),
+        ):
+            if magnitudes.size:
+                keys = np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+                uniq, counts = np.unique(keys, return_counts=True)
+                for key, n in zip(uniq.tolist(), counts.tolist(), strict=True):
+                    bins[key] = bins.get(key, 0) + n
+        self.zero_count += int(np.count_nonzero(arr == 0.0))
+        mean = float(arr.mean())
+        m2 = float(((arr - mean) ** 2).sum())
+        self._update_moments(
+            int(arr.size), mean, m2, float(arr.min()), float(arr.max())
+        )
+        self._bound()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add all values summarized by ``other`` to this sketch.
+
+        Raises:
+            ValueError: If the sketches use different relative accuracies.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                "Cannot merge sketches with different relative accuracy "
+                f"({self.relative_accuracy} vs {other.relative_accuracy})"
+            )
+        if other.count == 0:
+            return
+        for bins, source in (
+            (self.bins, other.bins),
+            (self.negative_bins, other.negative_bins),
+        ):
+            for key, n in source.items():
+                bins[key] = bins.get(key, 0) + n
+        self.zero_count += other.zero_count
+        assert other.min is not None and other.max is not None
+        self._update_moments(other.count, other._mean, other._m2, other.min, other.max)
+        self._bound()
+
+    def __repr__(self) -> str:
+        return (
+            f"QuantileSketch(relative_accuracy={self.relative_accuracy}, "
+            f"count={self.count})"
+        )
+
+    @property
+    def mean(self) -> float:
+        """Mean of the added values (0.0 when empty)."""
+        return self._mean
+
+    @property
+    def stdev(self) -> float:
+        """Population standard deviation of the added values (0.0 when empty)."""
+        return (self._m2 / self.count) ** 0.5 if self.count else 0.0
+
+    def _build_index(self) -> None:
+        values: List[float] = []
+        counts: List[int] = []
+        for key in sorted(self.negative_bins, reverse=True):
+            values.append(-self._value(key))
+            counts.append(self.negative_bins[key])
+        if self.zero_count:
+            values.append(0.0)
+            counts.append(self.zero_count)
+        for key in sorted(self.bins):
+            values.append(self._value(key))
+            counts.append(self.bins[key])
+        cumulative: List[int] = []
+        running = 0
+        for n in counts:
+            running += n
+            cumulative.append(running)
+        self._values = values
+        self._cumulative = cumulative
+
+    def quantile(self, q: float) -> float:
+        """Return the value at quantile ``q`` in [0, 1].
+
+        The result is the smallest bucket value whose cumulative count reaches
+        ``q * count``, clamped to the exact [min, max] range.
+
+        Raises:
+            ValueError: If ``q`` is outside [0, 1] or the sketch is empty.
+        """
+        if not (0.0 <= q <= 1.0):
+            raise ValueError("Quantile must be between 0 and 1")
+        if self.count == 0:
+            raise ValueError("Cannot compute quantile of an empty sketch")
+        if self._values is None:
+            self._build_index()
+        assert self._values is not None
+        assert self.min is not None and self.max is not None
+        i = min(bisect_left(self._cumulative, q * self.count), len(self._values) - 1)
+        return min(max(self._values[i], self.min), self.max)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary (bucket keys as strings)."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_buckets": self.max_buckets,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self._mean,
+            "m2": self._m2,
+            "zero_count": self.zero_count,
+            "bins": {str(k): n for k, n in sorted(self.bins.items())},
+            "negative_bins": {str(k): n for k, n in sorted(self.negative_bins.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """Construct a sketch from a dictionary produced by ``to_dict``."""
+        sketch = cls(
+            relative_accuracy=float(
+                data.get("relative_accuracy", DEFAULT_RELATIVE_ACCURACY)
+            ),
+            max_buckets=int(data.get("max_buckets", DEFAULT_MAX_BUCKETS)),
+        )
+        sketch.bins = {int(k): int(n) for k, n in (data.get("bins") or {}).items()}
+        sketch.negative_bins = {
+            int(k): int(n) for k, n in (data.get("negative_bins") or {}).items()
+        }
+        sketch.zero_count = int(data.get("zero_count", 0))
+        sketch.count = int(data.get("count", 0))
+        if sketch.count:
+            sketch.min = float(data["min"])
+            sketch.max = float(data["max"])
+        sketch._mean = float(data.get("mean", 0.0))
+        sketch._m2 = float(data.get("m2", 0.0))
+        return sketch
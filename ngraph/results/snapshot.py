@@ -62,6 +62,7 @@ def build_scenario_snapshot(
             "attrs": dict(getattr(policy, "attrs", {}) or {}),
             "expand_groups": getattr(policy, "expand_groups", False),
             "expand_children": getattr(policy, "expand_children", False),
+            "sampler": getattr(policy, "sampler", "python"),
             "modes": modes_list,
         }
 
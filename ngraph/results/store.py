@@ -13,8 +13,9 @@ with shape ``{workflow, steps, scenario}``. During export, objects with a
 tuples are emitted as lists, and only JSON primitives are produced.
 """
 
+import threading
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -61,22 +62,27 @@ class Results:
     # Metadata registry: _metadata[step_name] = WorkflowStepMetadata
     _metadata: Dict[str, WorkflowStepMetadata] = field(default_factory=dict)
 
-    # Active step scope during WorkflowStep.execute()
-    _active_step: Optional[str] = None
+    # Active step scope during WorkflowStep.execute(), per thread so that
+    # concurrently running steps write to their own namespaces
+    _active_steps: Dict[int, str] = field(default_factory=dict)
 
     # Scenario snapshot
     _scenario: Dict[str, Any] = field(default_factory=dict)
 
     # ---- Scope management -------------------------------------------------
+    @property
+    def _active_step(self) -> Optional[str]:
+        return self._active_steps.get(threading.get_ident())
+
     def enter_step(self, step_name: str) -> None:
-        """Enter step scope. Subsequent put/get are scoped to this step."""
-        self._active_step = step_name
+        """Enter step scope. Subsequent put/get in this thread use this step."""
+        self._active_steps[threading.get_ident()] = step_name
         if step_name not in self._store:
             self._store[step_name] = {}
 
     def exit_step(self) -> None:
         """Exit step scope."""
-        self._active_step = None
+        self._active_steps.pop(threading.get_ident(), None)
 
     # ---- Step-scoped accessors -------------------------------------------
     def put(self, key: str, value: Any) -> None:
@@ -135,6 +141,36 @@ class Results:
             active_seed=active_seed,
         )
 
+    def restore_step(
+        self,
+        step_name: str,
+        store: Dict[str, Any],
+        metadata: WorkflowStepMetadata,
+    ) -> None:
+        """Install a previously completed step's results and metadata.
+
+        Used to resume runs from checkpoints; replaces anything stored for
+        ``step_name``.
+
+        Args:
+            step_name: The step name.
+            store: The step's raw dict, as returned by ``get_step``.
+            metadata: The step's metadata, as returned by ``get_step_metadata``.
+
+        Raises:
+            ValueError: If ``store`` has keys other than metadata/data or
+                ``metadata`` belongs to another step.
+        """
+        if not isinstance(store, dict) or not set(store).issubset({"metadata", "data"}):
+            raise ValueError(f"Invalid stored results for step '{step_name}'")
+        if (
+            not isinstance(metadata, WorkflowStepMetadata)
+            or metadata.step_name != step_name
+        ):
+            raise ValueError(f"Metadata does not belong to step '{step_name}'")
+        self._store[step_name] = dict(store)
+        self._metadata[step_name] = metadata
+
     def get_step_metadata(self, step_name: str) -> Optional[WorkflowStepMetadata]:
         """Get metadata for a workflow step.
 
@@ -168,8 +204,30 @@ class Results:
         """Attach a normalized scenario snapshot for export."""
         self._scenario = snapshot
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Return exported results with shape: {workflow, steps, scenario}."""
+    def _export_sections(
+        self, keys: Optional[List[str]] = None
+    ) -> Tuple[Dict[str, Any], List[Tuple[str, Dict[str, Any], Dict[str, Any]]]]:
+        """Return the workflow registry and validated, unconverted step parts.
+
+        Args:
+            keys: Optional step names to include (in the given order); all
+                steps in execution order when None. The workflow registry
+                always lists every step.
+
+        Returns:
+            Tuple of (workflow registry, list of (step name, metadata, data)).
+
+        Raises:
+            ValueError: If a step stores keys other than metadata/data or
+                non-dict values.
+        """
+        by_order = self.get_steps_by_execution_order()
+        if keys is None:
+            ordered = [name for name in by_order if name in self._store]
+            ordered += [name for name in self._store if name not in self._metadata]
+        else:
+            ordered = [name for name in keys if name in self._store]
+
         # Workflow metadata
         workflow: Dict[str, Any] = {
             step_name: {
@@ -181,12 +239,12 @@ class Results:
                 "seed_source": md.seed_source,
                 "active_seed": md.active_seed,
             }
-            for step_name, md in self._metadata.items()
+            for step_name, md in ((name, self._metadata[name]) for name in by_order)
         }
 
-        # Steps data with validation and to_dict() conversion
-        steps: Dict[str, Dict[str, Any]] = {}
-        for step_name, data in self._store.items():
+        parts: List[Tuple[str, Dict[str, Any], Dict[str, Any]]] = []
+        for step_name in ordered:
+            data = self._store[step_name]
             # Enforce explicit keys
             if not set(data.keys()).issubset({"metadata", "data"}):
                 invalid = ", ".join(sorted(set(data.keys()) - {"metadata", "data"}))
@@ -203,21 +261,34 @@ class Results:
                 raise ValueError(
                     f"Step '{step_name}' must store dicts for 'metadata' and 'data'"
                 )
+            parts.append((step_name, metadata_part, data_part))
+        return workflow, parts
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return exported results with shape: {workflow, steps, scenario}.
 
-            def deep_convert(v: Any) -> Any:
-                # Convert nested structures; apply to_dict to any object that supports it
-                if hasattr(v, "to_dict") and callable(v.to_dict):
-                    return v.to_dict()
-                if isinstance(v, dict):
-                    return {str(k): deep_convert(val) for k, val in v.items()}
-                if isinstance(v, (list, tuple)):
-                    return [deep_convert(x) for x in v]
-                return v
-
-            steps[step_name] = {
+        Steps appear in execution order, also when they ran concurrently.
+        """
+        workflow, parts = self._export_sections()
+
+        def deep_convert(v: Any) -> Any:
+            # Convert nested structures; apply to_dict to any object that supports it
+            if hasattr(v, "to_dict") and callable(v.to_dict):
+                return v.to_dict()
+            if isinstance(v, dict):
+                return {str(k): deep_convert(val) for k, val in v.items()}
+            if isinstance(v, (list, tuple)):
+                return [deep_convert(x) for x in v]
+            return v
+
+        # Steps data with to_dict() conversion
+        steps: Dict[str, Dict[str, Any]] = {
+            step_name: {
                 "metadata": deep_convert(metadata_part),
                 "data": deep_convert(data_part),
             }
+            for step_name, metadata_part, data_part in parts
+        }
 
         # Compose final
         out: Dict[str, Any] = {
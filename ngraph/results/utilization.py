@@ -0,0 +1,143 @@
+"""Per-link utilization envelopes across failure iterations.
+
+``LinkUtilizationAccumulator`` keeps running statistics of the utilization
+(flow / capacity) of every link direction: a weighted mean, the maximum and a
+fixed-bin histogram over [0, 1]. Each Monte Carlo result contributes its link
+flow matrix (see ``AnalysisContext.link_flows``) once, weighted by its
+``occurrence_count``, so memory is independent of the number of iterations and
+no per-demand edge lists are needed. Accumulators with the same links and bins
+merge by adding their arrays.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+_DIRECTIONS = ("fwd", "rev")
+
+
+class LinkUtilizationAccumulator:
+    """Weighted running utilization statistics per link direction.
+
+    Args:
+        link_ids: Link IDs in the row order of the flow matrices.
+        capacity: Link capacities aligned with ``link_ids``.
+        bins: Number of equal-width histogram bins over [0, 1]; utilization of
+            1 or more falls into the last bin.
+
+    Raises:
+        ValueError: If ``bins`` is less than 1 or ``capacity`` does not match
+            ``link_ids``.
+    """
+
+    def __init__(
+        self, link_ids: Sequence[str], capacity: Sequence[float], bins: int = 10
+    ) -> None:
+        if bins < 1:
+            raise ValueError(f"bins must be >= 1, got {bins}")
+        self.link_ids: List[str] = list(link_ids)
+        self.capacity = np.asarray(capacity, dtype=np.float64)
+        if self.capacity.shape != (len(self.link_ids),):
+            raise ValueError(
+                f"capacity has shape {self.capacity.shape}, expected "
+                f"({len(self.link_ids)},)"
+            )
+        self.bins = int(bins)
+        n = len(self.link_ids)
+        self.samples = 0
+        self._weighted_sum = np.zeros((n, 2), dtype=np.float64)
+        self._max = np.zeros((n, 2), dtype=np.float64)
+        self._histogram = np.zeros((n, 2, self.bins), dtype=np.int64)
+        self._rows = np.arange(n)[:, None]
+        self._cols = np.arange(2)[None, :]
+        self._inv_capacity = np.divide(
+            1.0,
+            self.capacity,
+            out=np.zeros_like(self.capacity),
+            where=self.capacity > 0.0,
+        )[:, None]
+        self.baseline: Optional[np.ndarray] = None
+
+    def utilization(self, link_flows: np.ndarray) -> np.ndarray:
+        """Return the (links, 2) utilization matrix of a link flow matrix.
+
+        Links without capacity have utilization 0.
+        """
+        flows = np.asarray(link_flows, dtype=np.float64)
+        if flows.shape != self._weighted_sum.shape:
+            raise ValueError(
+                f"link flows have shape {flows.shape}, expected "
+                f"{self._weighted_sum.shape}"
+            )
+        return flows * self._inv_capacity
+
+    def add(self, link_flows: np.ndarray, weight: int = 1) -> None:
+        """Add one iteration's (links, 2) flow matrix with ``weight`` occurrences.
+
+        Raises:
+            ValueError: If the matrix shape does not match or ``weight`` < 1.
+        """
+        if weight < 1:
+            raise ValueError(f"weight must be >= 1, got {weight}")
+        util = self.utilization(link_flows)
+        self.samples += int(weight)
+        self._weighted_sum += util * weight
+        np.maximum(self._max, util, out=self._max)
+        idx = np.minimum((util * self.bins).astype(np.int64), self.bins - 1)
+        self._histogram[self._rows, self._cols, np.maximum(idx, 0)] += weight
+
+    def set_baseline(self, link_flows: np.ndarray) -> None:
+        """Record the flow matrix of the no-failure baseline (not accumulated)."""
+        self.baseline = self.utilization(link_flows)
+
+    def merge(self, other: "LinkUtilizationAccumulator") -> None:
+        """Add the statistics of another accumulator over the same links.
+
+        Raises:
+            ValueError: If links or bins differ.
+        """
+        if other.link_ids != self.link_ids or other.bins != self.bins:
+            raise ValueError("Cannot merge accumulators with different links or bins")
+        self.samples += other.samples
+        self._weighted_sum += other._weighted_sum
+        np.maximum(self._max, other._max, out=self._max)
+        self._histogram += other._histogram
+        if self.baseline is None:
+            self.baseline = other.baseline
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export statistics as compact per-direction arrays aligned with ``links``.
+
+        Returns:
+            Dictionary with ``links``, ``capacity``, ``samples``, ``bin_edges``,
+            ``baseline`` (per-direction utilization or None) and, per direction
+            (``fwd``/``rev``), ``mean``, ``max`` and ``histogram`` (one row of
+            ``bins`` weighted counts per link).
+        """
+        mean = (
+            self._weighted_sum / self.samples
+            if self.samples
+            else np.zeros_like(self._weighted_sum)
+        )
+        result: Dict[str, Any] = {
+            "links": list(self.link_ids),
+            "capacity": self.capacity.tolist(),
+            "samples": self.samples,
+            "bin_edges": np.linspace(0.0, 1.0, self.bins + 1).tolist(),
+            "baseline": (
+                None
+                if self.baseline is None
+                else {
+                    d: self.baseline[:, i].tolist() for i, d in enumerate(_DIRECTIONS)
+                }
+            ),
+        }
+        for i, direction in enumerate(_DIRECTIONS):
+            result[direction] = {
+                "mean": mean[:, i].tolist(),
+                "max": self._max[:, i].tolist(),
+                "histogram": self._histogram[:, i, :].tolist(),
+            }
+        return result
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Union
 
 from ngraph.dsl.blueprints.expand import expand_network_dsl
 from ngraph.dsl.loader import load_scenario_yaml
@@ -22,10 +23,20 @@ from ngraph.model.failure.validation import (
 from ngraph.model.network import Network
 from ngraph.results import Results
 from ngraph.results.snapshot import build_scenario_snapshot
+from ngraph.utils.scenario_cache import (
+    load_compiled_scenario,
+    scenario_cache_key,
+    store_compiled_scenario,
+)
 from ngraph.utils.seed_manager import SeedManager
 from ngraph.workflow.base import WorkflowStep
 from ngraph.workflow.parse import build_workflow_steps
 
+if TYPE_CHECKING:
+    from ngraph.analysis.failure_patterns import FailurePatternStore
+    from ngraph.utils.checkpoint import RunCheckpoint
+    from ngraph.utils.step_cache import StepCache
+
 
 @dataclass
 class Scenario:
@@ -56,6 +67,17 @@ class Scenario:
     seed: Optional[int] = None
     # Per-instance execution counter for thread-safe step ordering
     _execution_counter: int = field(default=0, init=False, repr=False)
+    # Failure patterns and flattened attrs shared by steps of one run
+    _failure_pattern_store: Optional["FailurePatternStore"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Checkpoint directory of the current run, if any
+    checkpoint: Optional["RunCheckpoint"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    step_cache: Optional["StepCache"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     # Module-level logger
     _logger = get_logger(__name__)
@@ -69,22 +91,86 @@ class Scenario:
         """
         return SeedManager(self.seed)
 
-    def run(self) -> None:
+    @property
+    def failure_pattern_store(self) -> "FailurePatternStore":
+        """Failure patterns sampled so far in this run, shared across steps.
+
+        Created on first use, replaced at the start of every ``run()`` and
+        after every step that may modify the network (see
+        ``reset_failure_patterns_after``).
+        """
+        store = self._failure_pattern_store
+        if store is None or store.network is not self.network:
+            from ngraph.analysis.failure_patterns import FailurePatternStore
+
+            store = self._failure_pattern_store = FailurePatternStore(self.network)
+        return store
+
+    def reset_failure_patterns_after(self, step: WorkflowStep) -> None:
+        """Drop the shared failure patterns if ``step`` may have modified the network.
+
+        Steps that are not ``concurrent_safe`` may change nodes, links or their
+        attributes, which invalidates the flattened attributes and the patterns
+        sampled from them. Later steps then sample against the current network.
+        """
+        if not step.concurrent_safe:
+            self._failure_pattern_store = None
+
+    def run(
+        self,
+        checkpoint: Optional["RunCheckpoint"] = None,
+        max_workers: Optional[int] = None,
+        step_cache: Optional["StepCache"] = None,
+    ) -> None:
         """Executes the scenario's workflow steps in order.
 
         Each step may modify scenario data or store outputs
         in scenario.results.
+
+        Args:
+            checkpoint: Optional run checkpoint. Steps completed in a previous
+                run are restored from it instead of executed, completed steps
+                are saved to it, and Monte Carlo steps save their progress
+                periodically.
+            max_workers: Run independent steps concurrently, sharing this many
+                analysis workers (see ``ngraph.workflow.scheduler``). None runs
+                steps one after another. Results are the same either way.
+            step_cache: Optional memoization cache. Steps whose inputs are
+                unchanged since a cached run reuse its results (see
+                ``ngraph.utils.step_cache``).
         """
-        # Reset instance execution counter for this run
+        # Reset instance execution counter and shared failure patterns for this run
         self._execution_counter = 0
+        self._failure_pattern_store = None
+        self.checkpoint = checkpoint
+        self.step_cache = step_cache
+        if step_cache is not None:
+            step_cache.prepare(self)
+        if max_workers is not None:
+            from ngraph.workflow.scheduler import run_workflow_concurrently
+
+            run_workflow_concurrently(self, max_workers, checkpoint)
+            if checkpoint is not None:
+                checkpoint.mark_complete()
+            return
         for step in self.workflow:
+            if checkpoint is not None and checkpoint.restore_step(self, step):
+                continue
             step.execute(self)
+            self.reset_failure_patterns_after(step)
+            if checkpoint is not None:
+                checkpoint.save_step(self, step)
+        if checkpoint is not None:
+            checkpoint.mark_complete()
 
     @classmethod
     def from_yaml(
         cls,
         yaml_str: str,
         default_components: Optional[ComponentsLibrary] = None,
+        *,
+        validate_schema: bool = True,
+        cache_dir: Optional[Union[str, Path]] = None,
     ) -> Scenario:
         """Constructs a Scenario from a YAML string, optionally merging
         with a default ComponentsLibrary if provided.
@@ -113,10 +199,19 @@ class Scenario:
         If 'vars' is provided, it can contain YAML anchors and aliases for reuse.
         If any unrecognized top-level key is found, a ValueError is raised.
 
+        When ``cache_dir`` is given, the compiled scenario is looked up by a
+        content hash of the YAML text, the ngraph version, and the build
+        options, and stored there after a fresh build. A cache hit skips
+        parsing, validation, and expansion entirely.
+
         Args:
             yaml_str (str): The YAML string that defines the scenario.
             default_components (ComponentsLibrary, optional):
                 A default library to merge with scenario-specific components.
+            validate_schema (bool): If False, skip JSON schema validation of
+                the YAML. Structural checks during expansion still apply.
+            cache_dir (str | Path, optional): Directory for compiled scenario
+                cache entries. Disabled when None.
 
         Returns:
             Scenario: An initialized Scenario with expanded network.
@@ -126,7 +221,21 @@ class Scenario:
                 or if there are any unrecognized top-level keys.
             TypeError: If a workflow step's arguments are invalid for the step class.
         """
-        data = load_scenario_yaml(yaml_str)
+        cache_key: Optional[str] = None
+        if cache_dir is not None:
+            cache_key = scenario_cache_key(
+                yaml_str,
+                validate_schema=validate_schema,
+                extra=repr(default_components) if default_components else None,
+            )
+            cached = load_compiled_scenario(Path(cache_dir), cache_key)
+            if cached is not None:
+                Scenario._logger.info(
+                    "Loaded compiled scenario from cache: key=%s", cache_key[:12]
+                )
+                return cached
+
+        data = load_scenario_yaml(yaml_str, validate_schema=validate_schema)
 
         # Extract seed first as it may be used by other components
         seed = data.get("seed")
@@ -312,4 +421,12 @@ class Scenario:
         except Exception as exc:
             Scenario._logger.debug("Failed to log scenario construction stats: %s", exc)
 
+        if cache_dir is not None and cache_key is not None:
+            try:
+                path = store_compiled_scenario(Path(cache_dir), cache_key, scenario_obj)
+                Scenario._logger.debug("Stored compiled scenario: %s", path)
+            except Exception as exc:
+                # Caching is an optimization; never fail the build because of it
+                Scenario._logger.warning("Failed to store compiled scenario: %s", exc)
+
         return scenario_obj
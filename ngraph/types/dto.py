@@ -39,7 +39,9 @@ class MaxFlowResult:
     Attributes:
         total_flow: Maximum flow value achieved.
         cost_distribution: Mapping of path cost to flow volume placed at that cost.
-        min_cut: Saturated edges forming the min-cut (None if not computed).
+        min_cut: Edges crossing the minimum s-t cut, i.e. edges leaving the set
+            of nodes reachable from the source in the final residual graph
+            (None if not computed).
     """
 
     total_flow: float
@@ -0,0 +1,339 @@
+"""On-disk checkpoints for resumable scenario runs.
+
+A run checkpoint directory holds:
+
+- ``manifest.json``: format version and the key of the scenario it belongs to.
+- ``scenario.pkl``: the compiled scenario as it was before the run. Link IDs
+  are random per build, so a resumed run must use this exact network.
+- ``steps/<step>.pkl``: results and metadata of every completed workflow step.
+- ``monte_carlo/<step>.pkl``: progress of the Monte Carlo step that was
+  running (completed iteration prefix, deduplicated failure patterns with
+  counts and traces, and the analysis result of every pattern).
+
+``Scenario.run(checkpoint=...)`` restores completed steps instead of running
+them again, and ``FailureManager`` continues a Monte Carlo analysis after the
+last saved iteration. Seeded sampling is a pure function of the iteration
+index and analysis is deterministic per pattern, so a resumed run produces
+the same results as an uninterrupted one. Steps that are not
+``concurrent_safe`` may modify the network, which is checkpointed only as it
+was before the run, so they are executed again (on resume and when shards
+are merged) rather than restored; such steps must be deterministic.
+
+A shard run (see ``ngraph.utils.sharding``) uses the same layout: its Monte
+Carlo files hold the final progress of the shard's iteration slice and are
+kept, while steps without Monte Carlo work are saved as completed steps.
+
+Files are written atomically (temporary file + rename) and pickled, like the
+compiled scenario cache. Unreadable entries are ignored and recomputed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+from ngraph.logging import get_logger
+
+if TYPE_CHECKING:
+    from ngraph.analysis.failure_patterns import FailurePatternSet
+    from ngraph.scenario import Scenario
+    from ngraph.utils.sharding import ShardSpec
+    from ngraph.workflow.base import WorkflowStep
+
+logger = get_logger(__name__)
+
+# Bump when the pickled layout of checkpoint entries changes incompatibly
+CHECKPOINT_FORMAT_VERSION = 1
+
+# Default minimum number of seconds between Monte Carlo progress saves
+DEFAULT_CHECKPOINT_INTERVAL = 60.0
+
+_MANIFEST = "manifest.json"
+
+
+def _entry_name(step_name: str) -> str:
+    """Return a file-system safe, collision-free file stem for a step name."""
+    readable = re.sub(r"[^A-Za-z0-9_.-]+", "_", step_name)[:64]
+    digest = hashlib.sha1(step_name.encode("utf-8")).hexdigest()[:10]
+    return f"{readable}-{digest}"
+
+
+def _atomic_pickle(path: Path, obj: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".pkl")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _load_pickle(path: Path) -> Any:
+    if not path.is_file():
+        return None
+    try:
+        with path.open("rb") as f:
+            return pickle.load(f)
+    except Exception as exc:
+        logger.warning("Ignoring unreadable checkpoint entry %s: %s", path, exc)
+        return None
+
+
+@dataclass
+class MonteCarloProgress:
+    """Saved progress of one Monte Carlo analysis.
+
+    Attributes:
+        next_iteration: First failure iteration not yet sampled. All
+            iterations from ``start_iteration`` up to it are reflected in
+            ``patterns``.
+        patterns: Distinct patterns of the completed iterations, with counts
+            and traces, in first-occurrence order.
+        results: Analysis result of each pattern, aligned with
+            ``patterns.patterns``.
+        start_iteration: First iteration covered (non-zero for shards).
+    """
+
+    next_iteration: int
+    patterns: "FailurePatternSet"
+    results: List[Any] = field(default_factory=list)
+    start_iteration: int = 0
+
+
+class MonteCarloCheckpoint:
+    """Progress file of the Monte Carlo analysis run by one workflow step.
+
+    Args:
+        path: Checkpoint file.
+        interval: Minimum number of seconds between saves. Zero saves after
+            every segment.
+        shard: Iteration slice to run, for shard runs. The final progress of
+            the slice is always saved.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+        shard: Optional["ShardSpec"] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.interval = float(interval)
+        self.shard = shard
+        self._last_save = time.monotonic()
+
+    def load(self, signature: Tuple[Any, ...]) -> Optional[MonteCarloProgress]:
+        """Return saved progress for an analysis, or None.
+
+        Args:
+            signature: Identity of the analysis (function, policy, seed,
+                iteration count, ...). Progress saved under a different
+                signature is ignored.
+        """
+        entry = _load_pickle(self.path)
+        if not isinstance(entry, dict) or entry.get("signature") != signature:
+            return None
+        progress = entry.get("progress")
+        if not isinstance(progress, MonteCarloProgress):
+            return None
+        logger.info(
+            "Resuming Monte Carlo analysis at iteration %d (%d patterns)",
+            progress.next_iteration,
+            len(progress.patterns.patterns),
+        )
+        return progress
+
+    def due(self) -> bool:
+        """Return True if ``interval`` has elapsed since the last save."""
+        return time.monotonic() - self._last_save >= self.interval
+
+    def save(self, signature: Tuple[Any, ...], progress: MonteCarloProgress) -> None:
+        """Write progress for an analysis, replacing any previous file."""
+        _atomic_pickle(self.path, {"signature": signature, "progress": progress})
+        self._last_save = time.monotonic()
+        logger.debug(
+            "Saved Monte Carlo checkpoint at iteration %d: %s",
+            progress.next_iteration,
+            self.path,
+        )
+
+    def clear(self) -> None:
+        """Remove the progress file."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class RunCheckpoint:
+    """Checkpoint directory of one scenario run.
+
+    Args:
+        directory: Checkpoint directory (created if missing).
+        scenario_key: Identity of the scenario, e.g. ``scenario_cache_key`` of
+            its YAML text. A directory written for another key cannot be
+            resumed.
+        resume: Reuse existing checkpoints. When False, previous contents of
+            the directory are discarded.
+        interval: Minimum number of seconds between Monte Carlo progress saves.
+        shard: Iteration slice run by every Monte Carlo step, for shard runs.
+
+    Raises:
+        ValueError: If ``resume`` is set and the directory belongs to a
+            different scenario.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        scenario_key: str,
+        *,
+        resume: bool = False,
+        interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+        shard: Optional["ShardSpec"] = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.scenario_key = scenario_key
+        self.interval = float(interval)
+        self.shard = shard
+
+        manifest_path = self.directory / _MANIFEST
+        manifest: Optional[dict] = None
+        if manifest_path.is_file():
+            try:
+                manifest = json.loads(manifest_path.read_text())
+            except (OSError, ValueError) as exc:
+                logger.warning("Ignoring unreadable checkpoint manifest: %s", exc)
+
+        if resume and manifest is not None:
+            if manifest.get("format") != CHECKPOINT_FORMAT_VERSION:
+                raise ValueError(
+                    f"checkpoint directory {self.directory} uses an incompatible "
+                    f"format ({manifest.get('format')})"
+                )
+            if manifest.get("scenario_key") != scenario_key:
+                raise ValueError(
+                    f"checkpoint directory {self.directory} belongs to a "
+                    f"different scenario"
+                )
+        else:
+            for sub in ("steps", "monte_carlo"):
+                shutil.rmtree(self.directory / sub, ignore_errors=True)
+            for name in ("scenario.pkl", "complete"):
+                (self.directory / name).unlink(missing_ok=True)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            manifest_path.write_text(
+                json.dumps(
+                    {"format": CHECKPOINT_FORMAT_VERSION, "scenario_key": scenario_key}
+                )
+            )
+
+    def save_scenario(self, scenario: "Scenario") -> None:
+        """Store the compiled scenario the run starts from (before ``run()``)."""
+        _atomic_pickle(self.directory / "scenario.pkl", scenario)
+
+    def load_scenario(self) -> Optional["Scenario"]:
+        """Return the compiled scenario of the checkpointed run, or None."""
+        from ngraph.scenario import Scenario
+
+        obj = _load_pickle(self.directory / "scenario.pkl")
+        return obj if isinstance(obj, Scenario) else None
+
+    def _step_path(self, step_name: str) -> Path:
+        return self.directory / "steps" / f"{_entry_name(step_name)}.pkl"
+
+    def monte_carlo(self, step_name: str) -> MonteCarloCheckpoint:
+        """Return the Monte Carlo progress file of a step."""
+        return MonteCarloCheckpoint(
+            self.directory / "monte_carlo" / f"{_entry_name(step_name)}.pkl",
+            self.interval,
+            self.shard,
+        )
+
+    def monte_carlo_progress(self) -> dict[str, Any]:
+        """Return the raw Monte Carlo entries by file stem (used for merging)."""
+        entries: dict[str, Any] = {}
+        for path in sorted((self.directory / "monte_carlo").glob("*.pkl")):
+            entry = _load_pickle(path)
+            if isinstance(entry, dict) and "progress" in entry:
+                entries[path.stem] = entry
+        return entries
+
+    def steps_dir(self) -> Path:
+        """Directory of completed step entries."""
+        return self.directory / "steps"
+
+    def mark_complete(self) -> None:
+        """Record that every workflow step of the run finished."""
+        (self.directory / "complete").write_text("")
+
+    @property
+    def is_complete(self) -> bool:
+        """True if ``mark_complete`` was called for this run."""
+        return (self.directory / "complete").is_file()
+
+    def restore_step(self, scenario: "Scenario", step: "WorkflowStep") -> bool:
+        """Load a completed step's results into ``scenario.results``.
+
+        Steps that are not ``concurrent_safe`` are never restored: their
+        effect on the network is not part of the checkpoint, so they must run
+        again for later steps to see the same network.
+
+        Returns:
+            True if the step was restored and must not run again.
+        """
+        if not step.concurrent_safe:
+            return False
+        step_name = step.name or step.__class__.__name__
+        entry = _load_pickle(self._step_path(step_name))
+        if not isinstance(entry, dict) or "store" not in entry:
+            return False
+        scenario.results.restore_step(step_name, entry["store"], entry["metadata"])
+        scenario._execution_counter = max(
+            scenario._execution_counter, entry["metadata"].execution_order + 1
+        )
+        logger.info("Restored completed workflow step from checkpoint: %s", step_name)
+        return True
+
+    def save_step(self, scenario: "Scenario", step: "WorkflowStep") -> None:
+        """Persist a completed step and drop its Monte Carlo progress file.
+
+        In shard runs, steps with Monte Carlo progress hold only their slice
+        of the results; they are not saved and their progress file is kept
+        for merging.
+        """
+        step_name = step.name or step.__class__.__name__
+        if self.shard is not None and self.monte_carlo(step_name).path.is_file():
+            return
+        _atomic_pickle(
+            self._step_path(step_name),
+            {
+                "store": scenario.results.get_step(step_name),
+                "metadata": scenario.results.get_step_metadata(step_name),
+            },
+        )
+        self.monte_carlo(step_name).clear()
+
+
+def monte_carlo_checkpoint(
+    scenario: Any, step_name: str
+) -> Optional[MonteCarloCheckpoint]:
+    """Return the Monte Carlo checkpoint of a step if the run is checkpointed."""
+    run_checkpoint = getattr(scenario, "checkpoint", None)
+    if not isinstance(run_checkpoint, RunCheckpoint):
+        return None
+    return run_checkpoint.monte_carlo(step_name)
@@ -106,16 +106,48 @@ def results_path_for_run(
 
 
 def profiles_dir_for_run(scenario_path: Path, output_dir: Optional[Path]) -> Path:
-    """Return the directory for child worker profiles for ``run --profile``.
+    """Return the directory for per-step ``.pstats`` files of ``run --profile``.
 
     Args:
         scenario_path: The scenario YAML path.
         output_dir: Optional base output directory.
 
     Returns:
-        Directory path where worker profiles should be stored.
+        Directory path where step profiles should be stored.
     """
     prefix = scenario_prefix_from_path(scenario_path)
     if output_dir is None:
         return Path("worker_profiles")
     return build_artifact_path(output_dir, prefix, ".profiles")
+
+
+def checkpoints_dir_for_run(scenario_path: Path, output_dir: Optional[Path]) -> Path:
+    """Return the default checkpoint directory for ``run --resume``.
+
+    Args:
+        scenario_path: The scenario YAML path.
+        output_dir: Optional base output directory.
+
+    Returns:
+        Directory path where run checkpoints are stored.
+    """
+    prefix = scenario_prefix_from_path(scenario_path)
+    if output_dir is None:
+        return Path(f"{prefix}.checkpoints")
+    return build_artifact_path(output_dir, prefix, ".checkpoints")
+
+
+def shards_dir_for_run(scenario_path: Path, output_dir: Optional[Path]) -> Path:
+    """Return the default shard directory for ``run --shard``.
+
+    Args:
+        scenario_path: The scenario YAML path.
+        output_dir: Optional base output directory.
+
+    Returns:
+        Directory path shared by all shards of a run.
+    """
+    prefix = scenario_prefix_from_path(scenario_path)
+    if output_dir is None:
+        return Path(f"{prefix}.shards")
+    return build_artifact_path(output_dir, prefix, ".shards")
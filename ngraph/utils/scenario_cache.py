@@ -0,0 +1,132 @@
+"""On-disk cache of compiled scenarios.
+
+A compiled scenario is the fully built ``Scenario`` returned by
+``Scenario.from_yaml``: expanded network (blueprints, rules, risk-group
+membership), failure policies, demand sets, and workflow steps. Building it
+from YAML repeats the same work on every invocation, so it is pickled under a
+key derived from the YAML text, the installed ngraph version, and the build
+options. Any change to one of these produces a new key; stale entries are
+never reused.
+
+Cache files are written atomically (temporary file + rename). Unreadable or
+corrupt entries are treated as misses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from ngraph.logging import get_logger
+
+if TYPE_CHECKING:
+    from ngraph.scenario import Scenario
+
+logger = get_logger(__name__)
+
+# Bump when the pickled layout of Scenario or its members changes incompatibly
+CACHE_FORMAT_VERSION = 1
+
+CACHE_SUFFIX = ".scenario.pkl"
+
+
+def _ngraph_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("ngraph")
+    except PackageNotFoundError:  # pragma: no cover - source checkout without metadata
+        return "unknown"
+
+
+def scenario_cache_key(
+    yaml_str: str,
+    *,
+    validate_schema: bool = True,
+    extra: Optional[str] = None,
+) -> str:
+    """Return the cache key for a scenario YAML text and build options.
+
+    Args:
+        yaml_str: Scenario YAML text.
+        validate_schema: Whether the scenario is built with schema validation.
+            Unvalidated builds never satisfy validated lookups.
+        extra: Optional additional build input (e.g., a digest of default
+            components) that affects the compiled result.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    header = (
+        f"ngraph={_ngraph_version()};format={CACHE_FORMAT_VERSION};"
+        f"schema={int(bool(validate_schema))};extra={extra or ''}\n"
+    )
+    digest.update(header.encode("utf-8"))
+    digest.update(yaml_str.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def cache_path(cache_dir: Path, key: str) -> Path:
+    """Return the file path for a cache key."""
+    return Path(cache_dir) / f"{key}{CACHE_SUFFIX}"
+
+
+def load_compiled_scenario(cache_dir: Path, key: str) -> Optional["Scenario"]:
+    """Load a compiled scenario from the cache.
+
+    Args:
+        cache_dir: Cache directory.
+        key: Cache key from ``scenario_cache_key``.
+
+    Returns:
+        The cached Scenario, or None on a miss or unreadable entry.
+    """
+    path = cache_path(cache_dir, key)
+    if not path.is_file():
+        return None
+    try:
+        with path.open("rb") as f:
+            obj: Any = pickle.load(f)
+    except Exception as exc:
+        logger.warning("Ignoring unreadable scenario cache entry %s: %s", path, exc)
+        return None
+
+    from ngraph.scenario import Scenario
+
+    if not isinstance(obj, Scenario):
+        logger.warning("Ignoring scenario cache entry %s: unexpected content", path)
+        return None
+    return obj
+
+
+def store_compiled_scenario(cache_dir: Path, key: str, scenario: "Scenario") -> Path:
+    """Store a compiled scenario in the cache.
+
+    Args:
+        cache_dir: Cache directory (created if missing).
+        key: Cache key from ``scenario_cache_key``.
+        scenario: Scenario to store. Must not have been run yet.
+
+    Returns:
+        Path of the written cache file.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = cache_path(cache_dir, key)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix=".tmp-", suffix=".pkl")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(scenario, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return path
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class SeedManager:
@@ -55,3 +58,21 @@ class SeedManager:
         # Convert first 4 bytes to a positive integer
         seed_value = int.from_bytes(hash_digest[:4], byteorder="big")
         return seed_value & 0x7FFFFFFF  # Ensure positive 32-bit integer
+
+
+def numpy_generator(seed: Optional[int]) -> "np.random.Generator":
+    """Build the NumPy Generator used for vectorized random draws.
+
+    The stream for an integer ``seed`` is ``PCG64(SeedSequence(seed))``. Equal
+    seeds give equal draws on the same NumPy release. NumPy does not promise
+    identical streams across releases for every distribution method.
+
+    Args:
+        seed: Integer seed, or None for fresh OS entropy.
+
+    Returns:
+        A new ``numpy.random.Generator``.
+    """
+    import numpy as np
+
+    return np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed)))
@@ -0,0 +1,284 @@
+"""Sharded scenario execution across processes or machines.
+
+``ngraph run --shard K/N --shard-dir DIR`` runs the whole workflow, but every
+Monte Carlo step samples and analyzes only the K-th of N contiguous slices of
+its failure iterations. Iteration ``i`` uses seed ``seed + i`` in every shard,
+so the union of the slices is exactly the iteration set of a single run.
+
+The shard directory (on a filesystem shared by all shards) holds:
+
+- ``manifest.json``: scenario key, scenario name, and shard count.
+- ``scenario.pkl``: the compiled scenario. The first shard to start writes it
+  and all others load it, so every shard analyzes the same network (link IDs
+  are random per build).
+- ``shard-K-of-N/``: a run checkpoint per shard (see
+  ``ngraph.utils.checkpoint``) with the final Monte Carlo progress of its
+  slice and the results of steps without Monte Carlo work.
+
+``merge_shards`` combines the per-step pattern tables (summing occurrence
+counts, keeping the first occurrence and its trace) and then runs the workflow
+on the shared scenario with the merged tables as completed checkpoints: steps
+without Monte Carlo work are restored from shard 1, and Monte Carlo steps
+rebuild their outputs (envelopes, sensitivity aggregates, ...) from the merged
+results without sampling. The merged results equal a single run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from ngraph.logging import get_logger
+from ngraph.utils.checkpoint import (
+    MonteCarloProgress,
+    RunCheckpoint,
+    _atomic_pickle,
+    _load_pickle,
+)
+
+if TYPE_CHECKING:
+    from ngraph.analysis.failure_patterns import FailurePattern
+    from ngraph.scenario import Scenario
+
+logger = get_logger(__name__)
+
+_MANIFEST = "manifest.json"
+_SCENARIO = "scenario.pkl"
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """One of ``count`` contiguous slices of every Monte Carlo iteration range.
+
+    Attributes:
+        index: 1-based shard number.
+        count: Total number of shards.
+    """
+
+    index: int
+    count: int
+
+    def __post_init__(self) -> None:
+        if self.count < 1 or not (1 <= self.index <= self.count):
+            raise ValueError(
+                f"invalid shard {self.index}/{self.count}: expected 1 <= K <= N"
+            )
+
+    @classmethod
+    def parse(cls, text: str) -> "ShardSpec":
+        """Parse ``"K/N"`` (e.g. ``"2/8"``)."""
+        match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", text)
+        if match is None:
+            raise ValueError(f"invalid shard '{text}': expected K/N, e.g. 1/4")
+        return cls(int(match.group(1)), int(match.group(2)))
+
+    def iteration_range(self, iterations: int) -> range:
+        """Return this shard's slice of ``range(iterations)``."""
+        k = self.index - 1
+        return range(k * iterations // self.count, (k + 1) * iterations // self.count)
+
+    @property
+    def label(self) -> str:
+        """Directory name of the shard, ``shard-K-of-N``."""
+        return f"shard-{self.index}-of-{self.count}"
+
+
+def _read_manifest(directory: Path) -> Optional[Dict[str, Any]]:
+    path = directory / _MANIFEST
+    if not path.is_file():
+        return None
+    return json.loads(path.read_text())
+
+
+def _publish_once(path: Path, obj: Any) -> bool:
+    """Write ``obj`` to ``path`` unless it exists. Returns True if written.
+
+    The file is written under a temporary name and hard-linked into place,
+    which fails atomically if another process published first.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".pkl")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            os.link(tmp_name, path)
+        except FileExistsError:
+            return False
+        return True
+    finally:
+        os.unlink(tmp_name)
+
+
+def shared_scenario(
+    directory: Path,
+    scenario_key: str,
+    scenario_name: str,
+    shard: ShardSpec,
+    build: Callable[[], "Scenario"],
+) -> "Scenario":
+    """Return the compiled scenario shared by all shards of a directory.
+
+    Args:
+        directory: Shard directory.
+        scenario_key: Identity of the scenario YAML.
+        scenario_name: Name used for the merged results file.
+        shard: Shard being started.
+        build: Builds the scenario when no shard has published it yet.
+
+    Raises:
+        ValueError: If the directory belongs to a different scenario or shard
+            count.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "scenario_key": scenario_key,
+        "scenario_name": scenario_name,
+        "shards": shard.count,
+    }
+    existing = _read_manifest(directory)
+    if existing is None:
+        (directory / _MANIFEST).write_text(json.dumps(manifest))
+    elif (existing.get("scenario_key"), existing.get("shards")) != (
+        scenario_key,
+        shard.count,
+    ):
+        raise ValueError(
+            f"shard directory {directory} belongs to a different scenario or "
+            f"shard count ({existing.get('shards')})"
+        )
+
+    from ngraph.scenario import Scenario
+
+    path = directory / _SCENARIO
+    if not path.is_file():
+        if _publish_once(path, build()):
+            logger.info("Published compiled scenario for shards: %s", path)
+    scenario = _load_pickle(path)
+    if not isinstance(scenario, Scenario):
+        raise ValueError(f"unreadable shared scenario: {path}")
+    return scenario
+
+
+def shard_checkpoint(
+    directory: Path,
+    scenario_key: str,
+    shard: ShardSpec,
+    *,
+    resume: bool = False,
+    interval: Optional[float] = None,
+) -> RunCheckpoint:
+    """Return the run checkpoint that records one shard's outputs."""
+    kwargs: Dict[str, Any] = {"resume": resume, "shard": shard}
+    if interval is not None:
+        kwargs["interval"] = interval
+    return RunCheckpoint(Path(directory) / shard.label, scenario_key, **kwargs)
+
+
+def merge_progress(parts: List[MonteCarloProgress]) -> MonteCarloProgress:
+    """Combine the progress of consecutive iteration slices.
+
+    Occurrence counts of patterns seen in several slices are summed; the
+    first occurrence (lowest iteration) keeps its trace and analysis result.
+
+    Raises:
+        ValueError: If the slices are not contiguous.
+    """
+    parts = sorted(parts, key=lambda p: p.start_iteration)
+    by_key: Dict[Tuple[Any, Any], "FailurePattern"] = {}
+    results: Dict[Tuple[Any, Any], Any] = {}
+    iterations = 0
+    expected = parts[0].start_iteration if parts else 0
+    for part in parts:
+        if part.start_iteration != expected:
+            raise ValueError(
+                f"shard progress is not contiguous: expected iteration {expected}, "
+                f"got {part.start_iteration}"
+            )
+        expected = part.next_iteration
+        iterations += part.patterns.iterations
+        for pattern, result in zip(part.patterns.patterns, part.results, strict=True):
+            key = (pattern.excluded_nodes, pattern.excluded_links)
+            known = by_key.get(key)
+            if known is None:
+                by_key[key] = replace(pattern)
+                results[key] = result
+            else:
+                known.count += pattern.count
+
+    from ngraph.analysis.failure_patterns import FailurePatternSet
+
+    patterns = sorted(by_key.values(), key=lambda p: p.first_iteration)
+    return MonteCarloProgress(
+        next_iteration=expected,
+        patterns=FailurePatternSet(
+            patterns=patterns,
+            iterations=iterations,
+            has_traces=bool(parts) and parts[0].patterns.has_traces,
+        ),
+        results=[results[(p.excluded_nodes, p.excluded_links)] for p in patterns],
+        start_iteration=parts[0].start_iteration if parts else 0,
+    )
+
+
+def merge_shards(directory: Path) -> Tuple["Scenario", str]:
+    """Merge all shards of a directory into the results of a single run.
+
+    Args:
+        directory: Shard directory written by ``ngraph run --shard``.
+
+    Returns:
+        Tuple of (scenario with merged results, scenario name).
+
+    Raises:
+        ValueError: If the directory is not a shard directory or a shard is
+            missing or incomplete.
+    """
+    directory = Path(directory)
+    manifest = _read_manifest(directory)
+    if manifest is None:
+        raise ValueError(f"not a shard directory: {directory}")
+    count = int(manifest["shards"])
+    key = str(manifest["scenario_key"])
+
+    shards: List[RunCheckpoint] = []
+    for index in range(1, count + 1):
+        spec = ShardSpec(index, count)
+        if not (directory / spec.label).is_dir():
+            raise ValueError(f"shard {index}/{count} has not been run")
+        ckpt = RunCheckpoint(directory / spec.label, key, resume=True, shard=spec)
+        if not ckpt.is_complete:
+            raise ValueError(f"shard {index}/{count} did not finish")
+        shards.append(ckpt)
+
+    merged = RunCheckpoint(directory / "merged", key)
+    # Steps without Monte Carlo work are identical in every shard
+    shutil.copytree(shards[0].steps_dir(), merged.steps_dir(), dirs_exist_ok=True)
+
+    per_shard = [ckpt.monte_carlo_progress() for ckpt in shards]
+    for stem in sorted(set().union(*per_shard)):
+        entries = [entries[stem] for entries in per_shard if stem in entries]
+        signatures = {repr(entry["signature"]) for entry in entries}
+        if len(entries) != count or len(signatures) != 1:
+            raise ValueError(f"shards disagree on Monte Carlo step '{stem}'")
+        progress = merge_progress([entry["progress"] for entry in entries])
+        _atomic_pickle(
+            merged.directory / "monte_carlo" / f"{stem}.pkl",
+            {"signature": entries[0]["signature"], "progress": progress},
+        )
+
+    scenario = _load_pickle(directory / _SCENARIO)
+    from ngraph.scenario import Scenario
+
+    if not isinstance(scenario, Scenario):
+        raise ValueError(f"unreadable shared scenario in {directory}")
+    logger.info("Merging %d shards from %s", count, directory)
+    scenario.run(checkpoint=merged)
+    return scenario, str(manifest.get("scenario_name") or "merged")
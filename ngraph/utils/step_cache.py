@@ -0,0 +1,234 @@
+"""Memoization of workflow step results across runs.
+
+Before a run, every workflow step gets an input fingerprint: a hash of the
+network content (including link IDs), the step type and parameters, the
+scenario seed, the definitions the step reads (its failure policy, demand set,
+components library, ...; see ``WorkflowStep.cache_inputs``), the fingerprints
+of the steps it depends on, and the ngraph version. A step whose fingerprint
+has stored results restores them instead of running; step metadata reports
+``cache_hit``.
+
+Link and demand IDs are random per scenario build and appear in results, so
+the cache also remembers the IDs it saw for a given network (or demand set)
+content and assigns them again when the same content is rebuilt. Editing one
+workflow step therefore keeps the results of every unchanged step reusable;
+editing the network invalidates all of them.
+
+Not cached: steps that are not ``concurrent_safe`` (they may modify the
+scenario) and unseeded steps with a failure policy (their results are not
+reproducible). Entries are pickled and written atomically; unreadable entries
+are misses.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ngraph.logging import get_logger
+from ngraph.utils.checkpoint import _atomic_pickle, _load_pickle
+from ngraph.utils.scenario_cache import _ngraph_version
+
+if TYPE_CHECKING:
+    from ngraph.model.demand.spec import TrafficDemand
+    from ngraph.model.network import Network
+    from ngraph.scenario import Scenario
+    from ngraph.workflow.base import WorkflowStep
+
+logger = get_logger(__name__)
+
+# Bump when the fingerprint inputs or the pickled entry layout change
+STEP_CACHE_FORMAT_VERSION = 1
+
+# Step fields that do not affect results
+_IGNORED_FIELDS = frozenset({"name", "depends_on"})
+
+
+def _canonical(obj: Any) -> Any:
+    if isinstance(obj, (set, frozenset)):
+        return sorted(map(repr, obj))
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            f.name: getattr(obj, f.name)
+            for f in dataclasses.fields(obj)
+            if not f.name.startswith("_")
+        }
+    if hasattr(obj, "to_dict") and callable(obj.to_dict):
+        return obj.to_dict()
+    return repr(obj)
+
+
+def fingerprint(*parts: Any) -> str:
+    """Return a SHA-256 hex digest of JSON-like parts (order-sensitive)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        text = json.dumps(part, sort_keys=True, default=_canonical)
+        digest.update(text.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def network_content_key(network: "Network") -> str:
+    """Return a hash of network content that ignores link IDs."""
+    return fingerprint(
+        [
+            (n.name, n.disabled, sorted(n.risk_groups), n.attrs)
+            for n in network.nodes.values()
+        ],
+        [
+            (
+                lk.source,
+                lk.target,
+                lk.capacity,
+                lk.cost,
+                lk.disabled,
+                sorted(lk.risk_groups),
+                lk.attrs,
+            )
+            for lk in network.links.values()
+        ],
+        {name: rg for name, rg in network.risk_groups.items()},
+        network.attrs,
+    )
+
+
+def _demand_content(demands: List["TrafficDemand"]) -> List[Dict[str, Any]]:
+    return [{k: v for k, v in d.__dict__.items() if k != "id"} for d in demands]
+
+
+class StepCache:
+    """Directory of memoized workflow step results.
+
+    Args:
+        directory: Cache directory (created on first write).
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self._fingerprints: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _ids_path(self, kind: str, key: str) -> Path:
+        return self.directory / "ids" / f"{kind}-{key}.pkl"
+
+    def _adopt(self, kind: str, key: str, current: List[str]) -> Optional[List[str]]:
+        """Return previously issued IDs for ``key``, or record ``current``."""
+        path = self._ids_path(kind, key)
+        issued = _load_pickle(path)
+        if isinstance(issued, list) and len(issued) == len(current):
+            return None if issued == current else issued
+        _atomic_pickle(path, current)
+        return None
+
+    def adopt_ids(self, scenario: "Scenario") -> None:
+        """Give links and demands the IDs issued for identical content before."""
+        network = scenario.network
+        link_ids = self._adopt(
+            "links", network_content_key(network), list(network.links)
+        )
+        if link_ids is not None:
+            network.relabel_links(link_ids)
+            logger.debug("Reused %d link IDs from step cache", len(link_ids))
+
+        relabeled = False
+        for name, demands in scenario.demand_set.sets.items():
+            demand_ids = self._adopt(
+                "demands",
+                fingerprint(name, _demand_content(demands)),
+                [d.id for d in demands],
+            )
+            if demand_ids is not None:
+                for demand, demand_id in zip(demands, demand_ids, strict=True):
+                    demand.id = demand_id
+                relabeled = True
+        if relabeled and scenario.results._scenario:
+            from ngraph.results.snapshot import build_scenario_snapshot
+
+            scenario.results.set_scenario_snapshot(
+                build_scenario_snapshot(
+                    seed=scenario.seed,
+                    failure_policy_set=scenario.failure_policy_set,
+                    demand_set=scenario.demand_set,
+                )
+            )
+
+    def prepare(self, scenario: "Scenario") -> None:
+        """Stabilize IDs and fingerprint every workflow step of a scenario.
+
+        Must be called before the first step runs.
+        """
+        from ngraph.workflow.scheduler import step_dependencies
+
+        self.adopt_ids(scenario)
+        network_key = fingerprint(
+            network_content_key(scenario.network), list(scenario.network.links)
+        )
+        workflow = list(scenario.workflow)
+        deps = step_dependencies(workflow)
+        prints: List[Optional[str]] = []
+        self._fingerprints = {}
+        for step, step_deps in zip(workflow, deps, strict=True):
+            dep_prints = [prints[j] for j in sorted(step_deps)]
+            value: Optional[str] = None
+            if self.cacheable(step) and None not in dep_prints:
+                value = fingerprint(
+                    _ngraph_version(),
+                    STEP_CACHE_FORMAT_VERSION,
+                    network_key,
+                    f"{type(step).__module__}.{type(step).__qualname__}",
+                    {
+                        f.name: getattr(step, f.name)
+                        for f in dataclasses.fields(step)
+                        if f.name not in _IGNORED_FIELDS and not f.name.startswith("_")
+                    },
+                    scenario.seed,
+                    step.cache_inputs(scenario),
+                    dep_prints,
+                )
+            prints.append(value)
+            self._fingerprints[step.name or type(step).__name__] = value
+
+    @staticmethod
+    def cacheable(step: "WorkflowStep") -> bool:
+        """Return True if the results of a step may be memoized."""
+        if not step.concurrent_safe:
+            return False
+        return not (getattr(step, "failure_policy", None) and step.seed is None)
+
+    def fingerprint_for(self, step_name: str) -> Optional[str]:
+        """Return the fingerprint computed by ``prepare``, or None if uncached."""
+        return self._fingerprints.get(step_name)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / "steps" / f"{key}.pkl"
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored ``{"metadata", "data"}`` of a step, or None."""
+        entry = _load_pickle(self._entry_path(key))
+        hit = isinstance(entry, dict) and "data" in entry
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+        return entry if hit else None
+
+    def store(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store the results of a step under its fingerprint."""
+        try:
+            _atomic_pickle(self._entry_path(key), dict(entry))
+        except Exception as exc:
+            # Caching is an optimization; never fail the step because of it
+            logger.warning("Failed to store step results in cache: %s", exc)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Lookup counters of this cache object: ``hits`` and ``misses``."""
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses}
@@ -1,16 +1,33 @@
-"""Workflow automation for NetGraph scenarios."""
+"""Workflow automation for NetGraph scenarios.
 
-from .base import WorkflowStep, register_workflow_step
-from .build_graph import BuildGraph
-from .cost_power import CostPower
-from .max_flow_step import MaxFlow
-from .maximum_supported_demand_step import MaximumSupportedDemand
-from .network_stats import NetworkStats
-from .traffic_matrix_placement_step import TrafficMatrixPlacement
+Built-in step classes are imported lazily on attribute access so that
+``import ngraph.workflow`` does not load every analysis dependency.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .base import (
+    BUILTIN_STEP_MODULES,
+    WorkflowStep,
+    get_workflow_step_class,
+    register_workflow_step,
+)
+
+if TYPE_CHECKING:
+    from .build_graph import BuildGraph
+    from .cost_power import CostPower
+    from .max_flow_step import MaxFlow
+    from .maximum_supported_demand_step import MaximumSupportedDemand
+    from .network_stats import NetworkStats
+    from .traffic_matrix_placement_step import TrafficMatrixPlacement
 
 __all__ = [
     "WorkflowStep",
     "register_workflow_step",
+    "get_workflow_step_class",
     "BuildGraph",
     "MaxFlow",
     "NetworkStats",
@@ -18,3 +35,16 @@ __all__ = [
     "MaximumSupportedDemand",
     "CostPower",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = BUILTIN_STEP_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
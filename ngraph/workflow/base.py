@@ -8,11 +8,24 @@ re-raised.
 
 from __future__ import annotations
 
+import importlib
 import os
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, Optional, Type, Union
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
 from ngraph.logging import get_logger
 
@@ -25,6 +38,17 @@ logger = get_logger(__name__)
 # Registry for workflow step classes
 WORKFLOW_STEP_REGISTRY: Dict[str, Type["WorkflowStep"]] = {}
 
+# Modules defining the built-in steps. They are imported on first lookup so that
+# loading a scenario pulls in only the analysis code its workflow uses.
+BUILTIN_STEP_MODULES: Dict[str, str] = {
+    "BuildGraph": "ngraph.workflow.build_graph",
+    "CostPower": "ngraph.workflow.cost_power",
+    "MaxFlow": "ngraph.workflow.max_flow_step",
+    "MaximumSupportedDemand": "ngraph.workflow.maximum_supported_demand_step",
+    "NetworkStats": "ngraph.workflow.network_stats",
+    "TrafficMatrixPlacement": "ngraph.workflow.traffic_matrix_placement_step",
+}
+
 
 def register_workflow_step(step_type: str):
     """Return a decorator that registers a `WorkflowStep` subclass.
@@ -43,6 +67,44 @@ def register_workflow_step(step_type: str):
     return decorator
 
 
+def get_workflow_step_class(step_type: str) -> Optional[Type["WorkflowStep"]]:
+    """Return the step class registered under ``step_type``.
+
+    Built-in steps are imported on demand the first time they are requested.
+
+    Args:
+        step_type: Registry key from the workflow configuration.
+
+    Returns:
+        The registered class, or None if the type is unknown.
+    """
+    step_cls = WORKFLOW_STEP_REGISTRY.get(step_type)
+    if step_cls is None and step_type in BUILTIN_STEP_MODULES:
+        importlib.import_module(BUILTIN_STEP_MODULES[step_type])
+        step_cls = WORKFLOW_STEP_REGISTRY.get(step_type)
+    return step_cls
+
+
+# Worker cap of the step running in the current thread (set by the scheduler)
+_worker_budget: ContextVar[Optional[int]] = ContextVar(
+    "ngraph_worker_budget", default=None
+)
+
+
+@contextmanager
+def worker_budget(workers: int) -> Iterator[None]:
+    """Cap ``resolve_parallelism`` to ``workers`` in the current thread.
+
+    Used by the workflow scheduler so that concurrently running steps share
+    one global worker budget.
+    """
+    token = _worker_budget.set(max(1, int(workers)))
+    try:
+        yield
+    finally:
+        _worker_budget.reset(token)
+
+
 def resolve_parallelism(parallelism: Union[int, str]) -> int:
     """Resolve parallelism setting to a concrete worker count.
 
@@ -50,11 +112,15 @@ def resolve_parallelism(parallelism: Union[int, str]) -> int:
         parallelism: Either an integer worker count or "auto" for CPU count.
 
     Returns:
-        Positive integer worker count (minimum 1).
+        Positive integer worker count (minimum 1), capped by the active
+        ``worker_budget``.
     """
     if isinstance(parallelism, str):
-        return max(1, int(os.cpu_count() or 1))
-    return max(1, int(parallelism))
+        workers = max(1, int(os.cpu_count() or 1))
+    else:
+        workers = max(1, int(parallelism))
+    cap = _worker_budget.get()
+    return workers if cap is None else min(workers, cap)
 
 
 @dataclass
@@ -71,6 +137,7 @@ class WorkflowStep(ABC):
           - type: <StepTypeName>
             name: "optional_step_name"  # Optional: Custom name for this step instance
             seed: 42                    # Optional: Seed for reproducible random operations
+            depends_on: [other_step]    # Optional: Steps that must complete first
             # ... step-specific parameters ...
         ```
 
@@ -79,14 +146,25 @@ class WorkflowStep(ABC):
             used for logging and result storage purposes.
         seed: Optional seed for reproducible random operations. If None,
             random operations will be non-deterministic.
+        depends_on: Names of earlier steps whose results this step reads.
+            Only used to order steps when independent steps run concurrently
+            (``Scenario.run(max_workers=...)``).
     """
 
+    # Whether the step only reads the scenario (network, policies, demands) and
+    # writes nothing but its own results. Other steps run alone, after every
+    # earlier step, when the workflow runs concurrently.
+    concurrent_safe: ClassVar[bool] = False
+
     name: str = ""
     seed: Optional[int] = None
+    depends_on: List[str] = field(default_factory=list)
     # Internal: provenance of the step seed ("explicit-step" or "scenario-derived" or "none").
     _seed_source: str = ""
 
-    def execute(self, scenario: "Scenario") -> None:
+    def execute(
+        self, scenario: "Scenario", execution_order: Optional[int] = None
+    ) -> None:
         """Execute the workflow step with logging and metadata storage.
 
         This method wraps the abstract run() method with timing, logging, and
@@ -94,6 +172,9 @@ class WorkflowStep(ABC):
 
         Args:
             scenario: The scenario to execute the step on.
+            execution_order: Order recorded in the step metadata. Defaults to
+                the next value of the scenario's execution counter; the
+                concurrent scheduler passes the step's workflow position.
 
         Returns:
             None
@@ -128,9 +209,10 @@ class WorkflowStep(ABC):
             seed_source = "none"
             active_seed = None
 
-        # Get execution order from scenario instance (thread-safe)
-        execution_order = scenario._execution_counter
-        scenario._execution_counter += 1
+        # Get execution order from scenario instance
+        if execution_order is None:
+            execution_order = scenario._execution_counter
+            scenario._execution_counter += 1
 
         # Enter step scope and store workflow metadata
         scenario.results.enter_step(step_name)
@@ -155,7 +237,44 @@ class WorkflowStep(ABC):
         start_time = time.time()
 
         try:
-            self.run(scenario)
+            from ngraph.profiling.memory import (
+                StepMemory,
+                active_memory,
+                approx_size,
+                memory_tracking_enabled,
+            )
+            from ngraph.profiling.phases import PhaseRecorder, phase_timing_enabled
+
+            # Memoized results of an earlier run with identical inputs
+            from ngraph.utils.step_cache import StepCache
+
+            step_cache = getattr(scenario, "step_cache", None)
+            cache_key = (
+                step_cache.fingerprint_for(step_name)
+                if isinstance(step_cache, StepCache)
+                else None
+            )
+            cached = step_cache.load(cache_key) if cache_key is not None else None
+            recorder = (
+                PhaseRecorder() if phase_timing_enabled() and cached is None else None
+            )
+            # A profiler may already sample memory around this step
+            memory = active_memory()
+            with ExitStack() as stack:
+                if memory is None and memory_tracking_enabled():
+                    memory = stack.enter_context(StepMemory().activate())
+                if recorder is not None:
+                    stack.enter_context(recorder.activate())
+                if cached is not None:
+                    scenario.results.put("metadata", dict(cached.get("metadata") or {}))
+                    scenario.results.put("data", cached["data"])
+                    logger.info(
+                        f"Reusing cached results for workflow step: {display_name}"
+                    )
+                else:
+                    self.run(scenario)
+                if memory is not None:
+                    memory.note("results", approx_size(scenario.results.get("data")))
             end_time = time.time()
             duration = end_time - start_time
             # Persist step duration into step-scoped metadata for downstream analysis
@@ -164,7 +283,18 @@ class WorkflowStep(ABC):
                 raise TypeError("Results metadata must be a dict")
             updated_md = dict(existing_md)
             updated_md["duration_sec"] = float(duration)
+            # Phase timers and memory describe this run (not a cached earlier one)
+            updated_md.pop("phases", None)
+            updated_md.pop("memory", None)
+            if recorder is not None:
+                updated_md["phases"] = recorder.to_dict()
+            if memory is not None:
+                updated_md["memory"] = memory.to_dict()
+            if cache_key is not None:
+                updated_md["cache_hit"] = cached is not None
             scenario.results.put("metadata", updated_md)
+            if cache_key is not None and cached is None:
+                step_cache.store(cache_key, scenario.results.get_step(step_name))
             logger.info(
                 f"Completed workflow step: {display_name} ({step_type}) "
                 f"in {duration:.3f} seconds"
@@ -200,6 +330,24 @@ class WorkflowStep(ABC):
                     "Failed to exit step scope cleanly for %s: %s", display_name, exc
                 )
 
+    def cache_inputs(self, scenario: "Scenario") -> Dict[str, Any]:
+        """Return the scenario definitions this step reads, for memoization.
+
+        The default covers the failure policy named by ``failure_policy`` and
+        the demands of ``demand_set``. Steps reading other scenario inputs
+        extend it (see ``ngraph.utils.step_cache``).
+        """
+        inputs: Dict[str, Any] = {}
+        policy_name = getattr(self, "failure_policy", None)
+        if policy_name:
+            policy = scenario.failure_policy_set.policies.get(policy_name)
+            inputs["failure_policy"] = policy.to_dict() if policy else None
+        demand_set = getattr(self, "demand_set", None)
+        if demand_set:
+            demands = scenario.demand_set.sets.get(demand_set, [])
+            inputs["demand_set"] = [dict(d.__dict__) for d in demands]
+        return inputs
+
     @abstractmethod
     def run(self, scenario: "Scenario") -> None:
         """Execute the workflow step logic.
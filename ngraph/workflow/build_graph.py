@@ -27,8 +27,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-import networkx as nx
-
 from ngraph.logging import get_logger
 from ngraph.workflow.base import WorkflowStep, register_workflow_step
 
@@ -51,6 +49,8 @@ class BuildGraph(WorkflowStep):
                      Defaults to True.
     """
 
+    concurrent_safe = True
+
     add_reverse: bool = True
 
     def run(self, scenario: Scenario) -> None:
@@ -62,6 +62,10 @@ class BuildGraph(WorkflowStep):
         Returns:
             None
         """
+        # NetworkX is only needed here; importing it lazily keeps it off the
+        # startup path of scenarios that do not export the graph.
+        import networkx as nx
+
         logger.info("Starting BuildGraph: name=%s", self.name)
         network = scenario.network
 
@@ -73,6 +73,8 @@ class CostPower(WorkflowStep):
         aggregation_level: Inclusive depth for aggregation. 0=root only.
     """
 
+    concurrent_safe = True
+
     include_disabled: bool = False
     aggregation_level: int = 2
 
@@ -84,6 +86,12 @@ class CostPower(WorkflowStep):
         if self.aggregation_level < 0:
             raise ValueError("aggregation_level must be >= 0")
 
+    def cache_inputs(self, scenario: Any) -> Dict[str, Any]:
+        """Include the components library used for capex/power lookups."""
+        inputs = super().cache_inputs(scenario)
+        inputs["components_library"] = scenario.components_library
+        return inputs
+
     def run(self, scenario: Any) -> None:
         """Aggregate capex and power by hierarchy levels 0..N.
 
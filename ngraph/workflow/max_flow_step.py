@@ -34,8 +34,10 @@ from typing import TYPE_CHECKING, Any, Dict, Union
 
 from ngraph.analysis.failure_manager import FailureManager
 from ngraph.logging import get_logger
+from ngraph.profiling.phases import phase
 from ngraph.results.flow import FlowIterationResult
 from ngraph.types.base import FlowPlacement
+from ngraph.utils.checkpoint import monte_carlo_checkpoint
 from ngraph.workflow.base import (
     WorkflowStep,
     register_workflow_step,
@@ -74,6 +76,8 @@ class MaxFlow(WorkflowStep):
         include_min_cut: Whether to include min-cut edges per flow.
     """
 
+    concurrent_safe = True
+
     source: Union[str, Dict[str, Any]] = ""
     target: Union[str, Dict[str, Any]] = ""
     mode: str = "combine"
@@ -122,6 +126,10 @@ class MaxFlow(WorkflowStep):
             network=scenario.network,
             failure_policy_set=scenario.failure_policy_set,
             policy_name=self.failure_policy,
+            pattern_store=getattr(scenario, "failure_pattern_store", None),
+            checkpoint=monte_carlo_checkpoint(
+                scenario, self.name or type(self).__name__
+            ),
         )
         effective_parallelism = resolve_parallelism(self.parallelism)
         raw = fm.run_max_flow_monte_carlo(
@@ -141,24 +149,25 @@ class MaxFlow(WorkflowStep):
 
         scenario.results.put("metadata", raw.get("metadata", {}))
 
-        # Handle baseline (separate from failure results)
-        baseline_result = raw.get("baseline")
-        baseline_dict = None
-        if baseline_result is not None:
-            if hasattr(baseline_result, "to_dict"):
-                baseline_dict = baseline_result.to_dict()
-            else:
-                baseline_dict = baseline_result
-
-        # Handle failure results
-        flow_results: list[dict] = []
-        for item in raw.get("results", []):
-            if isinstance(item, FlowIterationResult):
-                flow_results.append(item.to_dict())
-            elif hasattr(item, "to_dict") and callable(item.to_dict):
-                flow_results.append(item.to_dict())  # type: ignore[union-attr]
-            else:
-                flow_results.append(item)
+        with phase("results.serialize"):
+            # Handle baseline (separate from failure results)
+            baseline_result = raw.get("baseline")
+            baseline_dict = None
+            if baseline_result is not None:
+                if hasattr(baseline_result, "to_dict"):
+                    baseline_dict = baseline_result.to_dict()
+                else:
+                    baseline_dict = baseline_result
+
+            # Handle failure results
+            flow_results: list[dict] = []
+            for item in raw.get("results", []):
+                if isinstance(item, FlowIterationResult):
+                    flow_results.append(item.to_dict())
+                elif hasattr(item, "to_dict") and callable(item.to_dict):
+                    flow_results.append(item.to_dict())  # type: ignore[union-attr]
+                else:
+                    flow_results.append(item)
 
         context = {
             "source": self.source,
@@ -30,7 +30,6 @@ import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-import netgraph_core
 import numpy as np
 
 from ngraph.analysis.demand import ExpandedDemand, expand_demands
@@ -85,6 +84,8 @@ class MaximumSupportedDemand(WorkflowStep):
         placement_rounds: Placement optimization rounds.
     """
 
+    concurrent_safe = True
+
     demand_set: str = "default"
     acceptance_rule: str = "hard"
     alpha_start: float = 1.0
@@ -333,17 +334,17 @@ class MaximumSupportedDemand(WorkflowStep):
         ctx = cache.ctx
         volumes = [d.volume * alpha for d in cache.base_expanded]
 
-        flow_graph = netgraph_core.FlowGraph(ctx.multidigraph)
-        result = place_demands(
-            cache.base_expanded,
-            volumes,
-            flow_graph,
-            ctx,
-            cache.node_mask,
-            cache.edge_mask,
-            resolved_ids=cache.resolved_ids,
-            collect_entries=False,
-        )
+        with ctx._flow_graph_pool.borrow() as state:
+            result = place_demands(
+                cache.base_expanded,
+                volumes,
+                state.flow_graph,
+                ctx,
+                cache.node_mask,
+                cache.edge_mask,
+                resolved_ids=cache.resolved_ids,
+                collect_entries=False,
+            )
 
         if result.summary.total_demand == 0.0:
             raise ValueError(
@@ -49,6 +49,8 @@ class NetworkStats(WorkflowStep):
         excluded_links: Optional list of link IDs to exclude (temporary exclusion).
     """
 
+    concurrent_safe = True
+
     include_disabled: bool = False
     excluded_nodes: Iterable[str] = ()
     excluded_links: Iterable[str] = ()
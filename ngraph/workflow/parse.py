@@ -2,6 +2,7 @@
 
 Converts a normalized workflow section (list[dict]) into WorkflowStep
 instances using the WORKFLOW_STEP_REGISTRY and attaches unique names/seeds.
+Built-in step modules are imported only for the step types that appear.
 """
 
 from __future__ import annotations
@@ -10,7 +11,8 @@ from typing import Any, Callable, Dict, List, Optional
 
 from ngraph.logging import get_logger
 from ngraph.utils.yaml_utils import normalize_yaml_dict_keys
-from ngraph.workflow.base import WORKFLOW_STEP_REGISTRY, WorkflowStep
+from ngraph.workflow.base import WorkflowStep, get_workflow_step_class
+from ngraph.workflow.scheduler import step_dependencies
 
 _logger = get_logger(__name__)
 
@@ -27,6 +29,10 @@ def build_workflow_steps(
 
     Returns:
         A list of WorkflowStep instances with unique names and optional seeds.
+
+    Raises:
+        ValueError: On unknown step types, duplicate names, or ``depends_on``
+            entries that do not name an earlier step.
     """
     if not isinstance(workflow_data, list):
         raise ValueError("'workflow' must be a list if present.")
@@ -42,7 +48,7 @@ def build_workflow_steps(
                 "indicating the WorkflowStep subclass to use."
             )
 
-        step_cls = WORKFLOW_STEP_REGISTRY.get(step_type)
+        step_cls = get_workflow_step_class(step_type)
         if not step_cls:
             raise ValueError(f"Unrecognized step 'type': {step_type}")
 
@@ -79,4 +85,6 @@ def build_workflow_steps(
 
         steps.append(step_obj)
 
+    # Reject dependencies on unknown or later steps at load time
+    step_dependencies(steps)
     return steps
@@ -0,0 +1,171 @@
+"""Concurrent execution of independent workflow steps.
+
+Dependencies between steps are inferred from declared ``depends_on`` names and
+from ``alpha_from_step`` (a ``TrafficMatrixPlacement`` reading the alpha of an
+``MaximumSupportedDemand``). A step that is not ``concurrent_safe`` (e.g. a
+custom step that modifies the network) depends on every earlier step and every
+later step depends on it. Dependencies must name earlier steps, so the
+sequential order is always a valid schedule.
+
+Ready steps start in workflow order. Each step is granted
+``min(resolve_parallelism(step.parallelism), max_workers)`` workers (1 for
+steps without a ``parallelism`` setting) and starts only when the global
+budget has room for its grant, so grants do not depend on timing. Step
+results do not depend on the worker count, per-step seeds are derived from
+step names, and the recorded ``execution_order`` is the workflow position, so
+concurrent runs export the same results as sequential ones.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple
+
+from ngraph.logging import get_logger
+from ngraph.workflow.base import WorkflowStep, resolve_parallelism, worker_budget
+
+if TYPE_CHECKING:
+    from ngraph.scenario import Scenario
+    from ngraph.utils.checkpoint import RunCheckpoint
+
+logger = get_logger(__name__)
+
+
+def _step_name(step: WorkflowStep) -> str:
+    return step.name or step.__class__.__name__
+
+
+def step_dependencies(workflow: Sequence[WorkflowStep]) -> List[Set[int]]:
+    """Return the indices of the steps each workflow step depends on.
+
+    Args:
+        workflow: Workflow steps in declaration order.
+
+    Returns:
+        For every step, the set of earlier step indices that must complete
+        before it starts.
+
+    Raises:
+        ValueError: If a step depends on an unknown or later step.
+    """
+    index_by_name = {_step_name(step): i for i, step in enumerate(workflow)}
+    deps: List[Set[int]] = []
+    barrier: Optional[int] = None
+    for i, step in enumerate(workflow):
+        refs = list(step.depends_on or [])
+        alpha_from = getattr(step, "alpha_from_step", None)
+        if alpha_from:
+            refs.append(alpha_from)
+        step_deps: Set[int] = set()
+        for ref in refs:
+            j = index_by_name.get(ref)
+            if j is None:
+                raise ValueError(
+                    f"Workflow step '{_step_name(step)}' depends on unknown step "
+                    f"'{ref}'"
+                )
+            if j >= i:
+                raise ValueError(
+                    f"Workflow step '{_step_name(step)}' depends on '{ref}', which "
+                    f"must come earlier in the workflow"
+                )
+            step_deps.add(j)
+        if not step.concurrent_safe:
+            step_deps.update(range(i))
+            barrier = i
+        elif barrier is not None:
+            step_deps.add(barrier)
+        deps.append(step_deps)
+    return deps
+
+
+def requested_workers(step: WorkflowStep) -> int:
+    """Return the worker count a step would use on its own."""
+    parallelism = getattr(step, "parallelism", None)
+    return 1 if parallelism is None else resolve_parallelism(parallelism)
+
+
+def _execute(
+    scenario: "Scenario",
+    step: WorkflowStep,
+    order: int,
+    workers: int,
+    checkpoint: Optional["RunCheckpoint"],
+) -> None:
+    with worker_budget(workers):
+        step.execute(scenario, execution_order=order)
+    if not step.concurrent_safe:
+        # The step ran alone; recreate the shared store before later steps
+        # race to create it
+        scenario.reset_failure_patterns_after(step)
+        _ = scenario.failure_pattern_store
+    if checkpoint is not None:
+        checkpoint.save_step(scenario, step)
+
+
+def run_workflow_concurrently(
+    scenario: "Scenario",
+    max_workers: int,
+    checkpoint: Optional["RunCheckpoint"] = None,
+) -> None:
+    """Run the scenario workflow, executing independent steps concurrently.
+
+    Args:
+        scenario: Scenario whose ``workflow`` runs.
+        max_workers: Global budget of analysis workers shared by all running
+            steps.
+        checkpoint: Optional run checkpoint (completed steps are restored).
+
+    Raises:
+        Exception: The error of the first (in workflow order) failed step.
+            Steps already running finish; no further steps start.
+    """
+    workflow = list(scenario.workflow)
+    deps = step_dependencies(workflow)
+    budget = max(1, int(max_workers))
+
+    done: Set[int] = set()
+    for i, step in enumerate(workflow):
+        if checkpoint is not None and checkpoint.restore_step(scenario, step):
+            done.add(i)
+    # Create the shared pattern store before steps race to create it
+    _ = scenario.failure_pattern_store
+
+    pending = [i for i in range(len(workflow)) if i not in done]
+    grants = {i: min(requested_workers(workflow[i]), budget) for i in pending}
+    running: Dict[Future, Tuple[int, int]] = {}
+    errors: Dict[int, BaseException] = {}
+    available = budget
+    logger.info(
+        "Running %d workflow steps concurrently with %d workers",
+        len(pending),
+        budget,
+    )
+    with ThreadPoolExecutor(
+        max_workers=budget, thread_name_prefix="ngraph-step"
+    ) as pool:
+        while pending or running:
+            if not errors:
+                for i in list(pending):
+                    if deps[i] <= done and grants[i] <= available:
+                        pending.remove(i)
+                        available -= grants[i]
+                        future = pool.submit(
+                            _execute, scenario, workflow[i], i, grants[i], checkpoint
+                        )
+                        running[future] = (i, grants[i])
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                i, grant = running.pop(future)
+                available += grant
+                exc = future.exception()
+                if exc is not None:
+                    errors[i] = exc
+                else:
+                    done.add(i)
+
+    scenario._execution_counter = max(scenario._execution_counter, len(workflow))
+    if errors:
+        raise errors[min(errors)]
@@ -17,6 +17,7 @@ YAML Configuration Example:
         parallelism: 4                   # Worker processes (or "auto")
         alpha: 1.0                       # Demand volume multiplier
         include_flow_details: true       # Include cost distribution per flow
+        include_link_utilization: true   # Per-link utilization envelopes
     ```
 """
 
@@ -28,7 +29,9 @@ from typing import TYPE_CHECKING, Any
 
 from ngraph.analysis.failure_manager import FailureManager
 from ngraph.logging import get_logger
+from ngraph.profiling.phases import phase
 from ngraph.results.flow import FlowIterationResult
+from ngraph.utils.checkpoint import monte_carlo_checkpoint
 from ngraph.workflow.base import (
     WorkflowStep,
     register_workflow_step,
@@ -60,11 +63,19 @@ class TrafficMatrixPlacement(WorkflowStep):
         store_failure_patterns: Whether to store failure pattern results.
         include_flow_details: When True, include cost_distribution per flow.
         include_used_edges: When True, include set of used edges per demand in entry data.
+        include_link_utilization: When True, accumulate per-link utilization
+            (mean, max, histogram) across failure iterations, weighted by
+            occurrence_count, under ``data.link_utilization``. Each unique
+            failure pattern keeps a float32 link flow matrix until sampling
+            ends: about ``8 * links * unique_patterns`` bytes.
+        utilization_bins: Histogram bins over [0, 1] for link utilization.
         alpha: Numeric scale for demands in the set.
         alpha_from_step: Optional producer step name to read alpha from.
         alpha_from_field: Dotted field path in producer step (default: "data.alpha_star").
     """
 
+    concurrent_safe = True
+
     demand_set: str = ""
     failure_policy: str | None = None
     iterations: int = 1
@@ -74,6 +85,8 @@ class TrafficMatrixPlacement(WorkflowStep):
     store_failure_patterns: bool = False
     include_flow_details: bool = False
     include_used_edges: bool = False
+    include_link_utilization: bool = False
+    utilization_bins: int = 10
     alpha: float = 1.0
     alpha_from_step: str | None = None
     alpha_from_field: str = "data.alpha_star"
@@ -89,6 +102,8 @@ class TrafficMatrixPlacement(WorkflowStep):
                 raise ValueError("parallelism must be >= 1")
         if not (float(self.alpha) > 0.0):
             raise ValueError("alpha must be > 0.0")
+        if self.utilization_bins < 1:
+            raise ValueError("utilization_bins must be >= 1")
 
     def run(self, scenario: "Scenario") -> None:
         if not self.demand_set:
@@ -163,6 +178,10 @@ class TrafficMatrixPlacement(WorkflowStep):
             network=scenario.network,
             failure_policy_set=scenario.failure_policy_set,
             policy_name=self.failure_policy,
+            pattern_store=getattr(scenario, "failure_pattern_store", None),
+            checkpoint=monte_carlo_checkpoint(
+                scenario, self.name or type(self).__name__
+            ),
         )
         effective_parallelism = resolve_parallelism(self.parallelism)
 
@@ -175,6 +194,8 @@ class TrafficMatrixPlacement(WorkflowStep):
             store_failure_patterns=self.store_failure_patterns,
             include_flow_details=self.include_flow_details,
             include_used_edges=self.include_used_edges,
+            include_link_utilization=self.include_link_utilization,
+            utilization_bins=self.utilization_bins,
         )
 
         logger.debug(
@@ -186,44 +207,45 @@ class TrafficMatrixPlacement(WorkflowStep):
         # Store outputs
         scenario.results.put("metadata", raw.get("metadata", {}))
 
-        # Handle baseline (separate from failure results)
-        baseline_result = raw.get("baseline")
-        baseline_dict = None
-        if baseline_result is not None:
-            if hasattr(baseline_result, "to_dict"):
-                baseline_dict = baseline_result.to_dict()
-            else:
-                baseline_dict = baseline_result
-
-        # Handle failure results
-        flow_results: list[dict] = []
-        for item in raw.get("results", []):
-            if isinstance(item, FlowIterationResult):
-                flow_results.append(item.to_dict())
-            elif hasattr(item, "to_dict") and callable(item.to_dict):
-                flow_results.append(item.to_dict())  # type: ignore[union-attr]
-            else:
-                flow_results.append(item)
+        with phase("results.serialize"):
+            # Handle baseline (separate from failure results)
+            baseline_result = raw.get("baseline")
+            baseline_dict = None
+            if baseline_result is not None:
+                if hasattr(baseline_result, "to_dict"):
+                    baseline_dict = baseline_result.to_dict()
+                else:
+                    baseline_dict = baseline_result
+
+            # Handle failure results
+            flow_results: list[dict] = []
+            for item in raw.get("results", []):
+                if isinstance(item, FlowIterationResult):
+                    flow_results.append(item.to_dict())
+                elif hasattr(item, "to_dict") and callable(item.to_dict):
+                    flow_results.append(item.to_dict())  # type: ignore[union-attr]
+                else:
+                    flow_results.append(item)
 
         alpha_value = float(effective_alpha)
         alpha_source_value = getattr(self, "_alpha_source", "explicit")
 
-        scenario.results.put(
-            "data",
-            {
-                "baseline": baseline_dict,
-                "flow_results": flow_results,
-                "context": {
-                    "demand_set": self.demand_set,
-                    "placement_rounds": self.placement_rounds,
-                    "include_flow_details": self.include_flow_details,
-                    "include_used_edges": self.include_used_edges,
-                    "base_demands": base_demands,
-                    "alpha": alpha_value,
-                    "alpha_source": alpha_source_value,
-                },
+        data: dict[str, Any] = {
+            "baseline": baseline_dict,
+            "flow_results": flow_results,
+            "context": {
+                "demand_set": self.demand_set,
+                "placement_rounds": self.placement_rounds,
+                "include_flow_details": self.include_flow_details,
+                "include_used_edges": self.include_used_edges,
+                "base_demands": base_demands,
+                "alpha": alpha_value,
+                "alpha_source": alpha_source_value,
             },
-        )
+        }
+        if self.include_link_utilization:
+            data["link_utilization"] = raw.get("link_utilization")
+        scenario.results.put("data", data)
 
         metadata = raw.get("metadata", {})
         logger.info(
@@ -49,3 +49,63 @@ def test_disabled_link_tracked():
 
     # Disabled link should be tracked
     assert len(ctx.disabled_link_ids) == 1
+
+
+def test_link_edge_indices_match_core_layout():
+    """Each link maps to its forward and reverse Core edges."""
+    net = Network()
+    for name in ("C", "B", "A"):
+        net.add_node(Node(name))
+    links = [Link("C", "A"), Link("A", "B"), Link("B", "C"), Link("A", "B")]
+    for link in links:
+        net.add_link(link)
+
+    ctx = AnalysisContext.from_network(net)
+    ext_ids = ctx.multidigraph.ext_edge_ids_view()
+    for link in links:
+        edge_indices = ctx.link_id_to_edge_indices[link.id]
+        assert len(edge_indices) == 2
+        refs = {ctx.edge_mapper.decode_ext_id(int(ext_ids[e])) for e in edge_indices}
+        assert {(r.link_id, r.direction) for r in refs} == {
+            (link.id, "fwd"),
+            (link.id, "rev"),
+        }
+
+
+def test_flow_graph_pool_reuses_and_resets():
+    """Pooled FlowGraphs are reset between borrows and reused per thread."""
+    import threading
+
+    from ngraph.analysis import build_demand_context, demand_placement_analysis
+
+    net = Network()
+    for name in ("A", "B", "C"):
+        net.add_node(Node(name))
+    ab = Link("A", "B", capacity=5.0)
+    net.add_link(ab)
+    net.add_link(Link("B", "C", capacity=5.0))
+    demands = [{"source": "^A$", "target": "^C$", "volume": 4.0}]
+    ctx = build_demand_context(net, demands)
+
+    def _run(excluded_links=frozenset()):
+        return demand_placement_analysis(
+            net, set(), set(excluded_links), demands, context=ctx
+        ).summary.total_placed
+
+    # Leftover flow or masks from a previous borrow would change these
+    assert [_run(), _run({ab.id}), _run(), _run()] == [4.0, 0.0, 4.0, 4.0]
+    stats = ctx.flow_graph_pool_stats()
+    assert (stats.created, stats.reused, stats.in_use) == (1, 3, 0)
+    assert stats.hit_rate == 0.75
+
+    # Nested borrows in one thread get distinct slots
+    with ctx._borrow_flow_state() as outer, ctx._borrow_flow_state() as inner:
+        assert outer.flow_graph is not inner.flow_graph
+        assert ctx.flow_graph_pool_stats().in_use == 2
+
+    # Each thread gets its own slots
+    worker = threading.Thread(target=_run)
+    worker.start()
+    worker.join()
+    stats = ctx.flow_graph_pool_stats()
+    assert (stats.created, stats.threads) == (3, 2)
@@ -377,7 +377,7 @@ class TestFailureManagerErrorHandling:
         """Test that parallel execution errors propagate correctly."""
         mock_pool = MagicMock()
         mock_pool_executor.return_value.__enter__.return_value = mock_pool
-        mock_pool.map.side_effect = RuntimeError("Parallel execution failed")
+        mock_pool.submit.side_effect = RuntimeError("Parallel execution failed")
 
         # Mock analysis function
         def mock_analysis_func(*args: Any, **kwargs: Any) -> dict[str, Any]:
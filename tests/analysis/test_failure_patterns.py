@@ -0,0 +1,367 @@
+"""Tests for failure pattern sampling and the scenario-scoped pattern store."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from ngraph import Link, Network, Node
+from ngraph.analysis import FailureManager
+from ngraph.analysis.failure_patterns import (
+    FailurePatternStore,
+    failure_id_for,
+    sample_failure_patterns,
+)
+from ngraph.model.failure.policy import FailurePolicy
+from ngraph.model.failure.policy_set import FailurePolicySet
+from ngraph.scenario import Scenario
+from ngraph.workflow.base import WorkflowStep, register_workflow_step
+
+YAML = """
+network:
+  nodes: {A: {}, B: {}, C: {}, D: {}}
+  links:
+    - {source: A, target: B, capacity: 10}
+    - {source: B, target: D, capacity: 10}
+    - {source: A, target: C, capacity: 10}
+    - {source: C, target: D, capacity: 10}
+failures:
+  single_link:
+    modes:
+      - weight: 1.0
+        rules:
+          - {scope: link, mode: choice, count: 1}
+workflow:
+  - {type: MaxFlow, name: flow_a, source: "^A$", target: "^D$",
+     failure_policy: single_link, iterations: 20, seed: 5}
+  - {type: MaxFlow, name: flow_b, source: "^B$", target: "^C$",
+     failure_policy: single_link, iterations: 20, seed: 5,
+     store_failure_patterns: true}
+  - {type: MaxFlow, name: flow_c, source: "^A$", target: "^D$",
+     failure_policy: single_link, iterations: 20, seed: 5}
+"""
+
+
+def test_sample_failure_patterns_dedups_in_first_occurrence_order() -> None:
+    draws = [({"n1"}, set()), (set(), {"l1"}), ({"n1"}, set()), (set(), set())]
+    seeds: list[int | None] = []
+
+    def _compute(seed_offset, trace):
+        seeds.append(seed_offset)
+        if trace is not None:
+            trace["seed"] = seed_offset
+        return draws[seed_offset - 10]
+
+    result = sample_failure_patterns(_compute, range(4), seed=10, with_traces=True)
+
+    assert seeds == [10, 11, 12, 13]
+    assert result.iterations == 4
+    assert [
+        (set(p.excluded_nodes), set(p.excluded_links)) for p in result.patterns
+    ] == [
+        ({"n1"}, set()),
+        (set(), {"l1"}),
+        (set(), set()),
+    ]
+    assert [p.count for p in result.patterns] == [2, 1, 1]
+    assert [p.first_iteration for p in result.patterns] == [0, 1, 3]
+    assert result.patterns[0].trace == {"seed": 10}
+    assert result.patterns[2].failure_id == ""
+    assert result.patterns[0].failure_id == failure_id_for(
+        frozenset({"n1"}), frozenset()
+    )
+
+
+def test_steps_share_sampled_patterns(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = {"apply": 0}
+    original = FailurePolicy.apply_failures
+
+    def _counting(self, *args, **kwargs):
+        calls["apply"] += 1
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(FailurePolicy, "apply_failures", _counting)
+
+    scenario = Scenario.from_yaml(YAML)
+    scenario.run()
+
+    # flow_a samples; flow_b needs traces and samples again; flow_c reuses either
+    assert calls["apply"] == 40
+    assert scenario.failure_pattern_store.stats == {
+        "hits": 1,
+        "misses": 2,
+        "entries": 2,
+    }
+
+    steps = scenario.results.to_dict()["steps"]
+
+    def _ids(step: str) -> list[tuple[str, int]]:
+        return sorted(
+            (r["failure_id"], r["occurrence_count"])
+            for r in steps[step]["data"]["flow_results"]
+        )
+
+    assert _ids("flow_a") == _ids("flow_b") == _ids("flow_c")
+    assert sum(count for _, count in _ids("flow_a")) == 20
+
+
+def test_flattened_attrs_built_once_per_store() -> None:
+    net = Network()
+    net.add_node(Node("A", attrs={"role": "core"}))
+    net.add_node(Node("B"))
+    net.add_link(Link("A", "B"))
+    store = FailurePatternStore(net)
+
+    nodes, links = store.flattened_attrs()
+    assert nodes["A"]["role"] == "core"
+    assert store.flattened_attrs()[0] is nodes
+    assert store.flattened_attrs()[1] is links
+
+
+def test_unseeded_runs_are_not_cached() -> None:
+    store = FailurePatternStore(Network())
+    policy = FailurePolicy(modes=[])
+    sampled = []
+
+    def _sample():
+        sampled.append(1)
+        return sample_failure_patterns(lambda s, t: (set(), set()), range(2), None)
+
+    for _ in range(2):
+        store.get_or_sample("p", policy, None, range(2), False, _sample)
+    assert len(sampled) == 2
+    assert store.stats["entries"] == 0
+
+
+def test_pattern_store_must_match_network() -> None:
+    with pytest.raises(ValueError, match="different network"):
+        FailureManager(
+            Network(),
+            FailurePolicySet(),
+            pattern_store=FailurePatternStore(Network()),
+        )
+
+
+def _fm_with_policy(net: Network) -> FailureManager:
+    from ngraph.model.failure.policy import FailureMode, FailureRule
+
+    policies = FailurePolicySet()
+    policies.add(
+        "one_link",
+        FailurePolicy(
+            modes=[
+                FailureMode(
+                    weight=1.0,
+                    rules=[FailureRule(scope="link", mode="choice", count=1)],
+                )
+            ]
+        ),
+    )
+    return FailureManager(net, policies, policy_name="one_link")
+
+
+def _ring(n: int) -> Network:
+    net = Network()
+    for i in range(n):
+        net.add_node(Node(f"n{i}"))
+    for i in range(n):
+        net.add_link(Link(f"n{i}", f"n{(i + 1) % n}"))
+    return net
+
+
+def test_analysis_starts_before_sampling_finishes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import ngraph.analysis.failure_manager as fm_mod
+
+    monkeypatch.setattr(fm_mod, "SAMPLE_CHUNK_SIZE", 4)
+    fm = _fm_with_policy(_ring(8))
+    events: list[str] = []
+    original = fm.compute_exclusions
+
+    def _compute(*args, **kwargs):
+        events.append("sample")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(fm, "compute_exclusions", _compute)
+
+    def _analysis(network, excluded_nodes, excluded_links, **kwargs):
+        events.append("analyze")
+        return len(excluded_links)
+
+    out = fm.run_monte_carlo_analysis(_analysis, iterations=40, seed=1)
+
+    assert events.count("sample") == 40
+    first_failure_analysis = events.index("analyze", 1)  # index 0 is baseline
+    assert first_failure_analysis < events.index("sample") + 4 + 1
+    assert out["metadata"]["unique_patterns"] == len(out["results"])
+
+
+def test_chunked_sampling_matches_single_chunk(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import ngraph.analysis.failure_manager as fm_mod
+    from ngraph.analysis.functions import max_flow_analysis
+
+    net = _ring(6)
+
+    def _run(chunk: int, parallelism: int) -> list[tuple[str, int]]:
+        monkeypatch.setattr(fm_mod, "SAMPLE_CHUNK_SIZE", chunk)
+        out = _fm_with_policy(net).run_monte_carlo_analysis(
+            max_flow_analysis,
+            iterations=50,
+            parallelism=parallelism,
+            seed=3,
+            source="^n0$",
+            target="^n3$",
+        )
+        return [(r.failure_id, r.occurrence_count) for r in out["results"]]
+
+    reference = _run(10_000, 1)
+    assert sum(count for _, count in reference) == 50
+    assert _run(3, 1) == reference
+    assert _run(3, 4) == reference
+
+
+def test_parallel_runner_bounds_in_flight_tasks() -> None:
+    fm = FailureManager(Network(), FailurePolicySet())
+    produced = {"n": 0}
+    ahead: list[int] = []
+
+    def _analysis(network, excluded_nodes, excluded_links, index=0, **kwargs):
+        ahead.append(produced["n"] - index)
+        return index
+
+    def _args():
+        for i in range(200):
+            produced["n"] += 1
+            yield (fm.network, set(), set(), _analysis, {"index": i}, i, False, "f")
+
+    results = fm._run_parallel(_args(), None, parallelism=2)
+
+    assert results == list(range(200))
+    assert max(ahead) <= 2 * 4 + 1
+
+
+def test_concurrent_table_keeps_lowest_iteration() -> None:
+    from ngraph.analysis.failure_patterns import ConcurrentPatternTable
+
+    table = ConcurrentPatternTable(with_traces=True)
+    _, new = table.record(7, {"a"}, set(), {"i": 7})
+    assert new
+    assert table.record(2, {"a"}, set(), {"i": 2}) == (
+        table.pattern_set().patterns[0],
+        False,
+    )
+    table.record(5, set(), {"l"}, {"i": 5})
+
+    result = table.pattern_set()
+    assert [p.first_iteration for p in result.patterns] == [2, 5]
+    assert result.patterns[0].trace == {"i": 2}
+    assert result.patterns[0].count == 2
+    assert result.iterations == 3
+
+
+def test_workers_sample_and_match_serial(monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    net = _ring(8)
+    fm = _fm_with_policy(net)
+    sampling_threads: set[str] = set()
+    original = fm.compute_exclusions
+
+    def _compute(*args, **kwargs):
+        sampling_threads.add(threading.current_thread().name)
+        return original(*args, **kwargs)
+
+    def _run(parallelism: int) -> list[tuple[str, int, dict]]:
+        out = fm.run_monte_carlo_analysis(
+            _len_analysis,
+            iterations=300,
+            parallelism=parallelism,
+            seed=11,
+            store_failure_patterns=True,
+        )
+        return [
+            (r.failure_id, r.occurrence_count, r.failure_trace) for r in out["results"]
+        ]
+
+    serial = _run(1)
+    # Fresh store so the parallel run samples instead of reusing patterns
+    fm.pattern_store = FailurePatternStore(net)
+    monkeypatch.setattr(fm, "compute_exclusions", _compute)
+    parallel = _run(4)
+
+    assert parallel == serial
+    assert threading.main_thread().name not in sampling_threads
+
+
+def _len_analysis(network, excluded_nodes, excluded_links, **kwargs):
+    from ngraph.results.flow import FlowIterationResult, FlowSummary
+
+    return FlowIterationResult(
+        flows=[],
+        summary=FlowSummary(
+            total_demand=0.0,
+            total_placed=float(len(excluded_links)),
+            overall_ratio=1.0,
+            dropped_flows=0,
+            num_flows=0,
+        ),
+    )
+
+
+@dataclass
+class _MarkCore(WorkflowStep):
+    """Custom step that tags link A->B as core (not concurrent_safe)."""
+
+    def run(self, scenario: Scenario) -> None:
+        for link in scenario.network.links.values():
+            if (link.source, link.target) == ("A", "B"):
+                link.attrs["role"] = "core"
+        scenario.results.put("metadata", {})
+        scenario.results.put("data", {})
+
+
+register_workflow_step("_MarkCore")(_MarkCore)
+
+EDIT_YAML = """
+network:
+  nodes: {A: {}, B: {}}
+  links:
+    - {source: A, target: B, capacity: 10}
+failures:
+  core:
+    modes:
+      - weight: 1.0
+        rules:
+          - scope: link
+            mode: all
+            match:
+              conditions: [{attr: role, op: "==", value: core}]
+workflow:
+  - {type: MaxFlow, name: before, source: "^A$", target: "^B$",
+     failure_policy: core, iterations: 2, seed: 5}
+  - {type: _MarkCore, name: mark}
+  - {type: MaxFlow, name: after, source: "^A$", target: "^B$",
+     failure_policy: core, iterations: 2, seed: 5}
+"""
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_network_edit_step_invalidates_shared_patterns(max_workers) -> None:
+    scenario = Scenario.from_yaml(EDIT_YAML)
+    scenario.run(max_workers=max_workers)
+
+    steps = scenario.results.to_dict()["steps"]
+
+    def _placed(step: str) -> list[float]:
+        return [
+            r["summary"]["total_placed"]
+            for r in steps[step]["data"]["flow_results"]
+            if r["failure_id"]
+        ]
+
+    assert _placed("before") == []
+    assert _placed("after") and set(_placed("after")) == {0.0}
@@ -59,3 +59,25 @@ def test_demand_placement_analysis_includes_flow_details_costs_and_edges() -> No
         assert isinstance(flow.data["edges"], list)
         # Should have some edges (exact count depends on flow distribution)
         assert len(flow.data["edges"]) > 0
+
+
+def test_demand_placement_analysis_link_flows_are_float32() -> None:
+    """Per-result link flow matrices are stored compactly as float32."""
+    network = Network()
+    for node in ["A", "B"]:
+        network.add_node(Node(node))
+    network.add_link(Link("A", "B", capacity=100.0, cost=1.0))
+
+    result = demand_placement_analysis(
+        network=network,
+        excluded_nodes=set(),
+        excluded_links=set(),
+        demands_config=[{"source": "A", "target": "B", "volume": 40.0}],
+        include_link_flows=True,
+    )
+
+    link_flows = result.data["link_flows"]
+    assert link_flows.dtype.name == "float32"
+    assert link_flows.shape == (1, 2)
+    assert link_flows[0, 0] == 40.0
+    assert link_flows[0, 1] == 0.0
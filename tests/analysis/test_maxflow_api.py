@@ -135,10 +135,11 @@ def test_max_flow_with_details_total_matches() -> None:
 
 
 def test_max_flow_with_details_include_min_cut() -> None:
-    """Test that include_min_cut correctly returns saturated edges.
+    """Test that include_min_cut returns the source-side minimum cut.
 
     Uses the simple network with two parallel paths S->A->T and S->B->T.
-    All 4 edges should be saturated (form the min-cut).
+    All 4 edges are saturated, but the cut taken from the residual graph is
+    the pair of edges leaving S.
     """
     net = _simple_network()
 
@@ -146,21 +147,21 @@ def test_max_flow_with_details_include_min_cut() -> None:
     res_no_cut = analyze(net).max_flow_detailed("^S$", "^T$", mode=Mode.COMBINE)
     assert res_no_cut[("^S$", "^T$")].min_cut is None
 
-    # With include_min_cut=True, min_cut should contain saturated edges
     res_with_cut = analyze(net).max_flow_detailed(
         "^S$", "^T$", mode=Mode.COMBINE, include_min_cut=True
     )
     summary = res_with_cut[("^S$", "^T$")]
 
     assert summary.min_cut is not None
-    assert len(summary.min_cut) == 4  # All 4 edges are saturated
-
-    # Verify edge refs have expected structure
-    link_ids = {e.link_id for e in summary.min_cut}
-    # Each link appears once (forward direction)
-    assert len(link_ids) == 4
-
-    # Verify total flow is still correct
+    cut = {
+        (net.links[e.link_id].source, net.links[e.link_id].target, e.direction)
+        for e in summary.min_cut
+    }
+    assert cut == {("S", "A", "fwd"), ("S", "B", "fwd")}
+
+    # Cut capacity equals the max flow
+    cut_capacity = sum(net.links[e.link_id].capacity for e in summary.min_cut)
+    assert pytest.approx(cut_capacity, rel=0, abs=1e-9) == summary.total_flow
     assert pytest.approx(summary.total_flow, rel=0, abs=1e-9) == 2.0
 
 
@@ -280,3 +281,36 @@ def test_require_capacity_parameter() -> None:
         "^S$", "^T$", mode=Mode.COMBINE, shortest_path=True, require_capacity=False
     )
     assert result_ip[("^S$", "^T$")] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_min_cut_uses_single_max_flow_run() -> None:
+    """Min-cut comes from the max-flow residual state, not a sensitivity run."""
+    net = Network()
+    sites = [f"s{i}" for i in range(4)]
+    for name in sites:
+        net.add_node(Node(name))
+    for i, name in enumerate(sites):
+        net.add_link(Link(name, sites[(i + 1) % 4], capacity=10.0))
+
+    ctx = analyze(net, source="^s0$", sink="^s2$")
+
+    class _CountingAlgorithms:
+        def __init__(self, inner):
+            self.inner = inner
+            self.calls: list[str] = []
+
+        def __getattr__(self, name):
+            self.calls.append(name)
+            return getattr(self.inner, name)
+
+    counting = _CountingAlgorithms(ctx.algorithms)
+    object.__setattr__(ctx, "_algorithms", counting)
+
+    result = ctx.max_flow_detailed(include_min_cut=True)[("^s0$", "^s2$")]
+    assert counting.calls == ["max_flow"]
+    assert result.total_flow == pytest.approx(20.0)
+    # Ring: every edge is saturated, but only the two leaving s0 form the cut
+    assert {
+        (net.links[e.link_id].source, net.links[e.link_id].target, e.direction)
+        for e in result.min_cut or ()
+    } == {("s0", "s1", "fwd"), ("s3", "s0", "rev")}
@@ -12,6 +12,7 @@ masked out in analysis results.
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from ngraph import Link, Mode, Network, Node, analyze
@@ -273,6 +274,79 @@ class TestPairwiseMode:
         assert ("S2", "T1") not in result
         assert ("S2", "T2") not in result
 
+    def test_pseudo_nodes_shared_across_pairs(self) -> None:
+        """Each group gets one pseudo node; pairs reuse them without leaking flow."""
+        from ngraph.analysis.context import _build_pseudo_node_augmentations
+
+        net = Network()
+        sites = [f"site{i}" for i in range(4)]
+        for name in sites:
+            net.add_node(Node(name))
+        for i, name in enumerate(sites):
+            net.add_link(Link(name, sites[(i + 1) % 4], capacity=10.0))
+
+        selector = r"^(site\d)$"
+        augmentations, pairs = _build_pseudo_node_augmentations(
+            net, selector, selector, Mode.PAIRWISE
+        )
+        # 4 source + 4 sink edges, not one set per pair
+        assert len(augmentations) == 8
+        assert len(pairs) == 12
+        assert {p[0] for p in pairs.values()} == {f"__PSEUDO_SRC_{s}__" for s in sites}
+
+        ctx = analyze(net, source=selector, sink=selector, mode=Mode.PAIRWISE)
+        flows = ctx.max_flow()
+        assert flows[("site0", "site0")] == 0.0
+        for (src, snk), value in flows.items():
+            if src != snk:
+                assert value == pytest.approx(20.0)
+
+        detailed = ctx.max_flow_detailed(include_min_cut=True)
+        result = detailed[("site0", "site2")]
+        assert result.total_flow == pytest.approx(20.0)
+        assert result.min_cut
+        assert all(edge.link_id in net.links for edge in result.min_cut)
+
+
+class TestFrozenGroups:
+    """Tests for group resolution frozen at context construction."""
+
+    def test_bound_calls_do_no_selector_work(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Bound calls, including overlap fill, must not re-run selectors."""
+        import ngraph.dsl.selectors as selectors
+
+        net = Network()
+        for name in ("S1", "S2", "T1"):
+            net.add_node(Node(name))
+        net.add_link(Link("S1", "T1", capacity=3.0))
+        net.add_link(Link("S2", "T1", capacity=4.0))
+
+        ctx = analyze(net, source=r"^(S\d|T1)$", sink=r"^(T1)$", mode=Mode.PAIRWISE)
+        assert set(ctx.source_groups) == {"S1", "S2", "T1"}
+        assert ctx.sink_groups["T1"].tolist() == [ctx.node_mapper.to_id("T1")]
+        assert ctx.source_groups["S1"].dtype == np.int32
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("selector evaluated after context build")
+
+        monkeypatch.setattr(selectors, "select_nodes", _fail)
+        monkeypatch.setattr(selectors, "normalize_selector", _fail)
+
+        flows = ctx.max_flow()
+        assert flows == {("S1", "T1"): 3.0, ("S2", "T1"): 4.0, ("T1", "T1"): 0.0}
+        detailed = ctx.max_flow_detailed()
+        assert detailed[("T1", "T1")].total_flow == 0.0
+        assert ctx.sensitivity()[("T1", "T1")] == {}
+
+    def test_combine_overlap_filled_with_default(self) -> None:
+        """Overlapping combined groups report zero under the combined key."""
+        net = make_asymmetric_diamond()
+        ctx = analyze(net, source="^(A|D)$", sink="^D$", mode=Mode.COMBINE)
+        assert ctx.max_flow() == {("A|D", "^D$"): 0.0}
+        assert analyze(net).source_groups == {}
+
 
 class TestContextReuse:
     """Tests for efficient context reuse with different exclusions."""
@@ -511,6 +511,35 @@ class TestSPFCachingEquivalence:
             # Edges should be the same
             assert cached_edges == ref_edges
 
+    def test_used_edges_with_policy_placement(self, mesh_network: Network) -> None:
+        """Used edges of non-cacheable (FlowPolicy) presets match the reference."""
+        demands_config = [
+            {
+                "source": "A",
+                "target": "D",
+                "volume": 50.0,
+                "mode": "pairwise",
+                "flow_policy": FlowPolicyPreset.TE_ECMP_16_LSP,
+            },
+        ]
+
+        result = demand_placement_analysis(
+            network=mesh_network,
+            excluded_nodes=set(),
+            excluded_links=set(),
+            demands_config=demands_config,
+            include_used_edges=True,
+        )
+        reference = _run_demand_placement_without_cache(
+            network=mesh_network,
+            demands_config=demands_config,
+            include_used_edges=True,
+        )
+
+        for flow, ref_flow in zip(result.flows, reference.flows, strict=True):
+            assert flow.data["edges"] == ref_flow.data["edges"]
+            assert flow.data["edges_kind"] == "used"
+
 
 class TestSPFCachingTEPolicy:
     """Test SPF caching with TE_WCMP_UNLIM policy including rerouting behavior."""
@@ -49,6 +49,27 @@ def test_run_writes_results_file_and_contains_build_graph(tmp_path: Path) -> Non
     assert "graph" in data["steps"]["build_graph"]["data"]
 
 
+def test_run_zip_results_writes_archive_and_inspect_reads_it(
+    tmp_path: Path, capsys
+) -> None:
+    from ngraph.results import ResultsReader
+
+    scenario = Path("tests/integration/scenario_1.yaml")
+    archive = tmp_path / "res.results.zip"
+
+    cli.main(["run", str(scenario), "--results", str(archive)])
+
+    with ResultsReader(archive) as reader:
+        assert "build_graph" in reader.steps
+        assert "graph" in reader.data_keys("build_graph")
+    capsys.readouterr()
+
+    cli.main(["inspect", str(archive), "--detail"])
+    out = capsys.readouterr().out
+    assert "NETGRAPH RESULTS INSPECTION" in out
+    assert "build_graph" in out and "BuildGraph" in out
+
+
 def test_run_stdout_and_default_results(tmp_path: Path, capsys, monkeypatch) -> None:
     scenario = Path("tests/integration/scenario_1.yaml").resolve()
     monkeypatch.chdir(tmp_path)
@@ -97,6 +118,79 @@ def test_run_output_dir_default_naming(tmp_path: Path) -> None:
     assert expected.exists()
 
 
+def test_run_cache_dir_reuses_compiled_scenario(tmp_path: Path) -> None:
+    scenario = Path("tests/integration/scenario_1.yaml").resolve()
+    cache_dir = tmp_path / "cache"
+
+    for i in range(2):
+        out = tmp_path / f"res{i}.json"
+        cli.main(["run", str(scenario), "--cache-dir", str(cache_dir), "-r", str(out)])
+
+    assert len(list(cache_dir.glob("*.scenario.pkl"))) == 1
+    first = json.loads((tmp_path / "res0.json").read_text())
+    second = json.loads((tmp_path / "res1.json").read_text())
+    assert first["steps"].keys() == second["steps"].keys()
+    assert (
+        first["steps"]["build_graph"]["data"] == second["steps"]["build_graph"]["data"]
+    )
+
+
+def test_run_resume_restores_completed_steps(tmp_path: Path, monkeypatch) -> None:
+    scenario = tmp_path / "mc.yaml"
+    scenario.write_text(
+        """
+seed: 3
+network:
+  nodes: {A: {}, B: {}, C: {}}
+  links:
+    - {source: A, target: B, capacity: 5}
+    - {source: B, target: C, capacity: 5}
+    - {source: A, target: C, capacity: 5}
+failures:
+  one:
+    modes: [{weight: 1, rules: [{scope: link, mode: choice, count: 1}]}]
+workflow:
+  - {type: MaxFlow, name: mf, source: "^A$", target: "^C$",
+     failure_policy: one, iterations: 30}
+"""
+    )
+    ckpt = tmp_path / "ckpt"
+    cli.main(
+        [
+            "run",
+            str(scenario),
+            "--checkpoint-dir",
+            str(ckpt),
+            "-r",
+            str(tmp_path / "a.json"),
+        ]
+    )
+    assert (ckpt / "manifest.json").is_file()
+
+    from ngraph.workflow.max_flow_step import MaxFlow
+
+    def _fail(self, scenario):
+        raise AssertionError("completed step must not run again")
+
+    monkeypatch.setattr(MaxFlow, "run", _fail)
+    cli.main(
+        [
+            "run",
+            str(scenario),
+            "--checkpoint-dir",
+            str(ckpt),
+            "--resume",
+            "-r",
+            str(tmp_path / "b.json"),
+        ]
+    )
+
+    first = json.loads((tmp_path / "a.json").read_text())
+    second = json.loads((tmp_path / "b.json").read_text())
+    assert first["steps"] == second["steps"]
+    assert first["workflow"] == second["workflow"]
+
+
 def test_run_output_dir_with_relative_override(tmp_path: Path, monkeypatch) -> None:
     scenario = Path("tests/integration/scenario_1.yaml").resolve()
     out_dir = tmp_path / "out2"
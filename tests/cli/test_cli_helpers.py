@@ -68,3 +68,28 @@ def test_summarize_pattern_error_path() -> None:
     out = cli_mod._summarize_pattern("ERR", net)
     assert out["pattern"] == "ERR"
     assert "error" in out
+
+
+def test_failed_results_export_keeps_previous_file(tmp_path) -> None:
+    import pytest
+
+    from ngraph.results.store import Results
+
+    def _results(value: float) -> Results:
+        r = Results()
+        r.enter_step("s")
+        r.put("data", {"v": [value] * 40})
+        r.exit_step()
+        return r
+
+    for name in ("r.results.json", "r.results.zip"):
+        path = tmp_path / name
+        cli_mod._write_results_file(_results(1.0), path, None)
+        good = path.read_bytes()
+        with pytest.raises(ValueError, match="step 's'"):
+            cli_mod._write_results_file(_results(float("nan")), path, None)
+        assert path.read_bytes() == good
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "r.results.json",
+        "r.results.zip",
+    ]
@@ -0,0 +1,88 @@
+"""Tests for reuse of expanded blueprint instances during DSL expansion."""
+
+from typing import Any, Dict
+
+from ngraph.dsl.blueprints.expand import expand_network_dsl
+
+
+def _pod_dsl(network_nodes: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "blueprints": {
+            "rack": {
+                "nodes": {"srv": {"count": 2, "template": "s{n}"}},
+            },
+            "pod": {
+                "nodes": {
+                    "leaf": {
+                        "count": 2,
+                        "template": "leaf{n}",
+                        "attrs": {"role": "leaf", "hw": {"ports": [1, 2]}},
+                        "risk_groups": ["RG_leaf"],
+                    },
+                    "spine": {"count": 1, "template": "spine{n}"},
+                    "rack1": {"blueprint": "rack"},
+                },
+                "links": [
+                    {"source": "leaf", "target": "spine", "capacity": 10},
+                    {"source": "rack1/srv", "target": "leaf", "pattern": "one_to_one"},
+                ],
+            },
+        },
+        "network": {"nodes": network_nodes},
+    }
+
+
+def test_identical_instances_are_stamped_with_own_names_and_links() -> None:
+    net = expand_network_dsl(
+        _pod_dsl({"dc/pod[1-3]": {"blueprint": "pod", "risk_groups": ["RG_dc"]}})
+    )
+
+    for i in (1, 2, 3):
+        prefix = f"dc/pod{i}"
+        names = [n for n in net.nodes if n.startswith(prefix + "/")]
+        assert names == [
+            f"{prefix}/leaf/leaf1",
+            f"{prefix}/leaf/leaf2",
+            f"{prefix}/spine/spine1",
+            f"{prefix}/rack1/srv/s1",
+            f"{prefix}/rack1/srv/s2",
+        ]
+        leaf = net.nodes[f"{prefix}/leaf/leaf1"]
+        assert leaf.risk_groups == {"RG_dc", "RG_leaf"}
+        assert leaf.attrs["role"] == "leaf"
+
+    # Links are expanded per instance and never cross pods
+    assert len(net.links) == 3 * (2 + 2)
+    for link in net.links.values():
+        assert link.source.split("/")[1] == link.target.split("/")[1]
+
+
+def test_stamped_instances_do_not_share_mutable_state() -> None:
+    net = expand_network_dsl(_pod_dsl({"pod[1-2]": {"blueprint": "pod"}}))
+
+    a = net.nodes["pod1/leaf/leaf1"]
+    b = net.nodes["pod2/leaf/leaf1"]
+    a.attrs["hw"]["ports"].append(3)
+    a.risk_groups.add("extra")
+
+    assert b.attrs["hw"]["ports"] == [1, 2]
+    assert "extra" not in b.risk_groups
+
+
+def test_instances_with_different_inputs_are_expanded_separately() -> None:
+    dsl = _pod_dsl(
+        {
+            "a": {"blueprint": "pod", "params": {"spine.count": 2}},
+            "b": {"blueprint": "pod", "attrs": {"site": "b"}},
+            "c": {"blueprint": "pod", "disabled": True},
+            "d": {"blueprint": "pod"},
+        }
+    )
+    net = expand_network_dsl(dsl)
+
+    assert "a/spine/spine2" in net.nodes
+    assert "d/spine/spine2" not in net.nodes
+    assert net.nodes["b/leaf/leaf1"].attrs["site"] == "b"
+    assert "site" not in net.nodes["d/leaf/leaf1"].attrs
+    assert net.nodes["c/rack1/srv/s1"].disabled
+    assert not net.nodes["d/rack1/srv/s1"].disabled
@@ -132,6 +132,36 @@ class TestLinkRulesFullSelectors:
             ):
                 assert link.attrs.get("tagged") is True
 
+    def test_link_rules_direction_and_isolation(self) -> None:
+        """Rules touch only links between the selected endpoints."""
+        net = Network()
+        for name in ["p1/a", "p1/b", "p2/a", "p2/b"]:
+            net.add_node(Node(name))
+        fwd = Link(source="p1/a", target="p1/b", capacity=1)
+        rev = Link(source="p1/b", target="p1/a", capacity=1)
+        other = Link(source="p2/a", target="p2/b", capacity=1)
+        cross = Link(source="p1/a", target="p2/b", capacity=1)
+        for link in (fwd, rev, other, cross):
+            net.add_link(link)
+
+        _process_link_rules(
+            net,
+            {
+                "link_rules": [
+                    {
+                        "source": "p1/a",
+                        "target": "p1/b",
+                        "bidirectional": False,
+                        "capacity": 5,
+                    },
+                    {"source": "p2/b", "target": "p2/a", "cost": 7},
+                ]
+            },
+        )
+
+        assert (fwd.capacity, rev.capacity, cross.capacity) == (5, 1, 1)
+        assert (other.cost, fwd.cost, cross.cost) == (7, 1, 1)
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # link_match Tests
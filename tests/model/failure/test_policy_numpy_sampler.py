@@ -0,0 +1,84 @@
+"""Tests for the NumPy Generator sampling backend of FailurePolicy."""
+
+import pytest
+
+from ngraph.model.failure.parser import build_failure_policy
+from ngraph.model.failure.policy import FailureMode, FailurePolicy, FailureRule
+
+
+def _policy(rule: FailureRule, seed: int = 1) -> FailurePolicy:
+    return FailurePolicy(
+        modes=[FailureMode(weight=1.0, rules=[rule])], seed=seed, sampler="numpy"
+    )
+
+
+def _links(n: int) -> dict[str, dict]:
+    return {f"L{i:04d}": {"cost": float(i % 3)} for i in range(n)}
+
+
+def test_random_mode_is_reproducible_and_unbiased() -> None:
+    policy = _policy(FailureRule(scope="link", mode="random", probability=0.25))
+    links = _links(4000)
+
+    first = policy.apply_failures({}, links, seed=3)
+    assert policy.apply_failures({}, links, seed=3) == first
+    assert policy.apply_failures({}, links, seed=4) != first
+    assert 800 < len(first) < 1200
+
+
+def test_random_mode_probability_edges() -> None:
+    links = _links(50)
+    none = _policy(FailureRule(scope="link", mode="random", probability=0.0))
+    every = _policy(FailureRule(scope="link", mode="random", probability=1.0))
+
+    assert none.apply_failures({}, links) == []
+    assert every.apply_failures({}, links) == sorted(links)
+
+
+def test_uniform_choice_picks_exact_count() -> None:
+    policy = _policy(FailureRule(scope="link", mode="choice", count=7))
+    links = _links(100)
+
+    seen: set[str] = set()
+    for seed in range(20):
+        failed = policy.apply_failures({}, links, seed=seed)
+        assert len(failed) == 7
+        seen.update(failed)
+    assert len(seen) > 50
+
+
+def test_weighted_choice_prefers_positive_weights() -> None:
+    # cost is 0, 1, 2 in turn; 10 picks never need a zero-weight link
+    policy = _policy(
+        FailureRule(scope="link", mode="choice", count=10, weight_by="cost")
+    )
+    links = _links(60)
+
+    heavy = 0
+    for seed in range(50):
+        failed = policy.apply_failures({}, links, seed=seed)
+        assert len(failed) == 10
+        assert all(links[lid]["cost"] > 0 for lid in failed)
+        heavy += sum(links[lid]["cost"] == 2.0 for lid in failed)
+    assert heavy > 250  # weight 2 links are drawn more often than weight 1
+
+
+def test_weighted_choice_fills_from_zero_weight() -> None:
+    policy = _policy(
+        FailureRule(scope="link", mode="choice", count=3, weight_by="cost")
+    )
+    links = {"A": {"cost": 5.0}, "B": {"cost": 0.0}, "C": {}, "D": {"cost": 0.0}}
+
+    failed = set(policy.apply_failures({}, links))
+    assert "A" in failed
+    assert len(failed) == 3
+
+
+def test_parser_reads_sampler_and_rejects_unknown() -> None:
+    data = {"sampler": "numpy", "modes": [{"weight": 1.0, "rules": []}]}
+    policy = build_failure_policy(data, policy_name="p", derive_seed=lambda _: 5)
+    assert policy.sampler == "numpy"
+    assert policy.to_dict()["sampler"] == "numpy"
+
+    with pytest.raises(ValueError, match="sampler"):
+        FailurePolicy(sampler="fast")  # type: ignore[arg-type]
@@ -252,3 +252,92 @@ class TestLinkUtilities:
 
         ab_links = net.get_links_between("A", "B")
         assert set(ab_links) == {link_ab1.id, link_ab2.id}
+
+
+class TestLinkArrays:
+    """Tests for the columnar link view used by graph construction."""
+
+    def test_sorted_order_and_endpoint_indices(self):
+        net = Network()
+        for name in ("C", "A", "B"):
+            net.add_node(Node(name))
+        link_ca = Link("C", "A", capacity=3.0, cost=7.0)
+        link_ab = Link("A", "B", capacity=5.0, cost=2.0)
+        net.add_link(link_ca)
+        net.add_link(link_ab)
+
+        arrays = net.link_arrays()
+        assert arrays.node_names == ["A", "B", "C"]
+        assert arrays.link_ids == sorted([link_ca.id, link_ab.id])
+        for i, link_id in enumerate(arrays.link_ids):
+            link = net.links[link_id]
+            assert arrays.node_names[arrays.src[i]] == link.source
+            assert arrays.node_names[arrays.dst[i]] == link.target
+            assert arrays.capacity[i] == link.capacity
+            assert arrays.cost[i] == link.cost
+
+    def test_reflects_attribute_edits_and_new_links(self):
+        net = Network()
+        net.add_node(Node("A"))
+        net.add_node(Node("B"))
+        link = Link("A", "B", capacity=1.0)
+        net.add_link(link)
+        assert net.link_arrays().capacity.tolist() == [1.0]
+
+        link.capacity = 9.0
+        net.disable_node("B")
+        net.disable_link(link.id)
+        arrays = net.link_arrays()
+        assert arrays.capacity.tolist() == [9.0]
+        assert arrays.disabled.tolist() == [True]
+        assert arrays.node_disabled.tolist() == [False, True]
+
+        net.add_node(Node("0"))
+        net.add_link(Link("0", "A"))
+        arrays = net.link_arrays()
+        assert arrays.node_names == ["0", "A", "B"]
+        assert len(arrays.link_ids) == 2
+
+    def test_direct_dict_edits_trigger_rebuild(self):
+        net = Network()
+        net.nodes["A"] = Node("A")
+        net.nodes["B"] = Node("B")
+        net.links["L1"] = Link("B", "A", capacity=4.0)
+        net.add_node(Node("C"))
+        net.add_link(Link("A", "C"))
+
+        arrays = net.link_arrays()
+        assert arrays.node_names == ["A", "B", "C"]
+        assert "L1" in arrays.link_ids
+        i = arrays.link_ids.index("L1")
+        assert (int(arrays.src[i]), int(arrays.dst[i])) == (1, 0)
+        assert arrays.capacity[i] == 4.0
+
+    def test_same_size_replacements_are_detected(self):
+        net = Network()
+        for name in ("A", "B", "C"):
+            net.add_node(Node(name))
+        a_b = Link("A", "B")
+        net.add_link(a_b)
+        net.link_arrays()
+
+        # Same number of links, different membership
+        b_c = Link("B", "C", capacity=2.0)
+        del net.links[a_b.id]
+        net.links[b_c.id] = b_c
+        arrays = net.link_arrays()
+        assert arrays.link_ids == [b_c.id]
+        assert (int(arrays.src[0]), int(arrays.dst[0])) == (1, 2)
+
+        # Same number of nodes, different membership
+        del net.nodes["A"]
+        net.nodes["D"] = Node("D")
+        assert net.link_arrays().node_names == ["B", "C", "D"]
+
+        # Replace the link again after a cached build
+        del net.links[b_c.id]
+        c_d = Link("C", "D")
+        net.links[c_d.id] = c_d
+        arrays = net.link_arrays()
+        assert arrays.link_ids == [c_d.id]
+        assert (int(arrays.src[0]), int(arrays.dst[0])) == (1, 2)
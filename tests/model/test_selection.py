@@ -9,7 +9,7 @@ This module contains tests for:
 
 import pytest
 
-from ngraph.model.network import Link, Network, Node
+from ngraph.model.network import Link, Network, Node, _regex_literal_prefix
 
 
 class TestNodeSelection:
@@ -100,6 +100,41 @@ class TestNodeSelection:
     # For attribute-based grouping, use the unified selector system with
     # {"group_by": "attr_name"} dict selectors via normalize_selector/select_nodes.
 
+    def test_prefix_index_preserves_insertion_order(self):
+        """Prefix-indexed selection returns nodes in insertion order."""
+        net = Network()
+        for name in ["dc/b2", "dc/a1", "x/a", "dc/c3", "dc/a0"]:
+            net.add_node(Node(name))
+
+        groups = net.select_node_groups_by_path("dc/(a|c)\\d")
+        assert [n.name for n in groups["a"]] == ["dc/a1", "dc/a0"]
+        assert [n.name for n in groups["c"]] == ["dc/c3"]
+
+        net.add_node(Node("dc/a5"))
+        groups = net.select_node_groups_by_path("dc/a")
+        assert [n.name for n in groups["dc/a"]] == ["dc/a1", "dc/a0", "dc/a5"]
+
+    @pytest.mark.parametrize(
+        "pattern,prefix",
+        [
+            ("SEA/leaf1/.*", "SEA/leaf1/"),
+            ("^SEA/spine", "SEA/spine"),
+            ("SEA/leafs?", "SEA/leaf"),
+            ("ab*", "a"),
+            ("ab+", "ab"),
+            ("a\\.b", "a.b"),
+            ("a\\d", "a"),
+            ("dc1/(a|b)", "dc1/"),
+            ("a|b", ""),
+            ("[ab]x|c", ""),
+            ("(?i)abc", ""),
+            (".*", ""),
+        ],
+    )
+    def test_regex_literal_prefix(self, pattern, prefix):
+        """Literal prefix extraction is conservative."""
+        assert _regex_literal_prefix(pattern) == prefix
+
 
 class TestLinkUtilities:
     """Tests for link utility methods."""
@@ -0,0 +1,98 @@
+"""Tests for per-step memory sampling and structure attribution."""
+
+import sys
+
+import numpy as np
+import pytest
+
+from ngraph.profiling.memory import (
+    StepMemory,
+    approx_size,
+    memory_tracking,
+    note_structure,
+    rss_bytes,
+)
+from ngraph.profiling.profiler import PerformanceProfiler, PerformanceReporter
+from ngraph.scenario import Scenario
+
+SCENARIO = """
+seed: 5
+network:
+  nodes: {A: {}, B: {}, C: {}, D: {}}
+  links:
+    - {source: A, target: B, capacity: 10}
+    - {source: B, target: D, capacity: 10}
+    - {source: A, target: C, capacity: 10}
+    - {source: C, target: D, capacity: 10}
+demands:
+  default:
+    - {source: "^A$", target: "^D$", volume: 5}
+failures:
+  one:
+    modes:
+      - weight: 1
+        rules:
+          - {scope: link, mode: choice, count: 1}
+workflow:
+  - type: MaxFlow
+    name: mf
+    source: "^A$"
+    target: "^D$"
+    failure_policy: one
+    iterations: 10
+    parallelism: 2
+  - type: TrafficMatrixPlacement
+    name: tm
+    demand_set: default
+    iterations: 1
+"""
+
+
+def test_step_memory_samples_rss_and_keeps_largest_structure():
+    memory = StepMemory(interval=0.001)
+    with memory.activate():
+        note_structure("buffers", 100)
+        note_structure("buffers", 40)
+    note_structure("buffers", 1000)
+
+    data = memory.to_dict()
+    assert data["structures"] == {"buffers": 100}
+    if sys.platform.startswith("linux"):
+        assert rss_bytes() > 0
+        assert data["samples"] >= 2
+        assert data["rss_peak"] >= max(data["rss_start"], data["rss_end"])
+
+
+def test_approx_size_counts_arrays_by_nbytes_once():
+    array = np.zeros(10_000, dtype=np.float64)
+    size = approx_size({"a": array, "b": [array, "x" * 100]})
+    assert array.nbytes < size < array.nbytes + 2_000
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs /proc")
+def test_step_metadata_records_memory_per_step():
+    scenario = Scenario.from_yaml(SCENARIO)
+    scenario.run()
+    assert "memory" not in scenario.results.get_step("mf")["metadata"]
+
+    scenario = Scenario.from_yaml(SCENARIO)
+    with memory_tracking():
+        scenario.run()
+    mf = scenario.results.get_step("mf")["metadata"]["memory"]
+    assert set(mf["structures"]) == {"graph_arrays", "monte_carlo_results", "results"}
+    assert all(v > 0 for v in mf["structures"].values())
+    assert mf["rss_peak"] >= mf["rss_start"]
+    tm = scenario.results.get_step("tm")["metadata"]["memory"]
+    assert tm["structures"]["dag_cache"] > 0
+
+    profiler = PerformanceProfiler(track_memory=True)
+    scenario = Scenario.from_yaml(SCENARIO)
+    with profiler.profile_step("mf", "MaxFlow"):
+        scenario.workflow[0].execute(scenario)
+    profile = profiler.results.step_profiles[0]
+    assert profile.memory_peak == profile.memory["rss_peak"]
+    assert "results" in profile.memory["structures"]
+    profiler.results.total_wall_time = profile.wall_time
+    assert (
+        "6. MEMORY BY STEP" in PerformanceReporter(profiler.results).generate_report()
+    )
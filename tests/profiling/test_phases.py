@@ -0,0 +1,96 @@
+"""Tests for phase timers and counters."""
+
+from ngraph.profiling.phases import PhaseRecorder, count, phase, phase_timing
+from ngraph.profiling.profiler import PerformanceReporter, ProfileResults, StepProfile
+from ngraph.scenario import Scenario
+
+SCENARIO = """
+seed: 3
+network:
+  nodes: {A: {}, B: {}, C: {}, D: {}}
+  links:
+    - {source: A, target: B, capacity: 10}
+    - {source: B, target: D, capacity: 10}
+    - {source: A, target: C, capacity: 10}
+    - {source: C, target: D, capacity: 10}
+failures:
+  one:
+    modes:
+      - weight: 1
+        rules:
+          - {scope: link, mode: choice, count: 1}
+workflow:
+  - type: MaxFlow
+    name: mf
+    source: "^A$"
+    target: "^D$"
+    failure_policy: one
+    iterations: 30
+    parallelism: 2
+"""
+
+
+def test_recorder_collects_only_while_active():
+    with phase("ignored"):
+        count("ignored")
+
+    recorder = PhaseRecorder()
+    with recorder.activate():
+        for _ in range(3):
+            with phase("work"):
+                pass
+        count("items", 5)
+    count("items")
+
+    data = recorder.to_dict()
+    assert data["timers"]["work"]["calls"] == 3
+    assert data["timers"]["work"]["seconds"] >= 0.0
+    assert data["counters"] == {"items": 5}
+
+
+def test_step_metadata_records_phases_from_worker_threads():
+    scenario = Scenario.from_yaml(SCENARIO)
+    scenario.run()
+    assert "phases" not in scenario.results.get_step("mf")["metadata"]
+
+    scenario = Scenario.from_yaml(SCENARIO)
+    with phase_timing():
+        scenario.run()
+    phases = scenario.results.get_step("mf")["metadata"]["phases"]
+
+    # Failures are sampled inside the worker threads
+    assert phases["timers"]["failures.sample"]["calls"] == 30
+    assert phases["counters"]["failures.iterations"] == 30
+    unique = phases["counters"]["failures.unique_patterns"]
+    # Baseline plus one analysis per unique pattern
+    assert phases["timers"]["core.max_flow"]["calls"] == unique + 1
+    assert phases["timers"]["results.serialize"]["calls"] == 1
+
+
+def test_reporter_renders_phase_breakdown():
+    results = ProfileResults(
+        step_profiles=[
+            StepProfile(
+                step_name="tm",
+                step_type="TrafficMatrixPlacement",
+                wall_time=2.0,
+                cpu_time=2.0,
+                function_calls=10,
+                phases={
+                    "timers": {"core.spf": {"seconds": 1.0, "calls": 4}},
+                    "counters": {
+                        "placement.dag_cache_hits": 3,
+                        "placement.dag_cache_misses": 1,
+                        "failures.iterations": 100,
+                        "failures.unique_patterns": 10,
+                    },
+                },
+            )
+        ],
+        total_wall_time=2.0,
+    )
+    report = PerformanceReporter(results).generate_report()
+    assert "5. PHASE BREAKDOWN" in report
+    assert "core.spf" in report and "50.0% of step" in report
+    assert "DAG cache hit rate: 75.0%" in report
+    assert "10 unique patterns / 100 iterations (10.0%)" in report
@@ -384,3 +384,50 @@ class TestProfilerIntegration:
         profile = profiler.results.step_profiles[0]
         assert profile.step_name == "error_step"
         assert profile.wall_time > 0
+
+
+def _worker_hot_function() -> int:
+    return sum(range(1000))
+
+
+def _run_worker_tasks(count: int) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ngraph.profiling.workers import profile_worker_task
+
+    def task(_: int) -> int:
+        with profile_worker_task():
+            return _worker_hot_function()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(task, range(count)))
+
+
+class TestWorkerProfiles:
+    """Test in-memory profiling of worker-thread analysis tasks."""
+
+    def test_worker_tasks_merged_into_step(self):
+        profiler = PerformanceProfiler()
+        with profiler.profile_step("mc", "MaxFlow"):
+            _run_worker_tasks(6)
+
+        profile = profiler.results.step_profiles[0]
+        assert profile.worker_profiles_merged == 6
+        hot = [
+            stat
+            for func, stat in profile.cprofile_stats.stats.items()
+            if func[2] == "_worker_hot_function"
+        ]
+        assert hot and hot[0][0] == 6
+
+    def test_sampling_profiles_every_nth_task(self):
+        profiler = PerformanceProfiler(worker_sample_every=4)
+        with profiler.profile_step("mc", "MaxFlow"):
+            _run_worker_tasks(10)
+
+        assert profiler.results.step_profiles[0].worker_profiles_merged == 3
+
+    def test_inactive_and_invalid(self):
+        _run_worker_tasks(2)  # no collector: tasks run unprofiled
+        with pytest.raises(ValueError):
+            PerformanceProfiler(worker_sample_every=0)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import io
+import json
+
+import numpy as np
+import pytest
+
+from ngraph.results.artifacts import CapacityEnvelope
+from ngraph.results.json_writer import write_results_json
+from ngraph.results.store import Results
+
+
+def _store(step: str, data: dict, order: int = 0, results: Results | None = None):
+    r = results or Results()
+    r.enter_step(step)
+    r.put("metadata", {"duration_sec": 0.5})
+    r.put("data", data)
+    r.exit_step()
+    r.put_step_metadata(step_name=step, step_type="ExampleStep", execution_order=order)
+    return r
+
+
+def _write(results: Results, **kwargs) -> dict:
+    buf = io.BytesIO()
+    write_results_json(results, buf, backend="json", **kwargs)
+    return json.loads(buf.getvalue())
+
+
+def test_streamed_document_matches_to_dict_export() -> None:
+    envelope = CapacityEnvelope.from_values("A", "B", "combine", [1.0, 2.0, 2.0])
+    r = _store(
+        "s1",
+        {
+            "envelope": envelope,
+            "flow_results": [{"i": i, "cost": {1.5: float(i)}} for i in range(40)],
+            "pairs": {("A", "B"): 1},
+        },
+    )
+    _store("s2", {"x": 1}, order=1, results=r)
+    r.set_scenario_snapshot({"name": "demo"})
+
+    expected = json.loads(json.dumps(r.to_dict(), default=str))
+    assert _write(r) == expected
+
+    filtered = _write(r, keys=["s2", "missing"])
+    assert list(filtered["steps"]) == ["s2"]
+    assert set(filtered["workflow"]) == {"s1", "s2"}
+
+
+def test_numpy_values_encode_natively_and_non_finite_is_rejected() -> None:
+    r = _store(
+        "arrays",
+        {"flows": np.arange(3, dtype=np.float64), "n": np.int64(7), "ok": True},
+    )
+    doc = _write(r)
+    assert doc["steps"]["arrays"]["data"] == {
+        "flows": [0.0, 1.0, 2.0],
+        "n": 7,
+        "ok": True,
+    }
+
+    for bad in (float("nan"), np.array([1.0, np.inf]), np.float32("nan")):
+        r = _store("bad", {"values": [bad]})
+        with pytest.raises(ValueError, match="step 'bad'"):
+            write_results_json(r, io.BytesIO(), backend="json")
+
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        write_results_json(Results(), io.BytesIO(), backend="yaml")
+
+
+def test_non_finite_scan_ignores_none_and_finds_nested_values() -> None:
+    from ngraph.results.json_writer import _has_non_finite
+
+    envelope = CapacityEnvelope.from_values("A", "B", "combine", [1.0, 2.0])
+    clean = {"baseline": None, "trace": [None, "null", 1], "env": envelope}
+    assert not _has_non_finite(clean)
+    assert not _has_non_finite(np.arange(3.0))
+
+    assert _has_non_finite({"a": [{"b": (1.0, float("inf"))}]})
+    assert _has_non_finite({float("nan"): 1})
+    assert _has_non_finite([np.array([1.0, np.nan])])
+    assert _has_non_finite(np.float32("nan"))
@@ -0,0 +1,31 @@
+"""Tests for per-link utilization accumulation."""
+
+import numpy as np
+import pytest
+
+from ngraph.results.utilization import LinkUtilizationAccumulator
+
+
+def test_weighted_statistics_and_merge():
+    acc = LinkUtilizationAccumulator(["L1", "L2"], [10.0, 0.0], bins=2)
+    acc.add(np.array([[5.0, 0.0], [1.0, 0.0]]), weight=3)
+    acc.add(np.array([[10.0, 2.0], [0.0, 0.0]]))
+
+    other = LinkUtilizationAccumulator(["L1", "L2"], [10.0, 0.0], bins=2)
+    other.add(np.array([[0.0, 0.0], [0.0, 0.0]]))
+    acc.merge(other)
+
+    data = acc.to_dict()
+    assert data["samples"] == 5
+    assert data["fwd"]["mean"][0] == pytest.approx((0.5 * 3 + 1.0) / 5)
+    assert data["fwd"]["max"] == [1.0, 0.0]
+    # 0.5 falls into the upper bin, full utilization into the last bin
+    assert data["fwd"]["histogram"] == [[1, 4], [5, 0]]
+    assert data["rev"]["histogram"][0] == [5, 0]
+    # Links without capacity report zero utilization
+    assert data["fwd"]["mean"][1] == 0.0
+
+    with pytest.raises(ValueError, match="shape"):
+        acc.add(np.zeros((3, 2)))
+    with pytest.raises(ValueError, match="different links"):
+        acc.merge(LinkUtilizationAccumulator(["L1"], [1.0]))
@@ -0,0 +1,82 @@
+"""Tests for the quantile sketch and sketch-backed capacity envelopes."""
+
+import json
+import random
+
+import numpy as np
+import pytest
+
+from ngraph.results.artifacts import SketchCapacityEnvelope
+from ngraph.results.sketch import QuantileSketch
+
+
+def test_quantiles_within_relative_error_and_size_bounded():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(3.0, 1.5) for _ in range(20_000)] + [0.0] * 500
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    sketch.extend(values)
+
+    ordered = sorted(values)
+    for q in (0.0, 0.01, 0.25, 0.5, 0.9, 0.99, 1.0):
+        exact = ordered[max(0, int(np.ceil(q * len(ordered))) - 1)]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.01, abs=1e-12)
+    assert sketch.count == len(values)
+    assert sketch.mean == pytest.approx(np.mean(values))
+    assert sketch.stdev == pytest.approx(np.std(values))
+    # Buckets grow with log(range), not with distinct values
+    assert len(sketch.bins) < 2_000
+
+    # Collapsing the smallest buckets keeps the upper quantiles intact
+    small = QuantileSketch(relative_accuracy=0.01, max_buckets=300)
+    small.extend(values)
+    assert len(small.bins) <= 300
+    assert small.quantile(0.5) == sketch.quantile(0.5)
+    assert small.quantile(0.99) == sketch.quantile(0.99)
+    assert small.max == max(values)
+
+
+def test_incremental_and_sharded_feeds_merge_exactly():
+    rng = random.Random(3)
+    values = [rng.uniform(-5.0, 100.0) for _ in range(3_000)]
+    whole = QuantileSketch()
+    whole.extend(values)
+
+    merged = QuantileSketch()
+    for start in range(0, len(values), 1_000):
+        part = QuantileSketch()
+        for value in values[start : start + 1_000]:
+            part.add(value)
+        merged.merge(part)
+
+    assert merged.bins == whole.bins
+    assert merged.negative_bins == whole.negative_bins
+    assert merged.count == whole.count
+    assert merged.stdev == pytest.approx(whole.stdev)
+    for q in (0.05, 0.5, 0.95):
+        assert merged.quantile(q) == whole.quantile(q)
+
+    with pytest.raises(ValueError, match="relative accuracy"):
+        merged.merge(QuantileSketch(relative_accuracy=0.05))
+    with pytest.raises(ValueError, match="non-finite"):
+        merged.add(float("nan"))
+
+
+def test_sketch_envelope_round_trip_and_merge():
+    env = SketchCapacityEnvelope.from_values("^A$", "^D$", "combine", [1.0, 2.0, 2.0])
+    other = SketchCapacityEnvelope("^A$", "^D$", "combine")
+    other.add(10.0)
+    env.merge(other)
+
+    assert env.total_samples == 4
+    assert env.min_capacity == 1.0 and env.max_capacity == 10.0
+    assert env.get_percentile(50) == pytest.approx(2.0, rel=0.01)
+    assert env.get_percentile(100) == 10.0
+
+    restored = SketchCapacityEnvelope.from_dict(json.loads(json.dumps(env.to_dict())))
+    assert restored.to_dict() == env.to_dict()
+    assert restored.get_percentile(75) == env.get_percentile(75)
+
+    with pytest.raises(ValueError, match="different flows"):
+        env.merge(SketchCapacityEnvelope("^B$", "^D$", "combine"))
+    with pytest.raises(ValueError, match="empty"):
+        SketchCapacityEnvelope("^A$", "^D$", "combine").get_percentile(50)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import io
+import json
+import zipfile
+
+import numpy as np
+import pytest
+
+from ngraph.results import ResultsReader, write_results_archive
+from ngraph.results.archive import is_results_archive
+from ngraph.results.flow import FlowEntry, FlowIterationResult, FlowSummary
+from ngraph.results.json_writer import write_results_json
+from ngraph.results.store import Results
+
+
+def _iteration(i: int) -> FlowIterationResult:
+    placed = float(i % 4)
+    flow = FlowEntry("A", "B", 0, 4.0, placed, 4.0 - placed)
+    summary = FlowSummary(4.0, placed, placed / 4.0, int(placed < 4.0), 1)
+    return FlowIterationResult(
+        failure_id=f"f{i}", occurrence_count=i + 1, flows=[flow], summary=summary
+    )
+
+
+def _results() -> Results:
+    r = Results()
+    r.enter_step("mc")
+    r.put("metadata", {"duration_sec": 1.0})
+    r.put(
+        "data",
+        {
+            "flow_results": [_iteration(i) for i in range(25)],
+            "mixed": [1, "two", {"three": 3.0}],
+            "matrix": np.arange(4, dtype=np.int64),
+            "context": {"mode": "combine"},
+        },
+    )
+    r.exit_step()
+    r.put_step_metadata("mc", "MaxFlow", 0)
+    r.enter_step("empty")
+    r.put("data", {})
+    r.exit_step()
+    r.put_step_metadata("empty", "NetworkStats", 1)
+    r.set_scenario_snapshot({"seed": 1})
+    return r
+
+
+def test_archive_round_trips_and_reads_lazily(tmp_path) -> None:
+    results = _results()
+    path = tmp_path / "run.results.zip"
+    write_results_archive(results, path, chunk_size=10)
+    buf = io.BytesIO()
+    write_results_json(results, buf, backend="json")
+    expected = json.loads(buf.getvalue())
+
+    assert is_results_archive(path)
+    with ResultsReader(path) as rr:
+        assert rr.to_dict() == expected
+        assert rr.steps == ["mc", "empty"]
+        assert rr.num_rows("mc", "flow_results") == 25
+        assert rr.num_rows("mc", "context") is None
+        assert rr.get("mc", "matrix") == [0, 1, 2, 3]
+
+        rows = expected["steps"]["mc"]["data"]["flow_results"]
+        assert rr.row("mc", "flow_results", 17) == rows[17]
+        assert rr.row("mc", "flow_results", -1) == rows[-1]
+        assert rr.failure_pattern("mc", "f12") == rows[12]
+        assert rr.column("mc", "flow_results", "summary.overall_ratio") == [
+            row["summary"]["overall_ratio"] for row in rows
+        ]
+        assert rr.column("mc", "mixed", "three") == [None, None, 3.0]
+        assert list(rr.iter_rows("mc", "mixed")) == [1, "two", {"three": 3.0}]
+
+        with pytest.raises(IndexError):
+            rr.row("mc", "flow_results", 25)
+        with pytest.raises(ValueError, match="not a list"):
+            rr.row("mc", "context", 0)
+        with pytest.raises(KeyError, match="f99"):
+            rr.failure_pattern("mc", "f99")
+        with pytest.raises(KeyError, match="nope"):
+            rr.metadata("nope")
+
+    # Rows of equal dicts are stored column-wise: one entry per field per chunk
+    names = zipfile.ZipFile(path).namelist()
+    assert "steps/0/data/0/2/4.json" in names
+    assert len([n for n in names if n.startswith("steps/0/data/0/")]) == 3 * 7
+
+
+def test_archive_rejects_invalid_input(tmp_path) -> None:
+    results = _results()
+    with pytest.raises(ValueError, match="chunk_size"):
+        write_results_archive(results, tmp_path / "a.zip", chunk_size=0)
+
+    bad = Results()
+    bad.enter_step("bad")
+    bad.put("data", {"values": [float("nan")]})
+    bad.exit_step()
+    with pytest.raises(ValueError, match="step 'bad'"):
+        write_results_archive(bad, tmp_path / "b.zip")
+
+    plain = tmp_path / "plain.zip"
+    with zipfile.ZipFile(plain, "w") as zf:
+        zf.writestr("other.txt", "x")
+    not_zip = tmp_path / "r.json"
+    not_zip.write_text("{}")
+    assert not is_results_archive(plain) and not is_results_archive(not_zip)
+    with pytest.raises(ValueError, match="no index"):
+        ResultsReader(plain)
+    with pytest.raises(ValueError, match="not a results archive"):
+        ResultsReader(not_zip)
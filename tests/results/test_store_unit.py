@@ -47,3 +47,22 @@ def test_results_scope_and_key_validation() -> None:
     r._store["s1"]["bad"] = 42  # type: ignore[index]
     with pytest.raises(ValueError):
         r.to_dict()
+
+
+def test_restore_step_installs_results_and_validates() -> None:
+    src = Results()
+    src.enter_step("s1")
+    src.put("metadata", {"a": 1})
+    src.put("data", {"x": 2})
+    src.exit_step()
+    src.put_step_metadata(step_name="s1", step_type="ExampleStep", execution_order=3)
+
+    r = Results()
+    r.restore_step("s1", src.get_step("s1"), src.get_step_metadata("s1"))
+    assert r.to_dict()["steps"] == src.to_dict()["steps"]
+    assert r.get_steps_by_execution_order() == ["s1"]
+
+    with pytest.raises(ValueError, match="Invalid stored results"):
+        r.restore_step("s2", {"bad": 1}, src.get_step_metadata("s1"))
+    with pytest.raises(ValueError, match="does not belong"):
+        r.restore_step("s2", {"data": {}}, src.get_step_metadata("s1"))
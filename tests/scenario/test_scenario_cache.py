@@ -0,0 +1,94 @@
+"""Tests for the compiled scenario cache and schema-skip mode."""
+
+from pathlib import Path
+
+import pytest
+
+from ngraph.scenario import Scenario
+from ngraph.utils import scenario_cache
+from ngraph.utils.scenario_cache import (
+    CACHE_SUFFIX,
+    load_compiled_scenario,
+    scenario_cache_key,
+    store_compiled_scenario,
+)
+
+YAML = """
+seed: 7
+network:
+  nodes:
+    A: {}
+    B: {}
+    C: {}
+  links:
+    - {source: A, target: B, capacity: 10}
+    - {source: B, target: C, capacity: 5}
+workflow:
+  - type: BuildGraph
+    name: build_graph
+"""
+
+
+def test_cache_key_depends_on_inputs(monkeypatch: pytest.MonkeyPatch) -> None:
+    base = scenario_cache_key(YAML)
+    assert base == scenario_cache_key(YAML)
+    assert base != scenario_cache_key(YAML + "\n# comment\n")
+    assert base != scenario_cache_key(YAML, validate_schema=False)
+    assert base != scenario_cache_key(YAML, extra="components")
+
+    monkeypatch.setattr(scenario_cache, "_ngraph_version", lambda: "0.0.0-other")
+    assert base != scenario_cache_key(YAML)
+
+
+def test_from_yaml_stores_and_reuses_compiled_scenario(tmp_path: Path) -> None:
+    first = Scenario.from_yaml(YAML, cache_dir=tmp_path)
+    entries = list(tmp_path.glob(f"*{CACHE_SUFFIX}"))
+    assert len(entries) == 1
+
+    second = Scenario.from_yaml(YAML, cache_dir=tmp_path)
+    assert second is not first
+    assert set(second.network.nodes) == {"A", "B", "C"}
+    assert {
+        (lk.source, lk.target, lk.capacity) for lk in second.network.links.values()
+    } == {(lk.source, lk.target, lk.capacity) for lk in first.network.links.values()}
+    assert second.seed == 7
+    assert [s.name for s in second.workflow] == ["build_graph"]
+
+    second.run()
+    assert second.results.to_dict()["steps"]["build_graph"]
+
+
+def test_corrupt_cache_entry_is_a_miss(tmp_path: Path) -> None:
+    key = scenario_cache_key(YAML)
+    (tmp_path / f"{key}{CACHE_SUFFIX}").write_bytes(b"not a pickle")
+    assert load_compiled_scenario(tmp_path, key) is None
+
+    scenario = Scenario.from_yaml(YAML, cache_dir=tmp_path)
+    assert load_compiled_scenario(tmp_path, key) is not None
+    assert set(scenario.network.nodes) == {"A", "B", "C"}
+
+
+def test_store_leaves_no_temp_files(tmp_path: Path) -> None:
+    scenario = Scenario.from_yaml(YAML)
+    path = store_compiled_scenario(tmp_path / "nested", "k", scenario)
+    assert path.is_file()
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+
+def test_skip_schema_validation() -> None:
+    yaml_str = """
+network:
+  name: 5
+  nodes: {A: {}, B: {}}
+"""
+    jsonschema = pytest.importorskip("jsonschema")
+    with pytest.raises(jsonschema.ValidationError):
+        Scenario.from_yaml(yaml_str)
+
+    scenario = Scenario.from_yaml(yaml_str, validate_schema=False)
+    assert set(scenario.network.nodes) == {"A", "B"}
+
+
+def test_skip_schema_validation_keeps_structural_checks() -> None:
+    with pytest.raises(ValueError, match="Unrecognized top-level key"):
+        Scenario.from_yaml("bogus: 1\n", validate_schema=False)
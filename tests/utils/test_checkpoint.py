@@ -0,0 +1,238 @@
+"""Tests for run checkpoints and resumable Monte Carlo analysis."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+import ngraph.analysis.failure_manager as fm_mod
+from ngraph import Link, Network, Node
+from ngraph.analysis import FailureManager
+from ngraph.analysis.functions import max_flow_analysis
+from ngraph.model.failure.policy import (
+    FailureMode,
+    FailurePolicy,
+    FailureRule,
+)
+from ngraph.model.failure.policy_set import FailurePolicySet
+from ngraph.scenario import Scenario
+from ngraph.utils.checkpoint import MonteCarloCheckpoint, RunCheckpoint
+from ngraph.workflow.base import WorkflowStep, register_workflow_step
+
+YAML = """
+seed: 7
+network:
+  nodes: {A: {}, B: {}, C: {}, D: {}}
+  links:
+    - {source: A, target: B, capacity: 10}
+    - {source: B, target: D, capacity: 10}
+    - {source: A, target: C, capacity: 10}
+    - {source: C, target: D, capacity: 10}
+failures:
+  two_links:
+    modes:
+      - weight: 1.0
+        rules:
+          - {scope: link, mode: choice, count: 2}
+workflow:
+  - {type: MaxFlow, name: flow_a, source: "^A$", target: "^D$",
+     failure_policy: two_links, iterations: 40}
+  - {type: MaxFlow, name: flow_b, source: "^B$", target: "^C$",
+     failure_policy: two_links, iterations: 40, store_failure_patterns: true}
+"""
+
+
+def _ring(n: int) -> Network:
+    net = Network()
+    for i in range(n):
+        net.add_node(Node(f"n{i}"))
+    for i in range(n):
+        net.add_link(Link(f"n{i}", f"n{(i + 1) % n}"))
+    return net
+
+
+def _manager(net: Network, checkpoint: MonteCarloCheckpoint | None) -> FailureManager:
+    policies = FailurePolicySet()
+    policies.add(
+        "one_link",
+        FailurePolicy(
+            modes=[
+                FailureMode(
+                    weight=1.0,
+                    rules=[FailureRule(scope="link", mode="choice", count=1)],
+                )
+            ]
+        ),
+    )
+    return FailureManager(net, policies, policy_name="one_link", checkpoint=checkpoint)
+
+
+def _summary(out: dict) -> list[tuple]:
+    return [
+        (r.failure_id, r.occurrence_count, r.failure_trace, r.summary.total_placed)
+        for r in out["results"]
+    ]
+
+
+@pytest.mark.parametrize("parallelism", [1, 2])
+def test_interrupted_monte_carlo_resumes_identically(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, parallelism: int
+) -> None:
+    monkeypatch.setattr(fm_mod, "SAMPLE_CHUNK_SIZE", 5)
+    net = _ring(10)
+    kwargs = dict(
+        iterations=60,
+        parallelism=parallelism,
+        seed=4,
+        store_failure_patterns=True,
+        source="^n0$",
+        target="^n5$",
+    )
+    reference = _summary(
+        _manager(net, None).run_monte_carlo_analysis(max_flow_analysis, **kwargs)
+    )
+
+    path = tmp_path / "mc.pkl"
+    crashing = _manager(net, MonteCarloCheckpoint(path, interval=0))
+    original_compute = crashing.compute_exclusions
+
+    def _crash_at_30(policy, seed_offset=None, **kw):
+        if seed_offset is not None and seed_offset - 4 >= 30:
+            raise RuntimeError("worker died")
+        return original_compute(policy, seed_offset, **kw)
+
+    monkeypatch.setattr(crashing, "compute_exclusions", _crash_at_30)
+    with pytest.raises(RuntimeError, match="worker died"):
+        crashing.run_monte_carlo_analysis(max_flow_analysis, **kwargs)
+    assert path.is_file()
+
+    fm = _manager(net, MonteCarloCheckpoint(path, interval=0))
+    sampled: list[int | None] = []
+    original = fm.compute_exclusions
+
+    def _compute(policy, seed_offset=None, **kw):
+        sampled.append(seed_offset)
+        return original(policy, seed_offset, **kw)
+
+    monkeypatch.setattr(fm, "compute_exclusions", _compute)
+    resumed = fm.run_monte_carlo_analysis(max_flow_analysis, **kwargs)
+
+    assert _summary(resumed) == reference
+    assert sum(count for _, count, _, _ in reference) == 60
+    # Segments of 5 (serial) or 10 (parallel) iterations: 30 were saved
+    assert sorted(sampled) == list(range(4 + 30, 4 + 60))
+
+
+def test_monte_carlo_checkpoint_ignores_other_signature(tmp_path: Path) -> None:
+    from ngraph.analysis.failure_patterns import FailurePatternSet
+    from ngraph.utils.checkpoint import MonteCarloProgress
+
+    ckpt = MonteCarloCheckpoint(tmp_path / "mc.pkl", interval=0)
+    ckpt.save(
+        ("f", "p", 1, 0, 10, False), MonteCarloProgress(5, FailurePatternSet([], 5))
+    )
+
+    assert ckpt.load(("f", "p", 2, 0, 10, False)) is None
+    assert ckpt.load(("f", "p", 1, 0, 10, False)).next_iteration == 5  # type: ignore[union-attr]
+
+
+def test_scenario_resume_skips_completed_steps(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ckpt = RunCheckpoint(tmp_path / "ckpt", "key")
+    ckpt.save_scenario(Scenario.from_yaml(YAML))
+    full = ckpt.load_scenario()
+    assert full is not None
+    full.run(checkpoint=ckpt)
+    expected = full.results.to_dict()
+
+    # Simulate a crash after the first step: drop the second step's entry
+    ckpt = RunCheckpoint(tmp_path / "ckpt", "key", resume=True)
+    ckpt._step_path("flow_b").unlink()
+
+    calls = {"apply": 0}
+    original = FailurePolicy.apply_failures
+
+    def _counting(self, *args, **kwargs):
+        calls["apply"] += 1
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(FailurePolicy, "apply_failures", _counting)
+    resumed = ckpt.load_scenario()
+    assert resumed is not None
+    resumed.run(checkpoint=ckpt)
+
+    assert calls["apply"] == 40  # only flow_b sampled again
+    got = resumed.results.to_dict()
+    assert got["workflow"] == expected["workflow"]
+    for name in ("flow_a", "flow_b"):
+        assert got["steps"][name]["data"] == expected["steps"][name]["data"]
+
+
+def test_run_checkpoint_rejects_other_scenario(tmp_path: Path) -> None:
+    RunCheckpoint(tmp_path, "a")
+    with pytest.raises(ValueError, match="different scenario"):
+        RunCheckpoint(tmp_path, "b", resume=True)
+    # A fresh (non-resume) run takes the directory over
+    RunCheckpoint(tmp_path, "b")
+    RunCheckpoint(tmp_path, "b", resume=True)
+
+
+@dataclass
+class _TagCore(WorkflowStep):
+    """Custom step that tags link A->B as core (not concurrent_safe)."""
+
+    def run(self, scenario: Scenario) -> None:
+        for link in scenario.network.links.values():
+            if (link.source, link.target) == ("A", "B"):
+                link.attrs["role"] = "core"
+        scenario.results.put("metadata", {})
+        scenario.results.put("data", {})
+
+
+register_workflow_step("_CheckpointTagCore")(_TagCore)
+
+EDIT_YAML = """
+seed: 7
+network:
+  nodes: {A: {}, B: {}}
+  links:
+    - {source: A, target: B, capacity: 10}
+failures:
+  core:
+    modes:
+      - weight: 1.0
+        rules:
+          - scope: link
+            mode: all
+            match:
+              conditions: [{attr: role, op: "==", value: core}]
+workflow:
+  - {type: _CheckpointTagCore, name: tag}
+  - {type: MaxFlow, name: flow, source: "^A$", target: "^B$",
+     failure_policy: core, iterations: 2}
+"""
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_resume_reexecutes_network_modifying_steps(
+    tmp_path: Path, max_workers: int | None
+) -> None:
+    ckpt = RunCheckpoint(tmp_path / "ckpt", "key")
+    ckpt.save_scenario(Scenario.from_yaml(EDIT_YAML))
+    full = ckpt.load_scenario()
+    assert full is not None
+    full.run(checkpoint=ckpt, max_workers=max_workers)
+    expected = full.results.to_dict()["steps"]["flow"]["data"]
+    assert {r["summary"]["total_placed"] for r in expected["flow_results"]} == {0.0}
+
+    # Crash before the Monte Carlo step finished
+    ckpt = RunCheckpoint(tmp_path / "ckpt", "key", resume=True)
+    ckpt._step_path("flow").unlink(missing_ok=True)
+    resumed = ckpt.load_scenario()
+    assert resumed is not None
+    resumed.run(checkpoint=ckpt, max_workers=max_workers)
+
+    assert resumed.results.to_dict()["steps"]["flow"]["data"] == expected
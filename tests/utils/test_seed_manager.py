@@ -102,3 +102,12 @@ class TestSeedManager:
         seed2 = seed_mgr.derive_seed()
         assert seed1 == seed2
         assert seed1 is not None
+
+    def test_numpy_generator_streams_are_reproducible(self):
+        """Equal seeds give equal NumPy streams."""
+        from ngraph.utils.seed_manager import numpy_generator
+
+        a = numpy_generator(7).random(5)
+        b = numpy_generator(7).random(5)
+        assert a.tolist() == b.tolist()
+        assert numpy_generator(8).random(5).tolist() != a.tolist()
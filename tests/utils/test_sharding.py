@@ -0,0 +1,107 @@
+"""Tests for sharded runs and merging shard outputs."""
+
+from __future__ import annotations
+
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from ngraph import cli
+from ngraph.scenario import Scenario
+from ngraph.utils.sharding import (
+    ShardSpec,
+    merge_shards,
+    shard_checkpoint,
+    shared_scenario,
+)
+
+YAML = """
+seed: 7
+network:
+  nodes: {A: {}, B: {}, C: {}, D: {}}
+  links:
+    - {source: A, target: B, capacity: 10}
+    - {source: B, target: D, capacity: 10}
+    - {source: A, target: C, capacity: 10}
+    - {source: C, target: D, capacity: 10}
+    - {source: B, target: C, capacity: 5}
+failures:
+  two_links:
+    modes:
+      - weight: 1.0
+        rules:
+          - {scope: link, mode: choice, count: 2}
+workflow:
+  - {type: MaxFlow, name: baseline, source: "^A$", target: "^D$", iterations: 0}
+  - {type: MaxFlow, name: flow_a, source: "^A$", target: "^D$",
+     failure_policy: two_links, iterations: 37}
+  - {type: MaxFlow, name: flow_b, source: "^B$", target: "^C$",
+     failure_policy: two_links, iterations: 37, store_failure_patterns: true}
+  - {type: MaxFlow, name: flow_c, source: "^A$", target: "^D$",
+     failure_policy: two_links, iterations: 37, parallelism: 2}
+"""
+
+
+def _data(scenario: Scenario) -> dict:
+    steps = scenario.results.to_dict()["steps"]
+    return {name: step["data"] for name, step in steps.items()}
+
+
+def test_shard_spec_parse_and_ranges() -> None:
+    assert ShardSpec.parse(" 2/3 ") == ShardSpec(2, 3)
+    ranges = [ShardSpec(k, 3).iteration_range(10) for k in (1, 2, 3)]
+    assert ranges == [range(0, 3), range(3, 6), range(6, 10)]
+    assert ShardSpec(4, 4).iteration_range(2) == range(1, 2)
+    for bad in ("0/2", "3/2", "1", "a/b"):
+        with pytest.raises(ValueError):
+            ShardSpec.parse(bad)
+
+
+def test_merged_shards_equal_single_run(tmp_path: Path) -> None:
+    compiled = pickle.dumps(Scenario.from_yaml(YAML))
+    single = pickle.loads(compiled)
+    single.run()
+
+    for k in (3, 1, 2):
+        spec = ShardSpec(k, 3)
+        scenario = shared_scenario(
+            tmp_path, "key", "demo", spec, lambda: pickle.loads(compiled)
+        )
+        scenario.run(checkpoint=shard_checkpoint(tmp_path, "key", spec))
+
+    merged, name = merge_shards(tmp_path)
+
+    assert name == "demo"
+    assert _data(merged) == _data(single)
+    counts = [r["occurrence_count"] for r in _data(merged)["flow_b"]["flow_results"]]
+    assert sum(counts) == 37
+
+
+def test_merge_requires_all_shards(tmp_path: Path) -> None:
+    spec = ShardSpec(1, 2)
+    scenario = shared_scenario(
+        tmp_path, "key", "demo", spec, lambda: Scenario.from_yaml(YAML)
+    )
+    scenario.run(checkpoint=shard_checkpoint(tmp_path, "key", spec))
+
+    with pytest.raises(ValueError, match="2/2 has not been run"):
+        merge_shards(tmp_path)
+    with pytest.raises(ValueError, match="different scenario or shard count"):
+        shared_scenario(tmp_path, "key", "demo", ShardSpec(1, 3), lambda: scenario)
+
+
+def test_cli_shard_and_merge(tmp_path: Path) -> None:
+    path = tmp_path / "demo.yaml"
+    path.write_text(YAML)
+    shards = tmp_path / "shards"
+    for k in (1, 2):
+        cli.main(["run", str(path), "--shard", f"{k}/2", "--shard-dir", str(shards)])
+    assert not (tmp_path / "demo.results.json").exists()
+
+    cli.main(["merge", str(shards), "-o", str(tmp_path)])
+
+    results = json.loads((tmp_path / "demo.results.json").read_text())
+    flow_results = results["steps"]["flow_a"]["data"]["flow_results"]
+    assert sum(r["occurrence_count"] for r in flow_results) == 37
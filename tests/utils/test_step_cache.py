@@ -0,0 +1,137 @@
+"""Tests for memoization of workflow step results across runs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ngraph import Link, Network, Node
+from ngraph.scenario import Scenario
+from ngraph.utils.step_cache import StepCache
+from ngraph.workflow.max_flow_step import MaxFlow
+
+YAML = """
+seed: 5
+network:
+  nodes: {A: {}, B: {}, C: {}, D: {}}
+  links:
+    - {source: A, target: B, capacity: 10}
+    - {source: B, target: D, capacity: 10}
+    - {source: A, target: C, capacity: 10}
+    - {source: C, target: D, capacity: 7}
+failures:
+  one_link:
+    modes:
+      - weight: 1.0
+        rules:
+          - {scope: link, mode: choice, count: 1}
+demands:
+  tm:
+    - {source: "^A$", target: "^D$", volume: 5}
+workflow:
+  - {type: NetworkStats, name: stats}
+  - {type: MaxFlow, name: flow_a, source: "^A$", target: "^D$",
+     failure_policy: one_link, iterations: 20}
+  - {type: MaxFlow, name: flow_b, source: "^B$", target: "^C$",
+     failure_policy: one_link, iterations: 20}
+  - {type: TrafficMatrixPlacement, name: tmp, demand_set: tm,
+     failure_policy: one_link, iterations: 10}
+"""
+
+
+def _run(yaml: str, cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> tuple:
+    ran: list[str] = []
+    original = MaxFlow.run
+
+    def _counting(self, scenario):
+        ran.append(self.name)
+        return original(self, scenario)
+
+    monkeypatch.setattr(MaxFlow, "run", _counting)
+    scenario = Scenario.from_yaml(yaml)
+    scenario.run(step_cache=StepCache(cache_dir))
+    monkeypatch.setattr(MaxFlow, "run", original)
+    return scenario, ran
+
+
+def _hits(scenario: Scenario) -> dict[str, bool]:
+    steps = scenario.results.to_dict()["steps"]
+    return {name: step["metadata"]["cache_hit"] for name, step in steps.items()}
+
+
+def test_unchanged_steps_are_reused_across_builds(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first, ran = _run(YAML, tmp_path, monkeypatch)
+    assert ran == ["flow_a", "flow_b"]
+    assert not any(_hits(first).values())
+
+    second, ran = _run(YAML, tmp_path, monkeypatch)
+    assert ran == []
+    assert all(_hits(second).values())
+    # Rebuilt links and demands get the IDs issued for the first build
+    assert list(second.network.links) == list(first.network.links)
+    assert [d.id for d in second.demand_set.get_set("tm")] == [
+        d.id for d in first.demand_set.get_set("tm")
+    ]
+    a, b = first.results.to_dict(), second.results.to_dict()
+    assert a["scenario"] == b["scenario"]
+    for name in a["steps"]:
+        assert a["steps"][name]["data"] == b["steps"][name]["data"]
+
+
+def test_only_edited_step_runs_again(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _run(YAML, tmp_path, monkeypatch)
+
+    edited = YAML.replace(
+        'target: "^C$",\n     failure_policy: one_link, iterations: 20',
+        'target: "^C$",\n     failure_policy: one_link, iterations: 30',
+    )
+    assert edited != YAML
+    scenario, ran = _run(edited, tmp_path, monkeypatch)
+    assert ran == ["flow_b"]
+    assert _hits(scenario) == {
+        "stats": True,
+        "flow_a": True,
+        "flow_b": False,
+        "tmp": True,
+    }
+
+    rewired, ran = _run(
+        YAML.replace("capacity: 7", "capacity: 8"), tmp_path, monkeypatch
+    )
+    assert ran == ["flow_a", "flow_b"]
+    assert not any(_hits(rewired).values())
+
+
+def test_unseeded_failure_steps_are_not_cached(tmp_path: Path) -> None:
+    yaml = YAML.replace("seed: 5\n", "")
+    scenario = Scenario.from_yaml(yaml)
+    cache = StepCache(tmp_path)
+    scenario.run(step_cache=cache)
+
+    assert cache.fingerprint_for("stats") is not None
+    assert cache.fingerprint_for("flow_a") is None
+    assert "cache_hit" not in scenario.results.get_step("flow_a")["metadata"]
+
+
+def test_relabel_links_keeps_order_and_arrays() -> None:
+    net = Network()
+    for name in "ABC":
+        net.add_node(Node(name))
+    net.add_link(Link("A", "B", capacity=1))
+    net.add_link(Link("B", "C", capacity=2))
+    before = net.link_arrays()
+
+    net.relabel_links(["A|B|x", "B|C|y"])
+
+    assert list(net.links) == ["A|B|x", "B|C|y"]
+    assert net.links["B|C|y"].capacity == 2
+    after = net.link_arrays()
+    assert list(after.link_ids) == ["A|B|x", "B|C|y"]
+    assert len(after.link_ids) == len(before.link_ids)
+    with pytest.raises(ValueError):
+        net.relabel_links(["B|C|x", "A|B|y"])
@@ -179,6 +179,8 @@ class TestMaxFlowStep:
             network=mock_scenario.network,
             failure_policy_set=mock_scenario.failure_policy_set,
             policy_name="test_policy",
+            pattern_store=mock_scenario.failure_pattern_store,
+            checkpoint=None,
         )
 
         # Verify convenience method was called with correct parameters
@@ -0,0 +1,70 @@
+"""Tests for lazy loading of the package namespace and built-in workflow steps."""
+
+import subprocess
+import sys
+
+import pytest
+
+import ngraph
+from ngraph.workflow.base import (
+    BUILTIN_STEP_MODULES,
+    WORKFLOW_STEP_REGISTRY,
+    get_workflow_step_class,
+)
+
+
+def _run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def test_import_ngraph_does_not_load_heavy_modules() -> None:
+    out = _run(
+        "import sys, ngraph; "
+        "print(','.join(m for m in ('networkx', 'numpy', 'pandas', 'ngraph.cli',"
+        " 'ngraph.analysis') if m in sys.modules))"
+    )
+    assert out == ""
+
+
+def test_scenario_loads_only_used_steps() -> None:
+    code = (
+        "import sys\n"
+        "from ngraph.scenario import Scenario\n"
+        "Scenario.from_yaml('network: {nodes: {A: {}}}\\n"
+        "workflow:\\n  - {type: NetworkStats, name: s}\\n')\n"
+        "print(sorted(m for m in sys.modules if m.startswith('ngraph.workflow.')))\n"
+        "print('networkx' in sys.modules)\n"
+    )
+    loaded, nx_loaded = _run(code).splitlines()
+    assert "ngraph.workflow.network_stats" in loaded
+    assert "ngraph.workflow.build_graph" not in loaded
+    assert "ngraph.workflow.max_flow_step" not in loaded
+    assert nx_loaded == "False"
+
+
+def test_lazy_package_attributes_resolve() -> None:
+    from ngraph.model.network import Network
+    from ngraph.scenario import Scenario
+
+    assert ngraph.Network is Network
+    assert ngraph.Scenario is Scenario
+    assert isinstance(ngraph.__version__, str)
+    assert set(ngraph.__all__) <= set(dir(ngraph))
+    with pytest.raises(AttributeError):
+        _ = ngraph.does_not_exist
+
+
+@pytest.mark.parametrize("step_type", sorted(BUILTIN_STEP_MODULES))
+def test_builtin_steps_resolve(step_type: str) -> None:
+    import ngraph.workflow as wf
+
+    step_cls = get_workflow_step_class(step_type)
+    assert step_cls is not None
+    assert WORKFLOW_STEP_REGISTRY[step_type] is step_cls
+    assert getattr(wf, step_type) is step_cls
+
+
+def test_unknown_step_type_returns_none() -> None:
+    assert get_workflow_step_class("NoSuchStep") is None
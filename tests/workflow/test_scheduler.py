@@ -0,0 +1,155 @@
+"""Tests for concurrent execution of independent workflow steps."""
+
+from __future__ import annotations
+
+import pickle
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from ngraph.scenario import Scenario
+from ngraph.workflow.base import WorkflowStep, resolve_parallelism, worker_budget
+from ngraph.workflow.scheduler import step_dependencies
+
+YAML = """
+seed: 11
+network:
+  nodes: {A: {}, B: {}, C: {}, D: {}}
+  links:
+    - {source: A, target: B, capacity: 10}
+    - {source: B, target: D, capacity: 10}
+    - {source: A, target: C, capacity: 10}
+    - {source: C, target: D, capacity: 10}
+failures:
+  one_link:
+    modes:
+      - weight: 1.0
+        rules:
+          - {scope: link, mode: choice, count: 1}
+workflow:
+  - {type: NetworkStats, name: stats}
+  - {type: MaxFlow, name: flow_a, source: "^A$", target: "^D$",
+     failure_policy: one_link, iterations: 30, parallelism: 2}
+  - {type: MaxFlow, name: flow_b, source: "^B$", target: "^C$",
+     failure_policy: one_link, iterations: 30, store_failure_patterns: true}
+  - {type: MaxFlow, name: flow_c, source: "^A$", target: "^D$",
+     failure_policy: one_link, iterations: 30, depends_on: [flow_a]}
+"""
+
+
+@dataclass
+class _Probe(WorkflowStep):
+    """Records how many probes run at the same time."""
+
+    concurrent_safe = True
+
+    state: Any = None
+    fail: bool = False
+
+    def run(self, scenario: Scenario) -> None:
+        with self.state["lock"]:
+            self.state["active"] += 1
+            self.state["peak"] = max(self.state["peak"], self.state["active"])
+        time.sleep(0.05)
+        with self.state["lock"]:
+            self.state["active"] -= 1
+            self.state["order"].append(self.name)
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        scenario.results.put("metadata", {})
+        scenario.results.put("data", {"name": self.name})
+
+
+@dataclass
+class _Mutator(_Probe):
+    concurrent_safe = False
+
+
+def _exported(scenario: Scenario) -> dict:
+    out = scenario.results.to_dict()
+    for step in out["steps"].values():
+        step["metadata"].pop("duration_sec", None)
+    return out
+
+
+def test_concurrent_run_matches_sequential() -> None:
+    # Same compiled network for both runs (link IDs are random per build)
+    compiled = pickle.dumps(Scenario.from_yaml(YAML))
+    sequential = pickle.loads(compiled)
+    sequential.run()
+    concurrent = pickle.loads(compiled)
+    concurrent.run(max_workers=3)
+
+    seq, conc = _exported(sequential), _exported(concurrent)
+    assert list(conc["steps"]) == ["stats", "flow_a", "flow_b", "flow_c"]
+    assert conc["workflow"] == seq["workflow"]
+    for name in seq["steps"]:
+        assert conc["steps"][name]["data"] == seq["steps"][name]["data"]
+
+
+def test_dependencies_from_depends_on_alpha_and_barriers() -> None:
+    steps = Scenario.from_yaml(YAML).workflow
+    assert step_dependencies(steps) == [set(), set(), set(), {1}]
+
+    state: dict = {}
+    mixed = [
+        _Probe(name="a", state=state),
+        _Mutator(name="m", state=state),
+        _Probe(name="b", state=state),
+    ]
+    assert step_dependencies(mixed) == [set(), {0}, {1}]
+
+    with pytest.raises(ValueError, match="unknown step 'nope'"):
+        step_dependencies([_Probe(name="a", depends_on=["nope"])])
+    with pytest.raises(ValueError, match="must come earlier"):
+        step_dependencies([_Probe(name="a", depends_on=["b"]), _Probe(name="b")])
+
+
+def test_unknown_dependency_rejected_at_load() -> None:
+    yaml = "workflow:\n  - {type: NetworkStats, name: s, depends_on: [missing]}\n"
+    with pytest.raises(ValueError, match="unknown step 'missing'"):
+        Scenario.from_yaml(yaml)
+
+
+def _probe_scenario(steps: list[WorkflowStep]) -> Scenario:
+    scenario = Scenario.from_yaml("network: {nodes: {A: {}}}")
+    scenario.workflow = steps
+    return scenario
+
+
+def test_independent_steps_share_worker_budget() -> None:
+    state = {"lock": threading.Lock(), "active": 0, "peak": 0, "order": []}
+    steps = [_Probe(name=f"p{i}", state=state) for i in range(6)]
+    steps.append(_Mutator(name="last", state=state))
+    scenario = _probe_scenario(steps)
+
+    scenario.run(max_workers=2)
+
+    assert state["peak"] == 2
+    assert state["order"][-1] == "last"
+    md = scenario.results.get_all_step_metadata()
+    assert [md[s.name].execution_order for s in steps] == list(range(7))
+
+
+def test_first_failing_step_error_is_raised() -> None:
+    state = {"lock": threading.Lock(), "active": 0, "peak": 0, "order": []}
+    steps = [
+        _Probe(name="ok", state=state),
+        _Probe(name="bad", state=state, fail=True),
+        _Probe(name="after", state=state, depends_on=["bad"]),
+    ]
+    with pytest.raises(RuntimeError, match="bad failed"):
+        _probe_scenario(steps).run(max_workers=4)
+    assert "after" not in state["order"]
+
+
+def test_worker_budget_caps_parallelism() -> None:
+    assert resolve_parallelism(8) == 8
+    with worker_budget(3):
+        assert resolve_parallelism(8) == 3
+        assert resolve_parallelism(2) == 2
+        assert resolve_parallelism("auto") <= 3
+    assert resolve_parallelism(8) == 8
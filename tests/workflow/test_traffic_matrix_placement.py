@@ -561,3 +561,52 @@ def test_traffic_matrix_placement_no_trace_when_disabled(
     data = exported["steps"]["tm_no_patterns"]["data"]
     assert len(data["flow_results"]) == 1
     assert data["flow_results"][0]["failure_trace"] is None
+
+
+def test_traffic_matrix_placement_link_utilization_envelope() -> None:
+    from ngraph.scenario import Scenario
+
+    scenario = Scenario.from_yaml(
+        """
+seed: 11
+network:
+  nodes: {A: {}, B: {}, C: {}, D: {}}
+  links:
+    - {source: A, target: B, capacity: 10}
+    - {source: B, target: D, capacity: 10}
+    - {source: A, target: C, capacity: 10}
+    - {source: C, target: D, capacity: 10}
+demands:
+  default:
+    - {source: "^A$", target: "^D$", volume: 5}
+failures:
+  one:
+    modes:
+      - weight: 1
+        rules:
+          - {scope: link, mode: choice, count: 1}
+workflow:
+  - type: TrafficMatrixPlacement
+    name: tm
+    demand_set: default
+    failure_policy: one
+    iterations: 20
+    include_link_utilization: true
+    utilization_bins: 4
+"""
+    )
+    scenario.run()
+    data = scenario.results.get_step("tm")["data"]
+    util = data["link_utilization"]
+
+    assert util["samples"] == 20
+    assert util["links"] == sorted(scenario.network.links)
+    assert util["bin_edges"] == [0.0, 0.25, 0.5, 0.75, 1.0]
+    # ECMP splits the baseline demand over both paths
+    assert util["baseline"]["fwd"] == [0.25] * 4
+    # One path carries the full demand whenever the other one fails
+    assert max(util["fwd"]["max"]) == pytest.approx(0.5)
+    assert all(sum(row) == 20 for row in util["fwd"]["histogram"])
+    assert util["rev"]["max"] == [0.0] * 4
+    # Flow matrices are consumed, not exported per iteration
+    assert all("link_flows" not in r["data"] for r in data["flow_results"])